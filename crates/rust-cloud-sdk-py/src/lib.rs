@@ -903,78 +903,128 @@ impl CloudApiClient {
     }
 
     /// Raw file bytes at `version` (branch, ref, or commit).
+    ///
+    /// Releases the GIL while waiting, so Python threads can read in parallel.
     fn read_filesystem_file(
         &self,
+        py: Python<'_>,
         project_id: String,
         name: String,
         path: String,
         version: String,
     ) -> PyResult<Vec<u8>> {
-        self.run_artifact_with_retry(5, move |client| {
-            let project_id = project_id.clone();
-            let name = name.clone();
-            let path = path.clone();
-            let version = version.clone();
-            async move {
-                let traced = client
-                    .read_native_filesystem_file(&project_id, &name, &path, &version)
-                    .await?;
-                Ok(traced.into_inner())
-            }
+        py.detach(|| {
+            self.run_artifact_with_retry(5, move |client| {
+                let project_id = project_id.clone();
+                let name = name.clone();
+                let path = path.clone();
+                let version = version.clone();
+                async move {
+                    let traced = client
+                        .read_native_filesystem_file(&project_id, &name, &path, &version)
+                        .await?;
+                    Ok(traced.into_inner())
+                }
+            })
         })
     }
 
-    /// One directory's full listing at `version` (all pages), as
-    /// `{"entries": [...]}`.
-    fn list_filesystem_tree(
+    /// File bytes at `version` with the file's content ID and full size, as
+    /// `(bytes, content_id, full_size)`.
+    ///
+    /// `range` is `(offset, length)` to read only part of the file; `None`
+    /// reads all of it. Releases the GIL while waiting.
+    #[pyo3(signature = (project_id, name, path, version, range=None))]
+    fn read_filesystem_file_with_metadata(
         &self,
+        py: Python<'_>,
         project_id: String,
         name: String,
-        dir_path: String,
+        path: String,
         version: String,
-    ) -> PyResult<String> {
-        self.run_artifact_with_retry(5, move |client| {
-            let project_id = project_id.clone();
-            let name = name.clone();
-            let dir_path = dir_path.clone();
-            let version = version.clone();
-            async move {
-                let mut entries = Vec::new();
-                let mut after: Option<String> = None;
-                let mut seen = std::collections::HashSet::new();
-                loop {
-                    let page = client
-                        .list_native_filesystem_entries_page(
+        range: Option<(u64, u64)>,
+    ) -> PyResult<(Py<pyo3::types::PyBytes>, String, u64)> {
+        let read = py.detach(|| {
+            self.run_artifact_with_retry(5, move |client| {
+                let project_id = project_id.clone();
+                let name = name.clone();
+                let path = path.clone();
+                let version = version.clone();
+                async move {
+                    let traced = client
+                        .read_native_filesystem_file_with_metadata(
                             &project_id,
                             &name,
-                            &dir_path,
+                            &path,
                             &version,
-                            after.as_deref(),
-                            1000,
+                            range,
                         )
-                        .await?
-                        .into_inner();
-                    entries.extend(page.entries);
-                    if !page.truncated {
-                        break;
-                    }
-                    // A truncated page must carry a fresh cursor; anything else
-                    // would silently drop entries or loop forever.
-                    match page.next_after {
-                        Some(next) if !next.is_empty() && seen.insert(next.clone()) => {
-                            after = Some(next);
+                        .await?;
+                    Ok(traced.into_inner())
+                }
+            })
+        })?;
+        Ok((
+            pyo3::types::PyBytes::new(py, &read.data).into(),
+            read.content_id,
+            read.full_size,
+        ))
+    }
+
+    /// One directory's full listing at `version` (all pages), as
+    /// `{"entries": [...]}`. Releases the GIL while waiting.
+    fn list_filesystem_tree(
+        &self,
+        py: Python<'_>,
+        project_id: String,
+        name: String,
+        dir_path: String,
+        version: String,
+    ) -> PyResult<String> {
+        py.detach(|| {
+            self.run_artifact_with_retry(5, move |client| {
+                let project_id = project_id.clone();
+                let name = name.clone();
+                let dir_path = dir_path.clone();
+                let version = version.clone();
+                async move {
+                    let mut entries = Vec::new();
+                    let mut after: Option<String> = None;
+                    let mut seen = std::collections::HashSet::new();
+                    loop {
+                        let page = client
+                            .list_native_filesystem_entries_page(
+                                &project_id,
+                                &name,
+                                &dir_path,
+                                &version,
+                                after.as_deref(),
+                                1000,
+                            )
+                            .await?
+                            .into_inner();
+                        entries.extend(page.entries);
+                        if !page.truncated {
+                            break;
                         }
-                        _ => {
-                            return Err(SdkError::ClientError(
-                                "directory listing truncated without a fresh pagination cursor"
-                                    .to_string(),
-                            ));
+                        // A truncated page must carry a fresh cursor; anything else
+                        // would silently drop entries or loop forever.
+                        match page.next_after {
+                            Some(next) if !next.is_empty() && seen.insert(next.clone()) => {
+                                after = Some(next);
+                            }
+                            _ => {
+                                return Err(SdkError::ClientError(
+                                    "directory listing truncated without a fresh pagination cursor"
+                                        .to_string(),
+                                ));
+                            }
                         }
                     }
+                    serde_json::to_string(&serde_json::json!({ "entries": entries }))
+                        .map_err(SdkError::from)
                 }
-                serde_json::to_string(&serde_json::json!({ "entries": entries }))
-                    .map_err(SdkError::from)
-            }
+            })
         })
     }
 
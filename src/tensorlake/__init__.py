@@ -1,17 +1,41 @@
-from tensorlake.image import (
-    Image,
-    delete_sandbox_image,
-    find_sandbox_image_by_name,
-    import_sandbox_image,
-    list_sandbox_images,
-)
-from tensorlake.repositories import RepositoryClient
-from tensorlake.sandbox import (
-    FileSystem,
-    FileSystemMount,
-    create_file_system,
-    delete_file_system,
-    list_file_systems,
+from typing import TYPE_CHECKING
+
+from tensorlake._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from tensorlake.image import (
+        Image,
+        delete_sandbox_image,
+        find_sandbox_image_by_name,
+        import_sandbox_image,
+        list_sandbox_images,
+    )
+    from tensorlake.repositories import RepositoryClient
+    from tensorlake.sandbox import (
+        FileSystem,
+        FileSystemMount,
+        create_file_system,
+        delete_file_system,
+        list_file_systems,
+    )
+
+# The subsystems are only imported when their exports are used, so processes
+# using one subsystem don't pay for importing the others.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Image": ".image",
+        "delete_sandbox_image": ".image",
+        "find_sandbox_image_by_name": ".image",
+        "import_sandbox_image": ".image",
+        "list_sandbox_images": ".image",
+        "FileSystem": ".sandbox",
+        "FileSystemMount": ".sandbox",
+        "create_file_system": ".sandbox",
+        "list_file_systems": ".sandbox",
+        "delete_file_system": ".sandbox",
+        "RepositoryClient": ".repositories",
+    },
 )
 
 __all__ = [
@@ -0,0 +1,36 @@
+"""Lazy package exports.
+
+Package ``__init__`` modules re-export names from their submodules so users
+can import them from the package. Importing all the submodules eagerly makes
+every process pay for every subsystem. A package lists its exports here
+instead, and each submodule is imported on the first access of one of its
+names.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns module ``__getattr__`` and ``__dir__`` functions for a package.
+
+    ``exports`` maps each exported name to the module defining it, relative to
+    the package (e.g. ".image"). A loaded name is stored in the package
+    namespace, so ``__getattr__`` is only called once per name.
+    """
+    package_globals: Dict[str, Any] = importlib.import_module(package_name).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module_name: str | None = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value: Any = getattr(importlib.import_module(module_name, package_name), name)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(exports))
+
+    return __getattr__, __dir__
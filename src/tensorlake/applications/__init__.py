@@ -1 +1,51 @@
-from .interface import *
+from typing import TYPE_CHECKING
+
+from tensorlake._lazy import lazy_exports
+
+# The "function" subpackage has the name of the function decorator. Importing the subpackage
+# sets it as an attribute of this package, so it's imported before the decorator is bound.
+# Otherwise the first import of the subpackage, e.g. by a lazy export, replaces the decorator.
+from . import function as _function_subpackage  # noqa: F401
+from .interface import (
+    RETURN_WHEN,
+    ApplicationCapability,
+    DeserializationError,
+    File,
+    Function,
+    FunctionError,
+    FunctionProgress,
+    Future,
+    Headers,
+    HttpBody,
+    Image,
+    InternalError,
+    Logger,
+    RemoteAPIError,
+    Request,
+    RequestContext,
+    RequestError,
+    RequestFailed,
+    RequestNotFinished,
+    RequestState,
+    Retries,
+    SDKUsageError,
+    SerializationError,
+    TensorlakeError,
+    TensorlakeException,
+    TimeoutError,
+    __all__,
+    application,
+    cls,
+    function,
+)
+
+if TYPE_CHECKING:
+    from .interface import run_local_application, run_remote_application
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "run_local_application": ".interface",
+        "run_remote_application": ".interface",
+    },
+)
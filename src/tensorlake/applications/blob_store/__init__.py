@@ -1,4 +1,4 @@
 from .blob import BLOB, BLOBChunk
-from .blob_store import BLOBStore
+from .blob_store import BLOBRange, BLOBStore
 
-__all__ = ["BLOB", "BLOBChunk", "BLOBStore"]
+__all__ = ["BLOB", "BLOBChunk", "BLOBRange", "BLOBStore"]
@@ -1,3 +1,4 @@
+import threading
 from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any
@@ -18,6 +19,18 @@ _MAX_WORKER_THREADS: int = 7
 _IO_WORKER_THREADS_PER_AVAILABLE_CPU: int = 3
 
 
+@dataclass
+class BLOBRange:
+    """A range of binary data inside a BLOB."""
+
+    blob: BLOB
+    offset: int
+    size: int
+    # Optional hashlib hash object, i.e. hashlib.sha256().
+    # If set then it gets updated with the range data in order while the data is being read.
+    digest: Any | None = None
+
+
 @dataclass
 class _ChunkInfo:
     index: int
@@ -67,6 +80,59 @@ class BLOBStore:
 
         Raises InternalError on error.
         """
+        return self.get_many(
+            reads=[BLOBRange(blob=blob, offset=offset, size=size)], logger=logger
+        )[0]
+
+    def get_many(
+        self, reads: list[BLOBRange], logger: InternalLogger
+    ) -> list[bytearray]:
+        """Returns binary data stored in each of the supplied BLOB ranges.
+
+        All chunk reads of all ranges are done concurrently using the BLOB store IO workers.
+        This keeps the total number of concurrent reads and S3 connections within the
+        limits that the BLOB store uses for a single large read. The returned list
+        is ordered the same way as the supplied reads.
+
+        Raises InternalError on error.
+        """
+        read_chunk_futures: list[Future] = []
+        destinations: list[bytearray] = []
+        for read in reads:
+            destination, futures = self._submit_get(
+                blob=read.blob,
+                offset=read.offset,
+                size=read.size,
+                digest=read.digest,
+                logger=logger,
+            )
+            destinations.append(destination)
+            read_chunk_futures.extend(futures)
+
+        wait(read_chunk_futures, return_when=FIRST_EXCEPTION)
+        for future in read_chunk_futures:
+            if future.exception() is not None:
+                raise InternalError(
+                    "Failed reading BLOB store chunk"
+                ) from future.exception()
+
+        return destinations
+
+    def _submit_get(
+        self,
+        blob: BLOB,
+        offset: int,
+        size: int,
+        digest: Any | None,
+        logger: InternalLogger,
+    ) -> tuple[bytearray, list[Future]]:
+        """Submits reads of BLOB chunks into the returned destination to IO workers.
+
+        If digest is not None then it's updated with the read data by the IO workers.
+
+        Returns the destination and the futures of the chunk reads.
+        Raises InternalError if the read is out of BLOB bounds.
+        """
         if offset + size > _blob_size(blob):
             raise InternalError(
                 f"Offset {offset} + size {size} is out of bounds for BLOB chunks of size {_blob_size(blob)}."
@@ -81,8 +147,11 @@ class BLOBStore:
 
         # Allow reads of size 0. This happens when an application function call with no arguments is made.
         if size == 0:
-            return destination
+            return destination, read_chunk_futures
 
+        ordered_digest: _OrderedDigest | None = (
+            None if digest is None else _OrderedDigest(digest)
+        )
         first_chunk_info: _ChunkInfo = _find_chunk(blob, offset)
         chunk_ix: int = first_chunk_info.index
         offset_inside_chunk: int = offset - first_chunk_info.offset
@@ -95,6 +164,9 @@ class BLOBStore:
             chunk_in_destination: memoryview = destination_view[
                 destination_offset : destination_offset + chunk_read_size
             ]
+            digest_chunk_ix: int | None = None
+            if ordered_digest is not None:
+                digest_chunk_ix = ordered_digest.add_chunk(chunk_in_destination)
             read_chunk_futures.append(
                 self._io_workers_pool.submit(
                     self._read_into,
@@ -104,6 +176,8 @@ class BLOBStore:
                     blob_uri=chunk.uri,
                     blob_read_offset=read_offset,
                     destination=chunk_in_destination,
+                    ordered_digest=ordered_digest,
+                    digest_chunk_ix=digest_chunk_ix,
                     logger=logger,
                 )
             )
@@ -114,22 +188,17 @@ class BLOBStore:
             )
             chunk_ix += 1
 
-        wait(read_chunk_futures, return_when=FIRST_EXCEPTION)
-        for future in read_chunk_futures:
-            if future.exception() is not None:
-                raise InternalError(
-                    "Failed reading BLOB store chunk"
-                ) from future.exception()
-
-        return destination
+        return destination, read_chunk_futures
 
     def _read_into(
         self,
         blob_uri: str,
         blob_read_offset: int,
         destination: memoryview,
+        ordered_digest: "_OrderedDigest | None",
+        digest_chunk_ix: int | None,
         logger: InternalLogger,
-    ) -> bytes:
+    ) -> None:
         if _is_file_uri(blob_uri):
             self._local.get(
                 uri=blob_uri,
@@ -145,6 +214,9 @@ class BLOBStore:
                 logger=logger,
             )
 
+        if ordered_digest is not None:
+            ordered_digest.chunk_read(digest_chunk_ix)
+
     def put(self, blob: BLOB, data: list[bytes], logger: InternalLogger) -> BLOB:
         """Stores the supplied binary data into the supplied BLOB starting from its very beginning.
 
@@ -252,6 +324,58 @@ class BLOBStore:
             )
 
 
+class _OrderedDigest:
+    """Updates a hash object with chunks of data in chunk order as the chunks get read.
+
+    Chunks are read concurrently and complete in any order. Hashing is not parallelizable
+    so the IO worker that completes the next chunk to hash hashes it and all the following
+    already read chunks. This overlaps hashing with reading of the remaining chunks instead
+    of doing a second pass over all the data after it is read. Thread-safe.
+    """
+
+    def __init__(self, digest: Any):
+        self._digest: Any = digest
+        self._chunks: list[memoryview] = []
+        self._chunks_read: list[bool] = []
+        # Index of the next chunk to hash.
+        self._next_chunk_ix: int = 0
+        # True while an IO worker is hashing chunks.
+        self._hashing: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    def add_chunk(self, chunk: memoryview) -> int:
+        """Adds the next chunk to hash and returns its index.
+
+        Must be called for all chunks before any of them are read.
+        """
+        self._chunks.append(chunk)
+        self._chunks_read.append(False)
+        return len(self._chunks) - 1
+
+    def chunk_read(self, chunk_ix: int) -> None:
+        """Marks the chunk as read and hashes all read chunks that are next in order."""
+        with self._lock:
+            self._chunks_read[chunk_ix] = True
+            if self._hashing:
+                # The hashing IO worker will pick up this chunk when it gets to it.
+                return
+            self._hashing = True
+
+        while True:
+            with self._lock:
+                if (
+                    self._next_chunk_ix == len(self._chunks)
+                    or not self._chunks_read[self._next_chunk_ix]
+                ):
+                    self._hashing = False
+                    return
+                chunk: memoryview = self._chunks[self._next_chunk_ix]
+                self._next_chunk_ix += 1
+
+            # Hashing releases GIL for large buffers so other IO workers keep reading chunks.
+            self._digest.update(chunk)
+
+
 def _find_chunk(blob: BLOB, offset: int) -> _ChunkInfo:
     """Returns info of the chunk where the supplied offset starts.
 
@@ -6,11 +6,7 @@ from tensorlake.vendor.nanoid import generate as nanoid
 
 from ..interface import File, Function, HttpBody
 from ..user_data_serializer import UserDataSerializer
-from .type_hints import (
-    function_parameters,
-    function_signature,
-    parameter_type_hint,
-)
+from .type_hints import FunctionCallPlan, function_call_plan
 from .user_data_serializer import (
     deserialize_value,
     function_input_serializer,
@@ -91,29 +87,25 @@ def deserialize_application_function_call_arguments(
     input_serializer: UserDataSerializer = function_input_serializer(
         application, app_call=True
     )
-    signature: inspect.Signature = function_signature(application)
+    call_plan: FunctionCallPlan = function_call_plan(application)
 
     deserialized_kwargs: dict[str, Any | File | HttpBody] = {}
     for key, serialized_kwarg in serialized_kwargs.items():
         serialized_kwarg: SerializedApplicationArgument
-        if key not in signature.parameters:
+        if key not in call_plan.parameter_type_hints:
             # Allow users to pass unknown args and ignore them instead of failing.
             # This gives them more flexibility i.e. when they migrate they add a new
             # application parameter but their new code is not deployed or used yet.
             continue
 
-        parameter: inspect.Parameter = signature.parameters[key]
-        param_type_hint: Any = parameter_type_hint(parameter)
         deserialized_kwargs[key] = _deserialize_application_function_call_arg(
             deserializer=input_serializer,
-            arg_type_hint=param_type_hint,
+            arg_type_hint=call_plan.parameter_type_hints[key],
             serialized_arg=serialized_kwarg,
         )
 
-    # signature.parameters is an ordered mapping in parameters definition order.
-    parameters_in_definition_order: list[inspect.Parameter] = function_parameters(
-        application
-    )
+    # Parameters in definition order.
+    parameters_in_definition_order: tuple[inspect.Parameter, ...] = call_plan.parameters
     deserialized_args: list[Any | File | HttpBody] = []
     for i, serialized_arg in enumerate(serialized_args):
         if i >= len(parameters_in_definition_order):
@@ -129,11 +121,10 @@ def deserialize_application_function_call_arguments(
             # argument is used.
             continue
 
-        param_type_hint: Any = parameter_type_hint(parameter)
         deserialized_args.append(
             _deserialize_application_function_call_arg(
                 deserializer=input_serializer,
-                arg_type_hint=param_type_hint,
+                arg_type_hint=call_plan.parameter_type_hints[parameter.name],
                 serialized_arg=serialized_arg,
             )
         )
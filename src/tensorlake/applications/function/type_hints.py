@@ -1,9 +1,84 @@
 import inspect
 import pickle
-from typing import Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from ..interface import File, Function, HttpBody
 from ..interface.futures import Future
+from ..user_data_serializer import (
+    APPLICATION_FUNCTION_CALL_SERIALIZER_NAME,
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
+    UserDataSerializer,
+    serializer_by_name,
+)
+
+
+@dataclass(frozen=True)
+class FunctionCallPlan:
+    """Introspection results of a Tensorlake Function that are needed on every call of the function.
+
+    Computed once per Function by function_call_plan() and stored on the Function object.
+    """
+
+    signature: inspect.Signature
+    # Parameters in definition order. Self parameter for instance methods is not included.
+    parameters: tuple[inspect.Parameter, ...]
+    # Parameter name -> its type hint, Any if the parameter has no type hint.
+    parameter_type_hints: Mapping[str, Any]
+    # Any if the function has no return type hint.
+    return_type_hint: Any
+    application_call_input_serializer: UserDataSerializer
+    sdk_call_input_serializer: UserDataSerializer
+    # Serializer of the function outputs if the output serializer is not overridden.
+    output_serializer: UserDataSerializer
+
+
+def function_call_plan(function: Function) -> FunctionCallPlan:
+    """Returns the call plan of the provided Tensorlake Function.
+
+    The plan is computed on first use because class methods only get their configuration
+    when their class is decorated. Decorators reset the plan when they change the configuration.
+    Raises Exception if the signature cannot be obtained.
+    """
+    call_plan: FunctionCallPlan | None = function._call_plan
+    if call_plan is None:
+        # Concurrent callers might compute the same plan twice, that's harmless.
+        call_plan = _create_function_call_plan(function)
+        function._call_plan = call_plan
+    return call_plan
+
+
+def _create_function_call_plan(function: Function) -> FunctionCallPlan:
+    # Common approach to getting the function signatures.
+    signature: inspect.Signature = inspect.signature(
+        function._original_function,
+        follow_wrapped=False,
+        eval_str=False,
+    )
+    first_arg_index: int = 0 if function._function_config.class_name is None else 1
+    # signature.parameters is an ordered mapping in parameters definition order.
+    parameters: tuple[inspect.Parameter, ...] = tuple(signature.parameters.values())[
+        first_arg_index:
+    ]
+    output_serializer_name: str = (
+        SDK_FUNCTION_CALL_SERIALIZER_NAME
+        if function._application_config is None
+        else APPLICATION_FUNCTION_CALL_SERIALIZER_NAME
+    )
+    return FunctionCallPlan(
+        signature=signature,
+        parameters=parameters,
+        parameter_type_hints=MappingProxyType(
+            {parameter.name: parameter_type_hint(parameter) for parameter in parameters}
+        ),
+        return_type_hint=return_type_hint(signature.return_annotation),
+        application_call_input_serializer=serializer_by_name(
+            APPLICATION_FUNCTION_CALL_SERIALIZER_NAME
+        ),
+        sdk_call_input_serializer=serializer_by_name(SDK_FUNCTION_CALL_SERIALIZER_NAME),
+        output_serializer=serializer_by_name(output_serializer_name),
+    )
 
 
 def function_parameters(function: Function) -> list[inspect.Parameter]:
@@ -13,10 +88,7 @@ def function_parameters(function: Function) -> list[inspect.Parameter]:
     Self parameter for instance methods is not included.
     Raises Exception if the signature cannot be obtained.
     """
-    signature: inspect.Signature = function_signature(function)
-    first_arg_index: int = 0 if function._function_config.class_name is None else 1
-    # signature.parameters is an ordered mapping in parameters definition order.
-    return list(signature.parameters.values())[first_arg_index:]
+    return list(function_call_plan(function).parameters)
 
 
 def serialize_type_hint(type_hint: Any) -> bytes:
@@ -32,12 +104,7 @@ def function_signature(function: Function) -> inspect.Signature:
 
     Raises Exception if the signature cannot be obtained.
     """
-    # Common approach to getting the function signatures.
-    return inspect.signature(
-        function._original_function,
-        follow_wrapped=False,
-        eval_str=False,
-    )
+    return function_call_plan(function).signature
 
 
 def is_file_type_hint(type_hint: Any) -> bool:
@@ -3,12 +3,16 @@ from typing import Any
 from ..interface import DeserializationError, File, Function, HttpBody
 from ..metadata import ValueMetadata
 from ..user_data_serializer import (
-    APPLICATION_FUNCTION_CALL_SERIALIZER_NAME,
     SDK_FUNCTION_CALL_SERIALIZER_NAME,
     UserDataSerializer,
     serializer_by_name,
 )
-from .type_hints import is_file_type_hint, is_http_body_type_hint
+from .type_hints import (
+    FunctionCallPlan,
+    function_call_plan,
+    is_file_type_hint,
+    is_http_body_type_hint,
+)
 
 
 def function_input_serializer(function: Function, app_call: bool) -> UserDataSerializer:
@@ -17,10 +21,11 @@ def function_input_serializer(function: Function, app_call: bool) -> UserDataSer
     app_call indicates if the inputs are for a top-level application function call.
     Raises InternalError if the serializer is unknown.
     """
+    call_plan: FunctionCallPlan = function_call_plan(function)
     return (
-        serializer_by_name(APPLICATION_FUNCTION_CALL_SERIALIZER_NAME)
+        call_plan.application_call_input_serializer
         if app_call
-        else serializer_by_name(SDK_FUNCTION_CALL_SERIALIZER_NAME)
+        else call_plan.sdk_call_input_serializer
     )
 
 
@@ -33,9 +38,7 @@ def function_output_serializer(
     """
     if output_serializer_override is not None:
         return serializer_by_name(output_serializer_override)
-    if function._application_config is not None:
-        return serializer_by_name(APPLICATION_FUNCTION_CALL_SERIALIZER_NAME)
-    return serializer_by_name(SDK_FUNCTION_CALL_SERIALIZER_NAME)
+    return function_call_plan(function).output_serializer
 
 
 def serialize_value(
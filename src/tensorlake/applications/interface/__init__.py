@@ -1,6 +1,9 @@
 # Import here all public Applications SDK interfaces.
 # No imports outside of the interface Applications SDK package are allowed here.
 
+from typing import TYPE_CHECKING
+
+from tensorlake._lazy import lazy_exports
 from tensorlake.image import Image
 
 from .decorators import application, cls, function
@@ -30,9 +33,21 @@ from .request_context import (
     RequestState,
 )
 from .retries import Retries
-from .run import (
-    run_local_application,
-    run_remote_application,
+
+if TYPE_CHECKING:
+    from .run import (
+        run_local_application,
+        run_remote_application,
+    )
+
+# Running applications needs the local and remote runners and their dependencies.
+# They are only imported when used, not by every process that defines or runs functions.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "run_local_application": ".run",
+        "run_remote_application": ".run",
+    },
 )
 
 __all__ = [
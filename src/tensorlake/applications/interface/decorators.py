@@ -82,6 +82,8 @@ class _ApplicationDecorator(_Decorator):
             version=nanoid(alphabet="0123456789abcdefghijklmnopqrstuvwxyz"),
             allow=list(self._allow),
         )
+        # The call plan depends on the configuration.
+        fn._call_plan = None
 
         return fn
 
@@ -163,6 +165,8 @@ class _FunctionDecorator(_Decorator):
             min_containers=self._min_containers,
             max_containers=self._max_containers,
         )
+        # The call plan depends on the configuration.
+        fn._call_plan = None
 
         return fn
 
@@ -262,6 +266,8 @@ class _ClassDecorator(_Decorator):
                 attr._function_config.class_name = _class_name(original_class)
                 attr._function_config.class_method_name = attr_name
                 attr._function_config.class_init_timeout = self._init_timeout
+                # The call plan depends on the configuration.
+                attr._call_plan = None
 
         return original_class
 
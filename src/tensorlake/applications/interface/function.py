@@ -79,6 +79,8 @@ class Function:
         self._original_function: Callable = original_function
         self._function_config: _FunctionConfiguration | None = None
         self._application_config: _ApplicationConfiguration | None = None
+        # FunctionCallPlan computed on first use from the function and its configuration.
+        self._call_plan: Any | None = None
         self._future_factory: FunctionFutureFactory = FunctionFutureFactory(self)
         # Mimic original function if it's a regular user defined function.
         if inspect.isfunction(self._original_function):
@@ -126,7 +128,10 @@ class Function:
             return future.result()
 
     def map(
-        self, items: Iterable[Any | Future] | MapFuture
+        self,
+        items: Iterable[Any | Future] | MapFuture,
+        *,
+        batch_size: int | None = None,
     ) -> Iterable[Any] | Coroutine[Any, Any, Any]:
         """Returns an iterable with every item transformed using the function if sync function. Returns a coroutine otherwise.
 
@@ -136,11 +141,16 @@ class Function:
         Similar to https://docs.python.org/3/library/functions.html#map except all transformations
         are done in parallel.
 
+        If batch_size is set then the items are split into batches of up to batch_size items and each batch
+        is transformed by a single function call that calls the function for each of its items one by one.
+        This reduces per function call overhead for maps over many small items. The function must return
+        a value, not a Future, when used in a batched map. Function retries and timeout apply to a whole batch.
+
         Raises RequestError if the function raised RequestError.
         Raises FunctionError if the function failed.
         Raises TensorlakeError on other errors.
         """
-        future: MapFuture = self.future.map(items)
+        future: MapFuture = self.future.map(items, batch_size=batch_size)
         if inspect.iscoroutinefunction(self):
             return _wrap_future_into_coroutine(future)
         else:
@@ -152,6 +162,8 @@ class Function:
         items: Iterable[Any | Future] | MapFuture,
         initial: Any | Future | _InitialMissingType = _InitialMissing,
         /,
+        *,
+        associative: bool = False,
     ) -> Any | Coroutine[Any, Any, Any]:
         """Performs a reduce operation using the supplied function over the supplied items and returns result if sync function. Returns a coroutine otherwise.
 
@@ -160,11 +172,19 @@ class Function:
         Otherwise, blocks until the result is ready.
         Similar to https://docs.python.org/3/library/functools.html#functools.reduce.
 
+        By default the items are reduced one by one so the reduce takes len(items) sequential function calls.
+        If associative is True then the function must be associative, i.e. f(f(a, b), c) == f(a, f(b, c)).
+        The items are then reduced as a balanced tree of function calls with log2(len(items)) depth, calls at
+        the same tree level run in parallel. The order of the items is preserved so the function doesn't need
+        to be commutative.
+
         Raises RequestError if the function raised RequestError.
         Raises FunctionError if the function failed.
         Raises TensorlakeError on other errors.
         """
-        future: ReduceOperationFuture = self.future.reduce(items, initial)
+        future: ReduceOperationFuture = self.future.reduce(
+            items, initial, associative=associative
+        )
         if inspect.iscoroutinefunction(self):
             return _wrap_future_into_coroutine(future)
         else:
@@ -249,14 +269,19 @@ class FunctionFutureFactory:
         """
         return self._function._make_function_call_future(list(args), dict(kwargs))
 
-    def map(self, items: Iterable[Any | Future] | Future) -> Future:
+    def map(
+        self, items: Iterable[Any | Future] | Future, *, batch_size: int | None = None
+    ) -> Future:
         """Returns a Future that represents mapping of the function over the iterable.
 
+        See Function.map for the meaning of batch_size.
+
         Raises TensorlakeError on error.
         """
         return _make_map_operation_future(
             function_name=self._function._function_config.function_name,
             items=items,
+            batch_size=batch_size,
         )
 
     def reduce(
@@ -264,15 +289,20 @@ class FunctionFutureFactory:
         items: Iterable[Any | Future] | Future,
         initial: Any | Future | _InitialMissingType = _InitialMissing,
         /,
+        *,
+        associative: bool = False,
     ) -> Future:
         """Returns a Future that represents reducing the iterable using the function.
 
+        See Function.reduce for the meaning of associative.
+
         Raises TensorlakeError on error.
         """
         return _make_reduce_operation_future(
             function_name=self._function._function_config.function_name,
             items=items,
             initial=initial,
+            associative=associative,
         )
 
     def __repr__(self) -> str:
@@ -312,12 +312,15 @@ class MapFuture(Future):
         id: str,
         items: "list[Any | _TensorlakeFutureWrapper[Future]] | _TensorlakeFutureWrapper[Future]",
         function_name: str,
+        batch_size: int | None = None,
     ):
         super().__init__(id=id)
         # Either a user constructed list of items to map over or just a Future that resolves to a list of items to map over.
         # A future i.e. can be another map operation of a function call that produces a list.
         self._items: "list[Any | _TensorlakeFutureWrapper[Future]] | _TensorlakeFutureWrapper[Future]" = (items)
         self._function_name: str = function_name
+        # If not None then up to batch_size items are mapped by a single function call.
+        self._batch_size: int | None = batch_size
 
     def __repr__(self) -> str:
         # Shows exact structure of the Future. Used for debug logging.
@@ -328,7 +331,8 @@ class MapFuture(Future):
         return (
             f"<{type(self)}(\n"
             f"  id={self._id!r},\n"
-            f"  items=[\n    " + items_repr + "\n  ]\n"
+            f"  items=[\n    " + items_repr + "\n  ],\n"
+            f"  batch_size={self._batch_size!r}\n"
             f")>"
         )
 
@@ -339,7 +343,16 @@ def _make_map_operation_future(
         Iterable[Any | _TensorlakeFutureWrapper[Future]]
         | _TensorlakeFutureWrapper[Future]
     ),
+    batch_size: int | None = None,
 ) -> MapFuture:
+    if batch_size is not None and (
+        isinstance(batch_size, bool)
+        or not isinstance(batch_size, int)
+        or batch_size < 1
+    ):
+        raise SDKUsageError(
+            f"Map operation batch_size must be a positive integer or None, got {batch_size!r}"
+        )
     items: list[Any | Future] | Future = items
     if not isinstance(_unwrap_future(items), Future):
         items = list(items)  # should be iterable
@@ -347,6 +360,7 @@ def _make_map_operation_future(
         id=_request_scoped_id(),
         items=items,
         function_name=function_name,
+        batch_size=batch_size,
     )
 
 
@@ -400,6 +414,7 @@ class ReduceOperationFuture(Future):
             | _TensorlakeFutureWrapper[Future]
         ),
         initial: Any | _TensorlakeFutureWrapper[Future] | _InitialMissingType,
+        associative: bool = False,
     ):
         super().__init__(id=id)
         self._function_name: str = function_name
@@ -410,6 +425,8 @@ class ReduceOperationFuture(Future):
         self._initial: Any | _TensorlakeFutureWrapper[Future] | _InitialMissingType = (
             initial
         )
+        # If True then the reduce function is associative and the items are reduced as a balanced tree.
+        self._associative: bool = associative
 
     def __repr__(self) -> str:
         # Shows exact structure of the Future. Used for debug logging.
@@ -418,7 +435,8 @@ class ReduceOperationFuture(Future):
             f"  id={self._id!r},\n"
             f"  function_name={self._function_name!r},\n"
             f"  items={self._items!r},\n"
-            f"  initial={self._initial!r}\n"
+            f"  initial={self._initial!r},\n"
+            f"  associative={self._associative!r}\n"
             f")>"
         )
 
@@ -430,6 +448,7 @@ def _make_reduce_operation_future(
         | _TensorlakeFutureWrapper[Future]
     ),
     initial: Any | _TensorlakeFutureWrapper[Future] | _InitialMissingType,
+    associative: bool = False,
 ) -> ReduceOperationFuture:
     if not isinstance(_unwrap_future(items), Future):
         items = list(items)
@@ -438,6 +457,7 @@ def _make_reduce_operation_future(
         function_name=function_name,
         items=items,
         initial=initial,
+        associative=associative,
     )
 
 
@@ -32,10 +32,9 @@ class LocalFunctionCallFuture:
         return self._future_metadata
 
     @property
-    def start_time_elapsed(self) -> bool:
-        if self._start_time is None:
-            return True
-        return time.time() >= self._start_time
+    def start_time(self) -> float | None:
+        """Returns time.time() timestamp when the future should start or None if it can start immediately."""
+        return self._start_time
 
     @property
     def output_consumer_future_ids(self) -> list[str]:
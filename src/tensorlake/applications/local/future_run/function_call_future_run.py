@@ -3,7 +3,7 @@ import copy
 import inspect
 from concurrent.futures import ThreadPoolExecutor
 from queue import SimpleQueue
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ...function.function_call import (
     create_function_error,
@@ -19,16 +19,22 @@ from ...interface.futures import (
 )
 from ...interface.request_context import RequestContext
 from ...interface.retries import Retries
-from ...metadata import SPLITTER_INPUT_MODE, FunctionCallMetadata
+from ...metadata import SPLITTER_INPUT_MODE, FunctionCallMetadata, ValueMetadata
 from ...registry import get_function
 from ...request_context.contextvar import set_current_request_context
+from ...request_context.http_client.context import RequestContextHTTPClient
+from ..class_instance_store import ClassInstanceStore
 from ..future import LocalFunctionCallFuture
 from .future_run import (
     LocalFutureRun,
     LocalFutureRunResult,
+    LocalRunnerRequired,
     StopLocalFutureRun,
 )
 
+if TYPE_CHECKING:
+    from ..process_pool import LocalProcessPool
+
 
 class FunctionCallFutureRun(LocalFutureRun):
     """LocalFutureRun that runs a function call and returns its result."""
@@ -42,6 +48,7 @@ class FunctionCallFutureRun(LocalFutureRun):
         function: Function,
         class_instance: Any | None,
         request_context: RequestContext,
+        process_pool: "LocalProcessPool | None" = None,
     ):
         super().__init__(
             local_future=local_future,
@@ -53,8 +60,25 @@ class FunctionCallFutureRun(LocalFutureRun):
         self._function: Function = function
         self._class_instance: Any | None = class_instance
         self._request_context: RequestContext = request_context
+        self._process_pool: "LocalProcessPool | None" = process_pool
         self._arg_values: list[Any] | None = None
         self._kwarg_values: dict[str, Any] | None = None
+        # Set instead of the argument values when the function call runs in process pool.
+        self._arg_metadata: list[ValueMetadata] | None = None
+        self._kwarg_metadata: dict[str, ValueMetadata] | None = None
+
+    @property
+    def uses_process_pool(self) -> bool:
+        """True if the function call runs in a worker process of the local process pool.
+
+        Special function calls always run in LocalRunner threads because they create Futures.
+        """
+        metadata: FunctionCallMetadata = self._local_future.future_metadata
+        return self._process_pool is not None and not (
+            metadata.is_map_splitter
+            or metadata.is_map_concat
+            or metadata.is_reduce_splitter
+        )
 
     def start(self, arg_values: list[Any], kwarg_values: dict[str, Any]) -> None:
         """Starts the function call future run with resolved argument values.
@@ -65,9 +89,42 @@ class FunctionCallFutureRun(LocalFutureRun):
         self._kwarg_values = kwarg_values
         super().start()
 
+    def start_with_stored_args(
+        self,
+        arg_metadata: list[ValueMetadata],
+        kwarg_metadata: dict[str, ValueMetadata],
+    ) -> None:
+        """Starts the function call future run in process pool with metadata of its argument values.
+
+        The worker process reads the argument values from the value store.
+        """
+        self._arg_metadata = arg_metadata
+        self._kwarg_metadata = kwarg_metadata
+        super().start()
+
     def _run_future(self) -> LocalFutureRunResult:
         """Runs the function call and returns its result.
 
+        Flushes request state writes, metrics and progress updates buffered by the function
+        call when it finishes, like Function Executor does when an allocation finishes.
+
+        Doesn't raise any exceptions, instead returns them in LocalFutureRunResult.exception.
+        """
+        result: LocalFutureRunResult = self._run_function_call()
+        if isinstance(self._request_context, RequestContextHTTPClient):
+            try:
+                self._request_context.flush()
+            except InternalError as e:
+                return LocalFutureRunResult(
+                    id=result.id,
+                    output=None,
+                    error=create_function_error(self._local_future.future, cause=e),
+                )
+        return result
+
+    def _run_function_call(self) -> LocalFutureRunResult:
+        """Runs the function call with retries and returns its result.
+
         The function call must have all its arguments resolved (no futures among them).
         If self._class_instance is not None, it is set as the self argument of the function call.
 
@@ -76,7 +133,15 @@ class FunctionCallFutureRun(LocalFutureRun):
         Doesn't raise any exceptions, instead returns them in LocalFutureRunResult.exception.
         """
         set_current_request_context(self._request_context)
-        if self._arg_values is None or self._kwarg_values is None:
+        if self.uses_process_pool:
+            if self._arg_metadata is None or self._kwarg_metadata is None:
+                raise InternalError(
+                    "Function call future started without stored arguments"
+                )
+            # Arguments are not used in this process, the worker process reads them.
+            self._arg_values = []
+            self._kwarg_values = {}
+        elif self._arg_values is None or self._kwarg_values is None:
             raise InternalError(
                 "Function call future started without resolved arguments"
             )
@@ -121,21 +186,39 @@ class FunctionCallFutureRun(LocalFutureRun):
                             attempt_kwarg_values,
                         )
                     )
-                elif inspect.iscoroutinefunction(self._function):
-                    result: Any | _TensorlakeFutureWrapper[Future] = asyncio.run(
-                        self._function._original_function(
-                            *attempt_arg_values, **attempt_kwarg_values
-                        )
+                elif self.uses_process_pool:
+                    # Each attempt reads pristine arguments from the value store.
+                    result: Any = self._process_pool.run_function_call(
+                        function=self._function,
+                        args=self._arg_metadata,
+                        kwargs=self._kwarg_metadata,
+                        is_map_batch=metadata.is_map_batch,
+                        request_context=self._request_context,
                     )
                 else:
-                    result: Any | _TensorlakeFutureWrapper[Future] = (
-                        self._function._original_function(
-                            *attempt_arg_values, **attempt_kwarg_values
-                        )
+                    result: Any | _TensorlakeFutureWrapper[Future] = run_user_function(
+                        function=self._function,
+                        arg_values=attempt_arg_values,
+                        kwarg_values=attempt_kwarg_values,
+                        is_map_batch=metadata.is_map_batch,
                     )
                 return LocalFutureRunResult(
                     id=future._id, output=_unwrap_future(result), error=None
                 )
+            except LocalRunnerRequired:
+                # The function call uses Futures, rerun it in this thread without using a retry.
+                original_arg_values = [
+                    self._process_pool.read_value(arg_metadata)
+                    for arg_metadata in self._arg_metadata
+                ]
+                original_kwarg_values = {
+                    key: self._process_pool.read_value(kwarg_metadata)
+                    for key, kwarg_metadata in self._kwarg_metadata.items()
+                }
+                self._class_instance = ClassInstanceStore.singleton().get(
+                    self._function
+                )
+                self._process_pool = None
             except RequestError as e:
                 # Never retry on RequestError.
                 return LocalFutureRunResult(id=future._id, output=None, error=e)
@@ -164,7 +247,7 @@ class FunctionCallFutureRun(LocalFutureRun):
         if metadata.is_map_splitter:
             return self._special_function_call_map_splitter(metadata, arg_values)
         elif metadata.is_map_concat:
-            return self._special_function_call_map_concat(arg_values)
+            return self._special_function_call_map_concat(metadata, arg_values)
         elif metadata.is_reduce_splitter:
             return self._special_function_call_reduce_splitter(
                 metadata,
@@ -196,16 +279,27 @@ class FunctionCallFutureRun(LocalFutureRun):
             map_inputs = arg_values
 
         # Important: use tail calls to optimize.
-        map_futures: list[Future] = [
-            map_function.future(map_input) for map_input in map_inputs
-        ]
+        map_futures: list[Future]
+        if metadata.map_batch_size is None:
+            map_futures = [map_function.future(map_input) for map_input in map_inputs]
+        else:
+            # Each map batch function call gets a list of its map inputs as its only argument.
+            map_futures = [
+                map_function.future(map_inputs[ix : ix + metadata.map_batch_size])
+                for ix in range(0, len(map_inputs), metadata.map_batch_size)
+            ]
         # Create concat future as tail call — collects all map results into a list.
         # LocalRunner handles this special tail call.
         return self._function.future(*map_futures)
 
-    def _special_function_call_map_concat(self, arg_values: list[Any]) -> list[Any]:
+    def _special_function_call_map_concat(
+        self, metadata: FunctionCallMetadata, arg_values: list[Any]
+    ) -> list[Any]:
         """Concatenates resolved map function call results into a list."""
-        return arg_values
+        if metadata.map_batch_size is None:
+            return arg_values
+        # Each arg is a list of map batch outputs.
+        return [output for batch_outputs in arg_values for output in batch_outputs]
 
     def _special_function_call_reduce_splitter(
         self,
@@ -213,7 +307,7 @@ class FunctionCallFutureRun(LocalFutureRun):
         arg_values: list[Any],
         kwarg_values: dict[str, Any],
     ) -> Future:
-        """Splits reduce inputs into a chain of function calls."""
+        """Splits reduce inputs into a chain (or a balanced tree for associative reduce) of function calls."""
         reduce_function: Function = get_function(metadata.splitter_function_name)
         reduce_inputs: list[Any] = []
         if "initial" in kwarg_values:
@@ -236,6 +330,20 @@ class FunctionCallFutureRun(LocalFutureRun):
         if len(reduce_inputs) == 1:
             return reduce_inputs[0]
 
+        if metadata.is_associative_reduce:
+            # Reduce adjacent pairs level by level, this preserves ordering of the inputs.
+            # Important: use tail calls to optimize.
+            level: list[Any] = reduce_inputs
+            while len(level) > 1:
+                next_level: list[Any] = [
+                    reduce_function.future(level[ix], level[ix + 1])
+                    for ix in range(0, len(level) - 1, 2)
+                ]
+                if len(level) % 2 == 1:
+                    next_level.append(level[-1])
+                level = next_level
+            return level[0]
+
         # Create a chain of function calls to reduce all args one by one.
         # Ordering of calls is important here. We should reduce ["a", "b", "c", "d"]
         # using string concat function into "abcd".
@@ -247,3 +355,55 @@ class FunctionCallFutureRun(LocalFutureRun):
 
         # Important: use tail calls to optimize.
         return last_future
+
+
+def run_user_function(
+    function: Function,
+    arg_values: list[Any],
+    kwarg_values: dict[str, Any],
+    is_map_batch: bool,
+) -> Any | _TensorlakeFutureWrapper[Future]:
+    """Runs the user function with resolved argument values and returns its output.
+
+    Map batch function calls run the function for each map input of the batch.
+    Raises any exception raised by the user function.
+    """
+    if is_map_batch:
+        # Not a special function call because it runs user code and gets the self arg.
+        return _run_map_batch(function, arg_values, kwarg_values)
+    elif inspect.iscoroutinefunction(function):
+        return asyncio.run(function._original_function(*arg_values, **kwarg_values))
+    else:
+        return function._original_function(*arg_values, **kwarg_values)
+
+
+def _run_map_batch(
+    function: Function, arg_values: list[Any], kwarg_values: dict[str, Any]
+) -> list[Any]:
+    """Calls the function for each map input of the batch and returns the list of its outputs."""
+    # The last arg is the list of map inputs, the args before it are i.e. self of a method.
+    *prefix_args, map_inputs = arg_values
+    if inspect.iscoroutinefunction(function):
+
+        async def map_batch() -> list[Any]:
+            return [
+                await function._original_function(
+                    *prefix_args, map_input, **kwarg_values
+                )
+                for map_input in map_inputs
+            ]
+
+        outputs: list[Any] = asyncio.run(map_batch())
+    else:
+        outputs: list[Any] = [
+            function._original_function(*prefix_args, map_input, **kwarg_values)
+            for map_input in map_inputs
+        ]
+
+    for output in outputs:
+        if isinstance(_unwrap_future(output), Future):
+            raise SDKUsageError(
+                f"{function} returned a Future from a batched map operation, "
+                "only values can be returned from batched map operations"
+            )
+    return outputs
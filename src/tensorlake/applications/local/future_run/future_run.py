@@ -32,6 +32,16 @@ class StopLocalFutureRun(BaseException):
         super().__init__("Future run stopped")
 
 
+class LocalRunnerRequired(BaseException):
+    """Exception raised by a local worker process when a function call needs LocalRunner.
+
+    Raised when the function call creates, waits for or returns Futures. Worker processes
+    don't have access to LocalRunner so such function calls are rerun in LocalRunner threads.
+    Inherited from BaseException so that it is not caught by most exception handlers
+    i.e. in user code.
+    """
+
+
 class LocalFutureRun:
     """Abstract base class for local future runs."""
 
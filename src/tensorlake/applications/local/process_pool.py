@@ -0,0 +1,224 @@
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Set
+
+from tensorlake.applications.blob_store import BLOBStore
+from tensorlake.applications.internal_logger import InternalLogger
+from tensorlake.applications.metadata import ValueMetadata
+
+from ..function.function_call import set_self_arg
+from ..function.user_data_serializer import deserialize_value_with_metadata
+from ..interface.function import Function
+from ..interface.futures import Future, _unwrap_future
+from ..registry import get_function
+from ..request_context.contextvar import set_current_request_context
+from ..request_context.http_client.context import RequestContextHTTPClient
+from ..runtime_hooks import (
+    set_await_future_hook,
+    set_coroutine_to_future_hook,
+    set_register_coroutine_hook,
+    set_run_future_hook,
+    set_wait_futures_hook,
+)
+from .class_instance_store import ClassInstanceStore
+from .future_run.function_call_future_run import run_user_function
+from .future_run.future_run import LocalRunnerRequired
+from .value_store import SerializedValueStore
+
+# Set to "1" to run function calls in local worker processes instead of LocalRunner threads.
+LOCAL_PROCESS_POOL_ENV_VAR_NAME = "TENSORLAKE_LOCAL_PROCESS_POOL"
+
+
+def local_process_pool_enabled() -> bool:
+    return os.getenv(LOCAL_PROCESS_POOL_ENV_VAR_NAME) == "1"
+
+
+@dataclass
+class _WorkerFunctionCall:
+    function_name: str
+    # Module where the function is defined. The worker imports it to register the function.
+    function_module_name: str
+    args: List[ValueMetadata]
+    kwargs: Dict[str, ValueMetadata]
+    is_map_batch: bool
+    request_context: RequestContextHTTPClient
+
+
+class LocalProcessPool:
+    """Runs function calls in local worker processes so they are not limited by the GIL.
+
+    The pool has a worker process per CPU core. Each function call reserves its
+    function's cpu from the pool CPU budget while it runs, i.e. at most two function
+    calls of a function with cpu=4 run at the same time on an 8 core machine.
+
+    Function call arguments are read by workers from the local value store directory.
+    Function call outputs are returned to LocalRunner by the process pool. Workers
+    don't have access to LocalRunner, so a function call that calls other functions,
+    waits for Futures or returns a Future raises LocalRunnerRequired. LocalRunner reruns
+    such function call in a thread and the function doesn't run in the pool anymore.
+    This means that such function might start twice, like on a retry. Special function
+    calls (map, reduce splitters, map concat) always run in LocalRunner threads.
+    """
+
+    def __init__(self, blob_store_dir_path: str):
+        # Reads function call arguments when they are rerun in LocalRunner threads.
+        self._value_store: SerializedValueStore = _create_value_store(
+            blob_store_dir_path
+        )
+        # Names of functions that use Futures, they run in LocalRunner threads.
+        self._local_runner_function_names: Set[str] = set()
+        self._local_runner_function_names_lock: threading.Lock = threading.Lock()
+        self._cpu_count: int = os.cpu_count() or 1
+        self._free_cpu: float = float(self._cpu_count)
+        self._free_cpu_condition: threading.Condition = threading.Condition()
+        # "spawn" because forking a process with running threads is not safe.
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=self._cpu_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(blob_store_dir_path,),
+        )
+
+    def runs_function(self, function: Function) -> bool:
+        """Returns True if calls of the function should run in the pool."""
+        with self._local_runner_function_names_lock:
+            return function._name not in self._local_runner_function_names
+
+    def run_function_call(
+        self,
+        function: Function,
+        args: List[ValueMetadata],
+        kwargs: Dict[str, ValueMetadata],
+        is_map_batch: bool,
+        request_context: RequestContextHTTPClient,
+    ) -> Any:
+        """Runs the function call in a worker process and returns its output.
+
+        Blocks the calling thread until the function call CPU reservation is available
+        and the function call finishes. Raises the exception raised by the function call.
+        Raises LocalRunnerRequired if the function call needs to run in LocalRunner thread.
+        """
+        # A function that needs more CPUs than the machine has can only run alone.
+        cpu: float = min(function._function_config.cpu, float(self._cpu_count))
+        with self._free_cpu_condition:
+            while self._free_cpu < cpu:
+                self._free_cpu_condition.wait()
+            self._free_cpu -= cpu
+
+        try:
+            return self._executor.submit(
+                _run_function_call_in_worker,
+                _WorkerFunctionCall(
+                    function_name=function._name,
+                    function_module_name=function._original_function.__module__,
+                    args=args,
+                    kwargs=kwargs,
+                    is_map_batch=is_map_batch,
+                    request_context=request_context,
+                ),
+            ).result()
+        except LocalRunnerRequired:
+            with self._local_runner_function_names_lock:
+                self._local_runner_function_names.add(function._name)
+            raise
+        finally:
+            with self._free_cpu_condition:
+                self._free_cpu += cpu
+                self._free_cpu_condition.notify_all()
+
+    def shutdown(self) -> None:
+        """Cancels function calls that didn't start yet and waits for running function calls.
+
+        Doesn't raise any exceptions.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def read_value(self, metadata: ValueMetadata) -> Any:
+        """Reads a function call argument value from the value store directory."""
+        return _read_value(self._value_store, metadata)
+
+
+def _create_value_store(blob_store_dir_path: str) -> SerializedValueStore:
+    return SerializedValueStore(
+        blob_store_dir_path=blob_store_dir_path,
+        blob_store=BLOBStore(available_cpu_count=1),
+        logger=InternalLogger.get_logger().bind(module=__name__),
+    )
+
+
+# Initialized once per worker process.
+_worker_value_store: SerializedValueStore | None = None
+# Set when the running function call used a runtime hook. Each worker runs one
+# function call at a time.
+_worker_runtime_hook_used: bool = False
+
+
+def _initialize_worker(blob_store_dir_path: str) -> None:
+    global _worker_value_store
+    _worker_value_store = _create_value_store(blob_store_dir_path)
+    set_run_future_hook(_raise_local_runner_required)
+    set_await_future_hook(_raise_local_runner_required)
+    set_wait_futures_hook(_raise_local_runner_required)
+    set_register_coroutine_hook(_raise_local_runner_required)
+    set_coroutine_to_future_hook(_raise_local_runner_required)
+
+
+def _raise_local_runner_required(*args: Any, **kwargs: Any) -> None:
+    global _worker_runtime_hook_used
+    _worker_runtime_hook_used = True
+    raise LocalRunnerRequired("Function call uses Futures")
+
+
+def _run_function_call_in_worker(function_call: _WorkerFunctionCall) -> Any:
+    global _worker_runtime_hook_used
+    _worker_runtime_hook_used = False
+    # "__main__" module is imported by multiprocessing "spawn" as "__mp_main__".
+    if function_call.function_module_name != "__main__":
+        importlib.import_module(function_call.function_module_name)
+    function: Function = get_function(function_call.function_name)
+    set_current_request_context(function_call.request_context)
+
+    arg_values: List[Any] = [
+        _read_value(_worker_value_store, arg_metadata)
+        for arg_metadata in function_call.args
+    ]
+    kwarg_values: Dict[str, Any] = {
+        key: _read_value(_worker_value_store, kwarg_metadata)
+        for key, kwarg_metadata in function_call.kwargs.items()
+    }
+    # Each worker process has its own class instances, like each Function Executor does.
+    class_instance: Any | None = ClassInstanceStore.singleton().get(function)
+    if class_instance is not None:
+        set_self_arg(args=arg_values, self_instance=class_instance)
+
+    try:
+        output: Any = _unwrap_future(
+            run_user_function(
+                function=function,
+                arg_values=arg_values,
+                kwarg_values=kwarg_values,
+                is_map_batch=function_call.is_map_batch,
+            )
+        )
+    except BaseException:
+        # User code might catch LocalRunnerRequired and fail differently.
+        if _worker_runtime_hook_used:
+            raise LocalRunnerRequired("Function call uses Futures")
+        raise
+
+    if _worker_runtime_hook_used:
+        raise LocalRunnerRequired("Function call uses Futures")
+    if isinstance(output, Future):
+        raise LocalRunnerRequired("Function call returned a Future")
+    return output
+
+
+def _read_value(value_store: SerializedValueStore, metadata: ValueMetadata) -> Any:
+    return deserialize_value_with_metadata(
+        serialized_value=value_store.get_stored(metadata).data,
+        metadata=metadata,
+    )
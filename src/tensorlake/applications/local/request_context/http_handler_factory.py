@@ -69,6 +69,10 @@ class LocalRequestContextHTTPHandlerFactory:
             ),
         }
 
+    @property
+    def routes(self) -> dict[Route, Handler]:
+        return self._routes
+
     def __call__(self, *args, **kwargs) -> Router:
         # This method is called by SimpleHTTPServer to create an HTTPHandler instance.
         # The instance can be called multiple times to handle multiple requests.
@@ -1,22 +1,23 @@
 import asyncio
+import heapq
 import inspect
 import shutil
 import sys
 import tempfile
 import threading
+import time
 import weakref
 from collections.abc import Coroutine, Generator
 from concurrent.futures import ALL_COMPLETED as STD_ALL_COMPLETED
 from concurrent.futures import FIRST_COMPLETED as STD_FIRST_COMPLETED
 from concurrent.futures import FIRST_EXCEPTION as STD_FIRST_EXCEPTION
 from concurrent.futures import Future as StdFuture
-from concurrent.futures import (
-    ThreadPoolExecutor,
-)
+from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import wait as std_wait
+from dataclasses import dataclass
 from queue import Empty as QueueEmptyError
 from queue import SimpleQueue
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set
 
 from tensorlake.applications.blob_store import BLOBStore
 from tensorlake.applications.internal_logger import InternalLogger
@@ -32,10 +33,10 @@ from ..function.application_call import (
     serialize_application_function_call_arguments,
 )
 from ..function.type_hints import (
+    function_call_plan,
     function_parameters,
     function_signature,
     parameter_type_hint,
-    return_type_hint,
 )
 from ..function.user_data_serializer import (
     deserialize_value_with_metadata,
@@ -73,7 +74,11 @@ from ..metadata import (
     FunctionCallMetadata,
 )
 from ..registry import get_function
+from ..request_context.contextvar import get_current_request_context
 from ..request_context.http_client.context import RequestContextHTTPClient
+from ..request_context.http_client.metrics import RequestMetricsBatchingConfig
+from ..request_context.http_client.progress import FunctionProgressRateLimitConfig
+from ..request_context.http_client.state import RequestStateCacheConfig
 from ..request_context.http_client.transport import RequestContextHTTPTransport
 from ..request_context.http_server.server import RequestContextHTTPServer
 from ..runtime_hooks import (
@@ -89,6 +94,7 @@ from ..runtime_hooks import (
     set_wait_futures_hook,
 )
 from ..user_data_serializer import (
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
     PickleUserDataSerializer,
     UserDataSerializer,
 )
@@ -107,15 +113,23 @@ from .future_run.future_run import (
     StopLocalFutureRun,
     get_current_future_run,
 )
+from .process_pool import LocalProcessPool, local_process_pool_enabled
 from .request import LocalRequest
 from .request_context.http_handler_factory import LocalRequestContextHTTPHandlerFactory
 from .utils import print_exception
 from .value_store import SerializedValue, SerializedValueStore
 
 _LOCAL_REQUEST_ID = "local-request-id"
-# 2 ms  interval for code paths that do polling.
-# This keeps our timers very accurate and doesn't add too much latency and CPU overhead.
-_SLEEP_POLL_INTERVAL_SECONDS = 0.002
+# Max time the control loop blocks waiting for an event. Keeps the control loop
+# responsive to KeyboardInterrupt while there are no events and no timers.
+_CONTROL_LOOP_MAX_IDLE_WAIT_SECONDS = 1.0
+
+
+@dataclass
+class _FutureRunCreated:
+    """Control loop event emitted when a new future run is added to LocalRunner."""
+
+    future_run: LocalFutureRun
 
 
 # TODO: Implement Exception propagation from called function to its caller.
@@ -152,14 +166,30 @@ class LocalRunner:
         # Future runs that currently exist.
         # Future ID -> LocalFutureRun
         self._future_runs: Dict[str, LocalFutureRun] = {}
+        # Set by close(), future runs added after it are cancelled right away.
+        # Protected by the lock because future runs are added from user function threads.
+        self._closing: bool = False
+        self._future_runs_lock: threading.Lock = threading.Lock()
+        # IDs of future runs that are not finished yet. Only accessed by control loop.
+        self._unfinished_future_run_ids: Set[str] = set()
+        # Value ID -> future runs that wait for the value to get stored in value store.
+        # Only accessed by control loop.
+        self._value_dependents: Dict[str, List[LocalFutureRun]] = {}
+        # Future run ID -> number of its data dependencies not in value store yet.
+        # Only accessed by control loop.
+        self._unresolved_dependency_counts: Dict[str, int] = {}
+        # Heap of (start time, sequence number, future run) for runnable future runs
+        # with start delays. Only accessed by control loop.
+        self._delayed_future_runs: List[tuple[float, int, LocalFutureRun]] = []
+        self._delayed_future_runs_seq: int = 0
         # Exception that caused the request to fail.
         # None when request finished successfully.
         self._request_failed_exception: RequestFailed | None = None
         # Share class instances between all functions. If we don't do this then there's
         # going to be >1 instance of the same class per process.
         self._class_instance_store: ClassInstanceStore = ClassInstanceStore.singleton()
-        # SimpleQueue[LocalFutureRunResult]
-        self._future_run_result_queue: SimpleQueue = SimpleQueue()
+        # SimpleQueue[LocalFutureRunResult | _FutureRunCreated]
+        self._control_loop_event_queue: SimpleQueue = SimpleQueue()
         self._future_run_thread_pool: ThreadPoolExecutor = ThreadPoolExecutor(
             # We need to allow lots of threads at a time because user code blocks
             # on waiting for another function to complete and the chain of blocked
@@ -167,13 +197,22 @@ class LocalRunner:
             max_workers=10000,
             thread_name_prefix="LocalFutureRunner:",
         )
+        # Runs function calls in worker processes if enabled by user.
+        self._process_pool: LocalProcessPool | None = (
+            LocalProcessPool(blob_store_dir_path=self._blob_store_dir_path)
+            if local_process_pool_enabled()
+            else None
+        )
 
+        request_context_http_handler_factory: LocalRequestContextHTTPHandlerFactory = (
+            LocalRequestContextHTTPHandlerFactory(
+                blob_store_dir_path=self._blob_store_dir_path,
+                logger=self._logger,
+            )
+        )
         self._request_context_http_server: RequestContextHTTPServer = (
             RequestContextHTTPServer(
-                server_router_class=LocalRequestContextHTTPHandlerFactory(
-                    blob_store_dir_path=self._blob_store_dir_path,
-                    logger=self._logger,
-                ),
+                server_router_class=request_context_http_handler_factory,
             )
         )
         self._request_context_http_server_thread: threading.Thread = threading.Thread(
@@ -181,11 +220,26 @@ class LocalRunner:
             name="LocalRequestContextHTTPServerThread",
             daemon=True,
         )
+        # None if the request state cache is disabled.
+        self._request_state_cache_config: RequestStateCacheConfig | None = (
+            RequestStateCacheConfig.from_env()
+        )
+        # None if request metrics batching is disabled.
+        self._request_metrics_batching_config: RequestMetricsBatchingConfig | None = (
+            RequestMetricsBatchingConfig.from_env()
+        )
+        # None if function progress rate limiting is disabled.
+        self._function_progress_rate_limit_config: (
+            FunctionProgressRateLimitConfig | None
+        ) = FunctionProgressRateLimitConfig.from_env()
         # Use a single HTTP client for the whole LocalRunner. It's thread-safe.
         # It reduces resource usage and makes it easy to close just one client at the end.
+        # The server is used by user subprocesses, LocalRunner process calls the handlers directly.
         self._request_context_http_client: RequestContextHTTPTransport = (
             RequestContextHTTPClient.create_http_client(
                 server_base_url=self._request_context_http_server.base_url,
+                routes=request_context_http_handler_factory.routes,
+                logger=self._logger,
             )
         )
 
@@ -307,7 +361,6 @@ class LocalRunner:
         setup_multiprocessing()
 
         try:
-            app_signature: inspect.Signature = function_signature(self._app)
             app_function_call_future: FunctionCallFuture = self._app.future(
                 *self._app_args, **self._app_kwargs
             )
@@ -318,10 +371,11 @@ class LocalRunner:
                 future=app_function_call_future,
                 output_serializer_name_override=app_output_serializer.name,
                 has_output_type_hint_override=True,
-                output_type_hint_override=return_type_hint(
-                    app_signature.return_annotation
-                ),
+                output_type_hint_override=function_call_plan(
+                    self._app
+                ).return_type_hint,
                 is_map_concat=False,
+                map_batch_size=None,
                 parent_function_name=self._app._name,
             )
         except TensorlakeError as e:
@@ -370,9 +424,16 @@ class LocalRunner:
         Cancels all running functions and waits for them to finish.
         Doesn't raise any exceptions.
         """
-        # Future runs can be modified concurrently so iterate over a copy.
-        for fr in self._future_runs.copy().values():
+        # User function threads can still add future runs, i.e. when the request failed
+        # while the application function is running. _add_future_run cancels them.
+        with self._future_runs_lock:
+            self._closing = True
+            future_runs: List[LocalFutureRun] = list(self._future_runs.values())
+        for fr in future_runs:
             fr.cancel()
+        # Unblocks future run threads waiting for function calls in worker processes.
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
         self._future_run_thread_pool.shutdown(wait=True, cancel_futures=True)
 
         # Only shutdown the HTTP server after all function runs are stopped so
@@ -456,6 +517,10 @@ class LocalRunner:
 
         try:
             self._user_code_cancellation_point()
+            # The function calls must see request state and progress updated by the calling function.
+            request_context: Any = get_current_request_context()
+            if isinstance(request_context, RequestContextHTTPClient):
+                request_context.flush()
             # SDK automatically starts user futures that are tail calls and
             # function call or other operation inputs. This is why we walk
             # the Futures tree, not just starting the user_future.
@@ -471,6 +536,7 @@ class LocalRunner:
                     has_output_type_hint_override=False,
                     output_type_hint_override=None,
                     is_map_concat=False,
+                    map_batch_size=None,
                     parent_function_name=current_future_run.local_future.future_metadata.function_name,
                 )
         except TensorlakeError:
@@ -605,55 +671,105 @@ class LocalRunner:
         if self._request_failed_exception is not None:
             return True
 
-        if not self._future_run_result_queue.empty():
+        if not self._control_loop_event_queue.empty():
             return False
 
-        return all(fr.std_future.done() for fr in self._future_runs.values())
+        return len(self._unfinished_future_run_ids) == 0
 
     def _control_loop(self) -> None:
         # NB: any exception raised here in control loop is unexpected and means a bug in LocalRunner.
+        # The control loop is event driven. It sleeps until a future run gets created or
+        # finishes or until the next delayed future run start time.
         while not self._finished():
-            self._control_loop_start_runnable_futures()
-            # Process one future run result at a time because it takes
-            # ~_SLEEP_POLL_INTERVAL_SECONDS at most. This keeps our timers accurate enough.
-            self._control_loop_wait_and_process_future_run_result()
+            self._control_loop_start_delayed_future_runs()
+            self._control_loop_wait_and_process_event()
             if self._request_failed_exception is not None:
                 break
 
-    def _control_loop_start_runnable_futures(self) -> None:
-        # Future runs can be modified concurrently so iterate over a copy.
-        for future_run in self._future_runs.copy().values():
-            future: LocalFunctionCallFuture = future_run.local_future
-
-            if not future.start_time_elapsed:
-                continue
+    def _control_loop_start_delayed_future_runs(self) -> None:
+        now: float = time.time()
+        while (
+            len(self._delayed_future_runs) > 0
+            and self._delayed_future_runs[0][0] <= now
+        ):
+            _, _, future_run = heapq.heappop(self._delayed_future_runs)
+            self._control_loop_start_future_run(future_run)
+
+    def _control_loop_wait_and_process_event(self) -> None:
+        timeout: float = _CONTROL_LOOP_MAX_IDLE_WAIT_SECONDS
+        if len(self._delayed_future_runs) > 0:
+            timeout = min(
+                timeout, max(self._delayed_future_runs[0][0] - time.time(), 0)
+            )
 
-            if not self._future_run_data_dependencies_are_resolved(future_run):
-                continue
+        try:
+            event: LocalFutureRunResult | _FutureRunCreated = (
+                self._control_loop_event_queue.get(timeout=timeout)
+            )
+        except QueueEmptyError:
+            # No new event for now.
+            return
 
-            try:
-                self._start_future_run(future_run)
-            except TensorlakeError as e:
-                # Handle exceptions that depend on user inputs. All other exceptions are
-                # unexpected and usually mean a bug in local runner.
-                self._handle_future_run_failure(
-                    future_run=future_run,
-                    error=e,
-                )
+        if isinstance(event, _FutureRunCreated):
+            self._control_loop_process_future_run_created(event.future_run)
+            return
 
-    def _control_loop_wait_and_process_future_run_result(self) -> None:
+        future_run: LocalFutureRun = self._future_runs[event.id]
         try:
-            # Wait at most 100ms. This is the precision of function call timers.
-            result: LocalFutureRunResult = self._future_run_result_queue.get(
-                timeout=_SLEEP_POLL_INTERVAL_SECONDS
+            self._control_loop_process_future_run_result(future_run, event)
+        except TensorlakeError as e:
+            # Handle exceptions that depend on user inputs. All other exceptions are
+            # unexpected and usually mean a bug in local runner.
+            self._handle_future_run_failure(
+                future_run=future_run,
+                error=e,
             )
-        except QueueEmptyError:
-            # No new result for now.
+
+    def _control_loop_process_future_run_created(
+        self, future_run: LocalFutureRun
+    ) -> None:
+        # Future runs are only finished by the control loop after their creation
+        # events are processed because the events are processed in FIFO order.
+        future_run_id: str = future_run.local_future.future._id
+        self._unfinished_future_run_ids.add(future_run_id)
+
+        metadata: FunctionCallMetadata = future_run.local_future.future_metadata
+        missing_value_ids: Set[str] = set()
+        for arg_metadata in metadata.args:
+            if not self._value_store.has(arg_metadata.value_id):
+                missing_value_ids.add(arg_metadata.value_id)
+        for arg_metadata in metadata.kwargs.values():
+            if not self._value_store.has(arg_metadata.value_id):
+                missing_value_ids.add(arg_metadata.value_id)
+
+        if len(missing_value_ids) == 0:
+            self._control_loop_schedule_runnable_future_run(future_run)
             return
 
-        future_run: LocalFutureRun = self._future_runs[result.id]
+        self._unresolved_dependency_counts[future_run_id] = len(missing_value_ids)
+        for value_id in missing_value_ids:
+            self._value_dependents.setdefault(value_id, []).append(future_run)
+
+    def _control_loop_schedule_runnable_future_run(
+        self, future_run: LocalFutureRun
+    ) -> None:
+        """Starts the future run now or when its start delay elapses.
+
+        The future run's data dependencies must be available in value store.
+        """
+        start_time: float | None = future_run.local_future.start_time
+        if start_time is None or start_time <= time.time():
+            self._control_loop_start_future_run(future_run)
+        else:
+            heapq.heappush(
+                self._delayed_future_runs,
+                (start_time, self._delayed_future_runs_seq, future_run),
+            )
+            self._delayed_future_runs_seq += 1
+
+    def _control_loop_start_future_run(self, future_run: LocalFutureRun) -> None:
         try:
-            self._control_loop_process_future_run_result(future_run, result)
+            self._start_future_run(future_run)
         except TensorlakeError as e:
             # Handle exceptions that depend on user inputs. All other exceptions are
             # unexpected and usually mean a bug in local runner.
@@ -662,6 +778,32 @@ class LocalRunner:
                 error=e,
             )
 
+    def _put_value(self, ser_value: SerializedValue) -> None:
+        """Stores the value in value store and schedules future runs that became runnable.
+
+        Must only be called from control loop.
+        """
+        self._value_store.put(ser_value)
+        for future_run in self._value_dependents.pop(ser_value.metadata.id, []):
+            future_run_id: str = future_run.local_future.future._id
+            self._unresolved_dependency_counts[future_run_id] -= 1
+            if self._unresolved_dependency_counts[future_run_id] == 0:
+                del self._unresolved_dependency_counts[future_run_id]
+                self._control_loop_schedule_runnable_future_run(future_run)
+
+    def _add_future_run(self, future_run: LocalFutureRun) -> None:
+        """Registers the new future run and notifies control loop about it.
+
+        Can be called from any thread.
+        """
+        with self._future_runs_lock:
+            self._future_runs[future_run.local_future.future._id] = future_run
+            if self._closing:
+                # Otherwise its thread waits forever for a start that never comes.
+                future_run.cancel()
+                return
+        self._control_loop_event_queue.put(_FutureRunCreated(future_run=future_run))
+
     def _control_loop_process_future_run_result(
         self, future_run: LocalFutureRun, result: LocalFutureRunResult
     ) -> None:
@@ -708,6 +850,9 @@ class LocalRunner:
                         else None
                     ),
                     is_map_concat=metadata.is_map_splitter and is_tail_call_output,
+                    map_batch_size=(
+                        metadata.map_batch_size if metadata.is_map_splitter else None
+                    ),
                     parent_function_name=metadata.function_name,
                 )
 
@@ -735,7 +880,7 @@ class LocalRunner:
                     self._handle_future_run_failure(future_run=future_run, error=e)
                     return
 
-                self._value_store.put(ser_value)
+                self._put_value(ser_value)
                 self._handle_future_run_final_output(
                     future_run=future_run, ser_value=ser_value, error=None
                 )
@@ -772,18 +917,6 @@ class LocalRunner:
             # Consistent with remote mode, full exception trace is printed separately.
             self._request_failed_exception = RequestFailed("function_error")
 
-    def _future_run_data_dependencies_are_resolved(
-        self, future_run: LocalFutureRun
-    ) -> bool:
-        metadata: FunctionCallMetadata = future_run.local_future.future_metadata
-        for arg_metadata in metadata.args:
-            if not self._value_store.has(arg_metadata.value_id):
-                return False
-        for arg_metadata in metadata.kwargs.values():
-            if not self._value_store.has(arg_metadata.value_id):
-                return False
-        return True
-
     def _handle_future_run_final_output(
         self,
         future_run: LocalFutureRun,
@@ -815,6 +948,7 @@ class LocalRunner:
             # Finish std future so wait hooks waiting on it unblock.
             # Success/failure needs to be propagated to std future as well so std wait calls work correctly.
             future_run.finish(is_exception=error is not None)
+            self._unfinished_future_run_ids.discard(future_run.local_future.future._id)
 
             # Propagate output to consumer futures if any.
             for consumer_future_id in local_future.output_consumer_future_ids:
@@ -831,7 +965,7 @@ class LocalRunner:
                         metadata=ser_value.metadata.model_copy(),
                     )
                     consumer_future_output.metadata.id = consumer_future.future._id
-                    self._value_store.put(consumer_future_output)
+                    self._put_value(consumer_future_output)
                 future_runs.append(consumer_future_run)
                 future_ser_values.append(consumer_future_output)
 
@@ -868,7 +1002,7 @@ class LocalRunner:
                 data=source_ser_value.data,
                 metadata=consumer_ser_value_metadata,
             )
-            self._value_store.put(consumer_ser_value)
+            self._put_value(consumer_ser_value)
 
         self._handle_future_run_final_output(
             future_run=consumer,
@@ -890,6 +1024,20 @@ class LocalRunner:
     ) -> None:
         local_future: LocalFunctionCallFuture = future_run.local_future
         metadata: FunctionCallMetadata = local_future.future_metadata
+        if future_run.uses_process_pool:
+            # Worker process reads the argument values from the value store directory.
+            future_run.start_with_stored_args(
+                arg_metadata=[
+                    self._value_store.get_metadata(arg_metadata.value_id)
+                    for arg_metadata in metadata.args
+                ],
+                kwarg_metadata={
+                    kwarg_key: self._value_store.get_metadata(kwarg_metadata.value_id)
+                    for kwarg_key, kwarg_metadata in metadata.kwargs.items()
+                },
+            )
+            return
+
         arg_values: List[Any] = []
         kwarg_values: Dict[str, Any] = {}
 
@@ -911,6 +1059,7 @@ class LocalRunner:
         has_output_type_hint_override: bool,
         output_type_hint_override: Any,
         is_map_concat: bool,
+        map_batch_size: int | None,
         parent_function_name: str,
     ) -> None:
         """Creates future run for the supplied Future created by user.
@@ -919,6 +1068,8 @@ class LocalRunner:
         output_serializer_name_override is the name of the serializer to use for serializing
         the output of the future run. This is used when propagating output to consumer future when the
         consumer future expects a specific serialization format.
+        map_batch_size is the batch size of the map splitter that created the future, None if the map
+        is not batched or the future wasn't created by a map splitter.
 
         Raises TensorlakeError on error.
         """
@@ -953,6 +1104,7 @@ class LocalRunner:
                 has_output_type_hint_override=has_output_type_hint_override,
                 output_type_hint_override=output_type_hint_override,
                 is_map_concat=is_map_concat,
+                map_batch_size=map_batch_size,
             )
         else:
             raise InternalError(f"Unexpected future type: {type(future)}.")
@@ -1020,6 +1172,7 @@ class LocalRunner:
                 else SPLITTER_INPUT_MODE.ITEMS_IN_ONE_ARG
             ),
             is_map_concat=False,
+            map_batch_size=future._batch_size,
         )
 
         function_run_request_context: RequestContextHTTPClient = (
@@ -1035,18 +1188,20 @@ class LocalRunner:
             )
         )
 
-        self._future_runs[future._id] = FunctionCallFutureRun(
-            local_future=LocalFunctionCallFuture(
-                future=future,
-                future_metadata=splitter_metadata,
-                start_delay=future._start_delay,
-            ),
-            result_queue=self._future_run_result_queue,
-            thread_pool=self._future_run_thread_pool,
-            application=self._app,
-            function=parent_function,
-            class_instance=self._class_instance_store.get(parent_function),
-            request_context=function_run_request_context,
+        self._add_future_run(
+            FunctionCallFutureRun(
+                local_future=LocalFunctionCallFuture(
+                    future=future,
+                    future_metadata=splitter_metadata,
+                    start_delay=future._start_delay,
+                ),
+                result_queue=self._control_loop_event_queue,
+                thread_pool=self._future_run_thread_pool,
+                application=self._app,
+                function=parent_function,
+                class_instance=self._class_instance_store.get(parent_function),
+                request_context=function_run_request_context,
+            )
         )
 
     def _create_future_run_for_function_call(
@@ -1056,6 +1211,7 @@ class LocalRunner:
         has_output_type_hint_override: bool,
         output_type_hint_override: Any,
         is_map_concat: bool,
+        map_batch_size: int | None,
     ) -> None:
         """Creates LocalFunctionCallFutureRun for the supplied future.
 
@@ -1065,6 +1221,12 @@ class LocalRunner:
         user_input_serializer: UserDataSerializer = function_input_serializer(
             function, app_call=False
         )
+        # All Futures created by a batched map splitter except its map concat tail call are map batches.
+        is_map_batch: bool = map_batch_size is not None and not is_map_concat
+        if is_map_batch:
+            # Map batch output is a list consumed only by map concat.
+            # Always pickle it because serializers like json don't preserve types of list items.
+            output_serializer_name_override = SDK_FUNCTION_CALL_SERIALIZER_NAME
 
         metadata: FunctionCallMetadata = FunctionCallMetadata(
             id=future._id,
@@ -1079,6 +1241,8 @@ class LocalRunner:
             splitter_function_name=None,
             is_map_concat=is_map_concat,
             splitter_input_mode=None,
+            map_batch_size=map_batch_size if is_map_concat else None,
+            is_map_batch=is_map_batch,
         )
 
         # Arguments don't inherit serializer overrides because only the
@@ -1106,20 +1270,38 @@ class LocalRunner:
                 http_client=self._request_context_http_client,
                 blob_store=self._blob_store,
                 logger=self._logger,
+                request_state_cache_config=self._request_state_cache_config,
+                request_metrics_batching_config=self._request_metrics_batching_config,
+                function_progress_rate_limit_config=self._function_progress_rate_limit_config,
             )
         )
-        self._future_runs[future._id] = FunctionCallFutureRun(
-            local_future=LocalFunctionCallFuture(
-                future=future,
-                future_metadata=metadata,
-                start_delay=future._start_delay,
-            ),
-            result_queue=self._future_run_result_queue,
-            thread_pool=self._future_run_thread_pool,
-            application=self._app,
-            function=function,
-            class_instance=self._class_instance_store.get(function),
-            request_context=function_run_request_context,
+        # Functions that turned out to use Futures in worker processes run in threads.
+        process_pool: LocalProcessPool | None = (
+            self._process_pool
+            if self._process_pool is not None
+            and self._process_pool.runs_function(function)
+            else None
+        )
+        self._add_future_run(
+            FunctionCallFutureRun(
+                local_future=LocalFunctionCallFuture(
+                    future=future,
+                    future_metadata=metadata,
+                    start_delay=future._start_delay,
+                ),
+                result_queue=self._control_loop_event_queue,
+                thread_pool=self._future_run_thread_pool,
+                application=self._app,
+                function=function,
+                # Worker processes create their own class instances.
+                class_instance=(
+                    None
+                    if process_pool is not None
+                    else self._class_instance_store.get(function)
+                ),
+                request_context=function_run_request_context,
+                process_pool=process_pool,
+            )
         )
 
     def _function_arg_metadata(
@@ -1158,7 +1340,8 @@ class LocalRunner:
         """Creates FunctionCallFutureRun with is_reduce_splitter for the supplied reduce operation.
 
         The splitter waits for its inputs (and optional initial value) to resolve,
-        then creates a chain of derived FunctionCallFutures that reduce the inputs.
+        then creates a chain (or a balanced tree for associative reduce) of derived
+        FunctionCallFutures that reduce the inputs.
 
         Raises TensorlakeError on error.
         """
@@ -1214,6 +1397,7 @@ class LocalRunner:
                 else SPLITTER_INPUT_MODE.ITEMS_IN_ONE_ARG
             ),
             is_map_concat=False,
+            is_associative_reduce=future._associative,
         )
 
         for arg in splitter_args:
@@ -1237,18 +1421,20 @@ class LocalRunner:
                 logger=self._logger,
             )
         )
-        self._future_runs[future._id] = FunctionCallFutureRun(
-            local_future=LocalFunctionCallFuture(
-                future=future,
-                future_metadata=splitter_metadata,
-                start_delay=future._start_delay,
-            ),
-            result_queue=self._future_run_result_queue,
-            thread_pool=self._future_run_thread_pool,
-            application=self._app,
-            function=parent_function,
-            class_instance=self._class_instance_store.get(parent_function),
-            request_context=function_run_request_context,
+        self._add_future_run(
+            FunctionCallFutureRun(
+                local_future=LocalFunctionCallFuture(
+                    future=future,
+                    future_metadata=splitter_metadata,
+                    start_delay=future._start_delay,
+                ),
+                result_queue=self._control_loop_event_queue,
+                thread_pool=self._future_run_thread_pool,
+                application=self._app,
+                function=parent_function,
+                class_instance=self._class_instance_store.get(parent_function),
+                request_context=function_run_request_context,
+            )
         )
 
     def _check_future_run_for_user_object_exists(
@@ -68,6 +68,30 @@ class SerializedValueStore:
     def has(self, value_id: str) -> bool:
         return value_id in self._metadata
 
+    def get_metadata(self, value_id: str) -> ValueMetadata:
+        if value_id not in self._metadata:
+            raise ValueError(
+                f"SerializedValueStore get_metadata failed: value with id {value_id} does not exist."
+            )
+        return self._metadata[value_id].model_copy()
+
+    def get_stored(self, metadata: ValueMetadata) -> SerializedValue:
+        """Returns the value stored by another SerializedValueStore with the same blob store directory.
+
+        Used by processes that share the blob store directory with the process that stored the value.
+        """
+        value_size: int = self._stored_value_size(metadata.id)
+        data: bytearray = self._blob_store.get(
+            blob=self._value_blob(value_id=metadata.id, value_size=value_size),
+            offset=0,
+            size=value_size,
+            logger=self._logger,
+        )
+        return SerializedValue(
+            data=data,
+            metadata=metadata,
+        )
+
     def _stored_value_size(self, value_id: str) -> int:
         return os.path.getsize(self._value_file_path(value_id))
 
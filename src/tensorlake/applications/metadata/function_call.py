@@ -40,3 +40,14 @@ class FunctionCallMetadata(BaseModel):
     splitter_function_name: str | None
     splitter_input_mode: SPLITTER_INPUT_MODE | None
     is_map_concat: bool
+    # If True then the reduce splitter reduces its inputs as a balanced tree of reduce function calls.
+    # Has a default value because metadata pickled by older SDK versions doesn't have this field.
+    # Pickled metadata doesn't get defaults applied, so read it using getattr with a default.
+    is_associative_reduce: bool = False
+    # Map splitter: the number of map inputs per map batch function call, None if the map is not batched.
+    # Map concat: not None if its inputs are lists of map batch outputs which need to be flattened.
+    # Has a default value for the same reason as is_associative_reduce.
+    map_batch_size: int | None = None
+    # If True then the function call maps its function over a list of map inputs and returns a list of outputs.
+    # Has a default value for the same reason as is_associative_reduce.
+    is_map_batch: bool = False
@@ -19,7 +19,7 @@ def serialize_metadata(
 
 
 def deserialize_metadata(
-    data: bytes,
+    data: bytes | bytearray | memoryview,
 ) -> ValueMetadata | FunctionCallMetadata:
     try:
         return pickle.loads(data)
@@ -1,7 +1,10 @@
 import os
+import re
 import subprocess
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set
+
+from .loader import DirectoryListing, list_directory_tree
 
 
 def ignored_code_paths(root_dir: str) -> Set[str]:
@@ -86,13 +89,15 @@ def _parse_gitignore(root: Path, gitignore_path: Path) -> Set[str]:
     """Fallback .gitignore parser when git is not available.
 
     Handles the key .gitignore semantics:
-    - Leading '/' anchors to root (stripped since root.glob is already rooted)
+    - Leading '/' anchors the pattern to root
     - Trailing '/' means directory-only match
-    - Patterns without '/' match at any depth (prepend '**/')
+    - Patterns without '/' match at any depth
     - '!' negation patterns are skipped (unsupported)
     - '#' lines are comments, blank lines are ignored
+
+    All the patterns are compiled into a single matcher and the tree is walked once.
+    Paths inside ignored directories are matched too so all the matching paths are returned.
     """
-    exclude_paths = set()
     patterns = []
     with gitignore_path.open("r") as f:
         for line in f:
@@ -101,43 +106,137 @@ def _parse_gitignore(root: Path, gitignore_path: Path) -> Set[str]:
                 continue
             patterns.append(line)
 
-    for pattern in patterns:
-        # Skip negation patterns (unsupported by Path.glob)
-        if pattern.startswith("!"):
-            continue
+    matcher = _GitignoreMatcher(patterns)
+    if matcher.is_empty():
+        return set()
 
-        # Track whether the original pattern was anchored to root (had leading '/')
-        anchored = pattern.startswith("/")
+    root_path: str = os.path.abspath(root)
+    exclude_paths = set()
+    listings: Dict[str, DirectoryListing] = list_directory_tree(
+        root_path, skip_dir_path=lambda dir_path: False
+    )
+    for dir_path, listing in listings.items():
+        relative_dir_path: str = os.path.relpath(dir_path, root_path)
+        if relative_dir_path == ".":
+            relative_dir_path = ""
+        else:
+            relative_dir_path = relative_dir_path.replace(os.sep, "/") + "/"
+        for names, is_dir in ((listing.dir_names, True), (listing.file_names, False)):
+            for name in names:
+                if matcher.matches(relative_dir_path + name, is_dir):
+                    exclude_paths.add(os.path.join(dir_path, name))
 
-        # Strip leading '/' — in .gitignore it anchors the pattern to the
-        # repo root, which is already what root.glob() does.
-        pattern = pattern.lstrip("/")
+    return exclude_paths
 
-        if not pattern:
-            continue
 
-        # Determine if this is a directory-only pattern (trailing '/')
-        dir_only = pattern.endswith("/")
-        pattern = pattern.rstrip("/")
+class _GitignoreMatcher:
+    """Matches paths relative to root against .gitignore patterns with a single regular expression per path kind."""
 
-        # In .gitignore, patterns without a '/' match at any depth.
-        # Anchored patterns (had leading '/') or patterns containing '/'
-        # only match relative to root. Prepend '**/' for unanchored,
-        # slash-free patterns so Path.glob searches recursively.
-        if not anchored and "/" not in pattern:
-            glob_pattern = f"**/{pattern}"
-        else:
-            glob_pattern = pattern
+    def __init__(self, patterns: List[str]):
+        any_path_regexes: List[str] = []
+        dir_regexes: List[str] = []
+        for pattern in patterns:
+            # Skip negation patterns (unsupported)
+            if pattern.startswith("!"):
+                continue
 
-        try:
-            for match in root.glob(glob_pattern):
-                if dir_only and not match.is_dir():
-                    continue
-                if match.exists():
-                    abs_path = os.path.abspath(match)
-                    exclude_paths.add(abs_path)
-        except (NotImplementedError, ValueError):
-            # Ignore unrecognized or unsupported patterns
-            continue
+            # Track whether the original pattern was anchored to root (had leading '/')
+            anchored = pattern.startswith("/")
+            pattern = pattern.lstrip("/")
 
-    return exclude_paths
+            # Determine if this is a directory-only pattern (trailing '/')
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+
+            if not pattern:
+                continue
+
+            # In .gitignore, patterns without a '/' match at any depth.
+            # Anchored patterns (had leading '/') or patterns containing '/'
+            # only match relative to root.
+            regex: str = _gitignore_pattern_regex(pattern)
+            if not anchored and "/" not in pattern:
+                regex = "(?:.*/)?" + regex
+
+            if dir_only:
+                dir_regexes.append(regex)
+            else:
+                any_path_regexes.append(regex)
+
+        self._any_path_regex: re.Pattern | None = _compile_alternatives(
+            any_path_regexes
+        )
+        self._dir_regex: re.Pattern | None = _compile_alternatives(dir_regexes)
+
+    def is_empty(self) -> bool:
+        return self._any_path_regex is None and self._dir_regex is None
+
+    def matches(self, relative_path: str, is_dir: bool) -> bool:
+        """Returns True if the '/' separated path relative to root matches any pattern."""
+        if (
+            self._any_path_regex is not None
+            and self._any_path_regex.fullmatch(relative_path) is not None
+        ):
+            return True
+        return (
+            is_dir
+            and self._dir_regex is not None
+            and self._dir_regex.fullmatch(relative_path) is not None
+        )
+
+
+def _compile_alternatives(regexes: List[str]) -> Optional[re.Pattern]:
+    if len(regexes) == 0:
+        return None
+    return re.compile(
+        "|".join(f"(?:{regex})" for regex in regexes),
+        re.DOTALL,
+    )
+
+
+def _gitignore_pattern_regex(pattern: str) -> str:
+    """Translates a .gitignore glob pattern into a regular expression matching '/' separated paths."""
+    regex: List[str] = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            # Zero or more directories.
+            regex.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            # Everything, including '/'.
+            regex.append(".*")
+            i += 2
+        elif char == "*":
+            regex.append("[^/]*")
+            i += 1
+        elif char == "?":
+            regex.append("[^/]")
+            i += 1
+        elif char == "[":
+            class_end: int = _character_class_end(pattern, i)
+            if class_end == -1:
+                regex.append(re.escape(char))
+                i += 1
+            else:
+                members: str = pattern[i + 1 : class_end].replace("\\", "\\\\")
+                if members[0] in "!^":
+                    members = "^" + members[1:]
+                regex.append(f"[{members}]")
+                i = class_end + 1
+        else:
+            regex.append(re.escape(char))
+            i += 1
+    return "".join(regex)
+
+
+def _character_class_end(pattern: str, class_start: int) -> int:
+    """Returns index of ']' closing the character class at class_start or -1 if it's not closed."""
+    i = class_start + 1
+    if i < len(pattern) and pattern[i] in "!^":
+        i += 1
+    # ']' right after the opening '[' is a class member.
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1
+    return pattern.find("]", i)
@@ -1,8 +1,14 @@
 import importlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from types import ModuleType
-from typing import Generator, Set
+from typing import Callable, Dict, Generator, List, Set
+
+from tensorlake.utils.cache import KVCache
 
 from ...interface import InternalError
 
@@ -37,38 +43,225 @@ def load_code(application_file_path: str) -> ModuleType:
 
 # Allow soft links in code directory. This allows users to include dirs and files
 # into code directory that are not really inside the directory.
-# This might result in infinite recursion but we protect from it by checking the size of
-# the ZIP archive as we go.
+# Soft links that point at their own parent directories are not followed to prevent infinite recursion.
 _FOLLOW_LINKS = True
+_WALK_PARALLELISM = os.cpu_count() or 1
+# Coarsest file modification time granularity of common file systems (FAT).
+# A directory changed within this time of its listing can keep its modification time.
+_MTIME_GRANULARITY_NS = 2 * 1_000_000_000
+
+
+@dataclass
+class DirectoryListing:
+    # Modification time of the directory when it was listed.
+    mtime_ns: int
+    # Sorted names of files and other non directory entries.
+    file_names: List[str]
+    # Sorted names of subdirectories including soft links to directories.
+    dir_names: List[str]
+    # True if the directory was modified within the modification time granularity
+    # of its listing, like racily clean entries in git index. The directory could have
+    # changed after the listing without changing its modification time, so the listing
+    # is never reused.
+    is_racy: bool = False
+
+
+def list_directory_tree(
+    root_dir_path: str,
+    skip_dir_path: Callable[[str], bool],
+    previous_listings: Dict[str, DirectoryListing] | None = None,
+) -> Dict[str, DirectoryListing]:
+    """Returns listings of the root directory and all its subdirectories keyed by directory paths.
+
+    The directories are listed in parallel one tree level at a time. Subdirectories for which
+    skip_dir_path returns True are not listed. Directories whose modification time didn't change
+    since their previous listing are not listed again, their previous listing is reused.
+    The root directory path must be absolute.
+    """
+    listings: Dict[str, DirectoryListing] = {}
+    # Directory path -> its path with soft links resolved, used to detect soft link cycles.
+    real_paths: Dict[str, str] = {root_dir_path: os.path.realpath(root_dir_path)}
+    level: List[str] = [root_dir_path]
+    with ThreadPoolExecutor(
+        max_workers=_WALK_PARALLELISM, thread_name_prefix="CodeWalk"
+    ) as executor:
+        while len(level) > 0:
+            next_level: List[str] = []
+            for dir_path, listing in zip(
+                level,
+                executor.map(
+                    lambda dir_path: _list_directory(
+                        dir_path,
+                        (
+                            None
+                            if previous_listings is None
+                            else previous_listings.get(dir_path)
+                        ),
+                    ),
+                    level,
+                ),
+            ):
+                if listing is None:
+                    continue
+                listings[dir_path] = listing
+                for dir_name in listing.dir_names:
+                    subdir_path: str = os.path.join(dir_path, dir_name)
+                    if skip_dir_path(subdir_path):
+                        continue
+                    subdir_real_path: str | None = _subdir_real_path(
+                        real_paths[dir_path], subdir_path
+                    )
+                    if subdir_real_path is None:
+                        continue
+                    real_paths[subdir_path] = subdir_real_path
+                    next_level.append(subdir_path)
+            level = next_level
+
+    return listings
+
+
+def _list_directory(
+    dir_path: str, previous_listing: DirectoryListing | None
+) -> DirectoryListing | None:
+    """Returns listing of the directory or None if it can't be listed."""
+    try:
+        # The modification time is read before the listing so a concurrent change
+        # results in a newer modification time on the next listing.
+        mtime_ns: int = os.stat(dir_path).st_mtime_ns
+        if (
+            previous_listing is not None
+            and not previous_listing.is_racy
+            and previous_listing.mtime_ns == mtime_ns
+        ):
+            return previous_listing
+
+        file_names: List[str] = []
+        dir_names: List[str] = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                try:
+                    is_dir: bool = entry.is_dir(follow_symlinks=_FOLLOW_LINKS)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dir_names.append(entry.name)
+                else:
+                    file_names.append(entry.name)
+    except OSError:
+        # Same as os.walk which skips directories that can't be listed.
+        return None
+
+    file_names.sort()
+    dir_names.sort()
+    return DirectoryListing(
+        mtime_ns=mtime_ns,
+        file_names=file_names,
+        dir_names=dir_names,
+        is_racy=time.time_ns() - mtime_ns < _MTIME_GRANULARITY_NS,
+    )
+
+
+def _subdir_real_path(parent_real_path: str, subdir_path: str) -> str | None:
+    """Returns the subdirectory path with soft links resolved or None if walking it would never end."""
+    if not os.path.islink(subdir_path):
+        return os.path.join(parent_real_path, os.path.basename(subdir_path))
+
+    subdir_real_path: str = os.path.realpath(subdir_path)
+    if parent_real_path == subdir_real_path or parent_real_path.startswith(
+        os.path.join(subdir_real_path, "")
+    ):
+        # The soft link points at the parent directory or one of its ancestors.
+        return None
+    return subdir_real_path
 
 
 def walk_code(
-    code_dir_or_file_path: str, ignored_absolute_paths: Set[str]
+    code_dir_or_file_path: str,
+    ignored_absolute_paths: Set[str],
+    cache: KVCache | None = None,
 ) -> Generator[str, None, None]:
-    """Yields all absolute Python file paths from the code directory or just yields the supplied file path."""
+    """Yields all absolute Python file paths from the code directory or just yields the supplied file path.
+
+    The paths are yielded in the same order as os.walk with sorted directory and file names yields them.
+    If cache is set then only the directories that changed since the previous walk are listed again.
+    """
     if os.path.isfile(code_dir_or_file_path):
         if code_dir_or_file_path.endswith(".py"):
             yield os.path.abspath(code_dir_or_file_path)
         return
 
-    for dir_path, dir_names, file_names in os.walk(
-        code_dir_or_file_path, followlinks=_FOLLOW_LINKS
-    ):
-        # Prevent walking into excluded directories
-        dir_names[:] = [
-            dir_name
-            for dir_name in dir_names
-            if os.path.join(dir_path, dir_name) not in ignored_absolute_paths
-        ]
-        dir_names.sort()
-        file_names.sort()
-        for file_name in file_names:
+    code_dir_path: str = os.path.abspath(code_dir_or_file_path)
+    cache_key: str = f"walk:{code_dir_path}"
+    previous_listings: Dict[str, DirectoryListing] | None = None
+    if cache is not None:
+        previous_listings = _deserialize_listings(cache.get(cache_key))
+
+    # Prevent walking into excluded directories.
+    listings: Dict[str, DirectoryListing] = list_directory_tree(
+        code_dir_path,
+        skip_dir_path=lambda dir_path: dir_path in ignored_absolute_paths,
+        previous_listings=previous_listings,
+    )
+    if cache is not None:
+        cache.set(cache_key, _serialize_listings(listings))
+
+    dir_paths: List[str] = [code_dir_path] if code_dir_path in listings else []
+    while len(dir_paths) > 0:
+        dir_path: str = dir_paths.pop()
+        listing: DirectoryListing = listings[dir_path]
+        for file_name in listing.file_names:
             # Only include Python files.
             if not file_name.endswith(".py"):
                 continue
 
-            file_path = os.path.abspath(os.path.join(dir_path, file_name))
+            file_path: str = os.path.join(dir_path, file_name)
             if file_path in ignored_absolute_paths:
                 continue
 
             yield file_path
+
+        # Walk subdirectories depth first in their sorted order.
+        for dir_name in reversed(listing.dir_names):
+            subdir_path: str = os.path.join(dir_path, dir_name)
+            if subdir_path in listings:
+                dir_paths.append(subdir_path)
+
+
+def _serialize_listings(listings: Dict[str, DirectoryListing]) -> str:
+    # Only Python files are cached because only they are walked.
+    # Racy listings are not cached because they are never reused.
+    return json.dumps(
+        {
+            dir_path: [
+                listing.mtime_ns,
+                [
+                    file_name
+                    for file_name in listing.file_names
+                    if file_name.endswith(".py")
+                ],
+                listing.dir_names,
+            ]
+            for dir_path, listing in listings.items()
+            if not listing.is_racy
+        },
+        separators=(",", ":"),
+    )
+
+
+def _deserialize_listings(
+    serialized_listings: str | None,
+) -> Dict[str, DirectoryListing] | None:
+    if serialized_listings is None:
+        return None
+    try:
+        return {
+            dir_path: DirectoryListing(
+                mtime_ns=mtime_ns, file_names=file_names, dir_names=dir_names
+            )
+            for dir_path, (mtime_ns, file_names, dir_names) in json.loads(
+                serialized_listings
+            ).items()
+        }
+    except (ValueError, TypeError):
+        # Corrupted cache entry, walk the whole directory.
+        return None
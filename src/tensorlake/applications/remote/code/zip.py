@@ -1,14 +1,23 @@
+import hashlib
+import importlib.util
 import inspect
 import io
 import json
+import marshal
 import os
 import stat
+import struct
 import sys
 import zipfile
-from typing import Dict, List, Set
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
 
 from pydantic import BaseModel
 
+from tensorlake.utils.cache import KVCache
+
 from ...interface import Function, SDKUsageError
 from .loader import walk_code
 
@@ -34,6 +43,8 @@ CODE_ZIP_MANIFEST_FILE_NAME = ".tensorlake_code_manifest.json"
 _MAX_CODE_SIZE_BYTES = 5 * 1024 * 1024
 _CANONICAL_ZIP_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
 _CANONICAL_MANIFEST_MODE = stat.S_IFREG | 0o644
+_COMPRESS_LEVEL = 5
+_ZIP_PARALLELISM = os.cpu_count() or 1
 
 
 def _canonical_zip_info(file_name: str, mode: int) -> zipfile.ZipInfo:
@@ -45,10 +56,23 @@ def _canonical_zip_info(file_name: str, mode: int) -> zipfile.ZipInfo:
 
 
 def zip_code(
-    code_dir_path: str, ignored_absolute_paths: Set[str], all_functions: List[Function]
+    code_dir_path: str,
+    ignored_absolute_paths: Set[str],
+    all_functions: List[Function],
+    compile_bytecode: bool = False,
+    cache: KVCache | None = None,
 ) -> bytes:
     """Returns ZIP archive with all Python source files from the source code directory.
 
+    If compile_bytecode is True then each source file is also compiled by the current Python
+    interpreter and its bytecode is added to the archive next to the source file.
+    zipimport loads this bytecode instead of compiling the source file on import if the
+    importing Python version matches the current one. Otherwise it falls back to the source file.
+
+    If cache is set then compressed ZIP entries are stored in it keyed by the source file content hash.
+    Files that didn't change since the previous call are not read, hashed or compressed again.
+    The returned archive is the same with and without the cache.
+
     Raises SDKUsageError if failed to create the ZIP archive due to code directory issues.
     Raises Exception on other errors.
     """
@@ -63,78 +87,357 @@ def zip_code(
             code_zip_manifest=code_zip_manifest,
             code_dir_path=code_dir_path,
             ignored_absolute_paths=ignored_absolute_paths,
+            compile_bytecode=compile_bytecode,
+            cache=cache,
         )
         return zip_buffer.getvalue()
     finally:
         _save_zip_for_debugging(zip_buffer)
 
 
+@dataclass
+class _CodeFile:
+    path: str
+    path_inside_code_dir: str
+    stat: os.stat_result
+
+
+@dataclass
+class _ZIPEntry:
+    file_name: str
+    mode: int
+    crc: int
+    file_size: int
+    compressed_data: bytes
+
+
 def _zip_code(
     zip_buffer: io.BytesIO,
     code_zip_manifest: CodeZIPManifest,
     code_dir_path: str,
     ignored_absolute_paths: Set[str],
+    compile_bytecode: bool,
+    cache: KVCache | None,
 ) -> None:
     """Zips the code directory and writes it to the ZIP buffer.
 
     Raises SDKUsageError if failed to create the ZIP archive due to code directory issues.
     Raises Exception on other errors.
     """
-    zip_code_size: int = 0
-    zip_infos: List[zipfile.ZipInfo] = []
-
-    with zipfile.ZipFile(
-        zip_buffer,
-        "w",
-        compression=zipfile.ZIP_DEFLATED,
-        allowZip64=False,
-        compresslevel=5,
-    ) as zipf:
-        manifest_json = json.dumps(
-            code_zip_manifest.model_dump(mode="json"),
-            sort_keys=True,
-            separators=(",", ":"),
+    manifest_json = json.dumps(
+        code_zip_manifest.model_dump(mode="json"),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    zip_entries: List[_ZIPEntry] = [
+        _compress_zip_entry(
+            CODE_ZIP_MANIFEST_FILE_NAME,
+            _CANONICAL_MANIFEST_MODE,
+            manifest_json.encode("utf-8"),
         )
-        zipf.writestr(
-            _canonical_zip_info(
-                CODE_ZIP_MANIFEST_FILE_NAME,
-                _CANONICAL_MANIFEST_MODE,
-            ),
-            manifest_json,
-            compress_type=zipfile.ZIP_DEFLATED,
-            compresslevel=5,
+    ]
+    # Stat, reading, hashing and compressing release GIL so the files are processed in parallel.
+    with ThreadPoolExecutor(
+        max_workers=_ZIP_PARALLELISM, thread_name_prefix="CodeZIP"
+    ) as executor:
+        file_paths: List[str] = list(
+            walk_code(code_dir_path, ignored_absolute_paths, cache=cache)
         )
-        for file_path in walk_code(code_dir_path, ignored_absolute_paths):
+        code_files: List[_CodeFile] = []
+        zip_code_size: int = 0
+        for file_path, file_stat in zip(file_paths, executor.map(os.stat, file_paths)):
             # The file is added to the ZIP archive with its original rwx/rwx/rwx permissions.
             # When unzipping the files owner and group are set to the current process uid, gid.
             # We need to check that file owner has read access on the file so the unzipping process
             # can load and run them.
-            file_stat = os.stat(file_path)
             if not (file_stat.st_mode & stat.S_IRUSR):
                 raise SDKUsageError(
                     f"Application code file {file_path} is not readable by its owner. "
                     "Please change the file permissions."
                 )
 
-            file_path_inside_code_dir = os.path.relpath(file_path, code_dir_path)
-            with open(file_path, "rb") as source_file:
-                zipf.writestr(
-                    _canonical_zip_info(
-                        file_path_inside_code_dir,
-                        file_stat.st_mode,
-                    ),
-                    source_file.read(),
-                    compress_type=zipfile.ZIP_DEFLATED,
-                    compresslevel=5,
+            code_files.append(
+                _CodeFile(
+                    path=file_path,
+                    path_inside_code_dir=os.path.relpath(file_path, code_dir_path),
+                    stat=file_stat,
                 )
-            zip_infos.append(zipf.getinfo(file_path_inside_code_dir))
+            )
             zip_code_size += file_stat.st_size
-            # Check code size after adding each file to the ZIP archive to prevent infinite
-            # recursion because we allow soft links in the code directory for users' convenience.
-            _check_code_size(zip_code_size, zip_infos)
+            # We allow soft links in the code directory for users' convenience so it can
+            # include much more code than users expect.
+            _check_code_size(zip_code_size, code_files)
+
+        for code_file_entries in executor.map(
+            lambda code_file: _code_file_zip_entries(
+                code_file, compile_bytecode, cache
+            ),
+            code_files,
+        ):
+            zip_entries.extend(code_file_entries)
+
+    _write_zip(zip_buffer, zip_entries)
+
+
+def _code_file_zip_entries(
+    code_file: _CodeFile, compile_bytecode: bool, cache: KVCache | None
+) -> List[_ZIPEntry]:
+    """Returns ZIP entries of the code file, using the cached ones if the file didn't change."""
+    # The content hash is looked up by file metadata so unchanged files are not even read.
+    stat_key: str = ":".join(
+        str(part)
+        for part in (
+            "stat",
+            code_file.path,
+            code_file.stat.st_ino,
+            code_file.stat.st_size,
+            code_file.stat.st_mtime_ns,
+            code_file.stat.st_ctime_ns,
+        )
+    )
+    sha256: str | None = None if cache is None else cache.get(stat_key)
+    if sha256 is not None:
+        cached_entries: List[_ZIPEntry] | None = _cached_zip_entries(
+            code_file, sha256, compile_bytecode, cache
+        )
+        if cached_entries is not None:
+            return cached_entries
+
+    with open(code_file.path, "rb") as source_file:
+        source: bytes = source_file.read()
+    sha256 = hashlib.sha256(source).hexdigest()
+
+    source_entry: _ZIPEntry = _compress_zip_entry(
+        code_file.path_inside_code_dir, code_file.stat.st_mode, source
+    )
+    entries: List[_ZIPEntry] = [source_entry]
+    if cache is not None:
+        cache.set_bytes(_source_cache_key(sha256), _pack_cached_entry(source_entry))
+
+    if compile_bytecode:
+        bytecode_entry: _ZIPEntry | None = None
+        bytecode: bytes | None = _compile_bytecode(
+            source, code_file.path_inside_code_dir
+        )
+        if bytecode is not None:
+            # zipimport only looks for legacy "foo.pyc" files next to "foo.py" files,
+            # not for __pycache__ directories.
+            bytecode_entry = _compress_zip_entry(
+                code_file.path_inside_code_dir + "c",
+                _CANONICAL_MANIFEST_MODE,
+                bytecode,
+            )
+            entries.append(bytecode_entry)
+        if cache is not None:
+            cache.set_bytes(
+                _bytecode_cache_key(sha256, code_file.path_inside_code_dir),
+                (
+                    _NO_BYTECODE
+                    if bytecode_entry is None
+                    else _pack_cached_entry(bytecode_entry)
+                ),
+            )
+
+    if cache is not None:
+        cache.set(stat_key, sha256)
+    return entries
+
+
+def _cached_zip_entries(
+    code_file: _CodeFile, sha256: str, compile_bytecode: bool, cache: KVCache
+) -> List[_ZIPEntry] | None:
+    """Returns ZIP entries of the code file with the supplied content hash or None if any is not cached."""
+    source_entry: _ZIPEntry | None = _unpack_cached_entry(
+        cache.get_bytes(_source_cache_key(sha256)),
+        file_name=code_file.path_inside_code_dir,
+        mode=code_file.stat.st_mode,
+    )
+    if source_entry is None:
+        return None
+    entries: List[_ZIPEntry] = [source_entry]
+
+    if compile_bytecode:
+        cached_bytecode: bytes | None = cache.get_bytes(
+            _bytecode_cache_key(sha256, code_file.path_inside_code_dir)
+        )
+        if cached_bytecode != _NO_BYTECODE:
+            bytecode_entry: _ZIPEntry | None = _unpack_cached_entry(
+                cached_bytecode,
+                file_name=code_file.path_inside_code_dir + "c",
+                mode=_CANONICAL_MANIFEST_MODE,
+            )
+            if bytecode_entry is None:
+                return None
+            entries.append(bytecode_entry)
+
+    return entries
+
+
+def _source_cache_key(sha256: str) -> str:
+    return f"source:{_COMPRESS_LEVEL}:{sha256}"
+
+
+def _bytecode_cache_key(sha256: str, file_path_inside_code_dir: str) -> str:
+    # Bytecode depends on the Python version and on the file path recorded in the code objects.
+    return ":".join(
+        (
+            "bytecode",
+            importlib.util.MAGIC_NUMBER.hex(),
+            str(_COMPRESS_LEVEL),
+            file_path_inside_code_dir,
+            sha256,
+        )
+    )
+
+
+# Cached value of files that don't compile.
+_NO_BYTECODE: bytes = b""
+# CRC32 and uncompressed size of the cached ZIP entry.
+_CACHED_ENTRY_HEADER = struct.Struct("<II")
+
+
+def _pack_cached_entry(zip_entry: _ZIPEntry) -> bytes:
+    return (
+        _CACHED_ENTRY_HEADER.pack(zip_entry.crc, zip_entry.file_size)
+        + zip_entry.compressed_data
+    )
+
+
+def _unpack_cached_entry(
+    cached_entry: bytes | None, file_name: str, mode: int
+) -> _ZIPEntry | None:
+    if cached_entry is None or len(cached_entry) < _CACHED_ENTRY_HEADER.size:
+        return None
+    crc, file_size = _CACHED_ENTRY_HEADER.unpack_from(cached_entry)
+    return _ZIPEntry(
+        file_name=file_name,
+        mode=mode,
+        crc=crc,
+        file_size=file_size,
+        compressed_data=cached_entry[_CACHED_ENTRY_HEADER.size :],
+    )
 
 
-def _check_code_size(app_code_size: int, zip_infos: List[zipfile.ZipInfo]) -> None:
+def _compress_zip_entry(file_name: str, mode: int, data: bytes) -> _ZIPEntry:
+    # Raw deflate stream, the same as zipfile writes for ZIP_DEFLATED entries.
+    compressor = zlib.compressobj(_COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    return _ZIPEntry(
+        file_name=file_name,
+        mode=mode,
+        crc=zlib.crc32(data),
+        file_size=len(data),
+        compressed_data=compressor.compress(data) + compressor.flush(),
+    )
+
+
+def _write_zip(zip_buffer: io.BytesIO, zip_entries: List[_ZIPEntry]) -> None:
+    """Writes ZIP archive with the already compressed entries to the ZIP buffer.
+
+    zipfile can't add already compressed data so the archive records are written here.
+    The archive is byte for byte the same as zipfile writes for the same entries.
+    """
+    zip_infos: List[zipfile.ZipInfo] = []
+    for zip_entry in zip_entries:
+        zip_info = _canonical_zip_info(zip_entry.file_name, zip_entry.mode)
+        zip_info.CRC = zip_entry.crc
+        zip_info.file_size = zip_entry.file_size
+        zip_info.compress_size = len(zip_entry.compressed_data)
+        zip_info.header_offset = zip_buffer.tell()
+        zip_buffer.write(zip_info.FileHeader(zip64=False))
+        zip_buffer.write(zip_entry.compressed_data)
+        zip_infos.append(zip_info)
+
+    central_dir_offset: int = zip_buffer.tell()
+    for zip_info in zip_infos:
+        file_name, flag_bits = _encode_zip_file_name(zip_info.filename)
+        dosdate, dostime = _dos_date_time(zip_info.date_time)
+        zip_buffer.write(
+            _ZIP_CENTRAL_DIR.pack(
+                b"PK\001\002",
+                zip_info.create_version,
+                zip_info.create_system,
+                zip_info.extract_version,
+                zip_info.reserved,
+                flag_bits,
+                zip_info.compress_type,
+                dostime,
+                dosdate,
+                zip_info.CRC,
+                zip_info.compress_size,
+                zip_info.file_size,
+                len(file_name),
+                0,
+                0,
+                0,
+                zip_info.internal_attr,
+                zip_info.external_attr,
+                zip_info.header_offset,
+            )
+        )
+        zip_buffer.write(file_name)
+
+    central_dir_size: int = zip_buffer.tell() - central_dir_offset
+    zip_buffer.write(
+        _ZIP_END_OF_CENTRAL_DIR.pack(
+            b"PK\005\006",
+            0,
+            0,
+            len(zip_infos),
+            len(zip_infos),
+            central_dir_size,
+            central_dir_offset,
+            0,
+        )
+    )
+
+
+_ZIP_CENTRAL_DIR = struct.Struct("<4s4B4HL2L5H2L")
+_ZIP_END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+
+
+def _encode_zip_file_name(file_name: str) -> Tuple[bytes, int]:
+    try:
+        return file_name.encode("ascii"), 0
+    except UnicodeEncodeError:
+        # Language encoding flag: the file name is UTF-8.
+        return file_name.encode("utf-8"), 0x800
+
+
+def _dos_date_time(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    dosdate: int = (date_time[0] - 1980) << 9 | date_time[1] << 5 | date_time[2]
+    dostime: int = date_time[3] << 11 | date_time[4] << 5 | (date_time[5] // 2)
+    return dosdate, dostime
+
+
+def _compile_bytecode(source: bytes, file_path_inside_code_dir: str) -> bytes | None:
+    """Returns .pyc file content for the source file or None if it can't be compiled.
+
+    The bytecode is validated using the source file hash (PEP 552) instead of the source file
+    modification time because the ZIP archive has canonical timestamps.
+    Files that fail to compile are left for the importing Python version to report.
+    """
+    try:
+        code = compile(
+            source,
+            file_path_inside_code_dir,
+            "exec",
+            dont_inherit=True,
+            optimize=0,
+        )
+    except (SyntaxError, ValueError):
+        return None
+
+    # Header flags: hash based (0b01), check source (0b10).
+    flags: bytes = (0b11).to_bytes(4, "little")
+    return (
+        importlib.util.MAGIC_NUMBER
+        + flags
+        + importlib.util.source_hash(source)
+        + marshal.dumps(code)
+    )
+
+
+def _check_code_size(app_code_size: int, code_files: List[_CodeFile]) -> None:
     """Checks if the size of the application code is less than _MAX_APPLICATION_CODE_SIZE_BYTES.
 
     If the size is greater than _MAX_APPLICATION_CODE_SIZE_BYTES, raises a SDKUsageError.
@@ -143,8 +446,11 @@ def _check_code_size(app_code_size: int, zip_infos: List[zipfile.ZipInfo]) -> No
         return
 
     print(f"Application code ZIP archive content:", file=sys.stderr)
-    for zip_info in zip_infos:
-        print(f"  {zip_info.filename}: {zip_info.file_size} bytes", file=sys.stderr)
+    for code_file in code_files:
+        print(
+            f"  {code_file.path_inside_code_dir}: {code_file.stat.st_size} bytes",
+            file=sys.stderr,
+        )
     raise SDKUsageError(
         f"Application code size {app_code_size / 1024 / 1024} MB exceeds maximum size {_MAX_CODE_SIZE_BYTES / 1024/ 1024} MB. "
         "Please check the application code ZIP archive content above to see if anything unexpected is included."
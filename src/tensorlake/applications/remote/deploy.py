@@ -2,9 +2,10 @@ import os
 from typing import List, Set
 
 from tensorlake.public_endpoint import generate_public_endpoint_id
+from tensorlake.utils.cache import KVCache
 
 from ..applications import filter_applications
-from ..interface.exceptions import RemoteAPIError
+from ..interface.exceptions import RemoteAPIError, SDKUsageError
 from ..interface.function import Function
 from ..registry import get_functions
 from ..remote.manifests.application import (
@@ -17,6 +18,25 @@ from .code.zip import zip_code
 from .images import prepare_application_images
 
 _UNAUTHENTICATED_REQUESTS = "unauthenticated_requests"
+# Size limit of the local cache of compressed code ZIP entries, "0" disables the cache.
+_CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME = "TENSORLAKE_CODE_ZIP_CACHE_SIZE_MB"
+_DEFAULT_CODE_ZIP_CACHE_SIZE_MB = 512
+
+
+def _code_zip_cache_max_bytes() -> int:
+    value: str = os.getenv(
+        _CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME, str(_DEFAULT_CODE_ZIP_CACHE_SIZE_MB)
+    )
+    try:
+        size_mb: int = int(value)
+    except ValueError:
+        size_mb = -1
+    if size_mb < 0:
+        raise SDKUsageError(
+            f"{_CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME} must be a non-negative number "
+            f"of megabytes, got {value!r}"
+        )
+    return size_mb * 1024 * 1024
 
 
 def _existing_public_endpoint_id(api_client, application_name: str) -> str | None:
@@ -60,6 +80,7 @@ def deploy_applications(
     load_source_dir_modules: bool = False,
     api_client=None,
     function_images: dict[tuple[str, str], str] | None = None,
+    compile_bytecode: bool = False,
 ) -> None:
     """Deploys all applications in the supplied .py file so they are runnable in remote mode (i.e. on Tensorlake Cloud).
 
@@ -70,6 +91,12 @@ def deploy_applications(
                                Should be set to True when called from CLI, False when called programmatically from test code
                                because applications in test code are already loaded into registry.
     `api_client` is a CloudClient or APIClient for deployment. If not supplied, a new CloudClient will be created from environment.
+    `compile_bytecode` indicates whether to add bytecode compiled by the current Python interpreter to the code ZIP archive.
+                       Speeds up function container cold starts running the same Python version.
+
+    Compressed code ZIP entries are cached in ~/.tensorlake/cache so only changed files are compressed again
+    on repeated deploys. TENSORLAKE_CODE_ZIP_CACHE_SIZE_MB sets the cache size limit, "0" disables the cache.
+    The whole code ZIP archive is still uploaded on every deploy.
 
     Raises SDKUsageError if the client configuration is not valid for the operation.
     Raises TensorlakeError on other errors.
@@ -93,11 +120,21 @@ def deploy_applications(
             functions,
             context_dir=applications_dir_path,
         )
+    code_zip_cache_max_bytes: int = _code_zip_cache_max_bytes()
+    code_zip_cache: KVCache | None = (
+        KVCache("code_zip") if code_zip_cache_max_bytes > 0 else None
+    )
     app_code: bytes = zip_code(
         code_dir_path=applications_dir_path,
         ignored_absolute_paths=ignored_absolute_paths,
         all_functions=functions,
+        compile_bytecode=compile_bytecode,
+        # Only changed files are compressed again on repeated deploys.
+        cache=code_zip_cache,
     )
+    if code_zip_cache is not None:
+        # Entries of changed and deleted files are never read again.
+        code_zip_cache.evict(max_bytes=code_zip_cache_max_bytes)
 
     should_close = False
     if api_client is None:
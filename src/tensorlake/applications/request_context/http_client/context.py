@@ -13,9 +13,12 @@ from ...interface.request_context import (
     RequestMetrics,
     RequestState,
 )
-from .metrics import RequestMetricsHTTPClient
-from .progress import FunctionProgressHTTPClient
-from .state import RequestStateHTTPClient
+from ..http_server.handlers.handler import Handler
+from ..http_server.route import Route
+from .in_process_transport import RequestContextInProcessTransport
+from .metrics import RequestMetricsBatchingConfig, RequestMetricsHTTPClient
+from .progress import FunctionProgressHTTPClient, FunctionProgressRateLimitConfig
+from .state import RequestStateCacheConfig, RequestStateHTTPClient
 from .transport import RequestContextHTTPTransport
 
 _DEFAULT_HTTP_REQUEST_TIMEOUT_SEC: float = 300.0
@@ -38,6 +41,11 @@ class RequestContextHTTPClient(RequestContext):
         blob_store: BLOBStore,
         logger: InternalLogger,
         headers: dict[str, str] | list[tuple[str, str]] | Headers | None = None,
+        request_state_cache_config: RequestStateCacheConfig | None = None,
+        request_metrics_batching_config: RequestMetricsBatchingConfig | None = None,
+        function_progress_rate_limit_config: (
+            FunctionProgressRateLimitConfig | None
+        ) = None,
     ):
         self._request_id: str = request_id
         self._allocation_id: str = allocation_id
@@ -54,6 +62,7 @@ class RequestContextHTTPClient(RequestContext):
             http_client=http_client,
             blob_store=self._blob_store,
             logger=self._logger,
+            cache_config=request_state_cache_config,
         )
         self._progress: FunctionProgressHTTPClient = FunctionProgressHTTPClient(
             request_id=request_id,
@@ -61,17 +70,29 @@ class RequestContextHTTPClient(RequestContext):
             function_name=function_name,
             function_run_id=function_run_id,
             http_client=http_client,
+            rate_limit_config=function_progress_rate_limit_config,
         )
         self._metrics: RequestMetricsHTTPClient = RequestMetricsHTTPClient(
             request_id=request_id,
             allocation_id=allocation_id,
             function_name=function_name,
             http_client=http_client,
+            batching_config=request_metrics_batching_config,
         )
 
     @classmethod
-    def create_http_client(cls, server_base_url: str) -> RequestContextHTTPTransport:
-        """Creates an HTTP client for use in RequestContextHTTPClient."""
+    def create_http_client(
+        cls,
+        server_base_url: str,
+        routes: dict[Route, Handler] | None = None,
+        logger: InternalLogger | None = None,
+    ) -> RequestContextHTTPTransport:
+        """Creates an HTTP client for use in RequestContextHTTPClient.
+
+        If the routes of the request context server are provided then the client calls
+        their handlers directly in the current process instead of sending HTTP requests
+        to the server. The logger is required in this case.
+        """
 
         def _inject_headers(request: httpx.Request) -> None:
             request.headers["traceparent"] = generate_traceparent()
@@ -82,12 +103,20 @@ class RequestContextHTTPClient(RequestContext):
             timeout=_DEFAULT_HTTP_REQUEST_TIMEOUT_SEC,
             base_url=server_base_url,
             event_hooks={"request": [_inject_headers]},
+            transport=(
+                None
+                if routes is None
+                else RequestContextInProcessTransport(routes=routes, logger=logger)
+            ),
         )
 
     def __getstate__(self):
         """Get the state for pickling."""
         # This is called when user creates a new subprocess to capture the request ctx client state.
         # When a user creates a new child thread, this is not called.
+        # Request state cache, metrics batching and progress rate limiting configs are not
+        # pickled. Updates buffered in a subprocess would be lost because only the allocation's
+        # own request context is flushed when it finishes.
         return {
             "request_id": self._request_id,
             "allocation_id": self._allocation_id,
@@ -117,6 +146,15 @@ class RequestContextHTTPClient(RequestContext):
             headers=state.get("headers"),
         )
 
+    def flush(self) -> None:
+        """Sends request state writes, metrics and progress updates buffered by the allocation.
+
+        Called when the allocation finishes. Raises InternalError on error.
+        """
+        self._state.flush()
+        self._metrics.flush()
+        self._progress.flush()
+
     @property
     def request_id(self) -> str:
         return self._request_id
@@ -0,0 +1,50 @@
+import httpx
+
+from tensorlake.applications.internal_logger import InternalLogger
+
+from ..http_server.handlers.handler import Handler, Request, Response
+from ..http_server.route import Route
+
+
+class RequestContextInProcessTransport(httpx.BaseTransport):
+    """httpx transport that runs request context handlers in the calling thread.
+
+    Used by request context clients living in the same process as the request context
+    server. Skips the loopback TCP connection, the server thread per connection and HTTP
+    parsing done by the server. The handlers return the same responses as they return
+    when called by the server. Subprocesses use the server because they don't have the handlers.
+    """
+
+    def __init__(self, routes: dict[Route, Handler], logger: InternalLogger):
+        self._routes: dict[Route, Handler] = routes
+        self._logger: InternalLogger = logger.bind(module=__name__)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        handler: Handler | None = self._routes.get(
+            Route(verb=request.method, path=request.url.path)
+        )
+        if handler is None:
+            self._logger.error(
+                "No handler found", verb=request.method, path=request.url.path
+            )
+            return httpx.Response(status_code=404)
+
+        try:
+            response: Response = handler.handle(
+                Request(
+                    method=request.method,
+                    path=request.url.path,
+                    headers=dict(request.headers),
+                    body=request.read(),
+                )
+            )
+        except Exception as e:
+            message: str = f"Internal Server Error: {e}"
+            self._logger.error(message, exc_info=e)
+            return httpx.Response(status_code=500, content=message.encode("utf-8"))
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=response.body,
+        )
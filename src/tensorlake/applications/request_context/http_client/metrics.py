@@ -1,4 +1,9 @@
 import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List
 
 import httpx
 
@@ -10,9 +15,44 @@ from ..http_server.handlers.add_metrics import (
     AddCounterRequest,
     AddMetricsRequest,
     AddTimerRequest,
+    AddTimerValuesRequest,
 )
 from .transport import RequestContextHTTPTransport
 
+# Set to "1" to batch request metrics of an allocation.
+REQUEST_METRICS_BATCHING_ENV_VAR_NAME = "TENSORLAKE_REQUEST_METRICS_BATCHING"
+REQUEST_METRICS_FLUSH_INTERVAL_SEC_ENV_VAR_NAME = (
+    "TENSORLAKE_REQUEST_METRICS_FLUSH_INTERVAL_SEC"
+)
+
+
+@dataclass
+class RequestMetricsBatchingConfig:
+    """Configuration of request metrics batching.
+
+    With batching, counters are summed per name and timer values are buffered per name
+    in memory. The buffered metrics are sent in a single request when the allocation
+    finishes, before the allocation starts function calls, when max_buffered_values
+    metric values are buffered or when a metric is recorded flush_interval_sec after
+    the oldest buffered value. Buffered metrics are lost if the Function Executor crashes.
+    """
+
+    flush_interval_sec: float = 1.0
+    max_buffered_values: int = 1000
+
+    @classmethod
+    def from_env(cls) -> "RequestMetricsBatchingConfig | None":
+        """Returns the batching config set in environment variables or None if batching is disabled."""
+        if os.getenv(REQUEST_METRICS_BATCHING_ENV_VAR_NAME) != "1":
+            return None
+        config: RequestMetricsBatchingConfig = RequestMetricsBatchingConfig()
+        flush_interval_sec: str | None = os.getenv(
+            REQUEST_METRICS_FLUSH_INTERVAL_SEC_ENV_VAR_NAME
+        )
+        if flush_interval_sec is not None:
+            config.flush_interval_sec = float(flush_interval_sec)
+        return config
+
 
 class RequestMetricsHTTPClient(RequestMetrics):
     """HTTP client for accessing request metrics in subprocesses and child threads.
@@ -26,11 +66,27 @@ class RequestMetricsHTTPClient(RequestMetrics):
         allocation_id: str,
         function_name: str,
         http_client: RequestContextHTTPTransport,
+        batching_config: RequestMetricsBatchingConfig | None = None,
     ):
         self._request_id: str = request_id
         self._allocation_id: str = allocation_id
         self._function_name: str = function_name
         self._http_client: RequestContextHTTPTransport = http_client
+        # None if batching is disabled.
+        self._batching_config: RequestMetricsBatchingConfig | None = batching_config
+        self._buffer_lock: threading.Lock = threading.Lock()
+        # Serializes flushes so metrics are sent in the order they were recorded.
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._buffered_counters: Dict[str, int] = {}
+        self._buffered_timers: Dict[str, List[int | float]] = {}
+        self._buffered_values_count: int = 0
+        self._oldest_buffered_value_time: float | None = None
+        self._flushes: int = 0
+
+    @property
+    def flushes(self) -> int:
+        """Number of requests that sent batched metrics."""
+        return self._flushes
 
     def timer(self, name: str, value: int | float):
         # If we don't validate user supplied inputs here then there will be a Pydantic validation error
@@ -44,6 +100,13 @@ class RequestMetricsHTTPClient(RequestMetrics):
         ):
             raise SDKUsageError(f"Timer value must be a finite number, got: {value}")
 
+        if self._batching_config is not None:
+            with self._buffer_lock:
+                self._buffered_timers.setdefault(name, []).append(value)
+                self._on_value_buffered()
+            self._flush_if_threshold_reached()
+            return
+
         request_payload: AddMetricsRequest = AddMetricsRequest(
             request_id=self._request_id,
             allocation_id=self._allocation_id,
@@ -61,6 +124,15 @@ class RequestMetricsHTTPClient(RequestMetrics):
         if isinstance(value, bool) or not isinstance(value, int):
             raise SDKUsageError(f"Counter value must be an int, got: {value}")
 
+        if self._batching_config is not None:
+            with self._buffer_lock:
+                self._buffered_counters[name] = (
+                    self._buffered_counters.get(name, 0) + value
+                )
+                self._on_value_buffered()
+            self._flush_if_threshold_reached()
+            return
+
         request_payload: AddMetricsRequest = AddMetricsRequest(
             request_id=self._request_id,
             allocation_id=self._allocation_id,
@@ -70,6 +142,61 @@ class RequestMetricsHTTPClient(RequestMetrics):
         )
         self._run_add_request(request_payload)
 
+    def flush(self) -> None:
+        """Sends all buffered metrics in a single request.
+
+        Called when the allocation finishes. Does nothing if batching is disabled.
+        Raises InternalError on error.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                counters: Dict[str, int] = self._buffered_counters
+                timers: Dict[str, List[int | float]] = self._buffered_timers
+                self._buffered_counters = {}
+                self._buffered_timers = {}
+                self._buffered_values_count = 0
+                self._oldest_buffered_value_time = None
+            if len(counters) == 0 and len(timers) == 0:
+                return
+
+            self._run_add_request(
+                AddMetricsRequest(
+                    request_id=self._request_id,
+                    allocation_id=self._allocation_id,
+                    function_name=self._function_name,
+                    timer=None,
+                    counter=None,
+                    timers=[
+                        AddTimerValuesRequest(name=name, values=values)
+                        for name, values in timers.items()
+                    ],
+                    counters=[
+                        AddCounterRequest(name=name, value=value)
+                        for name, value in counters.items()
+                    ],
+                )
+            )
+            self._flushes += 1
+
+    def _on_value_buffered(self) -> None:
+        # Must be called with self._buffer_lock held.
+        self._buffered_values_count += 1
+        if self._oldest_buffered_value_time is None:
+            self._oldest_buffered_value_time = time.monotonic()
+
+    def _flush_if_threshold_reached(self) -> None:
+        with self._buffer_lock:
+            threshold_reached: bool = (
+                self._buffered_values_count >= self._batching_config.max_buffered_values
+                or (
+                    self._oldest_buffered_value_time is not None
+                    and time.monotonic() - self._oldest_buffered_value_time
+                    >= self._batching_config.flush_interval_sec
+                )
+            )
+        if threshold_reached:
+            self.flush()
+
     def _run_add_request(self, request_payload: AddMetricsRequest) -> None:
         try:
             request: httpx.Request = self._http_client.build_request(
@@ -1,4 +1,8 @@
 import math
+import os
+import threading
+import time
+from dataclasses import dataclass
 
 import httpx
 
@@ -11,6 +15,37 @@ from ..http_server.handlers.progress_update import (
 )
 from .transport import RequestContextHTTPTransport
 
+# Minimal interval between progress updates sent by an allocation, enables progress update rate limiting.
+FUNCTION_PROGRESS_MIN_UPDATE_INTERVAL_SEC_ENV_VAR_NAME = (
+    "TENSORLAKE_FUNCTION_PROGRESS_MIN_UPDATE_INTERVAL_SEC"
+)
+
+
+@dataclass
+class FunctionProgressRateLimitConfig:
+    """Configuration of function progress update rate limiting.
+
+    With rate limiting, a progress update is sent only if the previous one was sent at
+    least min_update_interval_sec ago. Otherwise the update is kept in memory and replaces
+    the previous kept update. The kept update is sent by the next progress update made after
+    the interval, before the allocation starts function calls or when it finishes. Messages
+    of replaced progress updates are not printed.
+    """
+
+    min_update_interval_sec: float
+
+    @classmethod
+    def from_env(cls) -> "FunctionProgressRateLimitConfig | None":
+        """Returns the rate limit config set in environment variables or None if rate limiting is disabled."""
+        min_update_interval_sec: str | None = os.getenv(
+            FUNCTION_PROGRESS_MIN_UPDATE_INTERVAL_SEC_ENV_VAR_NAME
+        )
+        if min_update_interval_sec is None:
+            return None
+        return FunctionProgressRateLimitConfig(
+            min_update_interval_sec=float(min_update_interval_sec)
+        )
+
 
 def _is_non_negative_finite_number(value: object) -> bool:
     if isinstance(value, bool) or not isinstance(value, (int, float)):
@@ -37,12 +72,27 @@ class FunctionProgressHTTPClient(FunctionProgress):
         function_name: str,
         function_run_id: str,
         http_client: RequestContextHTTPTransport,
+        rate_limit_config: FunctionProgressRateLimitConfig | None = None,
     ):
         self._request_id: str = request_id
         self._allocation_id: str = allocation_id
         self._function_name: str = function_name
         self._function_run_id: str = function_run_id
         self._http_client: RequestContextHTTPTransport = http_client
+        # None if rate limiting is disabled.
+        self._rate_limit_config: FunctionProgressRateLimitConfig | None = (
+            rate_limit_config
+        )
+        # Serializes sending progress updates so the latest update is sent last.
+        self._send_lock: threading.Lock = threading.Lock()
+        self._pending_update: FunctionProgressUpdateRequest | None = None
+        self._last_update_sent_at: float | None = None
+        self._sent_updates: int = 0
+
+    @property
+    def sent_updates(self) -> int:
+        """Number of progress updates sent to the server."""
+        return self._sent_updates
 
     def update(
         self,
@@ -83,9 +133,41 @@ class FunctionProgressHTTPClient(FunctionProgress):
                     current=current,
                     total=total,
                     message=message,
-                    attributes=attributes,
+                    # Copy because user code might modify the dict before the update is sent.
+                    attributes=None if attributes is None else dict(attributes),
                 )
             )
+        except Exception as e:
+            raise InternalError(
+                f"Failed to update function progress via HTTP: {e}"
+            ) from e
+
+        with self._send_lock:
+            if self._rate_limit_config is not None and (
+                self._last_update_sent_at is not None
+                and time.monotonic() - self._last_update_sent_at
+                < self._rate_limit_config.min_update_interval_sec
+            ):
+                self._pending_update = request_payload
+                return
+            self._pending_update = None
+            self._send_update(request_payload)
+
+    def flush(self) -> None:
+        """Sends the latest progress update delayed by rate limiting.
+
+        Called when the allocation finishes. Raises InternalError on error.
+        """
+        with self._send_lock:
+            if self._pending_update is None:
+                return
+            pending_update: FunctionProgressUpdateRequest = self._pending_update
+            self._pending_update = None
+            self._send_update(pending_update)
+
+    def _send_update(self, request_payload: FunctionProgressUpdateRequest) -> None:
+        # Must be called with self._send_lock held.
+        try:
             request: httpx.Request = self._http_client.build_request(
                 PROGRESS_UPDATE_VERB,
                 url=PROGRESS_UPDATE_PATH,
@@ -97,6 +179,8 @@ class FunctionProgressHTTPClient(FunctionProgress):
             raise InternalError(
                 f"Failed to update function progress via HTTP: {e}"
             ) from e
+        self._last_update_sent_at = time.monotonic()
+        self._sent_updates += 1
 
     def __getstate__(self):
         raise SDKUsageError("Pickling of FunctionProgressHTTPClient is not supported.")
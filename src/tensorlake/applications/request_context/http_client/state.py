@@ -1,4 +1,8 @@
-from typing import Any
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
 
 import httpx
 
@@ -29,6 +33,70 @@ from ..http_server.handlers.request_state.prepare_write import (
 )
 from .transport import RequestContextHTTPTransport
 
+# Set to "1" to enable the per-allocation request state cache.
+REQUEST_STATE_CACHE_ENV_VAR_NAME = "TENSORLAKE_REQUEST_STATE_CACHE"
+REQUEST_STATE_CACHE_MAX_BUFFERED_BYTES_ENV_VAR_NAME = (
+    "TENSORLAKE_REQUEST_STATE_CACHE_MAX_BUFFERED_BYTES"
+)
+REQUEST_STATE_CACHE_MAX_BUFFER_AGE_SEC_ENV_VAR_NAME = (
+    "TENSORLAKE_REQUEST_STATE_CACHE_MAX_BUFFER_AGE_SEC"
+)
+
+
+@dataclass
+class RequestStateCacheConfig:
+    """Configuration of the per-allocation request state cache.
+
+    With the cache, a value read or written by the allocation is served from memory
+    on the next reads of its key. Writes are buffered and coalesced per key. Buffered
+    writes are flushed when the allocation finishes, before the allocation starts function
+    calls, when the buffered values size reaches max_buffered_bytes or when a request state
+    operation happens max_buffer_age_sec after the oldest buffered write.
+
+    Durability: a buffered write is durable only after it's flushed. The allocation
+    doesn't finish until its buffered writes are flushed, if the flush fails then the
+    allocation fails with an internal error. If the Function Executor crashes then the
+    buffered writes are lost, the allocation is retried and it writes the values again.
+    Visibility: function calls started by the allocation see all its writes, other running
+    allocations of the request don't see buffered writes, and the cache doesn't see writes
+    done by other allocations after the allocation read the key.
+    Replay: request state is not part of the allocation event history, replayed function
+    calls read the current request state as before.
+    """
+
+    max_buffered_bytes: int = 1024 * 1024
+    max_buffer_age_sec: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "RequestStateCacheConfig | None":
+        """Returns the cache config set in environment variables or None if the cache is disabled."""
+        if os.getenv(REQUEST_STATE_CACHE_ENV_VAR_NAME) != "1":
+            return None
+        config: RequestStateCacheConfig = RequestStateCacheConfig()
+        max_buffered_bytes: str | None = os.getenv(
+            REQUEST_STATE_CACHE_MAX_BUFFERED_BYTES_ENV_VAR_NAME
+        )
+        if max_buffered_bytes is not None:
+            config.max_buffered_bytes = int(max_buffered_bytes)
+        max_buffer_age_sec: str | None = os.getenv(
+            REQUEST_STATE_CACHE_MAX_BUFFER_AGE_SEC_ENV_VAR_NAME
+        )
+        if max_buffer_age_sec is not None:
+            config.max_buffer_age_sec = float(max_buffer_age_sec)
+        return config
+
+
+@dataclass
+class RequestStateCacheStats:
+    # Gets served from the cache.
+    hits: int = 0
+    # Gets that read the value from request state.
+    misses: int = 0
+    # Flushes of buffered writes.
+    flushes: int = 0
+    # Values written to request state by the flushes.
+    flushed_values: int = 0
+
 
 class RequestStateHTTPClient(RequestState):
     """HTTP client for accessing request state in subprocesses and child threads.
@@ -43,12 +111,30 @@ class RequestStateHTTPClient(RequestState):
         http_client: RequestContextHTTPTransport,
         blob_store: BLOBStore,
         logger: InternalLogger,
+        cache_config: RequestStateCacheConfig | None = None,
     ):
         self._request_id: str = request_id
         self._allocation_id: str = allocation_id
         self._http_client: RequestContextHTTPTransport = http_client
         self._blob_store: BLOBStore = blob_store
         self._logger: InternalLogger = logger.bind(module=__name__)
+        # None if the cache is disabled.
+        self._cache_config: RequestStateCacheConfig | None = cache_config
+        self._cache_stats: RequestStateCacheStats = RequestStateCacheStats()
+        self._cache_lock: threading.Lock = threading.Lock()
+        # Serializes flushes so values of the same key are written in order.
+        self._flush_lock: threading.Lock = threading.Lock()
+        # Key -> serialized value, None if the key doesn't exist in request state.
+        self._cached_values: Dict[str, bytes | None] = {}
+        # Key -> serialized value, writes that are not flushed yet.
+        self._buffered_writes: Dict[str, bytes] = {}
+        self._buffered_bytes: int = 0
+        self._oldest_buffered_write_time: float | None = None
+
+    @property
+    def cache_stats(self) -> RequestStateCacheStats:
+        with self._cache_lock:
+            return RequestStateCacheStats(**self._cache_stats.__dict__)
 
     def set(self, key: str, value: Any) -> None:
         # NB: This is called from user code, user code is blocked.
@@ -63,14 +149,13 @@ class RequestStateHTTPClient(RequestState):
             value, type_hint=None  # Type hint is not used with pickle
         )
 
+        if self._cache_config is not None:
+            self._buffer_write(key, serialized_value)
+            self._flush_if_threshold_reached()
+            return
+
         try:
-            blob: BLOB = self._get_writeable_blob(key=key, size=len(serialized_value))
-            uploaded_blob: BLOB = self._blob_store.put(
-                blob=blob,
-                data=[serialized_value],
-                logger=self._logger,
-            )
-            self._commit_writeable_blob(key=key, blob=uploaded_blob)
+            self._write(key, serialized_value)
         except Exception as e:
             self._logger.error(
                 "Failed to set request state",
@@ -88,15 +173,19 @@ class RequestStateHTTPClient(RequestState):
         if not isinstance(key, str):
             raise SDKUsageError(f"State key must be a string, got: {key}")
 
-        try:
-            blob: BLOB | None = self._get_read_only_blob(key=key)
-            if blob is None:
-                return default
+        if self._cache_config is not None:
+            self._flush_if_threshold_reached()
+            with self._cache_lock:
+                if key in self._cached_values:
+                    self._cache_stats.hits += 1
+                    serialized_value: bytes | bytearray | None = self._cached_values[
+                        key
+                    ]
+                    return self._deserialize(serialized_value, default)
+                self._cache_stats.misses += 1
 
-            size: int = sum(chunk.size for chunk in blob.chunks)
-            serialized_value: bytearray = self._blob_store.get(
-                blob=blob, offset=0, size=size, logger=self._logger
-            )
+        try:
+            serialized_value: bytearray | None = self._read(key)
         except Exception as e:
             self._logger.error(
                 "Failed to get request state",
@@ -105,12 +194,102 @@ class RequestStateHTTPClient(RequestState):
             )
             raise InternalError(f"Failed to get request state for key '{key}'.")
 
+        if self._cache_config is not None:
+            with self._cache_lock:
+                # Don't overwrite a value written by another thread while we were reading.
+                self._cached_values.setdefault(
+                    key, None if serialized_value is None else bytes(serialized_value)
+                )
+
+        return self._deserialize(serialized_value, default)
+
+    def flush(self) -> None:
+        """Writes all buffered request state writes to request state.
+
+        Called when the allocation finishes. Does nothing if the cache is disabled.
+        Raises InternalError on error.
+        """
+        if self._cache_config is None:
+            return
+
+        with self._flush_lock:
+            with self._cache_lock:
+                buffered_writes: Dict[str, bytes] = self._buffered_writes
+                self._buffered_writes = {}
+                self._buffered_bytes = 0
+                self._oldest_buffered_write_time = None
+            if len(buffered_writes) == 0:
+                return
+
+            for key, serialized_value in buffered_writes.items():
+                try:
+                    self._write(key, serialized_value)
+                except Exception as e:
+                    self._logger.error(
+                        "Failed to flush request state",
+                        exc_info=e,
+                        key=key,
+                    )
+                    raise InternalError(f"Failed to set request state for key '{key}'.")
+
+            with self._cache_lock:
+                self._cache_stats.flushes += 1
+                self._cache_stats.flushed_values += len(buffered_writes)
+
+    def _buffer_write(self, key: str, serialized_value: bytes) -> None:
+        with self._cache_lock:
+            self._cached_values[key] = serialized_value
+            previous_value: bytes | None = self._buffered_writes.pop(key, None)
+            if previous_value is not None:
+                self._buffered_bytes -= len(previous_value)
+            # Re-insert to keep the dict ordered by the last write time.
+            self._buffered_writes[key] = serialized_value
+            self._buffered_bytes += len(serialized_value)
+            if self._oldest_buffered_write_time is None:
+                self._oldest_buffered_write_time = time.monotonic()
+
+    def _flush_if_threshold_reached(self) -> None:
+        with self._cache_lock:
+            threshold_reached: bool = (
+                self._buffered_bytes >= self._cache_config.max_buffered_bytes
+                or (
+                    self._oldest_buffered_write_time is not None
+                    and time.monotonic() - self._oldest_buffered_write_time
+                    >= self._cache_config.max_buffer_age_sec
+                )
+            )
+        if threshold_reached:
+            self.flush()
+
+    def _deserialize(
+        self, serialized_value: bytes | bytearray | None, default: Any | None
+    ) -> Any | None:
+        if serialized_value is None:
+            return default
         # Raises SerializationError to customer code on failure.
         # Just pass some type hint because pickle doesn't use it anyway.
         return REQUEST_STATE_USER_DATA_SERIALIZER.deserialize(
             serialized_value, type_hint=type(default)
         )
 
+    def _read(self, key: str) -> bytearray | None:
+        """Returns the serialized value of the key or None if the key doesn't exist."""
+        blob: BLOB | None = self._get_read_only_blob(key=key)
+        if blob is None:
+            return None
+
+        size: int = sum(chunk.size for chunk in blob.chunks)
+        return self._blob_store.get(blob=blob, offset=0, size=size, logger=self._logger)
+
+    def _write(self, key: str, serialized_value: bytes) -> None:
+        blob: BLOB = self._get_writeable_blob(key=key, size=len(serialized_value))
+        uploaded_blob: BLOB = self._blob_store.put(
+            blob=blob,
+            data=[serialized_value],
+            logger=self._logger,
+        )
+        self._commit_writeable_blob(key=key, blob=uploaded_blob)
+
     def _get_read_only_blob(self, key: str) -> BLOB | None:
         request_payload: PrepareReadRequest = PrepareReadRequest(
             request_id=self._request_id,
@@ -11,6 +11,11 @@ class AddTimerRequest(BaseModel):
     value: int | float
 
 
+class AddTimerValuesRequest(BaseModel):
+    name: str
+    values: list[int | float]
+
+
 class AddCounterRequest(BaseModel):
     name: str
     value: int
@@ -22,6 +27,25 @@ class AddMetricsRequest(BaseModel):
     function_name: str
     timer: AddTimerRequest | None
     counter: AddCounterRequest | None
+    # Batched metrics, counters with the same name are summed.
+    timers: list[AddTimerValuesRequest] = []
+    counters: list[AddCounterRequest] = []
+
+    def all_counters(self) -> list[AddCounterRequest]:
+        """Returns the batched counters and the single counter if set."""
+        counters: list[AddCounterRequest] = list(self.counters)
+        if self.counter is not None:
+            counters.append(self.counter)
+        return counters
+
+    def all_timers(self) -> list[AddTimerValuesRequest]:
+        """Returns the batched timers and the single timer value if set."""
+        timers: list[AddTimerValuesRequest] = list(self.timers)
+        if self.timer is not None:
+            timers.append(
+                AddTimerValuesRequest(name=self.timer.name, values=[self.timer.value])
+            )
+        return timers
 
 
 class AddMetricsResponse(BaseModel):
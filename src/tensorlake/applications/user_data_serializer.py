@@ -1,4 +1,9 @@
+import os
 import pickle
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 import pydantic
@@ -23,7 +28,13 @@ APPLICATION_FUNCTION_CALL_SERIALIZER_NAME: str = "json"
 # different Python versions. This allows users to not care about serialization
 # format used between non-application (internal/SDK) function calls. This is why we use it
 # for all non-application (internal/SDK) functions.
-SDK_FUNCTION_CALL_SERIALIZER_NAME: str = "pickle"
+#
+# Setting TENSORLAKE_ZERO_COPY_PICKLE=1 opts into zero copy pickle serializer that stores large
+# buffers out-of-band. It's opt-in because SDK versions that don't have the serializer can't
+# deserialize values serialized with it.
+SDK_FUNCTION_CALL_SERIALIZER_NAME: str = (
+    "pickle_oob" if os.getenv("TENSORLAKE_ZERO_COPY_PICKLE") == "1" else "pickle"
+)
 
 
 class UserDataSerializer:
@@ -80,6 +91,112 @@ def create_type_adapter(type_hint: Any) -> pydantic.TypeAdapter:
     return pydantic.TypeAdapter(type_hint)
 
 
+@dataclass(frozen=True)
+class TypeAdapterCacheInfo:
+    hits: int
+    misses: int
+    # Number of lookups for type hints that can't be used as cache keys.
+    unhashable: int
+    size: int
+    max_size: int
+
+
+class _TypeAdapterCache:
+    """Bounded thread-safe LRU cache of Pydantic TypeAdapters keyed by type hint.
+
+    Creating a TypeAdapter builds a Pydantic core schema for the type hint.
+    This is much more expensive than validating or dumping a typical value
+    so we reuse the adapters between serializer calls.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size: int = max_size
+        # Type hint => TypeAdapter, least recently used first.
+        self._adapters: OrderedDict[Any, pydantic.TypeAdapter] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._unhashable: int = 0
+
+    def get(self, type_hint: Any) -> pydantic.TypeAdapter:
+        """Returns a TypeAdapter for the given type hint, creating it on cache miss.
+
+        Raises an Exception generated by Pydantic as is if the type hint
+        is not supported by Pydantic.
+        """
+        try:
+            hash(type_hint)
+        except TypeError:
+            # i.e. Annotated[...] with unhashable metadata. Such type hints are rare
+            # so we don't cache them instead of keying them by identity which is unsafe
+            # for short lived type hint objects.
+            with self._lock:
+                self._unhashable += 1
+            return create_type_adapter(type_hint)
+
+        with self._lock:
+            adapter: pydantic.TypeAdapter | None = self._adapters.get(type_hint)
+            if adapter is not None:
+                self._adapters.move_to_end(type_hint)
+                self._hits += 1
+                return adapter
+            self._misses += 1
+
+        # Don't hold the lock while building the schema because this can take a while.
+        # Concurrent misses for the same type hint might build the adapter more than once
+        # which is harmless.
+        adapter = create_type_adapter(type_hint)
+        with self._lock:
+            self._adapters[type_hint] = adapter
+            self._adapters.move_to_end(type_hint)
+            while len(self._adapters) > self._max_size:
+                self._adapters.popitem(last=False)
+        return adapter
+
+    def info(self) -> TypeAdapterCacheInfo:
+        with self._lock:
+            return TypeAdapterCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                unhashable=self._unhashable,
+                size=len(self._adapters),
+                max_size=self._max_size,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._adapters.clear()
+            self._hits = 0
+            self._misses = 0
+            self._unhashable = 0
+
+
+# Applications rarely use more than a few dozens of distinct type hints.
+_TYPE_ADAPTER_CACHE_MAX_SIZE: int = 1024
+_type_adapter_cache: _TypeAdapterCache = _TypeAdapterCache(
+    max_size=_TYPE_ADAPTER_CACHE_MAX_SIZE
+)
+
+
+def cached_type_adapter(type_hint: Any) -> pydantic.TypeAdapter:
+    """Returns a shared Pydantic TypeAdapter for the given type hint.
+
+    Raises an Exception generated by Pydantic as is if the type hint
+    is not supported by Pydantic.
+    """
+    return _type_adapter_cache.get(type_hint)
+
+
+def type_adapter_cache_info() -> TypeAdapterCacheInfo:
+    """Returns hit/miss statistics of the shared TypeAdapter cache."""
+    return _type_adapter_cache.info()
+
+
+def clear_type_adapter_cache() -> None:
+    """Removes all cached TypeAdapters and resets the cache statistics."""
+    _type_adapter_cache.clear()
+
+
 def generate_json_schema(type_adapter: pydantic.TypeAdapter) -> dict[str, Any]:
     """Generates a JSON schema for the given Pydantic TypeAdapter.
 
@@ -118,7 +235,7 @@ class JSONUserDataSerializer(UserDataSerializer):
 
     def serialize(self, object: Any, type_hint: Any) -> bytes:
         try:
-            adapter: pydantic.TypeAdapter = create_type_adapter(type_hint)
+            adapter: pydantic.TypeAdapter = cached_type_adapter(type_hint)
             # i.e. converts a dict into a Pydantic model instance if type_hint includes
             # a Pydantic model that matches the dict.
             validated_obj: Any = adapter.validate_python(object)
@@ -134,7 +251,7 @@ class JSONUserDataSerializer(UserDataSerializer):
             data: bytes | bytearray = data.tobytes()
 
         try:
-            return create_type_adapter(type_hint).validate_json(data)
+            return cached_type_adapter(type_hint).validate_json(data)
         except Exception as e:
             raise DeserializationError(
                 f"Failed to deserialize data '{data}' as '{type_hint}' with json serializer: {e}"
@@ -184,6 +301,106 @@ class PickleUserDataSerializer(UserDataSerializer):
             ) from e
 
 
+class ZeroCopyPickleUserDataSerializer(PickleUserDataSerializer):
+    """A pickle serializer that stores large buffers out-of-band and deserializes them without copying.
+
+    Uses pickle protocol 5 out-of-band buffers, i.e. numpy arrays, Pandas DataFrames, PickleBuffers.
+    The serialized data layout is:
+    * Header: pickle stream size, out-of-band buffers count, size of each buffer.
+    * Pickle stream.
+    * Each out-of-band buffer, padded to a multiple of _BUFFER_ALIGNMENT bytes from data beginning.
+
+    On deserialization the out-of-band buffers are passed to pickle as memoryviews of the
+    deserialized data. So i.e. a numpy array shares memory with the downloaded data instead
+    of being copied out of it. The deserialized objects are writable if the data is writable.
+
+    The buffers are only aligned in memory if the data itself starts at an aligned address.
+    This is not the case i.e. when the data follows value metadata in a downloaded BLOB.
+    Numpy supports unaligned arrays, operations on them might be slower.
+    """
+
+    NAME = "pickle_oob"
+    CONTENT_TYPE = "application/python-pickle-oob"
+    # Smaller buffers are stored inside the pickle stream because they are cheap to copy.
+    _OUT_OF_BAND_BUFFER_MIN_SIZE: int = 64 * 1024
+    # Cache line size, also satisfies alignment requirements of all numpy dtypes
+    # if the serialized data starts at an aligned address.
+    _BUFFER_ALIGNMENT: int = 64
+    # pickle stream size, out-of-band buffers count.
+    _HEADER_FORMAT: str = "<QI"
+    _BUFFER_SIZE_FORMAT: str = "<Q"
+
+    def serialize(self, object: Any, type_hint: Any) -> bytes:
+        out_of_band_buffers: list[memoryview] = []
+
+        def buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            # Returning True serializes the buffer inside the pickle stream.
+            try:
+                raw_buffer: memoryview = buffer.raw()
+            except BufferError:
+                # Non-contiguous buffer.
+                return True
+            if raw_buffer.nbytes < self._OUT_OF_BAND_BUFFER_MIN_SIZE:
+                return True
+            out_of_band_buffers.append(raw_buffer)
+            return False
+
+        try:
+            pickled: bytes = pickle.dumps(
+                object,
+                protocol=self._PROTOCOL_LEVEL,
+                buffer_callback=buffer_callback,
+            )
+        except Exception as e:
+            raise SerializationError(
+                f"Failed to serialize data with pickle serializer: {e}"
+            ) from e
+
+        parts: list[bytes | memoryview] = [
+            struct.pack(self._HEADER_FORMAT, len(pickled), len(out_of_band_buffers))
+        ]
+        for buffer in out_of_band_buffers:
+            parts.append(struct.pack(self._BUFFER_SIZE_FORMAT, buffer.nbytes))
+        parts.append(pickled)
+        size: int = sum(len(part) for part in parts)
+        for buffer in out_of_band_buffers:
+            padding_size: int = -size % self._BUFFER_ALIGNMENT
+            parts.append(b"\0" * padding_size)
+            parts.append(buffer)
+            size += padding_size + buffer.nbytes
+
+        # Each out-of-band buffer gets copied exactly once like with in-band pickling.
+        return b"".join(parts)
+
+    def deserialize(self, data: bytearray | bytes | memoryview, type_hint: Any) -> Any:
+        try:
+            data_view: memoryview = memoryview(data).cast("B")
+            pickle_size, buffers_count = struct.unpack_from(
+                self._HEADER_FORMAT, data_view, 0
+            )
+            offset: int = struct.calcsize(self._HEADER_FORMAT)
+            buffer_sizes: list[int] = []
+            for _ in range(buffers_count):
+                buffer_sizes.append(
+                    struct.unpack_from(self._BUFFER_SIZE_FORMAT, data_view, offset)[0]
+                )
+                offset += struct.calcsize(self._BUFFER_SIZE_FORMAT)
+
+            pickled: memoryview = data_view[offset : offset + pickle_size]
+            offset += pickle_size
+            buffers: list[memoryview] = []
+            for buffer_size in buffer_sizes:
+                offset += -offset % self._BUFFER_ALIGNMENT
+                buffers.append(data_view[offset : offset + buffer_size])
+                offset += buffer_size
+
+            return pickle.loads(pickled, buffers=buffers)
+        except Exception as e:
+            raise DeserializationError(
+                f"Failed to deserialize data with pickle serializer: {e}"
+            ) from e
+
+
 def serializer_by_name(serializer_name: str) -> UserDataSerializer:
     """Returns the UserDataSerializer instance for the given serializer name.
 
@@ -192,6 +409,8 @@ def serializer_by_name(serializer_name: str) -> UserDataSerializer:
     """
     if serializer_name == PickleUserDataSerializer.NAME:
         return PickleUserDataSerializer()
+    elif serializer_name == ZeroCopyPickleUserDataSerializer.NAME:
+        return ZeroCopyPickleUserDataSerializer()
     elif serializer_name == JSONUserDataSerializer.NAME:
         return JSONUserDataSerializer()
     # We're validating application serializers on app deployment so this should never happen.
@@ -143,6 +143,7 @@ def deploy(
     application_file_path: str,
     upgrade_running_requests: bool,
     build_envs: list[tuple[str, str]] | None = None,
+    compile_bytecode: bool = False,
 ):
     """Deploys applications to Tensorlake Cloud, emitting NDJSON events to stdout."""
     _emit(
@@ -239,6 +240,7 @@ def deploy(
         upgrade_running_requests=upgrade_running_requests,
         functions=functions,
         function_images=function_images,
+        compile_bytecode=compile_bytecode,
     )
 
 
@@ -289,6 +291,7 @@ def _deploy_applications(
     upgrade_running_requests: bool,
     functions: list[Function],
     function_images: dict[tuple[str, str], str],
+    compile_bytecode: bool = False,
 ):
     _emit({"type": "status", "message": "Deploying applications..."})
 
@@ -299,6 +302,7 @@ def _deploy_applications(
             load_source_dir_modules=False,
             api_client=api_client,
             function_images=function_images,
+            compile_bytecode=compile_bytecode,
         )
 
         for application_function in filter_applications(functions):
@@ -356,6 +360,12 @@ def deploy_entrypoint():
         metavar="KEY=VALUE",
         help="Environment variable to inject into generated Dockerfiles (repeatable)",
     )
+    parser.add_argument(
+        "--compile-bytecode",
+        action="store_true",
+        default=False,
+        help="Include bytecode compiled by the local Python in the application code for faster cold starts",
+    )
     args = parser.parse_args()
 
     try:
@@ -363,6 +373,7 @@ def deploy_entrypoint():
             application_file_path=args.application_file_path,
             upgrade_running_requests=args.upgrade_running_requests,
             build_envs=_parse_build_envs(args.build_env),
+            compile_bytecode=args.compile_bytecode,
         )
     except SystemExit:
         raise
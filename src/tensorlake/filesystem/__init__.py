@@ -5,7 +5,7 @@ shared Rust cloud-sdk core; take snapshots; and mount filesystems to local
 paths via the ``tl`` CLI.
 """
 
-from .client import Filesystem, FilesystemClient, Mount
+from .client import FileReader, Filesystem, FilesystemClient, Mount
 from .exceptions import (
     CliNotFoundError,
     FileNotFoundInFilesystemError,
@@ -30,6 +30,7 @@ __all__ = [
     "FilesystemClient",
     "Filesystem",
     "Mount",
+    "FileReader",
     "FilesystemInfo",
     "FilesystemVersion",
     "FilesystemSnapshot",
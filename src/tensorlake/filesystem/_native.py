@@ -166,6 +166,25 @@ class NativeFilesystems:
             )
         )
 
+    def read_file_with_metadata(
+        self,
+        name: str,
+        path: str,
+        version: str,
+        range: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[bytes, str, int]:
+        """Read a file, or ``range`` = ``(offset, length)`` of it.
+
+        Returns ``(bytes, content_id, full_size)``.
+        """
+        data, content_id, full_size = self._call(
+            lambda: self._client.read_filesystem_file_with_metadata(
+                self._project_id, name, path, version, range
+            ),
+            not_found=FileNotFoundInFilesystemError(name, path),
+        )
+        return bytes(data), str(content_id), int(full_size)
+
     def list_tree(self, name: str, dir_path: str, version: str) -> List[Dict[str, Any]]:
         raw = self._call(
             lambda: self._client.list_filesystem_tree(
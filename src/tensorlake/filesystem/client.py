@@ -28,11 +28,15 @@ Example::
 
 from __future__ import annotations
 
+import io
 import os
 import secrets
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from os import PathLike
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from tensorlake.cli._common import build_context_from_env
 
@@ -50,6 +54,13 @@ from .models import (
 )
 
 _FILESYSTEM_KIND = "filesystem"
+_DEFAULT_WALK_CONCURRENCY = 8
+# Total directory entries kept by a client's tree listing cache.
+_TREE_CACHE_MAX_ENTRIES = 200_000
+_DEFAULT_READ_CONCURRENCY = 16
+_DEFAULT_READ_CHUNK_SIZE = 8 * 1024 * 1024
+# Default total file bytes kept by a client's snapshot read cache.
+_DEFAULT_READ_CACHE_BYTES = 256 * 1024 * 1024
 _FileData = Union[bytes, str]
 
 
@@ -57,6 +68,107 @@ def _to_bytes(data: _FileData) -> bytes:
     return data.encode("utf-8") if isinstance(data, str) else data
 
 
+def _file_entry(prefix: str, entry: Dict[str, Any]) -> FileEntry:
+    """Map one native tree entry of the directory ``prefix`` to a :class:`FileEntry`."""
+    mode = int(entry.get("mode", 0o100644))
+    name = str(entry["name"])
+    return FileEntry(
+        name=name,
+        path=f"{prefix}/{name}" if prefix else name,
+        content_id=str(entry.get("oid") or ""),
+        kind=(
+            "directory"
+            if mode == 0o40000
+            else "symlink" if mode == 0o120000 else "file"
+        ),
+        executable=mode == 0o100755,
+        size=entry.get("size"),
+    )
+
+
+class _TreeCache:
+    """LRU cache of directory listings by content id, bounded by entry count.
+
+    A content id names an immutable tree, so cached listings never go stale.
+    """
+
+    def __init__(self, max_entries: int = _TREE_CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entry_count = 0
+        self._trees: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, content_id: str) -> Optional[List[Dict[str, Any]]]:
+        if not content_id:
+            return None
+        with self._lock:
+            entries = self._trees.get(content_id)
+            if entries is not None:
+                self._trees.move_to_end(content_id)
+            return entries
+
+    def put(self, content_id: str, entries: List[Dict[str, Any]]) -> None:
+        if not content_id or len(entries) > self._max_entries:
+            return
+        with self._lock:
+            if content_id in self._trees:
+                return
+            self._trees[content_id] = entries
+            self._entry_count += len(entries)
+            while self._entry_count > self._max_entries:
+                _, evicted = self._trees.popitem(last=False)
+                self._entry_count -= len(evicted)
+
+
+def _is_snapshot_version(version: str) -> bool:
+    """Whether ``version`` is a retained snapshot id, which never changes
+    (the alternative being the live head)."""
+    return len(version) == 64 and all(c in "0123456789abcdefABCDEF" for c in version)
+
+
+class _FileCache:
+    """LRU cache of file bytes at snapshot versions, bounded by total bytes.
+
+    Files are stored once per content id, so identical files at different
+    paths or snapshots share one copy.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._size = 0
+        # (filesystem, snapshot, path) -> content id
+        self._content_ids: Dict[Tuple[str, str, str], str] = {}
+        self._contents: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[bytes]:
+        with self._lock:
+            content_id = self._content_ids.get(key)
+            data = self._contents.get(content_id) if content_id else None
+            if data is None:
+                return None
+            self._contents.move_to_end(content_id)
+            return data
+
+    def put(self, key: Tuple[str, str, str], content_id: str, data: bytes) -> None:
+        if not content_id or len(data) > self._max_bytes:
+            return
+        with self._lock:
+            self._content_ids[key] = content_id
+            if content_id in self._contents:
+                return
+            self._contents[content_id] = data
+            self._size += len(data)
+            while self._size > self._max_bytes:
+                _, evicted = self._contents.popitem(last=False)
+                self._size -= len(evicted)
+            if len(self._content_ids) > 2 * len(self._contents) + 1024:
+                # Drop path mappings of evicted contents.
+                self._content_ids = {
+                    k: c for k, c in self._content_ids.items() if c in self._contents
+                }
+
+
 def mount_status_from_raw(raw: dict, local_path: Optional[str] = None) -> MountStatus:
     """Map one ``tl fs status --json`` payload to a :class:`MountStatus`.
 
@@ -84,12 +196,17 @@ class FilesystemClient:
         api_url: Optional[str] = None,
         organization_id: Optional[str] = None,
         project_id: Optional[str] = None,
+        read_cache_bytes: int = _DEFAULT_READ_CACHE_BYTES,
     ):
         """Create a client.
 
         Any argument left as ``None`` is resolved from the environment
         (``TENSORLAKE_API_KEY`` / ``TENSORLAKE_PAT``, ``TENSORLAKE_API_URL``,
         ``TENSORLAKE_ORGANIZATION_ID``, ``TENSORLAKE_PROJECT_ID``).
+
+        Files read at a retained snapshot never change, so up to
+        ``read_cache_bytes`` of them are kept in memory and served again
+        without network calls; ``0`` disables the cache.
         """
         ctx = build_context_from_env()
         token = api_key or ctx.api_key or ctx.personal_access_token
@@ -116,6 +233,8 @@ class FilesystemClient:
             project_id=project_id,
             api_url=api_url or ctx.api_url,
         )
+        self._tree_cache = _TreeCache()
+        self._file_cache = _FileCache(read_cache_bytes)
 
     # -- lifecycle -----------------------------------------------------------
 
@@ -382,10 +501,104 @@ class Filesystem:
 
     def read_file(self, path: str, version: Optional[str] = None) -> bytes:
         """Read a file's bytes at ``version`` (the current ``main`` head or
-        a retained snapshot id); defaults to the filesystem's current head."""
+        a retained snapshot id); defaults to the filesystem's current head.
+
+        Reads at a snapshot id are served from the client's read cache when
+        possible."""
+        if not path.strip("/"):
+            raise FilesystemError("file path must not be empty")
+        resolved_version = version or self._branch()
+        if not _is_snapshot_version(resolved_version):
+            return self._native.read_file(self._name, path, resolved_version)
+
+        file_cache = self._client._file_cache
+        key = (self._name, resolved_version, path.strip("/"))
+        data = file_cache.get(key)
+        if data is None:
+            data, content_id, _ = self._native.read_file_with_metadata(
+                self._name, path, resolved_version
+            )
+            file_cache.put(key, content_id, data)
+        return data
+
+    def read_files(
+        self,
+        paths: Iterable[str],
+        version: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_READ_CONCURRENCY,
+    ) -> Iterator[Tuple[str, bytes]]:
+        """Read many files at ``version``, yielding ``(path, bytes)`` in the
+        order of ``paths``.
+
+        Up to ``max_concurrency`` files are read in parallel, and at most
+        that many finished reads are buffered ahead of the consumer.
+        """
+        if max_concurrency < 1:
+            raise FilesystemError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        resolved_version = version or self._branch()
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            pending: deque = deque()
+            for path in paths:
+                pending.append(
+                    (path, executor.submit(self.read_file, path, resolved_version))
+                )
+                if len(pending) >= 2 * max_concurrency:
+                    done_path, read = pending.popleft()
+                    yield done_path, read.result()
+            while pending:
+                done_path, read = pending.popleft()
+                yield done_path, read.result()
+        finally:
+            # Also reached when the caller stops iterating early.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def read_file_range(
+        self, path: str, offset: int, length: int, version: Optional[str] = None
+    ) -> bytes:
+        """Read up to ``length`` bytes of a file from ``offset`` at ``version``.
+
+        Fewer bytes are returned when the file ends before the range.
+        """
+        if offset < 0 or length < 0:
+            raise FilesystemError("read offset and length must not be negative")
+        if not path.strip("/"):
+            raise FilesystemError("file path must not be empty")
+        resolved_version = version or self._branch()
+        if _is_snapshot_version(resolved_version):
+            cached = self._client._file_cache.get(
+                (self._name, resolved_version, path.strip("/"))
+            )
+            if cached is not None:
+                return cached[offset : offset + length]
+        data, _, _ = self._read_range(path, offset, length, resolved_version)
+        return data
+
+    def _read_range(
+        self, path: str, offset: int, length: int, version: str
+    ) -> Tuple[bytes, str, int]:
+        """Returns ``(bytes, content_id, full_size)`` of a byte range."""
+        if length == 0:
+            return b"", "", -1
+        return self._native.read_file_with_metadata(
+            self._name, path, version, (offset, length)
+        )
+
+    def open_read(
+        self,
+        path: str,
+        version: Optional[str] = None,
+        chunk_size: int = _DEFAULT_READ_CHUNK_SIZE,
+    ) -> "FileReader":
+        """Open a file at ``version`` for streaming reads in ``chunk_size``
+        ranges, without loading it into memory."""
         if not path.strip("/"):
             raise FilesystemError("file path must not be empty")
-        return self._native.read_file(self._name, path, version or self._branch())
+        if chunk_size < 1:
+            raise FilesystemError(f"chunk_size must be at least 1, got {chunk_size}")
+        return FileReader(self, path, version or self._branch(), chunk_size)
 
     def read_text(
         self, path: str, version: Optional[str] = None, encoding: str = "utf-8"
@@ -394,31 +607,76 @@ class Filesystem:
         return self.read_file(path, version).decode(encoding)
 
     def list_files(
-        self, dir_path: str = "", version: Optional[str] = None
+        self,
+        dir_path: str = "",
+        version: Optional[str] = None,
+        recursive: bool = False,
     ) -> List[FileEntry]:
-        """List one directory (non-recursive) at ``version``."""
+        """List one directory at ``version``; ``recursive=True`` lists its
+        whole subtree (see :meth:`walk`)."""
+        if recursive:
+            return list(self.walk(dir_path, version))
         prefix = dir_path.strip("/")
-        entries = []
-        for entry in self._native.list_tree(
-            self._name, dir_path, version or self._branch()
-        ):
-            mode = int(entry.get("mode", 0o100644))
-            name = str(entry["name"])
-            entries.append(
-                FileEntry(
-                    name=name,
-                    path=f"{prefix}/{name}" if prefix else name,
-                    content_id=str(entry.get("oid") or ""),
-                    kind=(
-                        "directory"
-                        if mode == 0o40000
-                        else "symlink" if mode == 0o120000 else "file"
-                    ),
-                    executable=mode == 0o100755,
-                    size=entry.get("size"),
-                )
+        return [
+            _file_entry(prefix, entry)
+            for entry in self._native.list_tree(
+                self._name, dir_path, version or self._branch()
+            )
+        ]
+
+    def walk(
+        self,
+        dir_path: str = "",
+        version: Optional[str] = None,
+        max_concurrency: int = _DEFAULT_WALK_CONCURRENCY,
+    ) -> Iterator[FileEntry]:
+        """Yield every entry below ``dir_path`` at ``version``, breadth-first.
+
+        Entries are yielded as their directory listing arrives while up to
+        ``max_concurrency`` subdirectories are listed in parallel. Listings
+        are cached by the directory's content id, which identifies an
+        immutable tree, so walks over unchanged subtrees (of any version)
+        skip their native calls. Only listings read at a snapshot id are
+        cached: a listing by path at the live head can belong to a newer
+        tree than the content id its parent listing reported.
+        """
+        if max_concurrency < 1:
+            raise FilesystemError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
             )
-        return entries
+        resolved_version = version or self._branch()
+        tree_cache = self._client._tree_cache
+        is_snapshot = _is_snapshot_version(resolved_version)
+
+        def list_dir(path: str, content_id: str) -> List[Dict[str, Any]]:
+            entries = tree_cache.get(content_id)
+            if entries is None:
+                entries = self._native.list_tree(self._name, path, resolved_version)
+                if is_snapshot:
+                    tree_cache.put(content_id, entries)
+            return entries
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            # The start directory is listed by path, its content id is unknown.
+            pending = deque(
+                [(dir_path.strip("/"), executor.submit(list_dir, dir_path, ""))]
+            )
+            while pending:
+                prefix, listing = pending.popleft()
+                for raw_entry in listing.result():
+                    entry = _file_entry(prefix, raw_entry)
+                    if entry.is_dir:
+                        pending.append(
+                            (
+                                entry.path,
+                                executor.submit(list_dir, entry.path, entry.content_id),
+                            )
+                        )
+                    yield entry
+        finally:
+            # Also reached when the caller stops iterating early.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # -- status -------------------------------------------------------------------
 
@@ -458,6 +716,89 @@ class Filesystem:
         return self._client.mount(self._name, local_path, readonly)
 
 
+class FileReader(io.RawIOBase):
+    """Binary file object reading one filesystem file in ranged requests.
+
+    Returned by :meth:`Filesystem.open_read`. Each read past the buffered
+    chunk fetches the next ``chunk_size`` byte range, so memory use stays
+    bounded for files of any size. Each range is read at the version the
+    reader was opened at; when that is the live head, a write between two
+    ranges changes the file's content id and the next read raises
+    :class:`~tensorlake.filesystem.FilesystemError` instead of mixing bytes
+    of two file versions.
+    """
+
+    def __init__(
+        self, filesystem: Filesystem, path: str, version: str, chunk_size: int
+    ):
+        super().__init__()
+        self._filesystem = filesystem
+        self._path = path
+        self._version = version
+        self._chunk_size = chunk_size
+        self._position = 0
+        self._size: Optional[int] = None
+        # Content id reported by the first ranged read.
+        self._content_id: Optional[str] = None
+        self._chunk = b""
+        self._chunk_offset = 0
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size of the file in bytes, known after the first read."""
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> None:
+        """Makes the buffered chunk cover the current position if not at EOF."""
+        chunk_end = self._chunk_offset + len(self._chunk)
+        if self._chunk_offset <= self._position < chunk_end:
+            return
+        if self._size is not None and self._position >= self._size:
+            self._chunk, self._chunk_offset = b"", self._position
+            return
+        data, content_id, full_size = self._filesystem._read_range(
+            self._path, self._position, self._chunk_size, self._version
+        )
+        if self._content_id is None:
+            self._content_id = content_id
+        elif content_id != self._content_id:
+            raise FilesystemError(
+                f"file {self._path!r} changed at version {self._version!r} "
+                f"while it was being read"
+            )
+        self._size = full_size
+        self._chunk, self._chunk_offset = data, self._position
+
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        view = memoryview(buffer).cast("B")
+        self._fill()
+        start = self._position - self._chunk_offset
+        count = min(len(view), len(self._chunk) - start)
+        if count <= 0:
+            return 0
+        view[:count] = self._chunk[start : start + count]
+        self._position += count
+        return count
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the rest of the file one ranged read at a time."""
+        while True:
+            self._fill()
+            data = self._chunk[self._position - self._chunk_offset :]
+            if not data:
+                return
+            self._position += len(data)
+            yield data
+
+    def __repr__(self) -> str:
+        return f"FileReader(path={self._path!r}, version={self._version!r})"
+
+
 class Mount:
     """A filesystem mounted to a local path via the ``tl`` CLI daemon."""
 
@@ -10,16 +10,18 @@ import inspect
 import json
 import logging
 import os
+import struct
 import sys
 import tempfile
 import threading
 import time
 import weakref
 import zipfile
+from collections import deque
 from dataclasses import dataclass, field
 from email.parser import BytesParser
 from email.policy import default as email_policy
-from typing import Any
+from typing import Any, Callable
 
 from tensorlake._cloud_sdk import FunctionAgentCore
 from tensorlake.applications import (
@@ -42,8 +44,8 @@ from tensorlake.applications.function.function_call import (
     set_self_arg,
 )
 from tensorlake.applications.function.type_hints import (
+    function_call_plan,
     function_signature,
-    return_type_hint,
 )
 from tensorlake.applications.function.user_data_serializer import (
     deserialize_value_with_metadata,
@@ -91,8 +93,14 @@ from tensorlake.applications.runtime_hooks import (
     set_run_future_hook,
     set_wait_futures_hook,
 )
+from tensorlake.applications.user_data_serializer import (
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
+)
 
 LOGGER = logging.getLogger("tensorlake.function_agent.runner")
+# Dispatch queue metrics are logged when the queue depth high water mark reaches
+# this value and then every time it doubles.
+_DISPATCH_QUEUE_DEPTH_LOG_THRESHOLD = 16
 MAX_REQUEST_STATE_KEY_BYTES = 1024
 MAX_REQUEST_STATE_VALUE_BYTES = 1024 * 1024
 _CURRENT_ATTEMPT: contextvars.ContextVar["Attempt"] = contextvars.ContextVar(
@@ -100,25 +108,164 @@ _CURRENT_ATTEMPT: contextvars.ContextVar["Attempt"] = contextvars.ContextVar(
 )
 
 
+# Protocol messages use bytes values for binary payloads, i.e. {"data": b"..."}.
+# JSON protocol sends a payload as a base64 string field {"data_base64": "..."}.
+# Binary protocol sends a payload as a separate frame {"data_frame": 0} referenced from the
+# JSON header. A binary protocol message is:
+# <header size: u32> <JSON header> (<frame size: u64> <frame bytes>)*
+_BASE64_FIELD_SUFFIX = "_base64"
+_FRAME_FIELD_SUFFIX = "_frame"
+_HEADER_SIZE_FORMAT = "<I"
+_FRAME_SIZE_FORMAT = "<Q"
+# Messages at least this large are decoded in a worker thread so the event loop
+# keeps submitting outputs and reading inputs while a large payload is decoded.
+_MIN_THREAD_DECODED_MESSAGE_BYTES = 64 * 1024
+
+
 def _b64decode(value: str) -> bytes:
     return base64.b64decode(value.encode("ascii"), validate=True)
 
 
-def _b64encode(value: bytes) -> str:
+def _b64encode(value: bytes | bytearray | memoryview) -> str:
     return base64.b64encode(value).decode("ascii")
 
 
+def _supports_binary_protocol(core: FunctionAgentCore) -> bool:
+    return hasattr(core, "next_input_bytes") and hasattr(core, "submit_output_bytes")
+
+
+def _encode_payloads(
+    value: Any, suffix: str, encode_payload: Callable[[bytes], Any]
+) -> Any:
+    if isinstance(value, dict):
+        encoded: dict[str, Any] = {}
+        for key, item in value.items():
+            if isinstance(item, (bytes, bytearray, memoryview)):
+                encoded[key + suffix] = encode_payload(item)
+            else:
+                encoded[key] = _encode_payloads(item, suffix, encode_payload)
+        return encoded
+    if isinstance(value, list):
+        return [_encode_payloads(item, suffix, encode_payload) for item in value]
+    return value
+
+
+def _decode_payloads(
+    value: Any, suffix: str, decode_payload: Callable[[Any], bytes | memoryview]
+) -> Any:
+    if isinstance(value, dict):
+        decoded: dict[str, Any] = {}
+        for key, item in value.items():
+            if key.endswith(suffix):
+                decoded[key[: -len(suffix)]] = (
+                    None if item is None else decode_payload(item)
+                )
+            else:
+                decoded[key] = _decode_payloads(item, suffix, decode_payload)
+        return decoded
+    if isinstance(value, list):
+        return [_decode_payloads(item, suffix, decode_payload) for item in value]
+    return value
+
+
+def _encode_json_message(message: dict[str, Any]) -> str:
+    return json.dumps(
+        _encode_payloads(message, _BASE64_FIELD_SUFFIX, _b64encode),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def _decode_json_message(encoded: str) -> dict[str, Any]:
+    return _decode_payloads(json.loads(encoded), _BASE64_FIELD_SUFFIX, _b64decode)
+
+
+def _encode_binary_message(message: dict[str, Any]) -> bytes:
+    frames: list[bytes | bytearray | memoryview] = []
+
+    def add_frame(payload: bytes | bytearray | memoryview) -> int:
+        frames.append(payload)
+        return len(frames) - 1
+
+    header = json.dumps(
+        _encode_payloads(message, _FRAME_FIELD_SUFFIX, add_frame),
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+    parts: list[bytes | bytearray | memoryview] = [
+        struct.pack(_HEADER_SIZE_FORMAT, len(header)),
+        header,
+    ]
+    for frame in frames:
+        parts.append(struct.pack(_FRAME_SIZE_FORMAT, len(frame)))
+        parts.append(frame)
+    return b"".join(parts)
+
+
+def _decode_binary_message(encoded: bytes) -> dict[str, Any]:
+    # Frames are memoryviews of the encoded message so payloads are not copied.
+    view = memoryview(encoded)
+    (header_size,) = struct.unpack_from(_HEADER_SIZE_FORMAT, view, 0)
+    offset = struct.calcsize(_HEADER_SIZE_FORMAT)
+    header = json.loads(view[offset : offset + header_size].tobytes())
+    offset += header_size
+    frames: list[memoryview] = []
+    while offset < len(view):
+        (frame_size,) = struct.unpack_from(_FRAME_SIZE_FORMAT, view, offset)
+        offset += struct.calcsize(_FRAME_SIZE_FORMAT)
+        if offset + frame_size > len(view):
+            raise ValueError("Truncated function-agent binary message frame")
+        frames.append(view[offset : offset + frame_size])
+        offset += frame_size
+    return _decode_payloads(header, _FRAME_FIELD_SUFFIX, lambda index: frames[index])
+
+
+async def _read_message(core: FunctionAgentCore) -> dict[str, Any]:
+    if _supports_binary_protocol(core):
+        encoded: bytes | str = await core.next_input_bytes()
+        decode: Callable[[Any], dict[str, Any]] = _decode_binary_message
+    else:
+        encoded = await core.next_input()
+        decode = _decode_json_message
+    if len(encoded) >= _MIN_THREAD_DECODED_MESSAGE_BYTES:
+        return await asyncio.to_thread(decode, encoded)
+    return decode(encoded)
+
+
+def _message_attempt_id(message: dict[str, Any]) -> str:
+    message_type = message.get("type")
+    if message_type == "assignment":
+        return message["assignment"]["attempt_id"]
+    if message_type == "request_state_result":
+        return message["result"]["attempt_id"]
+    # Unknown message types are rejected when they are handled.
+    return message.get("attempt_id", "")
+
+
 class ProtocolWriter:
     def __init__(self, core: FunctionAgentCore, loop: asyncio.AbstractEventLoop):
         self._core = core
         self._loop = loop
         self._lock = threading.Lock()
+        self._binary = _supports_binary_protocol(core)
 
     def write(self, message: dict[str, Any]) -> None:
-        encoded = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        """Sends the message to Function Service.
 
-        async def submit_output() -> None:
-            await self._core.submit_output(encoded)
+        bytes values in the message are binary payloads, they are sent using the
+        protocol supported by the native core.
+        """
+        if self._binary:
+            encoded_bytes = _encode_binary_message(message)
+
+            async def submit_output() -> None:
+                await self._core.submit_output_bytes(encoded_bytes)
+
+        else:
+            encoded = _encode_json_message(message)
+
+            async def submit_output() -> None:
+                await self._core.submit_output(encoded)
 
         with self._lock:
             asyncio.run_coroutine_threadsafe(submit_output(), self._loop).result()
@@ -139,7 +286,7 @@ class RuntimeRequestState(RequestState):
         result = self._attempt.request_state_operation(
             operation="set",
             key=key,
-            value_base64=_b64encode(serialized),
+            value=serialized,
         )
         if result.get("result") != "set":
             raise InternalError("Function Service returned an invalid state set result")
@@ -149,10 +296,9 @@ class RuntimeRequestState(RequestState):
         result = self._attempt.request_state_operation(operation="get", key=key)
         if result.get("result") != "get":
             raise InternalError("Function Service returned an invalid state get result")
-        encoded = result.get("value_base64")
-        if encoded is None:
+        serialized = result.get("value")
+        if serialized is None:
             return default
-        serialized = _b64decode(encoded)
         return REQUEST_STATE_USER_DATA_SERIALIZER.deserialize(
             serialized, type_hint=type(default)
         )
@@ -263,6 +409,9 @@ class SpecialSettings:
     splitter_function_name: str | None = None
     splitter_input_mode: SPLITTER_INPUT_MODE | None = None
     is_map_concat: bool = False
+    is_associative_reduce: bool = False
+    map_batch_size: int | None = None
+    is_map_batch: bool = False
 
 
 @dataclass(frozen=True)
@@ -365,48 +514,50 @@ class Attempt:
             info = self._future_infos.get(function_call_id)
             if info is None or info.finished or self.cancelled:
                 return
-            outcome = message["outcome"]
-            if outcome == "success":
-                metadata = deserialize_metadata(
-                    _b64decode(message.get("metadata_base64", ""))
-                )
-                if not isinstance(metadata, ValueMetadata):
-                    info.future._set_exception(
-                        InternalError("Function output is missing ValueMetadata")
-                    )
-                else:
-                    try:
-                        info.future._set_result(
-                            deserialize_value_with_metadata(
-                                _b64decode(message["output_base64"]), metadata
-                            )
-                        )
-                    except BaseException as error:
-                        info.future._set_exception(
-                            InternalError("Unable to deserialize child output")
-                        )
-                        LOGGER.exception(
-                            "unable to deserialize child output", exc_info=error
-                        )
-            elif outcome == "timed_out":
-                info.future._set_exception(TimeoutError())
-            elif message.get("reason") == "request_error":
-                info.future._set_exception(
-                    RequestError(message="Child function request failed")
-                )
+
+        # Deserialize without holding the lock so a large child output doesn't
+        # block the attempt thread and the delivery of other results.
+        output: Any = None
+        error: BaseException | None = None
+        outcome = message["outcome"]
+        if outcome == "success":
+            metadata = deserialize_metadata(message.get("metadata", b""))
+            if not isinstance(metadata, ValueMetadata):
+                error = InternalError("Function output is missing ValueMetadata")
             else:
-                info.future._set_exception(
-                    FunctionError(
-                        f"Child function failed: {message.get('reason', 'function_error')}"
+                try:
+                    output = deserialize_value_with_metadata(
+                        message["output"], metadata
                     )
-                )
+                except BaseException as deserialization_error:
+                    error = InternalError("Unable to deserialize child output")
+                    LOGGER.exception(
+                        "unable to deserialize child output",
+                        exc_info=deserialization_error,
+                    )
+        elif outcome == "timed_out":
+            error = TimeoutError()
+        elif message.get("reason") == "request_error":
+            error = RequestError(message="Child function request failed")
+        else:
+            error = FunctionError(
+                f"Child function failed: {message.get('reason', 'function_error')}"
+            )
+
+        with self._condition:
+            if info.finished or self.cancelled:
+                return
+            if error is None:
+                info.future._set_result(output)
+            else:
+                info.future._set_exception(error)
             self._complete_future(info)
 
     def request_state_operation(
         self,
         operation: str,
         key: str,
-        value_base64: str | None = None,
+        value: bytes | None = None,
     ) -> dict[str, Any]:
         with self._condition:
             self._check_cancelled()
@@ -422,8 +573,8 @@ class Attempt:
             "operation_id": operation_id,
             "operation": {"operation": operation, "key": key},
         }
-        if value_base64 is not None:
-            message["operation"]["value_base64"] = value_base64
+        if value is not None:
+            message["operation"]["value"] = value
         self.runtime.protocol.write(message)
 
         with self._condition:
@@ -562,15 +713,13 @@ class Attempt:
     def _prepare_call(
         self,
     ) -> tuple[list[Any], dict[str, Any], SpecialSettings | None]:
-        metadata_bytes = _b64decode(self.assignment.get("call_metadata_base64", ""))
+        metadata_bytes = self.assignment.get("call_metadata", b"")
         if not metadata_bytes:
             self._output_serializer_name = function_output_serializer(
                 self.function, None
             ).name
             self._has_output_type_hint = True
-            self._output_type_hint = return_type_hint(
-                function_signature(self.function).return_annotation
-            )
+            self._output_type_hint = function_call_plan(self.function).return_type_hint
             args, kwargs = self._application_arguments()
             if self.function_instance is not None:
                 set_self_arg(args, self.function_instance)
@@ -586,14 +735,10 @@ class Attempt:
         self._output_type_hint = metadata.output_type_hint_override
         values: dict[str, Any] = {}
         for input_value in self.assignment["inputs"]:
-            value_metadata = deserialize_metadata(
-                _b64decode(input_value["metadata_base64"])
-            )
+            value_metadata = deserialize_metadata(input_value["metadata"])
             if not isinstance(value_metadata, ValueMetadata):
                 raise InternalError("Function argument is missing ValueMetadata")
-            value = deserialize_value_with_metadata(
-                _b64decode(input_value["data_base64"]), value_metadata
-            )
+            value = deserialize_value_with_metadata(input_value["data"], value_metadata)
             value_id = input_value.get("source_function_call_id") or value_metadata.id
             values[value_id] = value
         args = [values[arg.value_id] for arg in metadata.args]
@@ -601,10 +746,13 @@ class Attempt:
         if self.function_instance is not None:
             set_self_arg(args, self.function_instance)
         settings = None
+        # Metadata pickled by older SDK versions doesn't have the newer fields.
+        is_map_batch = getattr(metadata, "is_map_batch", False)
         if (
             metadata.is_map_splitter
             or metadata.is_reduce_splitter
             or metadata.is_map_concat
+            or is_map_batch
         ):
             settings = SpecialSettings(
                 is_map_splitter=metadata.is_map_splitter,
@@ -612,6 +760,9 @@ class Attempt:
                 splitter_function_name=metadata.splitter_function_name,
                 splitter_input_mode=metadata.splitter_input_mode,
                 is_map_concat=metadata.is_map_concat,
+                is_associative_reduce=getattr(metadata, "is_associative_reduce", False),
+                map_batch_size=getattr(metadata, "map_batch_size", None),
+                is_map_batch=is_map_batch,
             )
         return args, kwargs, settings
 
@@ -622,7 +773,8 @@ class Attempt:
                 f"Application function call requires one HTTP payload, got {len(inputs)}"
             )
         payload = inputs[0]
-        data = _b64decode(payload["data_base64"])
+        # Application arguments are parsed by code that expects bytes, not memoryviews.
+        data = bytes(payload["data"])
         content_type = payload.get("content_type", "application/octet-stream")
         parameters = list(function_signature(self.function).parameters.values())
         if not data and not parameters:
@@ -652,7 +804,32 @@ class Attempt:
         self, settings: SpecialSettings, args: list[Any], kwargs: dict[str, Any]
     ) -> Any:
         if settings.is_map_concat:
-            return args
+            if settings.map_batch_size is None:
+                return args
+            return [output for batch_outputs in args for output in batch_outputs]
+        if settings.is_map_batch:
+            # The last arg is the list of map inputs, the args before it are i.e. self of a method.
+            *prefix_args, map_inputs = args
+            original = self.function._original_function
+            if inspect.iscoroutinefunction(original):
+
+                async def map_batch() -> list[Any]:
+                    return [
+                        await original(*prefix_args, item, **kwargs)
+                        for item in map_inputs
+                    ]
+
+                outputs = asyncio.run(map_batch())
+            else:
+                outputs = [
+                    original(*prefix_args, item, **kwargs) for item in map_inputs
+                ]
+            if any(isinstance(_unwrap_future(output), Future) for output in outputs):
+                raise SDKUsageError(
+                    f"{self.function} returned a Future from a batched map operation, "
+                    "only values can be returned from batched map operations"
+                )
+            return outputs
         if settings.is_map_splitter:
             map_function = get_function(settings.splitter_function_name)
             if settings.splitter_input_mode == SPLITTER_INPUT_MODE.ITEMS_IN_ONE_ARG:
@@ -663,6 +840,15 @@ class Attempt:
                 map_inputs = args[0]
             else:
                 map_inputs = args
+            if settings.map_batch_size is not None:
+                return self.function.future(
+                    *(
+                        map_function.future(
+                            map_inputs[ix : ix + settings.map_batch_size]
+                        )
+                        for ix in range(0, len(map_inputs), settings.map_batch_size)
+                    )
+                )
             return self.function.future(
                 *(map_function.future(item) for item in map_inputs)
             )
@@ -683,6 +869,17 @@ class Attempt:
                 raise SDKUsageError("reduce of empty iterable with no initial value")
             if len(reduce_inputs) == 1:
                 return reduce_inputs[0]
+            if settings.is_associative_reduce:
+                # Reduce adjacent pairs level by level, this keeps the item order.
+                while len(reduce_inputs) > 1:
+                    level = [
+                        reduce_function.future(reduce_inputs[ix], reduce_inputs[ix + 1])
+                        for ix in range(0, len(reduce_inputs) - 1, 2)
+                    ]
+                    if len(reduce_inputs) % 2 == 1:
+                        level.append(reduce_inputs[-1])
+                    reduce_inputs = level
+                return reduce_inputs[0]
             result = reduce_function.future(reduce_inputs[0], reduce_inputs[1])
             for item in reduce_inputs[2:]:
                 result = reduce_function.future(result, item)
@@ -727,11 +924,16 @@ class Attempt:
                 for name, value in future._kwargs.items()
             }
             if (
-                is_tail_call
-                and self._special_settings is not None
+                self._special_settings is not None
                 and self._special_settings.is_map_splitter
             ):
-                settings = SpecialSettings(is_map_concat=True)
+                if is_tail_call:
+                    settings = SpecialSettings(
+                        is_map_concat=True,
+                        map_batch_size=self._special_settings.map_batch_size,
+                    )
+                elif self._special_settings.map_batch_size is not None:
+                    settings = SpecialSettings(is_map_batch=True)
         elif isinstance(future, MapFuture):
             function_name = self.function._name
             items = _unwrap_future(future._items)
@@ -746,6 +948,7 @@ class Attempt:
                     if isinstance(items, list)
                     else SPLITTER_INPUT_MODE.ITEMS_IN_ONE_ARG
                 ),
+                map_batch_size=future._batch_size,
             )
         elif isinstance(future, ReduceOperationFuture):
             function_name = self.function._name
@@ -764,6 +967,7 @@ class Attempt:
                     if isinstance(items, list)
                     else SPLITTER_INPUT_MODE.ITEMS_IN_ONE_ARG
                 ),
+                is_associative_reduce=future._associative,
             )
         else:
             raise InternalError(f"Unsupported Future type: {type(future).__name__}")
@@ -821,8 +1025,8 @@ class Attempt:
             inputs.append(
                 {
                     "source": "data",
-                    "data_base64": _b64encode(data),
-                    "metadata_base64": _b64encode(serialize_metadata(metadata)),
+                    "data": data,
+                    "metadata": serialize_metadata(metadata),
                     "content_type": metadata.content_type,
                 }
             )
@@ -836,6 +1040,9 @@ class Attempt:
         output_serializer_override = None
         if call.is_tail_call:
             output_serializer_override = self._output_serializer_name
+        elif call.special_settings and call.special_settings.is_map_batch:
+            # Map batch output is a list consumed only by map concat, pickle preserves its item types.
+            output_serializer_override = SDK_FUNCTION_CALL_SERIALIZER_NAME
         elif call.special_settings and call.special_settings.splitter_function_name:
             output_serializer_override = function_output_serializer(
                 get_function(call.special_settings.splitter_function_name), None
@@ -860,12 +1067,17 @@ class Attempt:
             ),
             splitter_input_mode=settings.splitter_input_mode if settings else None,
             is_map_concat=settings.is_map_concat if settings else False,
+            is_associative_reduce=(
+                settings.is_associative_reduce if settings else False
+            ),
+            map_batch_size=settings.map_batch_size if settings else None,
+            is_map_batch=settings.is_map_batch if settings else False,
         )
         return {
             "function_call_id": call.function_call_id,
             "function_name": call.function_name,
             "inputs": inputs,
-            "call_metadata_base64": _b64encode(serialize_metadata(metadata)),
+            "call_metadata": serialize_metadata(metadata),
         }
 
     def _watch(self, future: Future, timeout: float | None) -> None:
@@ -946,8 +1158,8 @@ class Attempt:
                 "attempt_id": self.attempt_id,
                 "result": {
                     "type": "value",
-                    "output_base64": _b64encode(data),
-                    "metadata_base64": _b64encode(serialize_metadata(metadata)),
+                    "output": data,
+                    "metadata": serialize_metadata(metadata),
                     "content_type": metadata.content_type,
                 },
             }
@@ -977,11 +1189,36 @@ class Attempt:
             raise RunnerCancelled()
 
 
+@dataclass
+class DispatchMetrics:
+    # Number of attempts with undelivered messages.
+    active_queues: int
+    # Undelivered messages of all attempts, including the messages being delivered.
+    queued_messages: int
+    # Undelivered messages of the attempt with the most undelivered messages.
+    max_queue_depth: int
+    # The largest queue depth observed since the runner started.
+    max_queue_depth_high_water_mark: int
+
+
+@dataclass
+class _DispatchQueue:
+    messages: deque[dict[str, Any]] = field(default_factory=deque)
+    task: asyncio.Task[None] | None = None
+
+
 class PythonFunctionRunner:
     def __init__(self, protocol: ProtocolWriter):
         self.protocol = protocol
         self._lock = threading.Lock()
+        self._initialize_lock = threading.Lock()
         self._attempts: dict[str, Attempt] = {}
+        # Attempt ID -> its messages that are not delivered yet.
+        # Only accessed from the event loop thread.
+        self._dispatch_queues: dict[str, _DispatchQueue] = {}
+        self._max_dispatch_queue_depth = 0
+        self._next_logged_dispatch_queue_depth = _DISPATCH_QUEUE_DEPTH_LOG_THRESHOLD
+        self._dispatch_failure: asyncio.Future[None] | None = None
         self._initialized = False
         self._protocol_initialized = False
         self._code_sha256: str | None = None
@@ -992,15 +1229,92 @@ class PythonFunctionRunner:
         self._install_runtime_hooks()
 
     async def serve(self, core: FunctionAgentCore) -> None:
-        while True:
-            try:
-                message = json.loads(await core.next_input())
-                await asyncio.to_thread(self._handle_message, message)
-            except asyncio.CancelledError:
-                raise
-            except BaseException as error:
-                LOGGER.exception("invalid function-agent input", exc_info=error)
-                raise
+        """Reads messages from the core and delivers them.
+
+        Messages of different attempts are delivered concurrently. Messages of
+        the same attempt are delivered in order.
+        """
+        self._dispatch_failure = asyncio.get_running_loop().create_future()
+        try:
+            while True:
+                try:
+                    message = await self._next_message(core)
+                    self._dispatch(message)
+                except asyncio.CancelledError:
+                    raise
+                except BaseException as error:
+                    LOGGER.exception("invalid function-agent input", exc_info=error)
+                    raise
+        finally:
+            self._log_dispatch_metrics("stopped")
+            for queue in self._dispatch_queues.values():
+                if queue.task is not None:
+                    queue.task.cancel()
+
+    def dispatch_metrics(self) -> DispatchMetrics:
+        """Returns a snapshot of the message dispatch queue metrics.
+
+        Must be called from the event loop thread running serve().
+        """
+        depths = [len(queue.messages) for queue in self._dispatch_queues.values()]
+        return DispatchMetrics(
+            active_queues=len(depths),
+            queued_messages=sum(depths),
+            max_queue_depth=max(depths, default=0),
+            max_queue_depth_high_water_mark=self._max_dispatch_queue_depth,
+        )
+
+    def _log_dispatch_metrics(self, event: str) -> None:
+        metrics = self.dispatch_metrics()
+        LOGGER.info(
+            "message dispatch %s: %d active queues, %d queued messages, "
+            "max queue depth %d, max queue depth high water mark %d",
+            event,
+            metrics.active_queues,
+            metrics.queued_messages,
+            metrics.max_queue_depth,
+            metrics.max_queue_depth_high_water_mark,
+        )
+
+    async def _next_message(self, core: FunctionAgentCore) -> dict[str, Any]:
+        """Returns the next message or raises the error of a failed message delivery."""
+        read = asyncio.ensure_future(_read_message(core))
+        await asyncio.wait(
+            {read, self._dispatch_failure}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if self._dispatch_failure.done():
+            read.cancel()
+            self._dispatch_failure.result()
+        return read.result()
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        attempt_id = _message_attempt_id(message)
+        queue = self._dispatch_queues.get(attempt_id)
+        if queue is None:
+            queue = _DispatchQueue()
+            self._dispatch_queues[attempt_id] = queue
+        queue.messages.append(message)
+        if len(queue.messages) > self._max_dispatch_queue_depth:
+            self._max_dispatch_queue_depth = len(queue.messages)
+            if self._max_dispatch_queue_depth >= self._next_logged_dispatch_queue_depth:
+                self._next_logged_dispatch_queue_depth *= 2
+                self._log_dispatch_metrics("queue depth grew")
+        if queue.task is None:
+            queue.task = asyncio.create_task(self._deliver(attempt_id, queue))
+
+    async def _deliver(self, attempt_id: str, queue: _DispatchQueue) -> None:
+        try:
+            while len(queue.messages) > 0:
+                await asyncio.to_thread(self._handle_message, queue.messages[0])
+                queue.messages.popleft()
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            if not self._dispatch_failure.done():
+                self._dispatch_failure.set_exception(error)
+        finally:
+            # The queue is empty unless delivery failed, new messages get a new queue.
+            self._dispatch_queues.pop(attempt_id, None)
 
     def _handle_message(self, message: dict[str, Any]) -> None:
         message_type = message["type"]
@@ -1022,11 +1336,13 @@ class PythonFunctionRunner:
     def _assignment(self, assignment: dict[str, Any]) -> None:
         attempt_id = assignment["attempt_id"]
         try:
-            if not self._initialized:
-                self._initialize(assignment)
-            if not self._protocol_initialized:
-                self.protocol.write({"type": "initialized"})
-                self._protocol_initialized = True
+            # Assignments of different attempts are delivered concurrently.
+            with self._initialize_lock:
+                if not self._initialized:
+                    self._initialize(assignment)
+                if not self._protocol_initialized:
+                    self.protocol.write({"type": "initialized"})
+                    self._protocol_initialized = True
             self._validate_assignment(assignment)
             attempt = Attempt(
                 runtime=self,
@@ -1040,9 +1356,10 @@ class PythonFunctionRunner:
                 self._attempts[attempt_id] = attempt
             threading.Thread(target=attempt.run, daemon=True).start()
         except BaseException as error:
-            if not self._protocol_initialized:
-                self.protocol.write({"type": "initialized"})
-                self._protocol_initialized = True
+            with self._initialize_lock:
+                if not self._protocol_initialized:
+                    self.protocol.write({"type": "initialized"})
+                    self._protocol_initialized = True
             self.protocol.write(
                 {
                     "type": "failure",
@@ -1056,7 +1373,7 @@ class PythonFunctionRunner:
             )
 
     def _initialize(self, assignment: dict[str, Any]) -> None:
-        code = _b64decode(assignment["application_code_base64"])
+        code = assignment["application_code"]
         digest = hashlib.sha256(code).hexdigest()
         if digest != assignment["application_code_sha256"]:
             raise ValueError("Application code SHA-256 does not match assignment")
@@ -1152,11 +1469,15 @@ def _future_durable_id(
             _add_future_id(future._kwargs[name], durable_ids, attributes)
     elif isinstance(future, MapFuture):
         attributes.append(f"MAP_OPERATION:{future._function_name}")
+        if future._batch_size is not None:
+            attributes.append(f"BATCH_SIZE:{future._batch_size}")
         items = _unwrap_future(future._items)
         for value in items if isinstance(items, list) else [items]:
             _add_future_id(value, durable_ids, attributes)
     elif isinstance(future, ReduceOperationFuture):
         attributes.extend(["ReduceOperation", future._function_name])
+        if future._associative:
+            attributes.append("Associative")
         _add_future_id(future._initial, durable_ids, attributes)
         items = _unwrap_future(future._items)
         for value in items if isinstance(items, list) else [items]:
@@ -8,10 +8,7 @@ from tensorlake.applications import (
     RequestContext,
 )
 from tensorlake.applications.blob_store import BLOBStore
-from tensorlake.applications.function.type_hints import (
-    function_signature,
-    return_type_hint,
-)
+from tensorlake.applications.function.type_hints import function_call_plan
 from tensorlake.applications.function.user_data_serializer import (
     function_output_serializer,
 )
@@ -496,9 +493,7 @@ class AllocationRunner:
                     output_serializer_override=None,
                 ).name,
                 has_type_hint=True,
-                type_hint=return_type_hint(
-                    function_signature(self._function).return_annotation
-                ),
+                type_hint=function_call_plan(self._function).return_type_hint,
             )
         else:
             # Regular function call created by SDK. Uses function call metadata.
@@ -511,10 +506,13 @@ class AllocationRunner:
                     else None
                 ),
             )
+            # Metadata pickled by older SDK versions doesn't have the newer fields.
+            is_map_batch: bool = getattr(function_call_metadata, "is_map_batch", False)
             if (
                 function_call_metadata.is_map_splitter
                 or function_call_metadata.is_map_concat
                 or function_call_metadata.is_reduce_splitter
+                or is_map_batch
             ):
                 self._allocation_function_call_settings = SpecialFunctionCallSettings(
                     is_map_splitter=function_call_metadata.is_map_splitter,
@@ -522,6 +520,13 @@ class AllocationRunner:
                     splitter_function_name=function_call_metadata.splitter_function_name,
                     splitter_input_mode=function_call_metadata.splitter_input_mode,
                     is_map_concat=function_call_metadata.is_map_concat,
+                    is_associative_reduce=getattr(
+                        function_call_metadata, "is_associative_reduce", False
+                    ),
+                    map_batch_size=getattr(
+                        function_call_metadata, "map_batch_size", None
+                    ),
+                    is_map_batch=is_map_batch,
                 )
 
     def _parse_function_call_args(
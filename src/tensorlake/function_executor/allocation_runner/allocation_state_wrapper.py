@@ -13,7 +13,13 @@ from ..proto.function_executor_pb2 import (
 
 
 class AllocationStateWrapper:
-    """Thread-safe wrapper around AllocationState proto used to update it and notify about updates to it."""
+    """Thread-safe wrapper around AllocationState proto used to update it and notify about updates to it.
+
+    Each update only increments the state version. The state hash is computed when a
+    watcher reads the state and its version changed since the last hash computation. So a
+    burst of updates made while the watcher is streaming the previous state costs a single
+    hash and copy of the state.
+    """
 
     def __init__(self) -> None:
         self._allocation_state_update_lock: threading.Condition = threading.Condition()
@@ -22,15 +28,21 @@ class AllocationStateWrapper:
             request_state_operations=[],
         )
         self._finished: bool = False
-        self._update_hash()
+        # Incremented on every update of the allocation state.
+        self._version: int = 0
+        # Version of the allocation state that has sha256_hash set.
+        self._hashed_version: int = -1
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def update_progress(self, current: float, total: float) -> None:
         with self._allocation_state_update_lock:
             self._allocation_state.progress.CopyFrom(
                 AllocationProgress(current=current, total=total)
             )
-            self._update_hash()
-            self._allocation_state_update_lock.notify_all()
+            self._on_updated_locked()
 
     def set_finished(self) -> None:
         """Marks the allocation as finished. Unblocks wait_for_update."""
@@ -50,8 +62,7 @@ class AllocationStateWrapper:
                     size=size,
                 )
             )
-            self._update_hash()
-            self._allocation_state_update_lock.notify_all()
+            self._on_updated_locked()
 
     def remove_output_blob_request(self, id: str) -> None:
         with self._allocation_state_update_lock:
@@ -59,16 +70,14 @@ class AllocationStateWrapper:
                 lambda req: req.id == id,
                 self._allocation_state.output_blob_requests,
             )
-            self._update_hash()
-            self._allocation_state_update_lock.notify_all()
+            self._on_updated_locked()
 
     def add_request_state_operation(
         self, operation: AllocationRequestStateOperation
     ) -> None:
         with self._allocation_state_update_lock:
             self._allocation_state.request_state_operations.append(operation)
-            self._update_hash()
-            self._allocation_state_update_lock.notify_all()
+            self._on_updated_locked()
 
     def remove_request_state_operation(self, id: str) -> None:
         with self._allocation_state_update_lock:
@@ -76,16 +85,19 @@ class AllocationStateWrapper:
                 lambda op: op.operation_id == id,
                 self._allocation_state.request_state_operations,
             )
-            self._update_hash()
-            self._allocation_state_update_lock.notify_all()
+            self._on_updated_locked()
 
     def wait_for_update(self, last_seen_hash: str | None) -> AllocationState | None:
         """Returns copy of the current allocation state when it's updated.
 
+        States with the same content as the last seen state are not returned.
         Returns None if the allocation is finished and no more updates will happen.
         """
         with self._allocation_state_update_lock:
             while True:
+                if self._hashed_version != self._version:
+                    self._update_hash()
+                    self._hashed_version = self._version
                 if last_seen_hash != self._allocation_state.sha256_hash:
                     return self._copy_state_locked()
                 if self._finished:
@@ -94,6 +106,10 @@ class AllocationStateWrapper:
                     return None
                 self._allocation_state_update_lock.wait()
 
+    def _on_updated_locked(self) -> None:
+        self._version += 1
+        self._allocation_state_update_lock.notify_all()
+
     def _copy_state_locked(self) -> AllocationState:
         allocation_state_copy = AllocationState()
         allocation_state_copy.CopyFrom(self._allocation_state)
@@ -3,7 +3,7 @@ import time
 from typing import List
 
 from tensorlake.applications import InternalError
-from tensorlake.applications.blob_store import BLOBStore
+from tensorlake.applications.blob_store import BLOBRange, BLOBStore
 from tensorlake.applications.internal_logger import InternalLogger
 from tensorlake.applications.metadata import ValueMetadata, deserialize_metadata
 
@@ -50,51 +50,47 @@ def download_serialized_objects(
     blob_store: BLOBStore,
     logger: InternalLogger,
 ) -> List[SerializedValue]:
-    # TODO: Do this in parallel. Keep in mind that the underlying BLOB store
-    # chunks and parallelizes large downloads and performance degrades with
-    # too much parallelization.
     if len(serialized_objects) != len(serialized_object_blobs):
         raise InternalError(
             "Mismatched serialized objects and serialized object blobs lengths, "
             f"{len(serialized_objects)} != {len(serialized_object_blobs)}"
         )
 
-    return [
-        _download_serialized_value(blob, so, blob_store, logger)
+    for so in serialized_objects:
+        if not so.manifest.HasField("metadata_size"):
+            raise InternalError("SerializedObjectManifest is missing metadata_size.")
+
+    # Metadata and data of a serialized object are adjacent in its BLOB so each serialized
+    # object is downloaded using a single ranged read. All the reads are done concurrently.
+    # BLOB store runs chunk reads of all serialized objects on its IO workers so the total
+    # number of concurrent reads and connections stays the same as for a single large read.
+    # The hashes are computed by the IO workers while the data is being downloaded.
+    reads: List[BLOBRange] = [
+        BLOBRange(
+            blob=blob_proto_to_blob(blob),
+            offset=so.offset,
+            size=so.manifest.size,
+            digest=hashlib.sha256(),
+        )
         for blob, so in zip(serialized_object_blobs, serialized_objects)
     ]
+    serialized_objects_data: List[bytearray] = blob_store.get_many(
+        reads=reads, logger=logger
+    )
+
+    return [
+        _to_serialized_value(so, so_data, read.digest.hexdigest(), logger)
+        for so, so_data, read in zip(serialized_objects, serialized_objects_data, reads)
+    ]
 
 
-def _download_serialized_value(
-    blob: BLOBProto,
+def _to_serialized_value(
     so: SerializedObjectInsideBLOB,
-    blob_store: BLOBStore,
+    so_data: bytearray,
+    so_hash: str,
     logger: InternalLogger,
 ) -> SerializedValue:
-    """Returns the raw bytes of the serialized object metadata and data from blob store."""
-    if not so.manifest.HasField("metadata_size"):
-        raise InternalError("SerializedObjectManifest is missing metadata_size.")
-
-    # Download each part separately to avoid splitting the downloaded data and consuming extra memory.
-    serialized_metadata: bytearray | None = None
-    if so.manifest.metadata_size > 0:
-        serialized_metadata = blob_store.get(
-            blob=blob_proto_to_blob(blob),
-            offset=so.offset,
-            size=so.manifest.metadata_size,
-            logger=logger,
-        )
-
-    serialized_data: bytearray = blob_store.get(
-        blob=blob_proto_to_blob(blob),
-        offset=so.offset + so.manifest.metadata_size,
-        size=so.manifest.size - so.manifest.metadata_size,
-        logger=logger,
-    )
-
-    so_hash: str = _sha256_hexdigest(
-        b"" if serialized_metadata is None else serialized_metadata, serialized_data
-    )
+    """Verifies and splits the downloaded serialized object into metadata and data."""
     if so_hash != so.manifest.sha256_hash:
         logger.error(
             "serialized object data hash mismatch",
@@ -106,11 +102,16 @@ def _download_serialized_value(
         )
 
     metadata: ValueMetadata | None = None
-    if serialized_metadata is not None:
+    # Use the downloaded bytearray as is if there's no metadata. Otherwise, use memoryviews
+    # to avoid copying the data when splitting it.
+    serialized_data: bytearray | memoryview = so_data
+    if so.manifest.metadata_size > 0:
+        so_data_view: memoryview = memoryview(so_data)
         metadata = _deserialize_value_metadata(
             manifest=so.manifest,
-            serialized_metadata=serialized_metadata,
+            serialized_metadata=so_data_view[: so.manifest.metadata_size],
         )
+        serialized_data = so_data_view[so.manifest.metadata_size :]
 
     return SerializedValue(
         metadata=metadata,
@@ -123,7 +124,7 @@ def _download_serialized_value(
 
 def _deserialize_value_metadata(
     manifest: SerializedObjectManifest,
-    serialized_metadata: bytes,
+    serialized_metadata: bytes | memoryview,
 ) -> ValueMetadata:
     """Deserializes Serialized Object created by Python SDK into original value with sdk metadata."""
     value_metadata: ValueMetadata = deserialize_metadata(serialized_metadata)
@@ -146,10 +147,3 @@ def _deserialize_value_metadata(
     )
 
     return value_metadata
-
-
-def _sha256_hexdigest(metadata: bytes | bytearray, data: bytes | bytearray) -> str:
-    hasher = hashlib.sha256()
-    hasher.update(metadata)
-    hasher.update(data)
-    return hasher.hexdigest()
@@ -85,6 +85,9 @@ def future_durable_id(
     elif isinstance(future, MapFuture):
         # Future specific metadata, part of durable ID.
         durable_id_attrs.append(f"MAP_OPERATION:{future._function_name}")
+        if future._batch_size is not None:
+            # Only added when set to keep durable IDs of existing map operations unchanged.
+            durable_id_attrs.append(f"BATCH_SIZE:{future._batch_size}")
         items: Future | list[_TensorlakeFutureWrapper[Future] | Any] = _unwrap_future(
             future._items
         )
@@ -105,6 +108,9 @@ def future_durable_id(
     elif isinstance(future, ReduceOperationFuture):
         # Future specific metadata, part of durable ID.
         durable_id_attrs.extend(["ReduceOperation", future._function_name])
+        if future._associative:
+            # Only added when set to keep durable IDs of existing reduce operations unchanged.
+            durable_id_attrs.append("Associative")
 
         _add_future_durable_id(
             value=future._initial,
@@ -34,6 +34,9 @@ from tensorlake.applications.metadata import SPLITTER_INPUT_MODE
 from tensorlake.applications.request_context.contextvar import (
     set_current_request_context,
 )
+from tensorlake.applications.request_context.http_client.context import (
+    RequestContextHTTPClient,
+)
 
 from ..contextvars import set_allocation_id_context_variable
 from .durable_id import future_durable_id
@@ -287,12 +290,14 @@ class AllocationEventLoop:
             )
             return
         except BaseException as e:
+            self._flush_request_context()
             self._output_event_queue.put(
                 OutputEventBatch(events=[OutputEventFinishAllocation(user_exception=e)])
             )
             return
 
         # This is our code.
+        self._flush_request_context()
         output: Any | Future = _unwrap_future(output)
         if isinstance(output, Future):
             self._handle_tail_call_user_function_output(output)
@@ -301,6 +306,14 @@ class AllocationEventLoop:
                 OutputEventBatch(events=[OutputEventFinishAllocation(value=output)])
             )
 
+    def _flush_request_context(self) -> None:
+        """Flushes request state writes, metrics and progress updates buffered by the allocation.
+
+        Raises InternalError on error.
+        """
+        if isinstance(self._request_context, RequestContextHTTPClient):
+            self._request_context.flush()
+
     def _handle_tail_call_user_function_output(self, output: Future) -> None:
         function_calls: list[OutputEventCreateFunctionCall] = []
         # This is our code.
@@ -409,6 +422,8 @@ class AllocationEventLoop:
         if len(function_call_output_events) == 0:
             return
 
+        # The function calls must see request state written by the allocation.
+        self._flush_request_context()
         pending_durable_ids: list[str] = [
             event.durable_id for event in function_call_output_events
         ]
@@ -730,6 +745,7 @@ class AllocationEventLoop:
                     is_map_splitter=True,
                     splitter_function_name=user_future._function_name,
                     splitter_input_mode=splitter_input_mode,
+                    map_batch_size=user_future._batch_size,
                 ),
             )
         ]
@@ -776,6 +792,7 @@ class AllocationEventLoop:
                     is_reduce_splitter=True,
                     splitter_function_name=user_future._function_name,
                     splitter_input_mode=splitter_input_mode,
+                    is_associative_reduce=user_future._associative,
                 ),
             )
         ]
@@ -795,14 +812,20 @@ class AllocationEventLoop:
 
         special_settings: SpecialFunctionCallSettings | None = None
         if (
-            is_tail_call_output
-            and self._special_settings is not None
+            self._special_settings is not None
             and self._special_settings.is_map_splitter
         ):
-            # Tail call output of map splitter is map concat call.
-            special_settings = SpecialFunctionCallSettings(
-                is_map_concat=True,
-            )
+            if is_tail_call_output:
+                # Tail call output of map splitter is map concat call.
+                special_settings = SpecialFunctionCallSettings(
+                    is_map_concat=True,
+                    map_batch_size=self._special_settings.map_batch_size,
+                )
+            elif self._special_settings.map_batch_size is not None:
+                # Other Futures created by batched map splitter are map batch calls.
+                special_settings = SpecialFunctionCallSettings(
+                    is_map_batch=True,
+                )
 
         return [
             OutputEventCreateFunctionCall(
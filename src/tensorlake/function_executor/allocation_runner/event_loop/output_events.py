@@ -25,6 +25,9 @@ class SpecialFunctionCallSettings:
     splitter_function_name: str | None = None
     splitter_input_mode: SPLITTER_INPUT_MODE | None = None
     is_map_concat: bool = False
+    is_associative_reduce: bool = False
+    map_batch_size: int | None = None
+    is_map_batch: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 from typing import Any
 
 from tensorlake.applications import (
@@ -6,6 +8,7 @@ from tensorlake.applications import (
     InternalError,
     SDKUsageError,
 )
+from tensorlake.applications.interface.futures import _unwrap_future
 from tensorlake.applications.internal_logger import InternalLogger
 from tensorlake.applications.metadata import SPLITTER_INPUT_MODE
 from tensorlake.applications.registry import get_function
@@ -21,9 +24,11 @@ def special_function_call(
     logger: InternalLogger,
 ) -> Any | Future:
     if settings.is_map_concat:
-        return _map_concat(args, logger)
+        return _map_concat(settings, args, logger)
     elif settings.is_map_splitter:
         return _map_splitter(settings, function, args, logger)
+    elif settings.is_map_batch:
+        return _map_batch(function, args, kwargs, logger)
     elif settings.is_reduce_splitter:
         return _reduce_splitter(settings, args, kwargs, logger)
     else:
@@ -54,18 +59,62 @@ def _map_splitter(
         map_inputs = args
 
     # Important: use tail calls to optimize.
-    map_futures: list[Future] = [
-        map_function.future(map_input) for map_input in map_inputs
-    ]
+    map_futures: list[Future]
+    if settings.map_batch_size is None:
+        map_futures = [map_function.future(map_input) for map_input in map_inputs]
+    else:
+        # Each map batch function call gets a list of its map inputs as its only argument.
+        map_futures = [
+            map_function.future(map_inputs[ix : ix + settings.map_batch_size])
+            for ix in range(0, len(map_inputs), settings.map_batch_size)
+        ]
     return function.future(*map_futures)
 
 
 def _map_concat(
+    settings: SpecialFunctionCallSettings,
     args: list[Any],
     logger: InternalLogger,
 ) -> list[Any]:
     logger.info("running map concat special function call")
-    return args
+    if settings.map_batch_size is None:
+        return args
+    # Each arg is a list of map batch outputs.
+    return [output for batch_outputs in args for output in batch_outputs]
+
+
+def _map_batch(
+    function: Function,
+    args: list[Any],
+    kwargs: dict[str, Any],
+    logger: InternalLogger,
+) -> list[Any]:
+    logger.info("running map batch special function call")
+
+    # The last arg is the list of map inputs, the args before it are i.e. self of a method.
+    *prefix_args, map_inputs = args
+    if inspect.iscoroutinefunction(function):
+
+        async def map_batch() -> list[Any]:
+            return [
+                await function._original_function(*prefix_args, map_input, **kwargs)
+                for map_input in map_inputs
+            ]
+
+        outputs: list[Any] = asyncio.run(map_batch())
+    else:
+        outputs: list[Any] = [
+            function._original_function(*prefix_args, map_input, **kwargs)
+            for map_input in map_inputs
+        ]
+
+    for output in outputs:
+        if isinstance(_unwrap_future(output), Future):
+            raise SDKUsageError(
+                f"{function} returned a Future from a batched map operation, "
+                "only values can be returned from batched map operations"
+            )
+    return outputs
 
 
 def _reduce_splitter(
@@ -98,6 +147,10 @@ def _reduce_splitter(
     if len(reduce_inputs) == 1:
         return reduce_inputs[0]
 
+    if settings.is_associative_reduce:
+        # Important: use tail calls to optimize.
+        return _reduce_tree(reduce_function, reduce_inputs)
+
     # Create a chain of function calls to reduce all args one by one.
     # Ordering of calls is important here. We should reduce ["a", "b", "c", "d"]
     # using string concat function into "abcd".
@@ -109,3 +162,24 @@ def _reduce_splitter(
 
     # Important: use tail calls to optimize.
     return last_future
+
+
+def _reduce_tree(reduce_function: Function, reduce_inputs: list[Any]) -> Future:
+    """Returns a balanced tree of reduce function calls over at least two inputs.
+
+    Adjacent inputs are reduced pairwise level by level so ordering of the inputs is preserved,
+    i.e. ["a", "b", "c", "d", "e"] is reduced as ((a+b)+(c+d))+e. The tree depth is log2(len(reduce_inputs)).
+    The Futures are created in a deterministic order so their durable IDs are the same on replay.
+    """
+    level: list[Any] = reduce_inputs
+    while len(level) > 1:
+        next_level: list[Any] = [
+            reduce_function.future(level[ix], level[ix + 1])
+            for ix in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2 == 1:
+            # Odd item gets reduced on the next level.
+            next_level.append(level[-1])
+        level = next_level
+
+    return level[0]
@@ -16,7 +16,10 @@ from tensorlake.applications.function.user_data_serializer import (
 )
 from tensorlake.applications.internal_logger import InternalLogger
 from tensorlake.applications.registry import get_function
-from tensorlake.applications.user_data_serializer import UserDataSerializer
+from tensorlake.applications.user_data_serializer import (
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
+    UserDataSerializer,
+)
 
 from ..proto.function_executor_pb2 import (
     BLOB,
@@ -259,6 +262,13 @@ class EventLoopOutputEventConverter:
             output_serializer_name_override = (
                 self._output_value_serializer_name_override
             )
+        elif (
+            output_event.special_settings is not None
+            and output_event.special_settings.is_map_batch
+        ):
+            # Map batch output is a list of map function outputs consumed only by map concat.
+            # Always pickle it because serializers like json don't preserve types of list items.
+            output_serializer_name_override = SDK_FUNCTION_CALL_SERIALIZER_NAME
         elif (
             output_event.special_settings is not None
             and output_event.special_settings.splitter_function_name is not None
@@ -1,5 +1,3 @@
-import time
-
 from tensorlake.applications.internal_logger import InternalLogger
 from tensorlake.applications.request_context.http_server.handlers.progress_update import (
     FunctionProgressUpdateRequest,
@@ -39,10 +37,4 @@ class AllocationProgress:
             local_mode=False,
         )
 
-        # sleep(0) here momentarily to give us a chance to send the progress update from allocation state to Executor.
-        # This is solves a hypothetical problem that we might return to running user code and lock GIL and Executor
-        # won't get the progress update. A proper fix for this is so add a reply message from Executor to acknowledge
-        # progress update received, but this is more involved change.
-        time.sleep(0)
-
         return FunctionProgressUpdateResponse()
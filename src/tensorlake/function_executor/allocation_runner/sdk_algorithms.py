@@ -12,9 +12,9 @@ from tensorlake.applications.function.function_call import (
     set_self_arg,
 )
 from tensorlake.applications.function.type_hints import (
-    function_parameters,
+    FunctionCallPlan,
+    function_call_plan,
     is_raw_body_type_hint,
-    parameter_type_hint,
 )
 from tensorlake.applications.function.user_data_serializer import (
     deserialize_value_with_metadata,
@@ -115,9 +115,9 @@ def deserialize_application_function_call_args(
         )
     else:
         # Current mode for application function calls with a single argument.
-        parameters = function_parameters(function)
-        expects_raw_body = bool(parameters) and is_raw_body_type_hint(
-            parameter_type_hint(parameters[0])
+        call_plan: FunctionCallPlan = function_call_plan(function)
+        expects_raw_body = bool(call_plan.parameters) and is_raw_body_type_hint(
+            call_plan.parameter_type_hints[call_plan.parameters[0].name]
         )
         content_type = (
             payload.content_type
@@ -328,6 +328,9 @@ def output_event_to_execution_plan_updates(
         ),
         is_map_concat=settings.is_map_concat if settings else False,
         is_reduce_splitter=settings.is_reduce_splitter if settings else False,
+        is_associative_reduce=settings.is_associative_reduce if settings else False,
+        map_batch_size=settings.map_batch_size if settings else None,
+        is_map_batch=settings.is_map_batch if settings else False,
     )
     function_pb_args: list[FunctionArg] = []
 
@@ -1,5 +1,6 @@
 import hashlib
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 from tensorlake.applications.blob_store import BLOBStore
@@ -17,11 +18,19 @@ from ..proto.function_executor_pb2 import (
 from .blob_utils import blob_proto_to_blob, blob_to_blob_proto
 from .value import SerializedValue
 
+# Outputs smaller than this are hashed before the upload because starting a hashing
+# thread costs more than hashing them.
+_CONCURRENT_HASHING_MIN_SIZE: int = 1 * 1024 * 1024  # 1 MB
+
 
 def serialized_values_to_serialized_objects(
     serialized_values: Dict[str, SerializedValue],
 ) -> Tuple[Dict[str, SerializedObjectInsideBLOB], List[bytes]]:
-    """Converts SerializedValues to SerializedObjectInsideBLOB and returns (SOs keyed by value IDs, SOs blob_data)."""
+    """Converts SerializedValues to SerializedObjectInsideBLOB and returns (SOs keyed by value IDs, SOs blob_data).
+
+    The returned SOs don't have their sha256 hashes set. They get set by upload_serialized_objects_to_blob.
+    blob_data contains metadata and data of each SO in the order of the returned SOs.
+    """
     serialized_objects: Dict[str, SerializedObjectInsideBLOB] = {}
     blob_data: List[bytes] = []
     blob_offset: int = 0
@@ -48,9 +57,6 @@ def serialized_values_to_serialized_objects(
                 encoding_version=encoding_version,
                 size=len(serialized_metadata) + len(serialized_value.data),
                 metadata_size=len(serialized_metadata),
-                sha256_hash=_sha256_hexdigest(
-                    serialized_metadata, serialized_value.data
-                ),
                 content_type=serialized_value.content_type,
             ),
             offset=blob_offset,
@@ -70,7 +76,10 @@ def upload_serialized_objects_to_blob(
     blob_store: BLOBStore,
     logger: InternalLogger,
 ) -> BLOBProto:
-    """Uploads serialized values to the destination blob and returns uploaded BLOB with all chunks used."""
+    """Uploads serialized values to the destination blob and returns uploaded BLOB with all chunks used.
+
+    Sets sha256 hashes of the serialized objects. The hashes are computed while the data is uploaded.
+    """
 
     total_size: int = sum(len(data) for data in blob_data)
     start_time = time.monotonic()
@@ -79,12 +88,30 @@ def upload_serialized_objects_to_blob(
         objects_count=len(serialized_objects),
         total_size=total_size,
     )
-    uploaded_blob: BLOBProto = _put_data_to_blob(
-        blob_data=blob_data,
-        destination=destination_blob,
-        blob_store=blob_store,
-        logger=logger,
-    )
+    if total_size < _CONCURRENT_HASHING_MIN_SIZE:
+        _set_sha256_hashes(serialized_objects, blob_data)
+        uploaded_blob: BLOBProto = _put_data_to_blob(
+            blob_data=blob_data,
+            destination=destination_blob,
+            blob_store=blob_store,
+            logger=logger,
+        )
+    else:
+        # Hashing releases GIL for large buffers so it runs in parallel with the upload
+        # instead of being an extra pass over all the data before the upload.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="OutputHasher"
+        ) as hashing_pool:
+            hashing: Future = hashing_pool.submit(
+                _set_sha256_hashes, serialized_objects, blob_data
+            )
+            uploaded_blob: BLOBProto = _put_data_to_blob(
+                blob_data=blob_data,
+                destination=destination_blob,
+                blob_store=blob_store,
+                logger=logger,
+            )
+            hashing.result()
     logger.info(
         "uploaded serialized objects to blob",
         objects_count=len(serialized_objects),
@@ -156,6 +183,17 @@ def _put_data_to_blob(
     )
 
 
+def _set_sha256_hashes(
+    serialized_objects: Dict[str, SerializedObjectInsideBLOB],
+    blob_data: List[bytes],
+) -> None:
+    """Sets sha256 hashes of the SOs using their metadata and data from blob_data."""
+    for ix, so in enumerate(serialized_objects.values()):
+        so.manifest.sha256_hash = _sha256_hexdigest(
+            blob_data[2 * ix], blob_data[2 * ix + 1]
+        )
+
+
 def _sha256_hexdigest(metadata: bytes, data: bytes) -> str:
     hasher = hashlib.sha256()
     hasher.update(metadata)
@@ -14,20 +14,21 @@ class AddMetricsHandler(BaseAddMetricsHandler):
         super().__init__()
 
     def _handle(self, request: AddMetricsRequest) -> AddMetricsResponse:
-        if request.counter is not None:
+        for counter in request.all_counters():
             print_counter_incremented_event(
                 request_id=request.request_id,
                 function_name=request.function_name,
-                counter_name=request.counter.name,
-                counter_value=request.counter.value,
-                local_mode=False,
-            )
-        if request.timer is not None:
-            print_timer_recorded_event(
-                request_id=request.request_id,
-                function_name=request.function_name,
-                timer_name=request.timer.name,
-                timer_value=request.timer.value,
+                counter_name=counter.name,
+                counter_value=counter.value,
                 local_mode=False,
             )
+        for timer in request.all_timers():
+            for value in timer.values:
+                print_timer_recorded_event(
+                    request_id=request.request_id,
+                    function_name=request.function_name,
+                    timer_name=timer.name,
+                    timer_value=value,
+                    local_mode=False,
+                )
         return AddMetricsResponse()
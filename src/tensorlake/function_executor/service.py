@@ -37,6 +37,15 @@ from tensorlake.applications.remote.code.zip import (
 from tensorlake.applications.request_context.http_client.context import (
     RequestContextHTTPClient,
 )
+from tensorlake.applications.request_context.http_client.metrics import (
+    RequestMetricsBatchingConfig,
+)
+from tensorlake.applications.request_context.http_client.progress import (
+    FunctionProgressRateLimitConfig,
+)
+from tensorlake.applications.request_context.http_client.state import (
+    RequestStateCacheConfig,
+)
 from tensorlake.applications.request_context.http_client.transport import (
     RequestContextHTTPTransport,
 )
@@ -140,6 +149,18 @@ class Service(FunctionExecutorServicer):
         self._request_context_http_server: RequestContextHTTPServer | None = None
         self._request_context_http_server_thread: threading.Thread | None = None
         self._request_context_http_client: RequestContextHTTPTransport | None = None
+        # None if the request state cache is disabled.
+        self._request_state_cache_config: RequestStateCacheConfig | None = (
+            RequestStateCacheConfig.from_env()
+        )
+        # None if request metrics batching is disabled.
+        self._request_metrics_batching_config: RequestMetricsBatchingConfig | None = (
+            RequestMetricsBatchingConfig.from_env()
+        )
+        # None if function progress rate limiting is disabled.
+        self._function_progress_rate_limit_config: (
+            FunctionProgressRateLimitConfig | None
+        ) = FunctionProgressRateLimitConfig.from_env()
         self._health_check_handler: HealthCheckHandler | None = None
         self._initialization_lock = threading.Lock()
         self._initialization_condition = threading.Condition()
@@ -320,14 +341,20 @@ class Service(FunctionExecutorServicer):
             )
             available_cpu_count: int = int(function._function_config.cpu)
             blob_store = BLOBStore(available_cpu_count=available_cpu_count)
-            request_context_http_server = RequestContextHTTPServer(
-                server_router_class=RequestContextHTTPHandlerFactory(
+            request_context_http_handler_factory: RequestContextHTTPHandlerFactory = (
+                RequestContextHTTPHandlerFactory(
                     allocation_infos=self._allocation_infos,
                     logger=self._logger,
-                ),
+                )
+            )
+            request_context_http_server = RequestContextHTTPServer(
+                server_router_class=request_context_http_handler_factory,
             )
+            # The server is used by user subprocesses, the Function Executor process calls the handlers directly.
             request_context_http_client = RequestContextHTTPClient.create_http_client(
-                server_base_url=request_context_http_server.base_url
+                server_base_url=request_context_http_server.base_url,
+                routes=request_context_http_handler_factory.routes,
+                logger=self._logger,
             )
             health_check_handler = HealthCheckHandler(self._logger)
 
@@ -513,6 +540,9 @@ class Service(FunctionExecutorServicer):
                 blob_store=self._blob_store,
                 logger=allocation_logger,
                 headers=request_headers,
+                request_state_cache_config=self._request_state_cache_config,
+                request_metrics_batching_config=self._request_metrics_batching_config,
+                function_progress_rate_limit_config=self._function_progress_rate_limit_config,
             ),
             logger=allocation_logger,
         )
@@ -1,7 +1,25 @@
+from typing import TYPE_CHECKING
+
+from tensorlake._lazy import lazy_exports
+
 from .image import Image
-from .sandbox_builder import (
-    delete_sandbox_image,
-    find_sandbox_image_by_name,
-    import_sandbox_image,
-    list_sandbox_images,
+
+if TYPE_CHECKING:
+    from .sandbox_builder import (
+        delete_sandbox_image,
+        find_sandbox_image_by_name,
+        import_sandbox_image,
+        list_sandbox_images,
+    )
+
+# Image is used by every application definition, the sandbox image builder
+# and its HTTP client dependencies are only imported when used.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "delete_sandbox_image": ".sandbox_builder",
+        "find_sandbox_image_by_name": ".sandbox_builder",
+        "import_sandbox_image": ".sandbox_builder",
+        "list_sandbox_images": ".sandbox_builder",
+    },
 )
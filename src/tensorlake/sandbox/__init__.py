@@ -8,6 +8,7 @@ from .exceptions import (
     PoolInUseError,
     PoolNotFoundError,
     RemoteAPIError,
+    SandboxBatchError,
     SandboxConnectionError,
     SandboxError,
     SandboxException,
@@ -18,6 +19,8 @@ from .file_system import (
     delete_file_system,
     list_file_systems,
 )
+from .file_transfer import AsyncFileReadStream, FileReadStream
+from .fleet import SandboxFleet
 from .models import (
     CLEAR_NETWORK_POLICY,
     ArchivedSandboxInfo,
@@ -32,6 +35,7 @@ from .models import (
     CreateSnapshotResponse,
     DaemonInfo,
     DirectoryEntry,
+    DirectorySyncResult,
     FileSystem,
     FileSystemMount,
     GpuModel,
@@ -74,6 +78,7 @@ from .models import (
     StdinMode,
     sandbox_url_from_ingress_endpoint,
 )
+from .output_stream import AsyncOutputStream, OutputStream
 from .pty import AsyncPty, Pty
 from .sandbox import Sandbox
 
@@ -81,11 +86,16 @@ __all__ = [
     # Lifecycle management
     "SandboxClient",
     "AsyncSandboxClient",
+    "SandboxFleet",
     # Sandbox interaction
     "Sandbox",
     "AsyncSandbox",
     "Pty",
     "AsyncPty",
+    "OutputStream",
+    "AsyncOutputStream",
+    "FileReadStream",
+    "AsyncFileReadStream",
     "Desktop",
     # Lifecycle models
     "SandboxStatus",
@@ -122,6 +132,7 @@ __all__ = [
     "CreateSnapshotResponse",
     # Command result
     "CommandResult",
+    "DirectorySyncResult",
     # Process models
     "ProcessStatus",
     "RestartPolicy",
@@ -159,4 +170,5 @@ __all__ = [
     "PoolNotFoundError",
     "PoolInUseError",
     "RemoteAPIError",
+    "SandboxBatchError",
 ]
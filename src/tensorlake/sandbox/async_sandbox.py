@@ -11,7 +11,7 @@ import asyncio
 import json
 import os
 from collections.abc import Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import httpx
@@ -20,6 +20,14 @@ from tensorlake._tracing import USER_AGENT, Traced, TracedIterator, inject_trace
 
 from . import _defaults
 from .exceptions import RemoteAPIError, SandboxConnectionError, SandboxError
+from .file_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_PARALLELISM,
+    DEFAULT_DOWNLOAD_PART_SIZE,
+    AsyncFileReadStream,
+    async_download_file,
+    open_async_file_stream,
+)
 from .models import (
     CheckpointType,
     ClearNetworkPolicy,
@@ -51,11 +59,17 @@ from .models import (
     SnapshotWaitCondition,
     StdinMode,
 )
+from .output_stream import (
+    AsyncOutputStream,
+    _CommandOutputFiles,
+    open_async_output_stream,
+)
 from .sandbox import (
     _PROCESS_ARG_UNSET,
     _RUST_SANDBOX_PROXY_CLIENT_AVAILABLE,
     RustCloudSandboxProxyClient,
     Sandbox,
+    _output_follow_path,
     _raise_as_sandbox_error,
     _resolve_process_arg,
     _validate_managed_name_client_side,
@@ -121,6 +135,7 @@ class AsyncSandbox:
         self._project_id = project_id
         self._request_timeout = request_timeout
         self._explicit_proxy_url = _explicit_proxy_url
+        self._routing_hint = routing_hint
         self._set_proxy_transport(proxy_url, sandbox_identifier)
 
         if _proxy_rust_client is not None:
@@ -166,6 +181,9 @@ class AsyncSandbox:
             self._proxy_headers["Host"] = self._host_header
         else:
             self._proxy_headers["X-Tensorlake-Sandbox-Id"] = sandbox_identifier
+        # Same routing header as the Rust proxy client sends.
+        if self._routing_hint:
+            self._proxy_headers["X-Tensorlake-Route-Hint"] = self._routing_hint
 
     def _rebind_proxy(self, info: SandboxInfo) -> None:
         self._require_lifecycle_client("refresh proxy routing")
@@ -200,6 +218,7 @@ class AsyncSandbox:
 
         self._rust_client = new_rust_client
         self._base_url = self._rust_client.base_url()
+        self._routing_hint = info.routing_hint
         self._set_proxy_transport(proxy_url, info.sandbox_id)
         self._cached_info = info
         self._sandbox_id = info.sandbox_id
@@ -638,7 +657,20 @@ class AsyncSandbox:
         working_dir: str | None = None,
         timeout: float | None = None,
         user: ProcessUser | None = None,
+        *,
+        stdout_path: str | os.PathLike[str] | None = None,
+        stderr_path: str | os.PathLike[str] | None = None,
     ) -> Traced[CommandResult]:
+        if stdout_path is not None or stderr_path is not None:
+            output = _CommandOutputFiles(stdout_path, stderr_path)
+            with output:
+                async with await self.stream_run(
+                    command, args, env, working_dir, timeout, user
+                ) as stream:
+                    async for event in stream:
+                        output.add(event)
+            return Traced(stream.trace_id, output.result(stream.exit_code))
+
         process_user = Sandbox._normalize_process_user(user)
         payload = Sandbox._build_command_payload(
             command,
@@ -683,6 +715,37 @@ class AsyncSandbox:
             ),
         )
 
+    async def stream_run(
+        self,
+        command: str,
+        args: list[str] | None = None,
+        env: dict[str, str] | None = None,
+        working_dir: str | None = None,
+        timeout: float | None = None,
+        user: ProcessUser | None = None,
+    ) -> AsyncOutputStream:
+        """Run a command and stream its output events as they are produced."""
+        payload = Sandbox._build_command_payload(
+            command,
+            args,
+            env,
+            working_dir,
+            timeout=timeout,
+            user=Sandbox._normalize_process_user(user),
+        )
+        return await self._open_output_stream("/api/v1/processes/run", payload)
+
+    async def _open_output_stream(
+        self, path: str, payload: dict[str, Any] | None = None
+    ) -> AsyncOutputStream:
+        return await open_async_output_stream(
+            self._base_url,
+            path,
+            self._proxy_headers,
+            payload,
+            connect_timeout=self._request_timeout,
+        )
+
     # --- Process management ---
 
     async def start_process(
@@ -931,6 +994,36 @@ class AsyncSandbox:
         except Exception as e:
             _raise_as_sandbox_error(e)
 
+    async def stream_stdout(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> AsyncOutputStream:
+        """Stream stdout output events by PID or process name as they are produced."""
+        seg = _resolve_process_arg(process, pid)
+        return await self._open_output_stream(_output_follow_path(seg, "stdout"))
+
+    async def stream_stderr(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> AsyncOutputStream:
+        """Stream stderr output events by PID or process name as they are produced."""
+        seg = _resolve_process_arg(process, pid)
+        return await self._open_output_stream(_output_follow_path(seg, "stderr"))
+
+    async def stream_output(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> AsyncOutputStream:
+        """Stream combined output events by PID or process name as they are produced."""
+        seg = _resolve_process_arg(process, pid)
+        return await self._open_output_stream(_output_follow_path(seg, "output"))
+
     # --- File operations ---
 
     async def read_file(self, path: str) -> Traced[bytes]:
@@ -960,6 +1053,52 @@ class AsyncSandbox:
         except Exception as e:
             _raise_as_sandbox_error(e)
 
+    async def read_file_range(
+        self, path: str, offset: int, length: int
+    ) -> Traced[bytes]:
+        async with await self.open_read(path, offset=offset, length=length) as stream:
+            return Traced(stream.trace_id, await stream.read())
+
+    async def open_read(
+        self,
+        path: str,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncFileReadStream:
+        """Open a file in the sandbox for streaming reads without loading it into memory."""
+        return await open_async_file_stream(
+            self._base_url,
+            self._proxy_headers,
+            path,
+            offset=offset,
+            length=length,
+            chunk_size=chunk_size,
+            request_timeout=self._request_timeout,
+        )
+
+    async def download_file(
+        self,
+        path: str,
+        local_path: str | os.PathLike[str],
+        *,
+        parallelism: int = DEFAULT_DOWNLOAD_PARALLELISM,
+        part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+        resume: bool = False,
+    ) -> Traced[None]:
+        trace_id = await async_download_file(
+            self._base_url,
+            self._proxy_headers,
+            path,
+            os.fspath(local_path),
+            parallelism=parallelism,
+            part_size=part_size,
+            resume=resume,
+            request_timeout=self._request_timeout,
+        )
+        return Traced(trace_id, None)
+
     async def delete_file(self, path: str) -> Traced[None]:
         try:
             trace_id = await self._rust_client.delete_file_async(path=path)
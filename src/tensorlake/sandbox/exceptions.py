@@ -74,3 +74,20 @@ class RemoteAPIError(SandboxError):
     @property
     def message(self) -> str:
         return self._message
+
+
+class SandboxBatchError(SandboxError):
+    """Raised when some operations of a batched fleet call fail.
+
+    All operations of the batch are attempted before this is raised.
+    ``errors`` maps the identifier of each failed sandbox to its error.
+    """
+
+    def __init__(self, operation: str, errors: dict[str, Exception]):
+        self._errors = errors
+        details = "; ".join(f"{key}: {error}" for key, error in errors.items())
+        super().__init__(f"{operation} failed for {len(errors)} sandbox(es): {details}")
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        return self._errors
@@ -0,0 +1,651 @@
+"""Ranged and streaming reads of sandbox files.
+
+Provides :class:`FileReadStream` (sync) and :class:`AsyncFileReadStream`
+(asyncio-based) plus resumable, parallel file downloads. Files are read from
+the sandbox daemon's ``GET /api/v1/files`` endpoint in chunks, so client
+memory doesn't grow with the file size.
+
+Ranges are requested with the HTTP ``Range`` header. Responses that ignore it
+still work: the bytes outside of the range are skipped while streaming, and
+downloads fall back to one sequential request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import re
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+import httpx
+
+from tensorlake._tracing import USER_AGENT, inject_traceparent
+
+from . import _defaults
+from .exceptions import RemoteAPIError, SandboxConnectionError, SandboxError
+
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+DEFAULT_DOWNLOAD_PART_SIZE: int = 64 * 1024 * 1024
+DEFAULT_DOWNLOAD_PARALLELISM: int = 4
+
+_CONTENT_RANGE_TOTAL = re.compile(r"^bytes (?:\d+-\d+|\*)/(\d+)$")
+
+
+def _validate_range(offset: int, length: int | None) -> None:
+    if offset < 0:
+        raise SandboxError(f"offset must be non-negative, got {offset}")
+    if length is not None and length < 0:
+        raise SandboxError(f"length must be non-negative, got {length}")
+
+
+def _validate_download_options(parallelism: int, part_size: int) -> None:
+    if parallelism < 1:
+        raise SandboxError(f"parallelism must be at least 1, got {parallelism}")
+    if part_size < 1:
+        raise SandboxError(f"part_size must be positive, got {part_size}")
+
+
+def _http_timeout(request_timeout: float | None) -> httpx.Timeout:
+    # Bounds every connect and chunk read, not the whole transfer.
+    return httpx.Timeout(
+        request_timeout
+        if request_timeout is not None
+        else _defaults.DEFAULT_HTTP_TIMEOUT_SEC
+    )
+
+
+def _build_file_request(
+    client: httpx.Client | httpx.AsyncClient,
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    offset: int,
+    length: int | None,
+) -> tuple[str, httpx.Request]:
+    request_headers = inject_traceparent({**headers, "User-Agent": USER_AGENT})
+    if length:
+        request_headers["Range"] = f"bytes={offset}-{offset + length - 1}"
+    elif offset > 0:
+        # Also used for empty ranges which have no Range header form, their
+        # readers stop before reading the body.
+        request_headers["Range"] = f"bytes={offset}-"
+    # Same trace ID format as the Rust client: the trace-id field of traceparent.
+    trace_id = request_headers["traceparent"].split("-")[1]
+    request = client.build_request(
+        "GET",
+        f"{base_url.rstrip('/')}/api/v1/files",
+        params={"path": path},
+        headers=request_headers,
+    )
+    return trace_id, request
+
+
+def _content_range_total(response: httpx.Response) -> int | None:
+    match = _CONTENT_RANGE_TOTAL.match(response.headers.get("content-range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _file_size(response: httpx.Response) -> int | None:
+    """Total size of the file served by a successful response, if known."""
+    if response.status_code == 206:
+        return _content_range_total(response)
+    content_length = response.headers.get("content-length")
+    return int(content_length) if content_length is not None else None
+
+
+class _ChunkSlicer:
+    """Cuts the requested range out of response chunks.
+
+    A partial content response already holds just the range. A full content
+    response holds the whole file, its bytes before ``offset`` and after
+    ``offset + length`` are dropped.
+    """
+
+    def __init__(self, response: httpx.Response, offset: int, length: int | None):
+        self._skip = 0 if response.status_code == 206 else offset
+        self._remaining = length
+
+    @property
+    def done(self) -> bool:
+        return self._remaining == 0
+
+    def slice(self, chunk: bytes) -> bytes:
+        if self._skip > 0:
+            skipped = min(self._skip, len(chunk))
+            self._skip -= skipped
+            chunk = chunk[skipped:]
+        if self._remaining is not None:
+            chunk = chunk[: self._remaining]
+            self._remaining -= len(chunk)
+        return chunk
+
+
+class FileReadStream(io.RawIOBase):
+    """Read-only binary file object streaming a sandbox file or its range.
+
+    Returned by ``Sandbox.open_read``. Works with :func:`shutil.copyfileobj`
+    and other consumers of file objects; :meth:`iter_chunks` yields the
+    received chunks directly. At most one chunk is held in memory. Close the
+    stream (or use it as a context manager) to release the connection.
+    """
+
+    def __init__(
+        self,
+        trace_id: str,
+        client: httpx.Client,
+        response: httpx.Response,
+        offset: int,
+        length: int | None,
+        chunk_size: int,
+    ) -> None:
+        super().__init__()
+        self.trace_id = trace_id
+        self._client = client
+        self._response = response
+        self._size = self._stream_size(response, offset, length)
+        self._chunks = self._read_chunks(
+            _ChunkSlicer(response, offset, length), chunk_size
+        )
+        self._buffer = b""
+
+    @staticmethod
+    def _stream_size(
+        response: httpx.Response, offset: int, length: int | None
+    ) -> int | None:
+        if response.status_code == 416:
+            return 0
+        file_size = _file_size(response)
+        if file_size is None:
+            return None
+        remaining = max(file_size - offset, 0)
+        return remaining if length is None else min(length, remaining)
+
+    @property
+    def size(self) -> int | None:
+        """Number of bytes the stream returns in total, ``None`` if the server didn't tell."""
+        return self._size
+
+    def _read_chunks(self, slicer: _ChunkSlicer, chunk_size: int) -> Iterator[bytes]:
+        if self._response.status_code == 416 or slicer.done:
+            return
+        try:
+            for chunk in self._response.iter_bytes(chunk_size):
+                chunk = slicer.slice(chunk)
+                if chunk:
+                    yield chunk
+                if slicer.done:
+                    return
+        except httpx.TransportError as e:
+            raise SandboxConnectionError(str(e)) from e
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yields the remaining bytes of the stream as they are received."""
+        if self._buffer:
+            buffer, self._buffer = self._buffer, b""
+            yield bytes(buffer)
+        yield from self._chunks
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._buffer:
+            self._buffer = memoryview(next(self._chunks, b""))
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def readall(self) -> bytes:
+        return b"".join(self.iter_chunks())
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection. Idempotent."""
+        if not self.closed:
+            self._response.close()
+            self._client.close()
+        super().close()
+
+
+class AsyncFileReadStream:
+    """Async counterpart of :class:`FileReadStream`, returned by ``AsyncSandbox.open_read``.
+
+    Iterate :meth:`iter_chunks` or call :meth:`read`. Close the stream with
+    :meth:`aclose` or use it as an async context manager.
+    """
+
+    def __init__(
+        self,
+        trace_id: str,
+        client: httpx.AsyncClient,
+        response: httpx.Response,
+        offset: int,
+        length: int | None,
+        chunk_size: int,
+    ) -> None:
+        self.trace_id = trace_id
+        self._client = client
+        self._response = response
+        self._size = FileReadStream._stream_size(response, offset, length)
+        self._chunks = self._read_chunks(
+            _ChunkSlicer(response, offset, length), chunk_size
+        )
+        self._buffer = b""
+
+    @property
+    def size(self) -> int | None:
+        """Number of bytes the stream returns in total, ``None`` if the server didn't tell."""
+        return self._size
+
+    async def _read_chunks(
+        self, slicer: _ChunkSlicer, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        if self._response.status_code == 416 or slicer.done:
+            return
+        try:
+            async for chunk in self._response.aiter_bytes(chunk_size):
+                chunk = slicer.slice(chunk)
+                if chunk:
+                    yield chunk
+                if slicer.done:
+                    return
+        except httpx.TransportError as e:
+            raise SandboxConnectionError(str(e)) from e
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """Yields the remaining bytes of the stream as they are received."""
+        if self._buffer:
+            buffer, self._buffer = self._buffer, b""
+            yield bytes(buffer)
+        async for chunk in self._chunks:
+            yield chunk
+
+    async def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes, all remaining bytes if ``size`` is negative."""
+        if size < 0:
+            return b"".join([chunk async for chunk in self.iter_chunks()])
+        if not self._buffer:
+            self._buffer = memoryview(await anext(self._chunks, b""))
+        data, self._buffer = bytes(self._buffer[:size]), self._buffer[size:]
+        return data
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection. Idempotent."""
+        await self._response.aclose()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncFileReadStream:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+
+def _check_file_response(response: httpx.Response) -> None:
+    # 416: the range starts at or after the end of the file, so it's empty.
+    if not response.is_success and response.status_code != 416:
+        raise RemoteAPIError(response.status_code, response.text)
+
+
+def _send_file_request(
+    client: httpx.Client,
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    offset: int,
+    length: int | None,
+) -> tuple[str, httpx.Response]:
+    trace_id, request = _build_file_request(
+        client, base_url, headers, path, offset, length
+    )
+    try:
+        response = client.send(request, stream=True)
+    except httpx.TransportError as e:
+        raise SandboxConnectionError(str(e)) from e
+    try:
+        if not response.is_success:
+            response.read()
+        _check_file_response(response)
+    except BaseException:
+        response.close()
+        raise
+    return trace_id, response
+
+
+async def _send_async_file_request(
+    client: httpx.AsyncClient,
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    offset: int,
+    length: int | None,
+) -> tuple[str, httpx.Response]:
+    trace_id, request = _build_file_request(
+        client, base_url, headers, path, offset, length
+    )
+    try:
+        response = await client.send(request, stream=True)
+    except httpx.TransportError as e:
+        raise SandboxConnectionError(str(e)) from e
+    try:
+        if not response.is_success:
+            await response.aread()
+        _check_file_response(response)
+    except BaseException:
+        await response.aclose()
+        raise
+    return trace_id, response
+
+
+def open_file_stream(
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    request_timeout: float | None = None,
+) -> FileReadStream:
+    """Sends a read request for the file range and returns its stream."""
+    _validate_range(offset, length)
+    client = httpx.Client(timeout=_http_timeout(request_timeout))
+    try:
+        trace_id, response = _send_file_request(
+            client, base_url, headers, path, offset, length
+        )
+    except BaseException:
+        client.close()
+        raise
+    return FileReadStream(trace_id, client, response, offset, length, chunk_size)
+
+
+async def open_async_file_stream(
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    offset: int = 0,
+    length: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    request_timeout: float | None = None,
+) -> AsyncFileReadStream:
+    """Async counterpart of :func:`open_file_stream`."""
+    _validate_range(offset, length)
+    client = httpx.AsyncClient(timeout=_http_timeout(request_timeout))
+    try:
+        trace_id, response = await _send_async_file_request(
+            client, base_url, headers, path, offset, length
+        )
+    except BaseException:
+        await client.aclose()
+        raise
+    return AsyncFileReadStream(trace_id, client, response, offset, length, chunk_size)
+
+
+def _truncate_to_downloaded_prefix(
+    local_path: str, parts: list[tuple[int, int]], completed: list[bool]
+) -> None:
+    """Drops the bytes after the first part that wasn't downloaded.
+
+    Keeps the file a prefix of the sandbox file, so ``resume`` can continue it.
+    """
+    end = parts[0][0]
+    for (offset, length), part_completed in zip(parts, completed):
+        if not part_completed:
+            break
+        end = offset + length
+    with open(local_path, "r+b") as file:
+        file.truncate(end)
+
+
+def _split_into_parts(start: int, size: int, part_size: int) -> list[tuple[int, int]]:
+    return [
+        (offset, min(part_size, size - offset))
+        for offset in range(start, size, part_size)
+    ]
+
+
+def _check_part_length(path: str, written: int, length: int) -> None:
+    if written != length:
+        raise SandboxConnectionError(
+            f"download of {path} ended after {written} of {length} bytes of a part"
+        )
+
+
+def _prepare_local_file(local_path: str, size: int) -> None:
+    """Creates the local file or cuts it to the given size."""
+    with open(local_path, "r+b" if os.path.exists(local_path) else "wb") as file:
+        file.truncate(size)
+
+
+def _resumable_size(local_path: str, resume: bool) -> int:
+    if resume and os.path.isfile(local_path):
+        return os.path.getsize(local_path)
+    return 0
+
+
+def _write_chunks(
+    file: IO[bytes], chunks: Iterator[bytes], slicer: _ChunkSlicer
+) -> int:
+    written = 0
+    try:
+        for chunk in chunks:
+            chunk = slicer.slice(chunk)
+            file.write(chunk)
+            written += len(chunk)
+            if slicer.done:
+                break
+    except httpx.TransportError as e:
+        raise SandboxConnectionError(str(e)) from e
+    return written
+
+
+async def _write_async_chunks(
+    file: IO[bytes], chunks: AsyncIterator[bytes], slicer: _ChunkSlicer
+) -> int:
+    written = 0
+    try:
+        async for chunk in chunks:
+            chunk = slicer.slice(chunk)
+            file.write(chunk)
+            written += len(chunk)
+            if slicer.done:
+                break
+    except httpx.TransportError as e:
+        raise SandboxConnectionError(str(e)) from e
+    return written
+
+
+def _first_request_length(parallelism: int, part_size: int) -> int | None:
+    # Parallel downloads request the first part on its own. The response tells
+    # if the server supports ranges and the file size, and it's the first part.
+    return part_size if parallelism > 1 else None
+
+
+class _DownloadPlan:
+    """Where the first response of a download goes and which parts are left."""
+
+    def __init__(
+        self, response: httpx.Response, start: int, length: int | None, part_size: int
+    ):
+        size = _file_size(response)
+        if response.status_code != 206 or size is None:
+            # The whole file is in the response body.
+            self.body_start = 0
+            self.body_length = None
+            self.parts = []
+            return
+        end = size if length is None else min(start + length, size)
+        self.body_start = start
+        self.body_length = end - start
+        self.parts = _split_into_parts(end, size, part_size)
+
+
+def download_file(
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    local_path: str,
+    parallelism: int = DEFAULT_DOWNLOAD_PARALLELISM,
+    part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+    resume: bool = False,
+    request_timeout: float | None = None,
+) -> str:
+    """Downloads a sandbox file to a local path, returns the trace ID of the first request.
+
+    Files larger than ``part_size`` are downloaded with up to ``parallelism``
+    concurrent ranged requests. With ``resume`` an existing local file is
+    treated as an already downloaded prefix of the sandbox file. A failed
+    download leaves the downloaded prefix in the local file.
+    """
+    _validate_download_options(parallelism, part_size)
+    start = _resumable_size(local_path, resume)
+    length = _first_request_length(parallelism, part_size)
+    with httpx.Client(
+        timeout=_http_timeout(request_timeout),
+        limits=httpx.Limits(max_connections=parallelism),
+    ) as client:
+        trace_id, response = _send_file_request(
+            client, base_url, headers, path, start, length
+        )
+        try:
+            if response.status_code == 416:
+                if _content_range_total(response) == start:
+                    _prepare_local_file(local_path, start)
+                    return trace_id  # Already downloaded.
+                # The local file isn't a prefix of the sandbox file.
+                response.close()
+                start = 0
+                _, response = _send_file_request(
+                    client, base_url, headers, path, start, length
+                )
+            plan = _DownloadPlan(response, start, length, part_size)
+            _prepare_local_file(local_path, plan.body_start)
+            with open(local_path, "r+b") as file:
+                file.seek(plan.body_start)
+                _write_chunks(
+                    file,
+                    response.iter_bytes(DEFAULT_CHUNK_SIZE),
+                    _ChunkSlicer(response, plan.body_start, plan.body_length),
+                )
+        finally:
+            response.close()
+        if not plan.parts:
+            return trace_id
+
+        parts = plan.parts
+        completed = [False] * len(parts)
+
+        def download_part(index: int) -> None:
+            offset, length = parts[index]
+            _, part_response = _send_file_request(
+                client, base_url, headers, path, offset, length
+            )
+            try:
+                with open(local_path, "r+b") as file:
+                    file.seek(offset)
+                    written = _write_chunks(
+                        file,
+                        part_response.iter_bytes(DEFAULT_CHUNK_SIZE),
+                        _ChunkSlicer(part_response, offset, length),
+                    )
+            finally:
+                part_response.close()
+            _check_part_length(path, written, length)
+            completed[index] = True
+
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [executor.submit(download_part, i) for i in range(len(parts))]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+                _truncate_to_downloaded_prefix(local_path, parts, completed)
+                raise
+    return trace_id
+
+
+async def async_download_file(
+    base_url: str,
+    headers: dict[str, str],
+    path: str,
+    local_path: str,
+    parallelism: int = DEFAULT_DOWNLOAD_PARALLELISM,
+    part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+    resume: bool = False,
+    request_timeout: float | None = None,
+) -> str:
+    """Async counterpart of :func:`download_file`."""
+    _validate_download_options(parallelism, part_size)
+    start = _resumable_size(local_path, resume)
+    length = _first_request_length(parallelism, part_size)
+    async with httpx.AsyncClient(
+        timeout=_http_timeout(request_timeout),
+        limits=httpx.Limits(max_connections=parallelism),
+    ) as client:
+        trace_id, response = await _send_async_file_request(
+            client, base_url, headers, path, start, length
+        )
+        try:
+            if response.status_code == 416:
+                if _content_range_total(response) == start:
+                    _prepare_local_file(local_path, start)
+                    return trace_id  # Already downloaded.
+                # The local file isn't a prefix of the sandbox file.
+                await response.aclose()
+                start = 0
+                _, response = await _send_async_file_request(
+                    client, base_url, headers, path, start, length
+                )
+            plan = _DownloadPlan(response, start, length, part_size)
+            _prepare_local_file(local_path, plan.body_start)
+            with open(local_path, "r+b") as file:
+                file.seek(plan.body_start)
+                await _write_async_chunks(
+                    file,
+                    response.aiter_bytes(DEFAULT_CHUNK_SIZE),
+                    _ChunkSlicer(response, plan.body_start, plan.body_length),
+                )
+        finally:
+            await response.aclose()
+        if not plan.parts:
+            return trace_id
+
+        parts = plan.parts
+        completed = [False] * len(parts)
+        semaphore = asyncio.Semaphore(parallelism)
+
+        async def download_part(index: int) -> None:
+            offset, length = parts[index]
+            async with semaphore:
+                _, part_response = await _send_async_file_request(
+                    client, base_url, headers, path, offset, length
+                )
+                try:
+                    with open(local_path, "r+b") as file:
+                        file.seek(offset)
+                        written = await _write_async_chunks(
+                            file,
+                            part_response.aiter_bytes(DEFAULT_CHUNK_SIZE),
+                            _ChunkSlicer(part_response, offset, length),
+                        )
+                finally:
+                    await part_response.aclose()
+            _check_part_length(path, written, length)
+            completed[index] = True
+
+        tasks = [asyncio.create_task(download_part(i)) for i in range(len(parts))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            _truncate_to_downloaded_prefix(local_path, parts, completed)
+            raise
+    return trace_id
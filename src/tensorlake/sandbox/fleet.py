@@ -0,0 +1,416 @@
+"""Fleet-level management of many sandboxes through one shared client.
+
+``Sandbox.create()`` and ``Sandbox.connect()`` build a new API client, and
+with it a new HTTP connection pool, for every sandbox. :class:`SandboxFleet`
+keeps one :class:`SandboxClient` for all its sandboxes instead. Sandbox
+handles are connected through that client, so their proxy requests share
+its pooled HTTP/2 connections.
+
+Waiting for status transitions of many sandboxes costs one list request per
+round for the whole fleet instead of one get request per sandbox.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from . import _defaults
+from .client import SandboxClient, _startup_failure_message
+from .exceptions import SandboxBatchError, SandboxError
+from .models import CreateSandboxResponse, SandboxInfo, SandboxStatus
+from .sandbox import Sandbox
+
+DEFAULT_FLEET_CONCURRENCY: int = 32
+# Status polls start fast and back off to ``poll_interval`` while nothing changes.
+_INITIAL_POLL_INTERVAL_SEC: float = 0.25
+
+T = TypeVar("T")
+
+
+class SandboxFleet:
+    """Creates, connects and manages many sandboxes at once.
+
+    All API and sandbox proxy requests go through one shared client and its
+    connection pool. Batched operations run up to ``max_concurrency``
+    requests at a time. They attempt every sandbox of the batch and raise
+    :class:`SandboxBatchError` listing the ones that failed.
+
+    Can be used as a context manager, which closes the shared client. Sandbox
+    handles returned by the fleet must not be used after it is closed.
+    """
+
+    def __init__(
+        self,
+        api_url: str = _defaults.API_URL,
+        api_key: str | None = _defaults.API_KEY,
+        organization_id: str | None = None,
+        project_id: str | None = None,
+        namespace: str | None = _defaults.NAMESPACE,
+        request_timeout: float = _defaults.DEFAULT_HTTP_TIMEOUT_SEC,
+        max_concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+    ):
+        if max_concurrency < 1:
+            raise SandboxError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        self._max_concurrency = max_concurrency
+        self._client = SandboxClient(
+            api_url=api_url,
+            api_key=api_key,
+            organization_id=organization_id,
+            project_id=project_id,
+            namespace=namespace,
+            request_timeout=request_timeout,
+            _internal=True,
+        )
+
+    @property
+    def client(self) -> SandboxClient:
+        """The shared client used for all requests of the fleet."""
+        return self._client
+
+    def __enter__(self) -> SandboxFleet:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the shared client."""
+        self._client.close()
+
+    def _run_concurrently(
+        self, keys: list[str], call: Callable[[str], T]
+    ) -> tuple[dict[str, T], dict[str, Exception]]:
+        """Runs ``call`` for every key concurrently, returns results and errors by key."""
+        results: dict[str, T] = {}
+        errors: dict[str, Exception] = {}
+        if not keys:
+            return results, errors
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(keys))
+        ) as executor:
+            futures = {key: executor.submit(call, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except SandboxError as e:
+                    errors[key] = e
+        return results, errors
+
+    def _run_batch(
+        self, operation: str, keys: list[str], call: Callable[[str], T]
+    ) -> dict[str, T]:
+        results, errors = self._run_concurrently(keys, call)
+        if errors:
+            raise SandboxBatchError(operation, errors)
+        return results
+
+    def create_many(
+        self,
+        count: int,
+        *,
+        pool_id: str | None = None,
+        startup_timeout: float = 300,
+        poll_interval: float = 1.0,
+        **create_kwargs: Any,
+    ) -> list[Sandbox]:
+        """Create ``count`` sandboxes and return connected, running handles.
+
+        Creates (or claims from ``pool_id``) all sandboxes concurrently and
+        waits for the pending ones together. If any sandbox fails to start,
+        the sandboxes that were created are deleted again and
+        :class:`SandboxBatchError` is raised. Its errors are keyed by sandbox
+        ID, or by the index of the sandbox in the batch if its create request
+        failed.
+
+        Args:
+            count: Number of sandboxes to create
+            pool_id: Pool ID to claim warm containers from (optional)
+            startup_timeout: Max seconds to wait for all sandboxes to run
+            poll_interval: Max seconds between status polls
+            **create_kwargs: Arguments of :meth:`SandboxClient.create`, such
+                as ``image``, ``cpus`` or ``memory_mb``. With ``pool_id``
+                only ``file_systems`` is supported because the pool defines
+                the sandbox configuration.
+
+        Returns:
+            Connected Sandbox handles (auto-terminate in context manager)
+        """
+        if count < 1:
+            raise SandboxError(f"count must be at least 1, got {count}")
+        if pool_id is not None:
+            unsupported = sorted(set(create_kwargs) - {"file_systems"})
+            if unsupported:
+                raise SandboxError(
+                    "create_many with pool_id only supports file_systems, got "
+                    + ", ".join(unsupported)
+                )
+
+        def create(_: str) -> CreateSandboxResponse:
+            if pool_id is not None:
+                return self._client.claim(
+                    pool_id, file_systems=create_kwargs.get("file_systems")
+                ).value
+            return self._client.create(**create_kwargs).value
+
+        keys = [str(index) for index in range(count)]
+        responses, errors = self._run_concurrently(keys, create)
+        try:
+            if errors:
+                raise SandboxBatchError("create", errors)
+            running = self._wait_for_running(responses, startup_timeout, poll_interval)
+            return [self._connect(running[key]) for key in keys]
+        except BaseException:
+            self._delete_ignoring_errors(
+                [response.sandbox_id for response in responses.values()]
+            )
+            raise
+
+    def _wait_for_running(
+        self,
+        responses: dict[str, CreateSandboxResponse],
+        timeout: float,
+        poll_interval: float,
+    ) -> dict[str, CreateSandboxResponse | SandboxInfo]:
+        running: dict[str, CreateSandboxResponse | SandboxInfo] = {}
+        errors: dict[str, Exception] = {}
+        pending: dict[str, str] = {}
+        for key, response in responses.items():
+            if response.status == SandboxStatus.RUNNING:
+                running[key] = response
+            elif response.status in (
+                SandboxStatus.SUSPENDED,
+                SandboxStatus.TERMINATED,
+                SandboxStatus.TIMEOUT,
+            ):
+                errors[response.sandbox_id] = SandboxError(
+                    _startup_failure_message(
+                        response.sandbox_id,
+                        response.status,
+                        error_details=response.error_details,
+                        termination_reason=response.termination_reason,
+                    )
+                )
+            else:
+                pending[key] = response.sandbox_id
+
+        if pending:
+            try:
+                infos = self.wait_for_status(
+                    list(pending.values()),
+                    SandboxStatus.RUNNING,
+                    timeout=timeout,
+                    poll_interval=poll_interval,
+                )
+            except SandboxBatchError as e:
+                # Keyed by sandbox ID like the startup failures above.
+                errors.update(e.errors)
+            else:
+                for key, sandbox_id in pending.items():
+                    running[key] = infos[sandbox_id]
+        if errors:
+            raise SandboxBatchError("create", errors)
+        return running
+
+    def _connect(self, info: CreateSandboxResponse | SandboxInfo) -> Sandbox:
+        sandbox = self._client.connect(
+            info.sandbox_id,
+            routing_hint=info.routing_hint,
+            _routing_info=info,
+        )
+        sandbox._owns_sandbox = True
+        if isinstance(info, CreateSandboxResponse):
+            sandbox._cached_info = SandboxInfo.model_construct(
+                sandbox_id=info.sandbox_id,
+                status=info.status,
+                ingress_endpoint=info.ingress_endpoint,
+                sandbox_url=info.sandbox_url,
+                name=info.name,
+            )
+        return sandbox
+
+    def _delete_ignoring_errors(self, sandbox_ids: list[str]) -> None:
+        if not sandbox_ids:
+            return
+        try:
+            self.delete_many(sandbox_ids)
+        except SandboxError:
+            pass
+
+    def connect_many(self, identifiers: Iterable[str]) -> list[Sandbox]:
+        """Connect to existing sandboxes by ID or name.
+
+        The sandboxes are resolved with one list request. Sandboxes missing
+        from the listing are resolved individually.
+
+        Returns:
+            Connected Sandbox handles in the order of ``identifiers``
+            (do not auto-terminate on context exit).
+        """
+        identifiers = list(identifiers)
+        listed = self._list_by_identifier(identifiers)
+        connected = self._run_batch(
+            "connect",
+            identifiers,
+            lambda identifier: self._client.connect(
+                identifier, _routing_info=listed.get(identifier)
+            ),
+        )
+        return [connected[identifier] for identifier in identifiers]
+
+    def delete_many(self, identifiers: Iterable[str]) -> None:
+        """Terminate sandboxes by ID or name concurrently."""
+        self._run_batch(
+            "delete",
+            list(identifiers),
+            lambda identifier: self._client.delete(identifier),
+        )
+
+    def suspend_many(
+        self,
+        identifiers: Iterable[str],
+        wait: bool = True,
+        timeout: float = 300,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Suspend named sandboxes concurrently.
+
+        With ``wait=True`` (default) blocks until all of them are
+        ``Suspended``, see :meth:`wait_for_status`.
+        """
+        identifiers = list(identifiers)
+        self._run_batch(
+            "suspend",
+            identifiers,
+            lambda identifier: self._client.suspend(identifier, wait=False),
+        )
+        if wait:
+            self.wait_for_status(
+                identifiers,
+                SandboxStatus.SUSPENDED,
+                timeout=timeout,
+                poll_interval=poll_interval,
+            )
+
+    def resume_many(
+        self,
+        identifiers: Iterable[str],
+        wait: bool = True,
+        timeout: float = 300,
+        poll_interval: float = 1.0,
+    ) -> None:
+        """Resume suspended sandboxes concurrently.
+
+        With ``wait=True`` (default) blocks until all of them are
+        ``Running``, see :meth:`wait_for_status`.
+        """
+        identifiers = list(identifiers)
+        self._run_batch(
+            "resume",
+            identifiers,
+            lambda identifier: self._client.resume(identifier, wait=False),
+        )
+        if wait:
+            self.wait_for_status(
+                identifiers,
+                SandboxStatus.RUNNING,
+                timeout=timeout,
+                poll_interval=poll_interval,
+            )
+
+    def _list_by_identifier(self, identifiers: list[str]) -> dict[str, SandboxInfo]:
+        """Returns the listed info of the given sandboxes, by ID or name."""
+        wanted = set(identifiers)
+        listed: dict[str, SandboxInfo] = {}
+        for info in self._client.list():
+            for identifier in (info.sandbox_id, info.name):
+                if identifier in wanted:
+                    listed[identifier] = info
+        return listed
+
+    def wait_for_status(
+        self,
+        identifiers: Iterable[str],
+        status: SandboxStatus,
+        timeout: float = 300,
+        poll_interval: float = 1.0,
+    ) -> dict[str, SandboxInfo]:
+        """Wait until all given sandboxes reach ``status``.
+
+        Each round fetches the status of the whole fleet with one list
+        request; sandboxes missing from the listing are fetched
+        individually. Rounds start 0.25s apart and back off to
+        ``poll_interval`` while no sandbox changes status.
+
+        Args:
+            identifiers: IDs or names of the sandboxes
+            status: Status to wait for
+            timeout: Max seconds to wait
+            poll_interval: Max seconds between rounds
+
+        Returns:
+            Info of each sandbox in ``status``, by identifier.
+
+        Raises:
+            SandboxBatchError: If sandboxes terminated or didn't reach
+                ``status`` within ``timeout``.
+        """
+        pending = set(identifiers)
+        reached: dict[str, SandboxInfo] = {}
+        errors: dict[str, Exception] = {}
+        deadline = time.monotonic() + timeout
+        interval = min(_INITIAL_POLL_INTERVAL_SEC, poll_interval)
+        last_statuses: dict[str, SandboxStatus] = {}
+        while pending:
+            infos = self._list_by_identifier(list(pending))
+            missing = [identifier for identifier in pending if identifier not in infos]
+            if missing:
+                try:
+                    infos.update(
+                        self._run_batch(
+                            "get",
+                            missing,
+                            lambda identifier: self._client.get(identifier).value,
+                        )
+                    )
+                except SandboxBatchError as e:
+                    errors.update(e.errors)
+                    pending.difference_update(e.errors)
+
+            statuses: dict[str, SandboxStatus] = {}
+            for identifier, info in infos.items():
+                statuses[identifier] = info.status
+                if info.status == status:
+                    reached[identifier] = info
+                    pending.discard(identifier)
+                elif info.status == SandboxStatus.TERMINATED:
+                    errors[identifier] = SandboxError(
+                        f"Sandbox {identifier!r} terminated while waiting for "
+                        f"{status.value}"
+                    )
+                    pending.discard(identifier)
+
+            remaining = deadline - time.monotonic()
+            if not pending:
+                break
+            if remaining <= 0:
+                for identifier in pending:
+                    errors[identifier] = SandboxError(
+                        f"Sandbox {identifier!r} did not reach {status.value} "
+                        f"within {timeout}s"
+                    )
+                break
+            if statuses == last_statuses:
+                interval = min(interval * 2, poll_interval)
+            else:
+                interval = min(_INITIAL_POLL_INTERVAL_SEC, poll_interval)
+            last_statuses = statuses
+            time.sleep(min(interval, remaining))
+
+        if errors:
+            raise SandboxBatchError(f"waiting for {status.value}", errors)
+        return reached
@@ -837,3 +837,11 @@ class CommandResult(BaseModel):
     exit_code: int
     stdout: str
     stderr: str
+
+
+class DirectorySyncResult(BaseModel):
+    """Result of syncing a directory between local disk and a sandbox."""
+
+    transferred_files: int
+    transferred_bytes: int
+    skipped_files: int
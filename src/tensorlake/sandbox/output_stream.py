@@ -0,0 +1,360 @@
+"""Live process output streams read from sandbox SSE endpoints.
+
+Provides :class:`OutputStream` (sync) and :class:`AsyncOutputStream`
+(asyncio-based). Events are parsed as they arrive. Nothing is read from the
+connection ahead of the consumer: a slow consumer leaves output in the socket
+buffers, which applies backpressure to the sandbox instead of growing memory.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import AsyncIterator, Iterator
+from typing import IO, Any
+
+import httpx
+from pydantic import ValidationError
+
+from tensorlake._tracing import USER_AGENT, inject_traceparent
+
+from .exceptions import RemoteAPIError, SandboxConnectionError, SandboxError
+from .models import CommandResult, OutputEvent
+
+
+class _OutputStreamState:
+    """Process state carried by the events of an output stream."""
+
+    def __init__(self, trace_id: str, run: bool) -> None:
+        self.trace_id = trace_id
+        # Set from the started and exit events of ``run`` streams. Follow
+        # streams only carry output events so these stay ``None``.
+        self.pid: int | None = None
+        self.exit_code: int | None = None
+        self._run = run
+        self._data_lines: list[str] = []
+
+    def _parse_line(self, line: str) -> OutputEvent | None:
+        """Feeds one SSE line, returns the output event it completes if any."""
+        if line == "":
+            if not self._data_lines:
+                return None
+            data = "\n".join(self._data_lines)
+            self._data_lines = []
+            return self._parse_data(data)
+
+        if line.startswith("data:"):
+            data = line[len("data:") :]
+            self._data_lines.append(data[1:] if data.startswith(" ") else data)
+        # Comments (heartbeats), event names, ids and retry hints are ignored.
+        return None
+
+    def _parse_data(self, data: str) -> OutputEvent | None:
+        if not self._run:
+            try:
+                return OutputEvent.model_validate_json(data)
+            except ValidationError:
+                return None  # Heartbeats and other non-output events.
+
+        try:
+            event: Any = json.loads(data)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(event, dict):
+            return None
+        if "line" in event:
+            try:
+                return OutputEvent.model_validate(event)
+            except ValidationError:
+                return None
+        if event.get("exit_code") is not None:
+            self.exit_code = event["exit_code"]
+        elif event.get("signal") is not None:
+            self.exit_code = -event["signal"]
+        elif event.get("pid") is not None:
+            self.pid = event["pid"]
+        return None
+
+
+class OutputStream(_OutputStreamState):
+    """Iterator over output events of a sandbox process as they are produced.
+
+    Returned by ``Sandbox.stream_stdout``/``stream_stderr``/``stream_output``
+    and ``Sandbox.stream_run``. The HTTP request is already sent and accepted
+    when the stream is returned. Iteration ends when the server closes the
+    stream, normally when the process exits. For ``stream_run`` streams
+    ``pid`` and ``exit_code`` are set once their events are received; signaled
+    processes get a negative ``exit_code`` like in :meth:`Sandbox.run`.
+
+    Close the stream (or use it as a context manager) to stop following the
+    process before it exits.
+    """
+
+    def __init__(
+        self,
+        trace_id: str,
+        client: httpx.Client,
+        response: httpx.Response,
+        run: bool = False,
+    ) -> None:
+        super().__init__(trace_id, run)
+        self._client = client
+        self._response = response
+        self._events = self._read_events()
+
+    def _read_events(self) -> Iterator[OutputEvent]:
+        try:
+            for line in self._response.iter_lines():
+                event = self._parse_line(line)
+                if event is not None:
+                    yield event
+            event = self._parse_line("")
+            if event is not None:
+                yield event
+        except httpx.TransportError as e:
+            raise SandboxConnectionError(str(e)) from e
+        finally:
+            self.close()
+
+    def __iter__(self) -> OutputStream:
+        return self
+
+    def __next__(self) -> OutputEvent:
+        return next(self._events)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection. Idempotent."""
+        self._response.close()
+        self._client.close()
+
+    def __enter__(self) -> OutputStream:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"OutputStream(trace_id={self.trace_id!r})"
+
+
+class AsyncOutputStream(_OutputStreamState):
+    """Async iterator over output events of a sandbox process as they are produced.
+
+    Async counterpart of :class:`OutputStream`, returned by the ``stream_*``
+    coroutines of ``AsyncSandbox``. Close it with :meth:`aclose` or use it as
+    an async context manager to stop following the process before it exits.
+    """
+
+    def __init__(
+        self,
+        trace_id: str,
+        client: httpx.AsyncClient,
+        response: httpx.Response,
+        run: bool = False,
+    ) -> None:
+        super().__init__(trace_id, run)
+        self._client = client
+        self._response = response
+        self._events = self._read_events()
+
+    async def _read_events(self) -> AsyncIterator[OutputEvent]:
+        try:
+            async for line in self._response.aiter_lines():
+                event = self._parse_line(line)
+                if event is not None:
+                    yield event
+            event = self._parse_line("")
+            if event is not None:
+                yield event
+        except httpx.TransportError as e:
+            raise SandboxConnectionError(str(e)) from e
+        finally:
+            await self.aclose()
+
+    def __aiter__(self) -> AsyncOutputStream:
+        return self
+
+    async def __anext__(self) -> OutputEvent:
+        return await self._events.__anext__()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection. Idempotent."""
+        await self._response.aclose()
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncOutputStream:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"AsyncOutputStream(trace_id={self.trace_id!r})"
+
+
+class _CommandOutputFiles:
+    """Collects output lines of a command, writing the ones of given streams to files.
+
+    Context manager that closes the files.
+    """
+
+    def __init__(
+        self,
+        stdout_path: str | os.PathLike[str] | None,
+        stderr_path: str | os.PathLike[str] | None,
+    ) -> None:
+        self._files: list[IO[str]] = []
+        self._stdout_file: IO[str] | None = None
+        self._stderr_file: IO[str] | None = None
+        self._stdout_lines: list[str] = []
+        self._stderr_lines: list[str] = []
+        try:
+            if stdout_path is not None:
+                self._stdout_file = self._open(stdout_path)
+            if stderr_path is not None:
+                if stdout_path is not None and os.path.abspath(
+                    stderr_path
+                ) == os.path.abspath(stdout_path):
+                    self._stderr_file = self._stdout_file
+                else:
+                    self._stderr_file = self._open(stderr_path)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, path: str | os.PathLike[str]) -> IO[str]:
+        file = open(path, "w", encoding="utf-8", newline="")
+        self._files.append(file)
+        return file
+
+    def add(self, event: OutputEvent) -> None:
+        if event.stream == "stderr":
+            file, lines = self._stderr_file, self._stderr_lines
+        else:
+            file, lines = self._stdout_file, self._stdout_lines
+        if file is None:
+            lines.append(event.line)
+        else:
+            file.write(event.line)
+            file.write("\n")
+
+    def result(self, exit_code: int | None) -> CommandResult:
+        if exit_code is None:
+            raise SandboxConnectionError(
+                "sandbox process stream ended without an exit event"
+            )
+        return CommandResult(
+            exit_code=exit_code,
+            stdout="\n".join(self._stdout_lines),
+            stderr="\n".join(self._stderr_lines),
+        )
+
+    def close(self) -> None:
+        for file in self._files:
+            file.close()
+
+    def __enter__(self) -> _CommandOutputFiles:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _build_stream_request(
+    client: httpx.Client | httpx.AsyncClient,
+    base_url: str,
+    path: str,
+    headers: dict[str, str],
+    payload: dict[str, Any] | None,
+) -> tuple[str, httpx.Request]:
+    request_headers = inject_traceparent(
+        {**headers, "Accept": "text/event-stream", "User-Agent": USER_AGENT}
+    )
+    # Same trace ID format as the Rust client: the trace-id field of traceparent.
+    trace_id = request_headers["traceparent"].split("-")[1]
+    request = client.build_request(
+        "GET" if payload is None else "POST",
+        f"{base_url.rstrip('/')}{path}",
+        headers=request_headers,
+        json=payload,
+    )
+    return trace_id, request
+
+
+def _check_stream_response(response: httpx.Response, path: str) -> None:
+    if not response.is_success:
+        raise RemoteAPIError(response.status_code, response.text)
+    content_type = response.headers.get("content-type", "").lower()
+    if "text/event-stream" not in content_type:
+        raise SandboxError(
+            f"expected text/event-stream response from {path}, got content-type: {content_type}"
+        )
+
+
+def _stream_timeout(connect_timeout: float | None) -> httpx.Timeout:
+    # Processes can stay quiet for arbitrarily long, so only connecting is bounded.
+    return httpx.Timeout(None, connect=connect_timeout)
+
+
+def open_output_stream(
+    base_url: str,
+    path: str,
+    headers: dict[str, str],
+    payload: dict[str, Any] | None = None,
+    connect_timeout: float | None = None,
+) -> OutputStream:
+    """Sends a follow (GET) or run (POST with ``payload``) request and returns its stream."""
+    client = httpx.Client(timeout=_stream_timeout(connect_timeout))
+    try:
+        trace_id, request = _build_stream_request(
+            client, base_url, path, headers, payload
+        )
+        response = client.send(request, stream=True)
+    except httpx.TransportError as e:
+        client.close()
+        raise SandboxConnectionError(str(e)) from e
+    except BaseException:
+        client.close()
+        raise
+
+    try:
+        if not response.is_success:
+            response.read()
+        _check_stream_response(response, path)
+    except BaseException:
+        response.close()
+        client.close()
+        raise
+    return OutputStream(trace_id, client, response, run=payload is not None)
+
+
+async def open_async_output_stream(
+    base_url: str,
+    path: str,
+    headers: dict[str, str],
+    payload: dict[str, Any] | None = None,
+    connect_timeout: float | None = None,
+) -> AsyncOutputStream:
+    """Async counterpart of :func:`open_output_stream`."""
+    client = httpx.AsyncClient(timeout=_stream_timeout(connect_timeout))
+    try:
+        trace_id, request = _build_stream_request(
+            client, base_url, path, headers, payload
+        )
+        response = await client.send(request, stream=True)
+    except httpx.TransportError as e:
+        await client.aclose()
+        raise SandboxConnectionError(str(e)) from e
+    except BaseException:
+        await client.aclose()
+        raise
+
+    try:
+        if not response.is_success:
+            await response.aread()
+        _check_stream_response(response, path)
+    except BaseException:
+        await response.aclose()
+        await client.aclose()
+        raise
+    return AsyncOutputStream(trace_id, client, response, run=payload is not None)
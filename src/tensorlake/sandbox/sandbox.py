@@ -7,7 +7,7 @@ import os
 import time
 from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 import httpx
 from pydantic import ValidationError
@@ -15,17 +15,31 @@ from pydantic import ValidationError
 from tensorlake._tracing import USER_AGENT, Traced, TracedIterator, inject_traceparent
 
 from . import _defaults
+from .directory_sync import (
+    DEFAULT_SYNC_PARALLELISM,
+    download_directory,
+    upload_directory,
+)
 from .exceptions import (
     RemoteAPIError,
     SandboxConnectionError,
     SandboxError,
 )
+from .file_transfer import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_PARALLELISM,
+    DEFAULT_DOWNLOAD_PART_SIZE,
+    FileReadStream,
+    download_file,
+    open_file_stream,
+)
 from .models import (
     CheckpointType,
     ClearNetworkPolicy,
     CommandResult,
     CopySandboxResponse,
     DaemonInfo,
+    DirectorySyncResult,
     FileSystemMount,
     GpuModel,
     GpuRequest,
@@ -52,6 +66,7 @@ from .models import (
     SnapshotWaitCondition,
     StdinMode,
 )
+from .output_stream import OutputStream, _CommandOutputFiles, open_output_stream
 
 # Avoid circular import: sandbox.py ↔ client.py.  With ``from __future__
 # import annotations`` the type string is never evaluated at runtime, but
@@ -164,6 +179,11 @@ def _resolve_process_arg(process: object, pid: object) -> str:
     return str(process)
 
 
+def _output_follow_path(process_segment: str, stream: str) -> str:
+    """Path of the SSE endpoint following the given output stream of a process."""
+    return f"/api/v1/processes/{quote(process_segment, safe='')}/{stream}/follow"
+
+
 class Sandbox:
     """Client for interacting with a running sandbox.
 
@@ -223,6 +243,7 @@ class Sandbox:
         self._project_id = project_id
         self._request_timeout = request_timeout
         self._explicit_proxy_url = _explicit_proxy_url
+        self._routing_hint = routing_hint
         self._set_proxy_transport(proxy_url, sandbox_identifier)
 
         if _proxy_rust_client is not None:
@@ -268,6 +289,9 @@ class Sandbox:
             self._proxy_headers["Host"] = self._host_header
         else:
             self._proxy_headers["X-Tensorlake-Sandbox-Id"] = sandbox_identifier
+        # Same routing header as the Rust proxy client sends.
+        if self._routing_hint:
+            self._proxy_headers["X-Tensorlake-Route-Hint"] = self._routing_hint
 
     def _rebind_proxy(self, info: SandboxInfo) -> None:
         self._require_lifecycle_client("refresh proxy routing")
@@ -302,6 +326,7 @@ class Sandbox:
 
         self._rust_client = new_rust_client
         self._base_url = self._rust_client.base_url()
+        self._routing_hint = info.routing_hint
         self._set_proxy_transport(proxy_url, info.sandbox_id)
         self._cached_info = info
         self._sandbox_id = info.sandbox_id
@@ -1119,6 +1144,9 @@ class Sandbox:
         working_dir: str | None = None,
         timeout: float | None = None,
         user: ProcessUser | None = None,
+        *,
+        stdout_path: str | os.PathLike[str] | None = None,
+        stderr_path: str | os.PathLike[str] | None = None,
     ) -> Traced[CommandResult]:
         """Run a command to completion and return its output.
 
@@ -1126,6 +1154,11 @@ class Sandbox:
         starts the process, streams output, and delivers the exit code — all
         over one HTTP connection.
 
+        Output of commands that print a lot can be written to local files
+        instead of memory with ``stdout_path``/``stderr_path``. The lines of
+        a stream written to a file are left out of the returned result. Use
+        :meth:`stream_run` to process output while the command runs.
+
         Args:
             command: Command to execute
             args: Command arguments
@@ -1136,12 +1169,27 @@ class Sandbox:
                 configured user (the image ``USER`` directive, falling back to
                 root). Pass a username such as ``"root"``, a Docker-style id
                 string like ``"1000:1000"``, or ``ProcessUserSpec(uid=1000, gid=1000)``.
+            stdout_path: Local file to write stdout lines to, one per line.
+            stderr_path: Local file to write stderr lines to. Can be the same
+                file as ``stdout_path`` to get both streams interleaved.
 
         Returns:
             Traced[CommandResult] — access ``.trace_id`` for the W3C trace ID
             and ``.exit_code`` / ``.stdout`` / ``.stderr`` directly (or via
             ``.value``).
         """
+        if stdout_path is not None or stderr_path is not None:
+            output = _CommandOutputFiles(stdout_path, stderr_path)
+            with (
+                output,
+                self.stream_run(
+                    command, args, env, working_dir, timeout, user
+                ) as stream,
+            ):
+                for event in stream:
+                    output.add(event)
+            return Traced(stream.trace_id, output.result(stream.exit_code))
+
         process_user = self._normalize_process_user(user)
         payload = self._build_command_payload(
             command,
@@ -1190,6 +1238,46 @@ class Sandbox:
             ),
         )
 
+    def stream_run(
+        self,
+        command: str,
+        args: list[str] | None = None,
+        env: dict[str, str] | None = None,
+        working_dir: str | None = None,
+        timeout: float | None = None,
+        user: ProcessUser | None = None,
+    ) -> OutputStream:
+        """Run a command and stream its output events as they are produced.
+
+        Takes the same arguments as :meth:`run`. Iterating the returned
+        :class:`OutputStream` yields stdout and stderr events in arrival
+        order. Once iteration ends, ``exit_code`` holds the command's exit
+        code, or ``None`` if the stream ended without an exit event.
+
+        Returns:
+            OutputStream — access ``.trace_id`` for the W3C trace ID.
+        """
+        payload = self._build_command_payload(
+            command,
+            args,
+            env,
+            working_dir,
+            timeout=timeout,
+            user=self._normalize_process_user(user),
+        )
+        return self._open_output_stream("/api/v1/processes/run", payload)
+
+    def _open_output_stream(
+        self, path: str, payload: dict[str, Any] | None = None
+    ) -> OutputStream:
+        return open_output_stream(
+            self._base_url,
+            path,
+            self._proxy_headers,
+            payload,
+            connect_timeout=self._request_timeout,
+        )
+
     # --- Process management ---
 
     def start_process(
@@ -1514,6 +1602,57 @@ class Sandbox:
         except Exception as e:
             _raise_as_sandbox_error(e)
 
+    def stream_stdout(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> OutputStream:
+        """Stream stdout output events from a process as they are produced.
+
+        Unlike :meth:`follow_stdout`, returns right away and doesn't keep
+        received events in memory.
+
+        Args:
+            process: PID or process name given on creation.
+        """
+        seg = _resolve_process_arg(process, pid)
+        return self._open_output_stream(_output_follow_path(seg, "stdout"))
+
+    def stream_stderr(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> OutputStream:
+        """Stream stderr output events from a process as they are produced.
+
+        Unlike :meth:`follow_stderr`, returns right away and doesn't keep
+        received events in memory.
+
+        Args:
+            process: PID or process name given on creation.
+        """
+        seg = _resolve_process_arg(process, pid)
+        return self._open_output_stream(_output_follow_path(seg, "stderr"))
+
+    def stream_output(
+        self,
+        process: int | str = _PROCESS_ARG_UNSET,
+        *,
+        pid: int | str = _PROCESS_ARG_UNSET,
+    ) -> OutputStream:
+        """Stream combined output events from a process as they are produced.
+
+        Unlike :meth:`follow_output`, returns right away and doesn't keep
+        received events in memory.
+
+        Args:
+            process: PID or process name given on creation.
+        """
+        seg = _resolve_process_arg(process, pid)
+        return self._open_output_stream(_output_follow_path(seg, "output"))
+
     # --- File operations ---
 
     def read_file(self, path: str) -> Traced[bytes]:
@@ -1562,6 +1701,89 @@ class Sandbox:
         except Exception as e:
             _raise_as_sandbox_error(e)
 
+    def read_file_range(self, path: str, offset: int, length: int) -> Traced[bytes]:
+        """Read a byte range of a file from the sandbox.
+
+        Args:
+            path: Absolute path inside the sandbox
+            offset: Offset of the first byte to read
+            length: Maximum number of bytes to read. Fewer bytes are returned
+                if the file ends before the range.
+
+        Returns:
+            Traced[bytes] — access ``.trace_id`` for the W3C trace ID and
+            ``.value`` for the raw bytes.
+        """
+        with self.open_read(path, offset=offset, length=length) as stream:
+            return Traced(stream.trace_id, stream.readall())
+
+    def open_read(
+        self,
+        path: str,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> FileReadStream:
+        """Open a file in the sandbox for streaming reads.
+
+        Unlike :meth:`read_file`, the file isn't loaded into memory. The
+        returned :class:`FileReadStream` is a binary file object; use
+        ``iter_chunks()`` to iterate the received chunks.
+
+        Args:
+            path: Absolute path inside the sandbox
+            offset: Offset of the first byte to read
+            length: Maximum number of bytes to read, ``None`` reads to the end
+            chunk_size: Maximum size of the chunks read from the connection
+        """
+        return open_file_stream(
+            self._base_url,
+            self._proxy_headers,
+            path,
+            offset=offset,
+            length=length,
+            chunk_size=chunk_size,
+            request_timeout=self._request_timeout,
+        )
+
+    def download_file(
+        self,
+        path: str,
+        local_path: str | os.PathLike[str],
+        *,
+        parallelism: int = DEFAULT_DOWNLOAD_PARALLELISM,
+        part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+        resume: bool = False,
+    ) -> Traced[None]:
+        """Stream a file from the sandbox into a local file.
+
+        Counterpart of :meth:`upload_file`. Files larger than ``part_size``
+        are downloaded with up to ``parallelism`` concurrent ranged requests.
+        A failed download keeps the downloaded prefix of the file in
+        ``local_path``; call again with ``resume=True`` to download the rest.
+
+        Args:
+            path: Absolute path inside the sandbox
+            local_path: Local destination file path
+            parallelism: Maximum number of concurrent requests
+            part_size: Size of the ranges downloaded by each request
+            resume: Treat an existing ``local_path`` file as the already
+                downloaded beginning of the sandbox file instead of
+                overwriting it.
+        """
+        trace_id = download_file(
+            self._base_url,
+            self._proxy_headers,
+            path,
+            os.fspath(local_path),
+            parallelism=parallelism,
+            part_size=part_size,
+            resume=resume,
+            request_timeout=self._request_timeout,
+        )
+        return Traced(trace_id, None)
+
     def delete_file(self, path: str) -> Traced[None]:
         """Delete a file from the sandbox.
 
@@ -1592,6 +1814,78 @@ class Sandbox:
         except Exception as e:
             _raise_as_sandbox_error(e)
 
+    def upload_directory(
+        self,
+        local_dir: str | os.PathLike[str],
+        remote_dir: str,
+        *,
+        compression: str | None = None,
+        skip_unchanged: bool = True,
+        parallelism: int = DEFAULT_SYNC_PARALLELISM,
+    ) -> DirectorySyncResult:
+        """Upload a local directory tree into the sandbox.
+
+        Files are sent in up to ``parallelism`` tar archives that are
+        extracted by ``tar`` in the sandbox, instead of one request per file.
+        Modification times are preserved, so files with the same size and
+        modification time in ``remote_dir`` are skipped by later syncs.
+
+        Args:
+            local_dir: Local directory to upload
+            remote_dir: Absolute destination directory inside the sandbox,
+                created if missing
+            compression: ``None``, ``"gzip"`` or ``"zstd"`` (requires the
+                ``zstandard`` package and zstd support of ``tar`` in the
+                sandbox)
+            skip_unchanged: Skip files whose size and modification time
+                match the sandbox copy
+            parallelism: Maximum number of concurrent archive transfers
+
+        Returns:
+            DirectorySyncResult with the number of transferred and skipped files.
+        """
+        return upload_directory(
+            self,
+            os.fspath(local_dir),
+            remote_dir,
+            compression=compression,
+            skip_unchanged=skip_unchanged,
+            parallelism=parallelism,
+        )
+
+    def download_directory(
+        self,
+        remote_dir: str,
+        local_dir: str | os.PathLike[str],
+        *,
+        compression: str | None = None,
+        skip_unchanged: bool = True,
+        parallelism: int = DEFAULT_SYNC_PARALLELISM,
+    ) -> DirectorySyncResult:
+        """Download a sandbox directory tree into a local directory.
+
+        Counterpart of :meth:`upload_directory`, with the same options.
+
+        Args:
+            remote_dir: Absolute directory inside the sandbox
+            local_dir: Local destination directory, created if missing
+            compression: ``None``, ``"gzip"`` or ``"zstd"``
+            skip_unchanged: Skip files whose size and modification time
+                match the local copy
+            parallelism: Maximum number of concurrent archive transfers
+
+        Returns:
+            DirectorySyncResult with the number of transferred and skipped files.
+        """
+        return download_directory(
+            self,
+            remote_dir,
+            os.fspath(local_dir),
+            compression=compression,
+            skip_unchanged=skip_unchanged,
+            parallelism=parallelism,
+        )
+
     # --- PTY sessions ---
 
     def create_pty_session(
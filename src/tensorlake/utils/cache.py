@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +15,8 @@ class KVCache:
     - Keys are arbitrary strings; they are hashed to safe filenames
     - Namespacing creates isolated subdirectories under the cache root
     - Default root: ~/.tensorlake/cache
+    - Reads refresh the modification time of values, evict() removes
+      least recently used values
     """
 
     def __init__(self, namespace: str, root_dir: Optional[Path] = None):
@@ -31,15 +35,16 @@ class KVCache:
         if not path.exists():
             return None
         try:
-            return path.read_text(encoding=encoding)
+            value = path.read_text(encoding=encoding)
         except Exception:
             return None
+        self._touch(path)
+        return value
 
     def set(self, key: str, value: str, encoding: str = "utf-8") -> None:
         path = self._key_path(key, ".txt")
         try:
-            self.ns_dir.mkdir(parents=True, exist_ok=True)
-            path.write_text(value, encoding=encoding)
+            self._write_atomic(path, value.encode(encoding))
         except Exception:
             # Best-effort cache; ignore failures
             pass
@@ -49,19 +54,63 @@ class KVCache:
         if not path.exists():
             return None
         try:
-            return path.read_bytes()
+            data = path.read_bytes()
         except Exception:
             return None
+        self._touch(path)
+        return data
 
     def set_bytes(self, key: str, data: bytes) -> None:
         path = self._key_path(key, ".bin")
         try:
-            self.ns_dir.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(data)
+            self._write_atomic(path, data)
         except Exception:
             # Best-effort cache; ignore failures
             pass
 
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        # Replace the file atomically so concurrent readers and writers never see partial values.
+        self.ns_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.ns_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _touch(self, path: Path) -> None:
+        # The modification time of a value is its last use time for evict().
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self, max_bytes: int) -> None:
+        """Deletes least recently used values until the namespace takes at most max_bytes."""
+        try:
+            with os.scandir(self.ns_dir) as entries:
+                values = [
+                    (stat.st_mtime_ns, stat.st_size, entry.path)
+                    for entry in entries
+                    if entry.name.endswith((".txt", ".bin")) and entry.is_file()
+                    for stat in (entry.stat(),)
+                ]
+        except OSError:
+            return
+
+        total_bytes: int = sum(size for _, size, _ in values)
+        values.sort()
+        for _, size, path in values:
+            if total_bytes <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total_bytes -= size
+
     def delete(self, key: str) -> None:
         for suffix in (".txt", ".bin"):
             path = self._key_path(key, suffix)
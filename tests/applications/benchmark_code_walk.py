@@ -0,0 +1,88 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from tensorlake.applications.remote.code.ignored_code_paths import _parse_gitignore
+from tensorlake.applications.remote.code.loader import walk_code
+from tensorlake.utils.cache import KVCache
+
+_GITIGNORE = "__pycache__/\n*.pyc\n/build/\n/dist/\n.env\nnode_modules/\n*.log\n"
+
+
+def _generate_tree(code_dir: str, file_count: int, files_per_dir: int) -> None:
+    """Generates a tree of packages with files_per_dir files in each leaf directory."""
+    dir_count: int = file_count // files_per_dir
+    for dir_index in range(dir_count):
+        # Three levels deep like vendored packages in a monorepo.
+        dir_path: str = os.path.join(
+            code_dir,
+            f"vendor_{dir_index % 10}",
+            f"package_{dir_index // 10 % 10}",
+            f"module_{dir_index}",
+        )
+        os.makedirs(dir_path)
+        for file_index in range(files_per_dir):
+            # Mix of Python files and files that are not walked.
+            suffix: str = ".py" if file_index % 4 != 0 else ".pyc"
+            with open(os.path.join(dir_path, f"file_{file_index}{suffix}"), "w"):
+                pass
+    with open(os.path.join(code_dir, ".gitignore"), "w") as f:
+        f.write(_GITIGNORE)
+
+
+def _os_walk_code(code_dir: str, ignored_absolute_paths: set[str]) -> list[str]:
+    """The os.walk based code walk used before the parallel walk."""
+    file_paths: list[str] = []
+    for dir_path, dir_names, file_names in os.walk(code_dir, followlinks=True):
+        dir_names[:] = [
+            dir_name
+            for dir_name in dir_names
+            if os.path.join(dir_path, dir_name) not in ignored_absolute_paths
+        ]
+        dir_names.sort()
+        file_names.sort()
+        for file_name in file_names:
+            if not file_name.endswith(".py"):
+                continue
+            file_path = os.path.abspath(os.path.join(dir_path, file_name))
+            if file_path not in ignored_absolute_paths:
+                file_paths.append(file_path)
+    return file_paths
+
+
+class Benchmark:
+    def measure(self, name: str, func) -> None:
+        durations: list[float] = []
+        for _ in range(3):
+            start: float = time.monotonic()
+            func()
+            durations.append(time.monotonic() - start)
+        print(f"{name}: {min(durations):.3f} seconds (best of 3)")
+
+    def run(self, file_count: int = 100_000, files_per_dir: int = 50):
+        """Measures walking of a large application code directory."""
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            code_dir: str = os.path.join(temporary_directory, "code")
+            _generate_tree(code_dir, file_count, files_per_dir)
+            cache = KVCache("code_zip", root_dir=Path(temporary_directory) / "cache")
+            print(f"Walking {file_count} files in {file_count // files_per_dir} dirs")
+
+            self.measure(
+                "parse .gitignore (single matcher)",
+                lambda: _parse_gitignore(Path(code_dir), Path(code_dir) / ".gitignore"),
+            )
+            self.measure("os.walk", lambda: _os_walk_code(code_dir, set()))
+            self.measure(
+                "walk_code without cache", lambda: list(walk_code(code_dir, set()))
+            )
+            # Fills the cache.
+            list(walk_code(code_dir, set(), cache=cache))
+            self.measure(
+                "walk_code with cache",
+                lambda: list(walk_code(code_dir, set(), cache=cache)),
+            )
+
+
+if __name__ == "__main__":
+    Benchmark().run()
@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+from tensorlake.applications.remote.code.zip import zip_code
+
+# Imports all the generated modules from the code ZIP archive like a function container cold start.
+_IMPORT_SCRIPT = """
+import importlib, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.monotonic()
+for index in range(int(sys.argv[2])):
+    importlib.import_module(f"bench_app.module_{index}")
+print(time.monotonic() - start)
+"""
+
+
+def _generate_application(code_dir: str, module_count: int, functions_per_module: int):
+    package_dir: str = os.path.join(code_dir, "bench_app")
+    os.makedirs(package_dir)
+    with open(os.path.join(package_dir, "__init__.py"), "w") as f:
+        f.write("")
+    for module_index in range(module_count):
+        with open(os.path.join(package_dir, f"module_{module_index}.py"), "w") as f:
+            for function_index in range(functions_per_module):
+                f.write(
+                    f"def function_{function_index}(items, factor={function_index}):\n"
+                    "    result = {}\n"
+                    "    for index, item in enumerate(items):\n"
+                    "        if index % 2 == 0:\n"
+                    "            result[item] = [x * factor for x in range(index)]\n"
+                    "        else:\n"
+                    "            result[item] = {str(x): x for x in range(index)}\n"
+                    "    return result\n\n\n"
+                )
+
+
+class Benchmark:
+    def measure(self, code_dir: str, module_count: int, compile_bytecode: bool) -> None:
+        code_zip: bytes = zip_code(
+            code_dir, set(), [], compile_bytecode=compile_bytecode
+        )
+        zip_path: str = os.path.join(code_dir, f"code-{compile_bytecode}.zip")
+        with open(zip_path, "wb") as f:
+            f.write(code_zip)
+
+        durations: list[float] = []
+        for _ in range(5):
+            # A fresh interpreter per run, nothing is cached between cold starts.
+            output: str = subprocess.check_output(
+                [sys.executable, "-c", _IMPORT_SCRIPT, zip_path, str(module_count)],
+                text=True,
+            )
+            durations.append(float(output))
+        print(
+            f"compile_bytecode={compile_bytecode}: ZIP size {len(code_zip) / 1024:.0f} KB, "
+            f"imported {module_count} modules in {min(durations):.3f} seconds (best of 5)"
+        )
+
+    def run(self, module_count: int = 200, functions_per_module: int = 50):
+        """Measures cold start import time of application code from its ZIP archive."""
+        with tempfile.TemporaryDirectory() as code_dir:
+            _generate_application(code_dir, module_count, functions_per_module)
+            self.measure(code_dir, module_count, compile_bytecode=False)
+            self.measure(code_dir, module_count, compile_bytecode=True)
+
+
+if __name__ == "__main__":
+    Benchmark().run()
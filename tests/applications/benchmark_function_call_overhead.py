@@ -0,0 +1,85 @@
+import inspect
+import sys
+import time
+
+from tensorlake.applications import application, function, run_local_application
+from tensorlake.applications.function.type_hints import (
+    function_call_plan,
+    function_parameters,
+    parameter_type_hint,
+    return_type_hint,
+)
+from tensorlake.applications.function.user_data_serializer import (
+    function_input_serializer,
+    function_output_serializer,
+)
+from tensorlake.applications.user_data_serializer import (
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
+    serializer_by_name,
+)
+
+
+@function()
+def tiny(x: int) -> int:
+    return x + 1
+
+
+@application()
+@function()
+def tiny_calls_app(count: int) -> int:
+    return sum(tiny.map(list(range(count))))
+
+
+def _introspect_without_call_plan() -> None:
+    # What each function call computed before the call plan was stored on the Function.
+    signature = inspect.signature(
+        tiny._original_function, follow_wrapped=False, eval_str=False
+    )
+    parameters = list(signature.parameters.values())
+    [parameter_type_hint(parameter) for parameter in parameters]
+    return_type_hint(signature.return_annotation)
+    serializer_by_name(SDK_FUNCTION_CALL_SERIALIZER_NAME)
+    serializer_by_name(SDK_FUNCTION_CALL_SERIALIZER_NAME)
+
+
+def _introspect_with_call_plan() -> None:
+    parameters = function_parameters(tiny)
+    [parameter_type_hint(parameter) for parameter in parameters]
+    function_call_plan(tiny).return_type_hint
+    function_input_serializer(tiny, app_call=False)
+    function_output_serializer(tiny, None)
+
+
+class Benchmark:
+    def measure_introspection(self, name: str, introspect, count: int) -> None:
+        start_time: float = time.perf_counter()
+        for _ in range(count):
+            introspect()
+        duration_sec: float = time.perf_counter() - start_time
+        print(f"{name}: {duration_sec / count * 1e6:.2f} microseconds per call")
+
+    def measure_local_calls(self, count: int) -> None:
+        start_cpu_time: float = time.process_time()
+        start_time: float = time.monotonic()
+        request = run_local_application(tiny_calls_app, count)
+        duration_sec: float = time.monotonic() - start_time
+        cpu_time_sec: float = time.process_time() - start_cpu_time
+        request.output()  # Raises if the request failed.
+        print(
+            f"{count} tiny function calls: finished in {duration_sec:.3f} seconds, "
+            f"{cpu_time_sec / count * 1e6:.0f} CPU microseconds per call"
+        )
+
+    def run(self, count: int):
+        """Measures per function call SDK overhead for functions that do almost nothing."""
+        self.measure_introspection(
+            "introspection without call plan", _introspect_without_call_plan, count
+        )
+        self.measure_introspection(
+            "introspection with call plan", _introspect_with_call_plan, count
+        )
+        self.measure_local_calls(count)
+
+
+if __name__ == "__main__":
+    Benchmark().run(10000 if len(sys.argv) < 2 else int(sys.argv[1]))
@@ -0,0 +1,52 @@
+import sys
+import time
+
+from tensorlake.applications import application, function, run_local_application
+
+
+@application()
+@function()
+def map_app(count: int) -> int:
+    return sum(square.map(list(range(count))))
+
+
+@function()
+def square(x: int) -> int:
+    return x * x
+
+
+@application()
+@function()
+def delayed_calls_app(count: int) -> int:
+    futures = [square.future(i).run_later(0.5 + i * 0.001) for i in range(count)]
+    return sum(future.result() for future in futures)
+
+
+class Benchmark:
+    def measure(self, app, count: int) -> None:
+        # Process CPU time includes the LocalRunner control loop and all function threads.
+        start_cpu_time: float = time.process_time()
+        start_time: float = time.monotonic()
+        request = run_local_application(app, count)
+        duration_sec: float = time.monotonic() - start_time
+        cpu_time_sec: float = time.process_time() - start_cpu_time
+        request.output()  # Raises if the request failed.
+        print(
+            f"{app._name}({count}): finished in {duration_sec:.3f} seconds, "
+            f"used {cpu_time_sec:.3f} CPU seconds, "
+            f"{count / duration_sec:.0f} function calls per second"
+        )
+
+    def run(self, counts: list[int]):
+        """Runs a local map over count items."""
+        for count in counts:
+            self.measure(map_app, count)
+
+    def run_delayed(self, count: int = 100):
+        """Runs function calls with start delays, most of the time the control loop has nothing to do."""
+        self.measure(delayed_calls_app, count)
+
+
+if __name__ == "__main__":
+    Benchmark().run([1000, 5000, 50000] if len(sys.argv) < 2 else [int(sys.argv[1])])
+    Benchmark().run_delayed()
@@ -0,0 +1,149 @@
+import pickle
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import pydantic
+
+from tensorlake.applications.user_data_serializer import (
+    JSONUserDataSerializer,
+    PickleUserDataSerializer,
+    UserDataSerializer,
+    ZeroCopyPickleUserDataSerializer,
+    clear_type_adapter_cache,
+    create_type_adapter,
+    type_adapter_cache_info,
+)
+
+
+class Address(pydantic.BaseModel):
+    street: str
+    city: str
+    zip_code: str
+
+
+class LineItem(pydantic.BaseModel):
+    sku: str
+    quantity: int
+    price: float
+    attributes: dict[str, str]
+
+
+class Customer(pydantic.BaseModel):
+    name: str
+    addresses: list[Address]
+
+
+class Order(pydantic.BaseModel):
+    id: int
+    customer: Customer
+    items: list[LineItem]
+    notes: str | None = None
+
+
+ORDER_TYPE_HINT: Any = dict[str, list[Order]]
+
+
+class Tensor:
+    """Pickles its data using out-of-band buffers like numpy arrays do."""
+
+    def __init__(self, buffer: Any):
+        self.data: memoryview = memoryview(buffer)
+
+    def __reduce_ex__(self, protocol: int):
+        return Tensor, (pickle.PickleBuffer(self.data),)
+
+
+def _uncached_serialize(object: Any, type_hint: Any) -> bytes:
+    """Serialization path used before TypeAdapters were cached."""
+    adapter: pydantic.TypeAdapter = create_type_adapter(type_hint)
+    return adapter.dump_json(adapter.validate_python(object), warnings="error")
+
+
+def _uncached_deserialize(data: bytes, type_hint: Any) -> Any:
+    """Deserialization path used before TypeAdapters were cached."""
+    return create_type_adapter(type_hint).validate_json(data)
+
+
+class Benchmark:
+    def generate_value(self) -> dict[str, list[Order]]:
+        order = Order(
+            id=1,
+            customer=Customer(
+                name="Jane",
+                addresses=[Address(street="Main St", city="SF", zip_code="94105")],
+            ),
+            items=[
+                LineItem(sku=f"sku-{i}", quantity=i, price=1.5, attributes={"k": "v"})
+                for i in range(3)
+            ],
+        )
+        return {"orders": [order]}
+
+    def measure(
+        self,
+        name: str,
+        serialize: Callable[[Any, Any], bytes],
+        deserialize: Callable[[bytes, Any], Any],
+        iterations: int,
+    ) -> float:
+        value: dict[str, list[Order]] = self.generate_value()
+        start_time = time.monotonic()
+        for _ in range(iterations):
+            deserialize(serialize(value, ORDER_TYPE_HINT), ORDER_TYPE_HINT)
+        duration_sec: float = time.monotonic() - start_time
+        print(
+            f"{name}: {iterations} round trips in {duration_sec:.2f} seconds, "
+            f"{duration_sec / iterations * 1_000_000:.1f} us per round trip"
+        )
+        return duration_sec
+
+    def run(self, iterations: int = 2000):
+        """Compares JSON serializer round trips with and without TypeAdapter caching."""
+        uncached_duration_sec: float = self.measure(
+            "uncached TypeAdapter",
+            _uncached_serialize,
+            _uncached_deserialize,
+            iterations,
+        )
+
+        clear_type_adapter_cache()
+        serializer = JSONUserDataSerializer()
+        cached_duration_sec: float = self.measure(
+            "cached TypeAdapter",
+            serializer.serialize,
+            serializer.deserialize,
+            iterations,
+        )
+        print(f"speedup: {uncached_duration_sec / cached_duration_sec:.1f}x")
+        print(f"cache info: {type_adapter_cache_info()}")
+
+    def run_zero_copy(self, tensor_size: int = 512 * 1024 * 1024):
+        """Compares peak memory used by deserialization of a large tensor with and without out-of-band buffers."""
+        for serializer in [
+            PickleUserDataSerializer(),
+            ZeroCopyPickleUserDataSerializer(),
+        ]:
+            serializer: UserDataSerializer
+            # Downloaded data is always a bytearray.
+            data: bytearray = bytearray(
+                serializer.serialize(Tensor(bytearray(tensor_size)), Tensor)
+            )
+            tracemalloc.start()
+            start_time = time.monotonic()
+            tensor: Tensor = serializer.deserialize(data, Tensor)
+            duration_sec: float = time.monotonic() - start_time
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{serializer.name}: deserialized {tensor.data.nbytes / 1024 / 1024} MB tensor "
+                f"in {duration_sec:.3f} seconds, "
+                f"allocated {peak_bytes / 1024 / 1024:.1f} MB on top of the serialized data"
+            )
+            del tensor
+            del data
+
+
+if __name__ == "__main__":
+    Benchmark().run()
+    Benchmark().run_zero_copy()
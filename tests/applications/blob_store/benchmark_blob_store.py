@@ -1,10 +1,11 @@
+import hashlib
 import os
 import sys
 import time
 from datetime import datetime
 from typing import List
 
-from tensorlake.applications.blob_store import BLOB, BLOBChunk, BLOBStore
+from tensorlake.applications.blob_store import BLOB, BLOBChunk, BLOBRange, BLOBStore
 from tensorlake.applications.internal_logger import InternalLogger
 from tensorlake.vendor.nanoid import generate as nanoid_generate
 
@@ -154,6 +155,57 @@ class Benchmark:
         )
         assert got_blob_data == blob_data, "Data mismatch in downloaded blob"
 
+    def run_verified_download(
+        self,
+        chunks_count: int = 10,
+        chunk_size_bytes: int = 100 * 1024 * 1024,
+    ):
+        """Compares downloads followed by a sha256 pass with downloads that hash the data while reading it."""
+        data_size: int = chunks_count * chunk_size_bytes
+        blob_key: str = self.random_name()
+        blob_data: bytes = self.generate_data(data_size)
+        expected_hash: str = hashlib.sha256(blob_data).hexdigest()
+        self.s3.put_object(Bucket=TEST_BUCKET_NAME, Key=blob_key, Body=blob_data)
+        del blob_data
+
+        blob: BLOB = BLOB(
+            id="benchmark-blob",
+            chunks=[
+                BLOBChunk(
+                    uri=self.presigned_uri(key=blob_key, operation="get_object"),
+                    size=chunk_size_bytes,
+                    etag=None,
+                )
+                for _ in range(chunks_count)
+            ],
+        )
+
+        start_time = time.monotonic()
+        got_blob_data: bytearray = self.blob_store.get(
+            blob=blob,
+            offset=0,
+            size=data_size,
+            logger=self.logger,
+        )
+        got_hash: str = hashlib.sha256(got_blob_data).hexdigest()
+        print(
+            f"FE S3 BLOB store: downloaded and then hashed {data_size / 1024 / 1024} MB in {time.monotonic() - start_time:.2f} seconds"
+        )
+        assert got_hash == expected_hash, "Hash mismatch in downloaded blob"
+        del got_blob_data
+
+        start_time = time.monotonic()
+        read: BLOBRange = BLOBRange(
+            blob=blob, offset=0, size=data_size, digest=hashlib.sha256()
+        )
+        self.blob_store.get_many(reads=[read], logger=self.logger)
+        print(
+            f"FE S3 BLOB store: downloaded and hashed while reading {data_size / 1024 / 1024} MB in {time.monotonic() - start_time:.2f} seconds"
+        )
+        assert (
+            read.digest.hexdigest() == expected_hash
+        ), "Hash mismatch in downloaded blob"
+
 
 if __name__ == "__main__":
     # Use a high CPU limit to use optimal number of IO workers.
@@ -163,3 +215,8 @@ if __name__ == "__main__":
         # 100 MB, min chunk size is 5 MB, max chunk size is 5 GB
         chunk_size_bytes=100 * 1024 * 1024,
     )
+    # 1 GB payload.
+    Benchmark(available_cpu_count=10).run_verified_download(
+        chunks_count=10,
+        chunk_size_bytes=100 * 1024 * 1024,
+    )
@@ -1,3 +1,4 @@
+import hashlib
 import sys
 import unittest
 from typing import List
@@ -6,7 +7,7 @@ from parameterized import parameterized
 from testing import create_tmp_blob, read_tmp_blob_bytes, write_tmp_blob_bytes
 
 from tensorlake.applications import InternalError
-from tensorlake.applications.blob_store import BLOB, BLOBChunk, BLOBStore
+from tensorlake.applications.blob_store import BLOB, BLOBChunk, BLOBRange, BLOBStore
 from tensorlake.applications.internal_logger import InternalLogger
 
 TESTED_CHUNKS = [
@@ -139,6 +140,66 @@ class TestBLOBStore(unittest.TestCase):
                 logger=self.logger,
             )
 
+    @parameterized.expand(TESTED_CHUNKS)
+    def test_get_many_ranges(self, case_name: str, chunks_count: int, chunk_size: int):
+        first_blob: BLOB = create_tmp_blob(
+            id="test-blob-1", chunks_count=chunks_count, chunk_size=chunk_size
+        )
+        second_blob: BLOB = create_tmp_blob(
+            id="test-blob-2", chunks_count=chunks_count, chunk_size=chunk_size
+        )
+        blob_size: int = chunks_count * chunk_size
+        first_blob_data: bytes = self.generate_data(blob_size)
+        second_blob_data: bytes = bytes(reversed(first_blob_data))
+        write_tmp_blob_bytes(blob=first_blob, data=first_blob_data)
+        write_tmp_blob_bytes(blob=second_blob, data=second_blob_data)
+
+        got_blob_data: List[bytearray] = self.blob_store.get_many(
+            reads=[
+                BLOBRange(blob=first_blob, offset=0, size=blob_size),
+                BLOBRange(blob=second_blob, offset=1, size=blob_size - 2),
+                BLOBRange(blob=first_blob, offset=blob_size // 2, size=0),
+                BLOBRange(blob=second_blob, offset=0, size=blob_size),
+            ],
+            logger=self.logger,
+        )
+        self.assertEqual(
+            got_blob_data,
+            [
+                first_blob_data,
+                second_blob_data[1 : blob_size - 1],
+                b"",
+                second_blob_data,
+            ],
+        )
+
+    @parameterized.expand(TESTED_CHUNKS)
+    def test_get_many_computes_digests(
+        self, case_name: str, chunks_count: int, chunk_size: int
+    ):
+        blob: BLOB = create_tmp_blob(
+            id="test-blob", chunks_count=chunks_count, chunk_size=chunk_size
+        )
+        blob_size: int = chunks_count * chunk_size
+        blob_data: bytes = self.generate_data(blob_size)
+        write_tmp_blob_bytes(blob=blob, data=blob_data)
+
+        reads: List[BLOBRange] = [
+            BLOBRange(blob=blob, offset=0, size=blob_size, digest=hashlib.sha256()),
+            BLOBRange(blob=blob, offset=3, size=blob_size - 4, digest=hashlib.sha256()),
+            BLOBRange(blob=blob, offset=0, size=0, digest=hashlib.sha256()),
+        ]
+        self.blob_store.get_many(reads=reads, logger=self.logger)
+
+        self.assertEqual(
+            [read.digest.hexdigest() for read in reads],
+            [
+                hashlib.sha256(blob_data).hexdigest(),
+                hashlib.sha256(blob_data[3 : blob_size - 1]).hexdigest(),
+                hashlib.sha256(b"").hexdigest(),
+            ],
+        )
+
     @parameterized.expand(TESTED_CHUNKS)
     def test_put_full_blob(self, case_name: str, chunks_count: int, chunk_size: int):
         blob: BLOB = create_tmp_blob(
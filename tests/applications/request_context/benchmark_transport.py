@@ -0,0 +1,85 @@
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable
+
+from tensorlake.applications.blob_store import BLOBStore
+from tensorlake.applications.internal_logger import InternalLogger
+from tensorlake.applications.local.request_context.http_handler_factory import (
+    LocalRequestContextHTTPHandlerFactory,
+)
+from tensorlake.applications.request_context.http_client.context import (
+    RequestContextHTTPClient,
+)
+from tensorlake.applications.request_context.http_client.transport import (
+    RequestContextHTTPTransport,
+)
+from tensorlake.applications.request_context.http_server.server import (
+    RequestContextHTTPServer,
+)
+
+
+class Benchmark:
+    def __init__(self):
+        self.logger = InternalLogger.get_logger()
+        self.blob_store_dir = tempfile.TemporaryDirectory()
+        self.handler_factory = LocalRequestContextHTTPHandlerFactory(
+            blob_store_dir_path=self.blob_store_dir.name,
+            logger=self.logger,
+        )
+        self.server = RequestContextHTTPServer(server_router_class=self.handler_factory)
+        threading.Thread(target=self.server.start, daemon=True).start()
+
+    def request_context(
+        self, http_client: RequestContextHTTPTransport
+    ) -> RequestContextHTTPClient:
+        return RequestContextHTTPClient(
+            request_id="benchmark-request",
+            allocation_id="benchmark-allocation",
+            function_name="benchmark_function",
+            function_run_id="benchmark-allocation",
+            server_base_url=self.server.base_url,
+            http_client=http_client,
+            blob_store=BLOBStore(available_cpu_count=1),
+            logger=self.logger,
+        )
+
+    def measure(self, name: str, calls: int, call: Callable[[int], None]) -> None:
+        start_time: float = time.monotonic()
+        for i in range(calls):
+            call(i)
+        duration_sec: float = time.monotonic() - start_time
+        print(f"  {name}: {duration_sec / calls * 1_000_000:.0f} us per call")
+
+    def run(self, calls: int):
+        """Measures latency of request context calls with the HTTP and in-process transports."""
+        transports: dict[str, RequestContextHTTPTransport] = {
+            "HTTP server": RequestContextHTTPClient.create_http_client(
+                server_base_url=self.server.base_url
+            ),
+            "in-process": RequestContextHTTPClient.create_http_client(
+                server_base_url=self.server.base_url,
+                routes=self.handler_factory.routes,
+                logger=self.logger,
+            ),
+        }
+        for transport_name, http_client in transports.items():
+            ctx: RequestContextHTTPClient = self.request_context(http_client)
+            print(f"{transport_name} transport, {calls} calls:")
+            self.measure("state.set", calls, lambda i: ctx.state.set("key", i))
+            self.measure("state.get", calls, lambda i: ctx.state.get("key"))
+            self.measure("metrics.counter", calls, lambda i: ctx.metrics.counter("c"))
+            self.measure(
+                "progress.update",
+                calls,
+                lambda i: ctx.progress.update(current=i, total=calls),
+            )
+            http_client.close()
+
+        self.server.stop()
+        self.blob_store_dir.cleanup()
+
+
+if __name__ == "__main__":
+    Benchmark().run(1000 if len(sys.argv) < 2 else int(sys.argv[1]))
@@ -0,0 +1,82 @@
+import unittest
+
+import httpx
+
+from tensorlake.applications.internal_logger import InternalLogger
+from tensorlake.applications.request_context.http_client.context import (
+    RequestContextHTTPClient,
+)
+from tensorlake.applications.request_context.http_server.handlers.handler import (
+    Handler,
+    Request,
+    Response,
+)
+from tensorlake.applications.request_context.http_server.route import Route
+
+# Nothing listens on this address, all requests must be handled in-process.
+UNREACHABLE_SERVER_BASE_URL = "http://127.0.0.1:1"
+
+
+class EchoHandler(Handler):
+    def __init__(self):
+        self.requests: list[Request] = []
+
+    def handle(self, request: Request) -> Response:
+        self.requests.append(request)
+        return Response(
+            status_code=200,
+            headers={"Content-Type": "application/octet-stream"},
+            body=request.body,
+        )
+
+
+class FailingHandler(Handler):
+    def handle(self, request: Request) -> Response:
+        raise ValueError("handler failed")
+
+
+class TestRequestContextInProcessTransport(unittest.TestCase):
+    def setUp(self):
+        self.echo_handler = EchoHandler()
+        self.http_client = RequestContextHTTPClient.create_http_client(
+            server_base_url=UNREACHABLE_SERVER_BASE_URL,
+            routes={
+                Route(verb="POST", path="/echo"): self.echo_handler,
+                Route(verb="POST", path="/fail"): FailingHandler(),
+            },
+            logger=InternalLogger(
+                context={},
+                destination=InternalLogger.LOG_FILE.NULL,
+                as_cloud_event=False,
+            ),
+        )
+        self.addCleanup(self.http_client.close)
+
+    def _post(self, path: str, body: bytes) -> httpx.Response:
+        return self.http_client.send(
+            self.http_client.build_request("POST", url=path, content=body)
+        )
+
+    def test_request_is_handled_in_process(self):
+        response: httpx.Response = self._post("/echo", b"payload")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"payload")
+        self.assertEqual(len(self.echo_handler.requests), 1)
+        request: Request = self.echo_handler.requests[0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.path, "/echo")
+        self.assertIn("traceparent", request.headers)
+
+    def test_unknown_route_returns_not_found(self):
+        self.assertEqual(self._post("/unknown", b"").status_code, 404)
+
+    def test_handler_exception_returns_internal_server_error(self):
+        response: httpx.Response = self._post("/fail", b"")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertIn(b"handler failed", response.content)
+
+
+if __name__ == "__main__":
+    unittest.main()
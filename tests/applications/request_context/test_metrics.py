@@ -19,6 +19,7 @@ from tensorlake.applications.applications import run_application
 from tensorlake.applications.interface.exceptions import SDKUsageError
 from tensorlake.applications.remote.deploy import deploy_applications
 from tensorlake.applications.request_context.http_client.metrics import (
+    RequestMetricsBatchingConfig,
     RequestMetricsHTTPClient,
 )
 from tensorlake.applications.request_context.metrics import (
@@ -145,6 +146,55 @@ class TestMetricValidationAndLogging(unittest.TestCase):
         transport.build_request.assert_not_called()
 
 
+class TestMetricsBatching(unittest.TestCase):
+    def _create_metrics(
+        self, transport: Mock, config: RequestMetricsBatchingConfig
+    ) -> RequestMetricsHTTPClient:
+        return RequestMetricsHTTPClient(
+            request_id="request",
+            allocation_id="allocation",
+            function_name="function",
+            http_client=transport,
+            batching_config=config,
+        )
+
+    def test_metrics_are_aggregated_and_sent_in_one_request(self):
+        transport = Mock()
+        metrics = self._create_metrics(
+            transport, RequestMetricsBatchingConfig(flush_interval_sec=60.0)
+        )
+
+        metrics.counter("counter")
+        metrics.counter("counter", 2)
+        metrics.timer("timer", 1.5)
+        metrics.timer("timer", 2)
+        transport.build_request.assert_not_called()
+
+        metrics.flush()
+        metrics.flush()  # Nothing to send.
+
+        transport.build_request.assert_called_once()
+        payload: dict = transport.build_request.call_args.kwargs["json"]
+        self.assertEqual(payload["counters"], [{"name": "counter", "value": 3}])
+        self.assertEqual(payload["timers"], [{"name": "timer", "values": [1.5, 2]}])
+        self.assertEqual(metrics.flushes, 1)
+
+    def test_metrics_are_sent_when_max_buffered_values_reached(self):
+        transport = Mock()
+        metrics = self._create_metrics(
+            transport,
+            RequestMetricsBatchingConfig(
+                flush_interval_sec=60.0, max_buffered_values=2
+            ),
+        )
+
+        for _ in range(5):
+            metrics.counter("counter")
+
+        self.assertEqual(transport.build_request.call_count, 2)
+        self.assertEqual(metrics.flushes, 2)
+
+
 @application()
 @function()
 def mt_emit_metrics(_: int) -> str:
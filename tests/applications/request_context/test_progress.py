@@ -1,7 +1,7 @@
 import io
 import sys
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import parameterized
 import validate_all_applications
@@ -15,6 +15,10 @@ from tensorlake.applications import (
 from tensorlake.applications.applications import run_application
 from tensorlake.applications.interface.exceptions import SDKUsageError
 from tensorlake.applications.remote.deploy import deploy_applications
+from tensorlake.applications.request_context.http_client.progress import (
+    FunctionProgressHTTPClient,
+    FunctionProgressRateLimitConfig,
+)
 from tensorlake.applications.request_context.progress import print_progress_update
 
 # Makes the test case discoverable by unittest framework.
@@ -141,6 +145,33 @@ class TestProgressLogging(unittest.TestCase):
             )
 
 
+class TestProgressRateLimiting(unittest.TestCase):
+    def test_progress_updates_are_coalesced_to_latest(self):
+        transport = Mock()
+        progress = FunctionProgressHTTPClient(
+            request_id="request",
+            allocation_id="allocation",
+            function_name="function",
+            function_run_id="function-run",
+            http_client=transport,
+            rate_limit_config=FunctionProgressRateLimitConfig(
+                min_update_interval_sec=60.0
+            ),
+        )
+
+        for current in range(10):
+            progress.update(current=current, total=10)
+        # The first update is sent immediately, others are rate limited.
+        self.assertEqual(progress.sent_updates, 1)
+
+        progress.flush()
+        progress.flush()  # Nothing to send.
+
+        self.assertEqual(progress.sent_updates, 2)
+        payload: dict = transport.build_request.call_args.kwargs["json"]
+        self.assertEqual(payload["current"], 9)
+
+
 @application()
 @function()
 def test_update_progress_raises_expected_error(values: tuple[int, int]) -> str:
@@ -0,0 +1,121 @@
+import os
+import unittest
+from unittest import mock
+
+from tensorlake.applications import (
+    RequestContext,
+    application,
+    function,
+    run_local_application,
+)
+from tensorlake.applications.request_context.http_client.state import (
+    REQUEST_STATE_CACHE_ENV_VAR_NAME,
+    REQUEST_STATE_CACHE_MAX_BUFFERED_BYTES_ENV_VAR_NAME,
+    RequestStateCacheStats,
+)
+
+
+def cache_stats() -> RequestStateCacheStats:
+    return RequestContext.get().state.cache_stats
+
+
+@application()
+@function()
+def read_your_writes(x: int) -> tuple[int, int, int]:
+    ctx: RequestContext = RequestContext.get()
+    ctx.state.set("key", x)
+    first: int = ctx.state.get("key")
+    second: int = ctx.state.get("key")
+    return first + second, cache_stats().hits, cache_stats().misses
+
+
+@application()
+@function()
+def cached_miss(_: int) -> tuple[str, str, int, int]:
+    ctx: RequestContext = RequestContext.get()
+    first: str = ctx.state.get("missing_key", "default_1")
+    second: str = ctx.state.get("missing_key", "default_2")
+    return first, second, cache_stats().hits, cache_stats().misses
+
+
+@function()
+def read_state(_: int) -> int:
+    return RequestContext.get().state.get("key")
+
+
+@application()
+@function()
+def child_reads_parent_writes(x: int) -> int:
+    RequestContext.get().state.set("key", x)
+    return read_state(0)
+
+
+@application()
+@function()
+def coalesce_writes(x: int) -> tuple[int, int, int]:
+    ctx: RequestContext = RequestContext.get()
+    for i in range(x + 1):
+        ctx.state.set("key", i)
+    ctx.state.flush()
+    return read_state(0), cache_stats().flushes, cache_stats().flushed_values
+
+
+@function()
+def write_state(x: int) -> int:
+    RequestContext.get().state.set("key", x)
+    return x
+
+
+@application()
+@function()
+def writes_flushed_at_finish(x: int) -> int:
+    write_state(x)
+    return read_state(0)
+
+
+@application()
+@function()
+def flush_on_size_threshold(x: int) -> tuple[int, int]:
+    ctx: RequestContext = RequestContext.get()
+    for i in range(x):
+        ctx.state.set(f"key_{i}", i)
+    return cache_stats().flushes, cache_stats().flushed_values
+
+
+@mock.patch.dict(os.environ, {REQUEST_STATE_CACHE_ENV_VAR_NAME: "1"})
+class TestRequestStateCache(unittest.TestCase):
+    def test_get_returns_value_set_by_allocation_from_cache(self):
+        self.assertEqual(
+            run_local_application(read_your_writes, 7).output(), (14, 2, 0)
+        )
+
+    def test_missing_key_is_cached(self):
+        self.assertEqual(
+            run_local_application(cached_miss, 0).output(),
+            ("default_1", "default_2", 1, 1),
+        )
+
+    def test_function_call_sees_writes_of_calling_function(self):
+        self.assertEqual(
+            run_local_application(child_reads_parent_writes, 3).output(), 3
+        )
+
+    def test_writes_of_same_key_are_coalesced(self):
+        self.assertEqual(
+            run_local_application(coalesce_writes, 10).output(), (10, 1, 1)
+        )
+
+    def test_writes_are_flushed_when_function_call_finishes(self):
+        self.assertEqual(run_local_application(writes_flushed_at_finish, 5).output(), 5)
+
+    @mock.patch.dict(
+        os.environ, {REQUEST_STATE_CACHE_MAX_BUFFERED_BYTES_ENV_VAR_NAME: "1"}
+    )
+    def test_writes_are_flushed_when_size_threshold_reached(self):
+        self.assertEqual(
+            run_local_application(flush_on_size_threshold, 3).output(), (3, 3)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,24 @@
+import importlib
+import os
 import stat
+import sys
 import tempfile
 import unittest
 import zipfile
 from io import BytesIO
 from pathlib import Path
+from unittest import mock
 
+from tensorlake.applications import SDKUsageError
 from tensorlake.applications.remote.code.zip import (
     CODE_ZIP_MANIFEST_FILE_NAME,
     zip_code,
 )
+from tensorlake.applications.remote.deploy import (
+    _CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME,
+    _code_zip_cache_max_bytes,
+)
+from tensorlake.utils.cache import KVCache
 
 
 class TestCodeZip(unittest.TestCase):
@@ -40,6 +50,88 @@ class TestCodeZip(unittest.TestCase):
                 self.assertEqual(entry.create_system, 3)
                 self.assertTrue(stat.S_ISREG(entry.external_attr >> 16))
 
+    def test_application_zip_with_bytecode(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory)
+            package = root / "code_zip_bytecode_pkg"
+            package.mkdir()
+            (package / "__init__.py").write_text("")
+            (package / "m.py").write_text("def f():\n    return 42\n")
+            (package / "broken.py").write_text("def broken(:\n")
+
+            first = zip_code(str(root), set(), [], compile_bytecode=True)
+            second = zip_code(str(root), set(), [], compile_bytecode=True)
+
+            self.assertEqual(first, second)
+            with zipfile.ZipFile(BytesIO(first)) as archive:
+                self.assertEqual(
+                    archive.namelist(),
+                    [
+                        CODE_ZIP_MANIFEST_FILE_NAME,
+                        "code_zip_bytecode_pkg/__init__.py",
+                        "code_zip_bytecode_pkg/__init__.pyc",
+                        # Files that don't compile have no bytecode.
+                        "code_zip_bytecode_pkg/broken.py",
+                        "code_zip_bytecode_pkg/m.py",
+                        "code_zip_bytecode_pkg/m.pyc",
+                    ],
+                )
+
+            zip_path = os.path.join(temporary_directory, "code.zip")
+            with open(zip_path, "wb") as zip_file:
+                zip_file.write(first)
+            sys.path.insert(0, zip_path)
+            try:
+                module = importlib.import_module("code_zip_bytecode_pkg.m")
+                # zipimport loaded the module from bytecode.
+                self.assertTrue(module.__file__.endswith("m.pyc"))
+                self.assertEqual(module.f(), 42)
+            finally:
+                sys.path.remove(zip_path)
+                sys.modules.pop("code_zip_bytecode_pkg.m", None)
+                sys.modules.pop("code_zip_bytecode_pkg", None)
+
+    def test_cached_application_zip(self) -> None:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory) / "code"
+            root.mkdir()
+            cache = KVCache("code_zip", root_dir=Path(temporary_directory) / "cache")
+            (root / "a.py").write_text("A = 1\n")
+            (root / "b.py").write_text("def broken(:\n")
+
+            uncached = zip_code(str(root), set(), [], compile_bytecode=True)
+            first = zip_code(str(root), set(), [], compile_bytecode=True, cache=cache)
+            second = zip_code(str(root), set(), [], compile_bytecode=True, cache=cache)
+            self.assertEqual(first, uncached)
+            self.assertEqual(second, uncached)
+
+            # Changed files are not taken from the cache.
+            (root / "a.py").write_text("A = 2222\n")
+            changed = zip_code(str(root), set(), [], compile_bytecode=True, cache=cache)
+            self.assertEqual(
+                changed, zip_code(str(root), set(), [], compile_bytecode=True)
+            )
+            with zipfile.ZipFile(BytesIO(changed)) as archive:
+                self.assertEqual(archive.read("a.py"), b"A = 2222\n")
+                self.assertEqual(
+                    archive.namelist(),
+                    [CODE_ZIP_MANIFEST_FILE_NAME, "a.py", "a.pyc", "b.py"],
+                )
+
+
+class TestCodeZipCacheSize(unittest.TestCase):
+    def test_cache_size_is_read_from_environment(self) -> None:
+        with mock.patch.dict(os.environ, {_CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME: "2"}):
+            self.assertEqual(_code_zip_cache_max_bytes(), 2 * 1024 * 1024)
+
+    def test_invalid_cache_size_raises_sdk_usage_error(self) -> None:
+        for value in ["-1", "many"]:
+            with mock.patch.dict(
+                os.environ, {_CODE_ZIP_CACHE_SIZE_MB_ENV_VAR_NAME: value}
+            ):
+                with self.assertRaises(SDKUsageError):
+                    _code_zip_cache_max_bytes()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+import inspect
+import unittest
+from typing import Any
+
+from tensorlake.applications import application, cls, function
+from tensorlake.applications.function.type_hints import (
+    function_call_plan,
+    function_parameters,
+    function_signature,
+)
+from tensorlake.applications.function.user_data_serializer import (
+    function_input_serializer,
+    function_output_serializer,
+)
+from tensorlake.applications.user_data_serializer import (
+    APPLICATION_FUNCTION_CALL_SERIALIZER_NAME,
+    SDK_FUNCTION_CALL_SERIALIZER_NAME,
+)
+
+
+@application()
+@function()
+def call_plan_application(payload: dict, count) -> str:
+    return "done"
+
+
+@function()
+def call_plan_function(x: int):
+    return x
+
+
+@cls()
+class CallPlanClass:
+    @function()
+    def method(self, a: int, b: str) -> int:
+        return a
+
+
+class TestFunctionCallPlan(unittest.TestCase):
+    def test_plan_is_computed_once(self):
+        call_plan = function_call_plan(call_plan_function)
+        self.assertIs(function_call_plan(call_plan_function), call_plan)
+        self.assertIs(function_signature(call_plan_function), call_plan.signature)
+        self.assertIs(
+            function_output_serializer(call_plan_function, None),
+            call_plan.output_serializer,
+        )
+
+    def test_application_plan(self):
+        call_plan = function_call_plan(call_plan_application)
+        self.assertEqual(
+            [parameter.name for parameter in call_plan.parameters],
+            ["payload", "count"],
+        )
+        self.assertEqual(
+            call_plan.parameter_type_hints, {"payload": dict, "count": Any}
+        )
+        self.assertIs(call_plan.return_type_hint, str)
+        self.assertEqual(
+            call_plan.output_serializer.name, APPLICATION_FUNCTION_CALL_SERIALIZER_NAME
+        )
+        self.assertEqual(
+            function_input_serializer(call_plan_application, app_call=True).name,
+            APPLICATION_FUNCTION_CALL_SERIALIZER_NAME,
+        )
+        self.assertEqual(
+            function_input_serializer(call_plan_application, app_call=False).name,
+            SDK_FUNCTION_CALL_SERIALIZER_NAME,
+        )
+
+    def test_function_plan(self):
+        call_plan = function_call_plan(call_plan_function)
+        self.assertIs(call_plan.return_type_hint, Any)
+        self.assertEqual(
+            call_plan.output_serializer.name, SDK_FUNCTION_CALL_SERIALIZER_NAME
+        )
+
+    def test_method_plan_has_no_self_parameter(self):
+        self.assertEqual(
+            [parameter.name for parameter in function_parameters(CallPlanClass.method)],
+            ["a", "b"],
+        )
+        self.assertEqual(
+            function_call_plan(CallPlanClass.method).parameter_type_hints,
+            {"a": int, "b": str},
+        )
+
+    def test_class_decorator_resets_plan(self):
+        class LateDecoratedClass:
+            @function()
+            def method(self, a: int) -> int:
+                return a
+
+        # Computed before the class is decorated, the self parameter is not known yet.
+        self.assertEqual(
+            [
+                parameter.name
+                for parameter in function_parameters(LateDecoratedClass.method)
+            ],
+            ["self", "a"],
+        )
+        cls()(LateDecoratedClass)
+        self.assertEqual(
+            [
+                parameter.name
+                for parameter in function_parameters(LateDecoratedClass.method)
+            ],
+            ["a"],
+        )
+
+    def test_plan_is_frozen(self):
+        call_plan = function_call_plan(call_plan_function)
+        with self.assertRaises(Exception):
+            call_plan.return_type_hint = int
+        with self.assertRaises(TypeError):
+            call_plan.parameter_type_hints["x"] = str
+        self.assertIsInstance(call_plan.signature, inspect.Signature)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import unittest
+from unittest import mock
+
+from tensorlake.applications import (
+    RequestError,
+    application,
+    cls,
+    function,
+    run_local_application,
+)
+from tensorlake.applications.local.process_pool import (
+    LOCAL_PROCESS_POOL_ENV_VAR_NAME,
+)
+
+
+@function(cpu=2)
+def process_id(_: int) -> int:
+    return os.getpid()
+
+
+@application()
+@function()
+def map_process_ids(count: int) -> list[int]:
+    return process_id.map(list(range(count)))
+
+
+@application()
+@function()
+def batched_map_process_ids(count: int) -> list[int]:
+    return process_id.map(list(range(count)), batch_size=2)
+
+
+@cls()
+class ProcessIdReporter:
+    def __init__(self):
+        self._process_id: int = os.getpid()
+
+    @function()
+    def process_id(self, _: int) -> int:
+        return self._process_id
+
+
+@application()
+@function()
+def class_instance_process_id(_: int) -> int:
+    return ProcessIdReporter().process_id(0)
+
+
+@function()
+def raise_request_error(message: str) -> str:
+    raise RequestError(message)
+
+
+@application()
+@function()
+def request_error_in_worker(message: str) -> str:
+    return raise_request_error(message)
+
+
+@function()
+def block_on_future(x: int) -> list[int]:
+    return [os.getpid(), process_id.future(x).result()]
+
+
+@application()
+@function()
+def future_blocked_in_function(x: int) -> list[int]:
+    return block_on_future(x)
+
+
+@function()
+def return_future(x: int) -> int:
+    return process_id.future(x)
+
+
+@application()
+@function()
+def future_returned_from_function(x: int) -> int:
+    return return_future(x)
+
+
+@function()
+def catch_local_runner_required(x: int) -> str:
+    try:
+        process_id(x)
+    except BaseException:
+        pass
+    return "caught"
+
+
+@application()
+@function()
+def local_runner_required_caught_in_function(x: int) -> str:
+    return catch_local_runner_required(x)
+
+
+@mock.patch.dict(os.environ, {LOCAL_PROCESS_POOL_ENV_VAR_NAME: "1"})
+class TestLocalProcessPool(unittest.TestCase):
+    def test_map_runs_in_worker_processes(self):
+        process_ids: list[int] = run_local_application(map_process_ids, 5).output()
+        self.assertEqual(len(process_ids), 5)
+        self.assertNotIn(os.getpid(), process_ids)
+
+    def test_batched_map_runs_in_worker_processes(self):
+        process_ids: list[int] = run_local_application(
+            batched_map_process_ids, 5
+        ).output()
+        self.assertEqual(len(process_ids), 5)
+        self.assertNotIn(os.getpid(), process_ids)
+
+    def test_class_instance_is_created_in_worker_process(self):
+        process_id: int = run_local_application(class_instance_process_id, 0).output()
+        self.assertNotEqual(process_id, os.getpid())
+
+    def test_request_error_from_worker_fails_request(self):
+        request = run_local_application(request_error_in_worker, "worker failed")
+        with self.assertRaises(RequestError) as context:
+            request.output()
+        self.assertEqual(context.exception.message, "worker failed")
+
+    def test_function_blocking_on_future_reruns_in_thread(self):
+        process_ids: list[int] = run_local_application(
+            future_blocked_in_function, 1
+        ).output()
+        # The function reran in LocalRunner thread and the called function ran in a worker.
+        self.assertEqual(process_ids[0], os.getpid())
+        self.assertNotEqual(process_ids[1], os.getpid())
+
+    def test_function_returning_future_reruns_in_thread(self):
+        process_id: int = run_local_application(
+            future_returned_from_function, 1
+        ).output()
+        self.assertNotEqual(process_id, os.getpid())
+
+    def test_function_catching_future_usage_error_reruns_in_thread(self):
+        output: str = run_local_application(
+            local_runner_required_caught_in_function, 1
+        ).output()
+        self.assertEqual(output, "caught")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import threading
+import time
+import unittest
+
+from tensorlake.applications import (
+    RequestError,
+    application,
+    function,
+    run_local_application,
+)
+
+
+@function()
+def fail_request(message: str) -> str:
+    raise RequestError(message)
+
+
+@function()
+def sleep_and_return_arg(arg: int, delay: float) -> int:
+    time.sleep(delay)
+    return arg
+
+
+@application()
+@function()
+def run_futures_after_request_failure(count: int) -> str:
+    fail_request.future(message="failed").run()
+    # Keeps creating future runs while LocalRunner closes after the request failure.
+    for i in range(count):
+        sleep_and_return_arg.future(arg=i, delay=0.01).run()
+        time.sleep(0.001)
+    return "success"
+
+
+class TestLocalRunnerClose(unittest.TestCase):
+    def test_close_cancels_future_runs_created_while_closing(self):
+        def run_requests() -> None:
+            for _ in range(5):
+                request = run_local_application(run_futures_after_request_failure, 200)
+                with self.assertRaises(RequestError):
+                    request.output()
+
+        thread = threading.Thread(target=run_requests, daemon=True)
+        thread.start()
+        thread.join(timeout=60)
+        self.assertFalse(thread.is_alive(), "LocalRunner.close() didn't return")
+
+
+if __name__ == "__main__":
+    unittest.main()
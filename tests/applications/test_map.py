@@ -2,6 +2,7 @@ import unittest
 
 import parameterized
 import validate_all_applications
+from pydantic import BaseModel
 
 from tensorlake.applications import (
     Future,
@@ -153,6 +154,49 @@ async def async_api_function_map_tail_call_with_future_input(
     return async_to_string.map(list_future)
 
 
+@application()
+@function()
+def api_function_batched_map(numbers: list[int]) -> list[int]:
+    return to_int.map(to_string.map(numbers, batch_size=3), batch_size=4)
+
+
+@application()
+@function()
+async def async_api_function_batched_map_with_future_input(
+    numbers: list[int],
+) -> list[str]:
+    list_future = async_generate_int_list.future(numbers)
+    return await async_to_string.map(list_future, batch_size=2)
+
+
+class Square(BaseModel):
+    value: int
+    square: int
+
+
+@function()
+def to_square(value: int) -> Square:
+    return Square(value=value, square=value * value)
+
+
+@application()
+@function()
+def api_function_batched_tail_call_map(numbers: list[int]) -> list[Square]:
+    return to_square.future.map(numbers, batch_size=3)
+
+
+@application()
+@function()
+def api_function_batched_map_returning_future(numbers: list[int]) -> list[int]:
+    return to_int_tail_call.map(to_string.map(numbers), batch_size=2)
+
+
+@application()
+@function()
+def api_function_batched_map_invalid_batch_size(numbers: list[int]) -> list[str]:
+    return to_string.map(numbers, batch_size=0)
+
+
 class TestRecursiveMaps(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -255,6 +299,48 @@ class TestRecursiveMaps(unittest.TestCase):
         )
         self.assertEqual(request.output(), ["1", "2", "3", "4", "5"])
 
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_batched_map(self, _: str, is_remote: bool):
+        for numbers in [[], [1], [1, 2, 3], list(range(10))]:
+            with self.subTest(numbers=numbers):
+                request: Request = run_application(
+                    api_function_batched_map, is_remote, numbers
+                )
+                self.assertEqual(request.output(), numbers)
+
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_async_batched_map_with_future_input(self, _: str, is_remote: bool):
+        request: Request = run_application(
+            async_api_function_batched_map_with_future_input,
+            is_remote,
+            [1, 2, 3, 4, 5],
+        )
+        self.assertEqual(request.output(), ["1", "2", "3", "4", "5"])
+
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_batched_tail_call_map_preserves_item_types(self, _: str, is_remote: bool):
+        request: Request = run_application(
+            api_function_batched_tail_call_map, is_remote, [1, 2, 3, 4]
+        )
+        self.assertEqual(
+            request.output(),
+            [Square(value=i, square=i * i) for i in [1, 2, 3, 4]],
+        )
+
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_batched_map_function_returning_future_fails(self, _: str, is_remote: bool):
+        request: Request = run_application(
+            api_function_batched_map_returning_future, is_remote, [1, 2, 3]
+        )
+        self.assertRaises(RequestFailed, request.output)
+
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_batched_map_invalid_batch_size(self, _: str, is_remote: bool):
+        request: Request = run_application(
+            api_function_batched_map_invalid_batch_size, is_remote, [1, 2, 3]
+        )
+        self.assertRaises(RequestFailed, request.output)
+
 
 if __name__ == "__main__":
     unittest.main()
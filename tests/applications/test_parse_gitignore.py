@@ -18,6 +18,7 @@ from tensorlake.applications.remote.code.ignored_code_paths import (
     ignored_code_paths,
 )
 from tensorlake.applications.remote.code.loader import walk_code
+from tensorlake.utils.cache import KVCache
 
 
 def _make_tree(root: Path, paths: list[str]):
@@ -555,5 +556,148 @@ class TestWalkCodeEndToEnd(unittest.TestCase):
             self.assertNotIn(_abspath(root, "dist/bundle.py"), walked_files)
 
 
+class TestGlobPatterns(unittest.TestCase):
+    """Glob syntax compiled into the single gitignore matcher."""
+
+    def test_double_star_matches_any_depth(self):
+        with TemporaryDirectory() as root:
+            root = Path(root)
+            _make_tree(
+                root,
+                ["docs/a/b/gen.py", "docs/gen.py", "gen.py", "other/a/gen.py"],
+            )
+
+            gitignore = root / ".gitignore"
+            gitignore.write_text("docs/**/gen.py\n")
+
+            result = _parse_gitignore(root, gitignore)
+            self.assertIn(_abspath(root, "docs/a/b/gen.py"), result)
+            self.assertIn(_abspath(root, "docs/gen.py"), result)
+            self.assertNotIn(_abspath(root, "gen.py"), result)
+            self.assertNotIn(_abspath(root, "other/a/gen.py"), result)
+
+    def test_character_class_and_question_mark(self):
+        with TemporaryDirectory() as root:
+            root = Path(root)
+            _make_tree(root, ["a1.py", "b1.py", "a12.py", "sub/a2.py"])
+
+            gitignore = root / ".gitignore"
+            gitignore.write_text("[a-a]?.py\n")
+
+            result = _parse_gitignore(root, gitignore)
+            self.assertIn(_abspath(root, "a1.py"), result)
+            self.assertIn(_abspath(root, "sub/a2.py"), result)
+            self.assertNotIn(_abspath(root, "b1.py"), result)
+            self.assertNotIn(_abspath(root, "a12.py"), result)
+
+    def test_star_does_not_match_slash(self):
+        with TemporaryDirectory() as root:
+            root = Path(root)
+            _make_tree(root, ["src/gen/x.py", "src/x.py"])
+
+            gitignore = root / ".gitignore"
+            gitignore.write_text("src/*.py\n")
+
+            result = _parse_gitignore(root, gitignore)
+            self.assertIn(_abspath(root, "src/x.py"), result)
+            self.assertNotIn(_abspath(root, "src/gen/x.py"), result)
+
+
+class TestWalkCode(unittest.TestCase):
+    def test_walk_order_matches_sorted_os_walk(self):
+        with TemporaryDirectory() as root:
+            root = Path(root)
+            _make_tree(
+                root,
+                ["z.py", "a.py", "b/c.py", "b/a/d.py", "a/e.py", "a/b/f.py"],
+            )
+
+            expected = []
+            for dir_path, dir_names, file_names in os.walk(root):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    expected.append(os.path.join(dir_path, file_name))
+
+            self.assertEqual(list(walk_code(str(root), set())), expected)
+
+    def test_walk_skips_soft_link_cycles(self):
+        with TemporaryDirectory() as root:
+            root = Path(root)
+            _make_tree(root, ["pkg/mod.py", "lib/util.py"])
+            os.symlink(root / "pkg", root / "pkg" / "loop")
+            os.symlink(root / "lib", root / "pkg" / "lib")
+
+            self.assertEqual(
+                list(walk_code(str(root), set())),
+                [
+                    _abspath(root, "lib/util.py"),
+                    _abspath(root, "pkg/mod.py"),
+                    _abspath(root, "pkg/lib/util.py"),
+                ],
+            )
+
+    def test_cached_walk_sees_changes(self):
+        with TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory) / "code"
+            cache = KVCache("code_zip", root_dir=Path(temporary_directory) / "cache")
+            _make_tree(root, ["app.py", "pkg/mod.py", "venv/site.py"])
+            excluded = {_abspath(root, "venv")}
+
+            first = list(walk_code(str(root), excluded, cache=cache))
+            self.assertEqual(first, list(walk_code(str(root), excluded, cache=cache)))
+
+            _make_tree(root, ["pkg/new.py"])
+            (root / "app.py").unlink()
+            self.assertEqual(
+                list(walk_code(str(root), excluded, cache=cache)),
+                [_abspath(root, "pkg/mod.py"), _abspath(root, "pkg/new.py")],
+            )
+            # Ignored paths are applied to cached listings too.
+            self.assertEqual(
+                list(walk_code(str(root), set(), cache=cache)),
+                [
+                    _abspath(root, "pkg/mod.py"),
+                    _abspath(root, "pkg/new.py"),
+                    _abspath(root, "venv/site.py"),
+                ],
+            )
+
+    def test_cached_walk_doesnt_reuse_racy_listings(self):
+        with TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory) / "code"
+            cache = KVCache("code_zip", root_dir=Path(temporary_directory) / "cache")
+            _make_tree(root, ["app.py", "pkg/mod.py"])
+            pkg_mtime_ns: int = os.stat(root / "pkg").st_mtime_ns
+            list(walk_code(str(root), set(), cache=cache))
+
+            # A change in the same modification time tick as the listing.
+            _make_tree(root, ["pkg/new.py"])
+            os.utime(root / "pkg", ns=(pkg_mtime_ns, pkg_mtime_ns))
+            self.assertEqual(
+                list(walk_code(str(root), set(), cache=cache)),
+                [
+                    _abspath(root, "app.py"),
+                    _abspath(root, "pkg/mod.py"),
+                    _abspath(root, "pkg/new.py"),
+                ],
+            )
+
+    def test_cached_walk_reuses_listings_of_unchanged_directories(self):
+        with TemporaryDirectory() as temporary_directory:
+            root = Path(temporary_directory) / "code"
+            cache = KVCache("code_zip", root_dir=Path(temporary_directory) / "cache")
+            _make_tree(root, ["app.py", "pkg/mod.py"])
+            # Modified long before the listing, so the listings are not racy.
+            for dir_path in [root, root / "pkg"]:
+                os.utime(dir_path, (1_000_000_000, 1_000_000_000))
+            first = list(walk_code(str(root), set(), cache=cache))
+
+            with patch(
+                "tensorlake.applications.remote.code.loader.os.scandir"
+            ) as scandir:
+                self.assertEqual(list(walk_code(str(root), set(), cache=cache)), first)
+            scandir.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -303,6 +303,23 @@ async def async_api_reduce_with_future_input(_: Any) -> AccumulatedState:
     return async_accumulate_reduce.future.reduce(list_future, AccumulatedState(sum=0))
 
 
+@application()
+@function()
+def api_associative_reduce(count: int) -> str:
+    # String concatenation is associative but not commutative so the output verifies item order.
+    items: list[str] = [str(i % 10) for i in range(count)]
+    return concat_strs.future.reduce(items, "[", associative=True)
+
+
+@application()
+@function()
+async def async_api_associative_reduce(count: int) -> str:
+    items: list[str] = [str(i % 10) for i in range(count)]
+    return await async_concat_strs.reduce(
+        async_int_to_str.future.map(items), "[", associative=True
+    )
+
+
 class TestReduce(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -532,6 +549,25 @@ class TestReduce(unittest.TestCase):
         result: AccumulatedState = request.output()
         self.assertEqual(result.sum, 7)  # 0 + 1 + 2 + 4
 
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_associative_reduce(self, _: str, is_remote: bool):
+        for count in [0, 1, 2, 7, 16, 33]:
+            with self.subTest(count=count):
+                request: Request = run_application(
+                    api_associative_reduce, is_remote, count
+                )
+                self.assertEqual(
+                    request.output(),
+                    "[" + "".join(str(i % 10) for i in range(count)),
+                )
+
+    @parameterized.parameterized.expand([("remote", True), ("local", False)])
+    def test_async_associative_reduce(self, _: str, is_remote: bool):
+        request: Request = run_application(async_api_associative_reduce, is_remote, 21)
+        self.assertEqual(
+            request.output(), "[" + "".join(str(i % 10) for i in range(21))
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
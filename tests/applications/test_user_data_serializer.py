@@ -0,0 +1,162 @@
+import pickle
+import struct
+import threading
+import unittest
+from typing import Annotated, Any
+
+import pydantic
+
+from tensorlake.applications import DeserializationError
+from tensorlake.applications.user_data_serializer import (
+    JSONUserDataSerializer,
+    PickleUserDataSerializer,
+    TypeAdapterCacheInfo,
+    ZeroCopyPickleUserDataSerializer,
+    _TypeAdapterCache,
+    cached_type_adapter,
+    clear_type_adapter_cache,
+    serializer_by_name,
+    type_adapter_cache_info,
+)
+
+
+class Item(pydantic.BaseModel):
+    name: str
+    tags: list[str]
+
+
+class Order(pydantic.BaseModel):
+    id: int
+    items: list[Item]
+
+
+class _UnhashableMetadata:
+    __hash__ = None
+
+
+class _Tensor:
+    """Mimics numpy arrays which pickle their data using out-of-band buffers."""
+
+    def __init__(self, buffer: Any):
+        self.data: memoryview = memoryview(buffer)
+
+    def __reduce_ex__(self, protocol: int):
+        return _Tensor, (pickle.PickleBuffer(self.data),)
+
+
+class TestTypeAdapterCache(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_type_adapter_cache()
+
+    def test_adapter_is_reused_for_same_type_hint(self) -> None:
+        first: pydantic.TypeAdapter = cached_type_adapter(dict[str, Order])
+        second: pydantic.TypeAdapter = cached_type_adapter(dict[str, Order])
+        self.assertIs(first, second)
+
+        info: TypeAdapterCacheInfo = type_adapter_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.size, 1)
+
+    def test_json_serializer_round_trip_uses_cache(self) -> None:
+        serializer = JSONUserDataSerializer()
+        order = Order(id=1, items=[Item(name="a", tags=["x"])])
+        for _ in range(3):
+            data: bytes = serializer.serialize(order, Order)
+            self.assertEqual(serializer.deserialize(data, Order), order)
+            self.assertEqual(serializer.deserialize(memoryview(data), Order), order)
+
+        info: TypeAdapterCacheInfo = type_adapter_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 8)
+
+    def test_unhashable_type_hint_is_not_cached(self) -> None:
+        type_hint: Any = Annotated[int, _UnhashableMetadata()]
+        self.assertEqual(JSONUserDataSerializer().deserialize(b"5", type_hint), 5)
+
+        info: TypeAdapterCacheInfo = type_adapter_cache_info()
+        self.assertEqual(info.unhashable, 1)
+        self.assertEqual(info.size, 0)
+
+    def test_least_recently_used_adapter_is_evicted(self) -> None:
+        cache = _TypeAdapterCache(max_size=2)
+        int_adapter: pydantic.TypeAdapter = cache.get(int)
+        cache.get(str)
+        self.assertIs(cache.get(int), int_adapter)
+        cache.get(float)  # Evicts str.
+
+        self.assertIs(cache.get(int), int_adapter)
+        cache.get(str)
+        info: TypeAdapterCacheInfo = cache.info()
+        self.assertEqual(info.size, 2)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.hits, 2)
+
+    def test_concurrent_lookups(self) -> None:
+        type_hints: list[Any] = [list[int], dict[str, Order], set[str], Item]
+        errors: list[BaseException] = []
+
+        def lookup() -> None:
+            try:
+                for _ in range(100):
+                    for type_hint in type_hints:
+                        cached_type_adapter(type_hint)
+            except BaseException as e:
+                errors.append(e)
+
+        threads: list[threading.Thread] = [
+            threading.Thread(target=lookup) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        info: TypeAdapterCacheInfo = type_adapter_cache_info()
+        self.assertEqual(info.size, len(type_hints))
+        self.assertEqual(info.hits + info.misses, 8 * 100 * len(type_hints))
+
+
+class TestZeroCopyPickleUserDataSerializer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.serializer = serializer_by_name(ZeroCopyPickleUserDataSerializer.NAME)
+
+    def test_round_trip_without_out_of_band_buffers(self) -> None:
+        value: dict[str, Any] = {
+            "a": [1, 2, 3],
+            "b": b"small",
+            "c": Item(name="x", tags=[]),
+        }
+        data: bytes = self.serializer.serialize(value, type(value))
+        self.assertEqual(self.serializer.deserialize(data, type(value)), value)
+
+    def test_large_buffers_are_deserialized_without_copying(self) -> None:
+        first: bytearray = bytearray(range(256)) * 1024
+        second: bytearray = bytearray(b"x" * (128 * 1024))
+        value: tuple[Any, ...] = (_Tensor(first), "between", _Tensor(second))
+        data: bytearray = bytearray(self.serializer.serialize(value, type(value)))
+        # The buffers are stored after the pickle stream.
+        pickle_size, buffers_count = struct.unpack_from("<QI", data, 0)
+        self.assertLess(pickle_size, 1024)
+        self.assertEqual(buffers_count, 2)
+
+        deserialized: tuple[Any, ...] = self.serializer.deserialize(
+            memoryview(data)[0:], type(value)
+        )
+        self.assertEqual(deserialized[0].data.tobytes(), first)
+        self.assertEqual(deserialized[1], "between")
+        self.assertEqual(deserialized[2].data.tobytes(), second)
+
+        # Deserialized buffers share memory with the serialized data.
+        deserialized[2].data[0] = ord("y")
+        self.assertIn(b"y" + b"x" * 16, data)
+
+    def test_deserialize_regular_pickle_data_fails(self) -> None:
+        data: bytes = PickleUserDataSerializer().serialize([1, 2], list)
+        with self.assertRaises(DeserializationError):
+            self.serializer.deserialize(data, list)
+
+
+if __name__ == "__main__":
+    unittest.main()
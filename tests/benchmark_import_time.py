@@ -0,0 +1,103 @@
+import subprocess
+import sys
+
+# Process entry points and the modules they import on startup.
+_ENTRY_POINTS: dict[str, str] = {
+    "function-executor": "import tensorlake.function_executor.main",
+    "tensorlake-python-function-runner": "import tensorlake.function_agent.runner",
+    "application definition": "from tensorlake.applications import function",
+}
+
+# Subsystems that must not be imported on startup of the entry points.
+_FORBIDDEN_MODULES: dict[str, list[str]] = {
+    "function-executor": [
+        "tensorlake.sandbox",
+        "tensorlake.repositories",
+        "tensorlake.image.sandbox_builder",
+        "tensorlake.applications.local.runner",
+        "tensorlake.applications.remote.runner",
+        "websockets",
+    ],
+    "tensorlake-python-function-runner": [
+        "tensorlake.sandbox",
+        "tensorlake.repositories",
+        "tensorlake.image.sandbox_builder",
+        "tensorlake.applications.local.runner",
+        "websockets",
+    ],
+    "application definition": [
+        "tensorlake.sandbox",
+        "tensorlake.repositories",
+        "tensorlake.image.sandbox_builder",
+        "tensorlake.applications.local.runner",
+        "tensorlake.applications.blob_store",
+        "httpx",
+        "websockets",
+        "pydantic",
+    ],
+}
+
+
+def _parse_importtime(stderr: str) -> dict[str, tuple[int, bool]]:
+    """Parses -X importtime output.
+
+    Returns (cumulative import time in microseconds, is imported at top level) by module name.
+    """
+    modules: dict[str, tuple[int, bool]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module_name = line[len("import time:") :].split("|")
+        # Nested imports are indented by two spaces per level after one separator space.
+        is_top_level: bool = not module_name.startswith("  ")
+        modules[module_name.strip()] = (int(cumulative), is_top_level)
+    return modules
+
+
+class Benchmark:
+    def measure(self, name: str, statement: str) -> bool:
+        """Measures import time of the entry point, returns False if it imports forbidden modules."""
+        runs: list[dict[str, tuple[int, bool]]] = []
+        for _ in range(5):
+            # A fresh interpreter per run, modules are never imported already.
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", statement],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                print(f"{name}: failed to import: {result.stderr.splitlines()[-1]}")
+                return True
+            runs.append(_parse_importtime(result.stderr))
+
+        # Cumulative times of top level tensorlake imports add up to the whole startup import time
+        # of the entry point without the modules imported by interpreter startup.
+        total_us: int = min(
+            sum(
+                cumulative_us
+                for module_name, (cumulative_us, is_top_level) in run.items()
+                if is_top_level and module_name.startswith("tensorlake")
+            )
+            for run in runs
+        )
+        print(f"{name}: imported in {total_us / 1000:.1f} ms (best of 5)")
+
+        imported_forbidden: list[str] = [
+            module_name
+            for module_name in _FORBIDDEN_MODULES[name]
+            if module_name in runs[0]
+        ]
+        if imported_forbidden:
+            print(f"  regression, imports {', '.join(imported_forbidden)} on startup")
+        return not imported_forbidden
+
+    def run(self) -> bool:
+        """Measures startup import time of the processes using the SDK."""
+        results: list[bool] = [
+            self.measure(name, statement) for name, statement in _ENTRY_POINTS.items()
+        ]
+        return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if Benchmark().run() else 1)
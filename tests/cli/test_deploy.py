@@ -315,6 +315,7 @@ class TestDeployEntrypoints(unittest.TestCase):
             load_source_dir_modules=False,
             api_client=auth.cloud_client,
             function_images={},
+            compile_bytecode=False,
         )
         deployed_event = next(
             call.args[0]
@@ -58,7 +58,9 @@ class _StubNative:
         repos: Optional[List[Dict[str, Any]]] = None,
         ref: Optional[Dict[str, Any]] = None,
         entries: Optional[List[Dict[str, Any]]] = None,
+        trees: Optional[Dict[str, List[Dict[str, Any]]]] = None,
         file_bytes: bytes = b"",
+        files: Optional[Dict[str, bytes]] = None,
         push_report: Optional[Dict[str, Any]] = None,
         errors: Optional[Dict[str, Tuple[str, Optional[int], str]]] = None,
     ):
@@ -77,7 +79,12 @@ class _StubNative:
             "generation": 3,
         }
         self.entries = entries or []
+        #: Entries by directory path; directories not listed here answer
+        #: with ``entries``.
+        self.trees = trees or {}
         self.file_bytes = file_bytes
+        #: Content by path; paths not listed here read as ``file_bytes``.
+        self.files = files or {}
         self.push_report = push_report or {
             "version_id": _COMMIT,
             "previous_version_id": None,
@@ -175,14 +182,31 @@ class _StubNative:
     def read_filesystem_file(self, project_id, name, path, version):
         self.calls.append(("read_filesystem_file", (project_id, name, path, version)))
         self._maybe_fail("read_filesystem_file")
-        return self.file_bytes
+        return self.files.get(path, self.file_bytes)
+
+    def read_filesystem_file_with_metadata(
+        self, project_id, name, path, version, range=None
+    ):
+        self.calls.append(
+            (
+                "read_filesystem_file_with_metadata",
+                (project_id, name, path, version, range),
+            )
+        )
+        self._maybe_fail("read_filesystem_file_with_metadata")
+        data = self.files.get(path, self.file_bytes)
+        full_size = len(data)
+        if range is not None:
+            offset, length = range
+            data = data[offset : offset + length]
+        return data, f"cid-{path}", full_size
 
     def list_filesystem_tree(self, project_id, name, dir_path, version):
         self.calls.append(
             ("list_filesystem_tree", (project_id, name, dir_path, version))
         )
         self._maybe_fail("list_filesystem_tree")
-        return json.dumps({"entries": self.entries})
+        return json.dumps({"entries": self.trees.get(dir_path, self.entries)})
 
     def push_filesystem_files(
         self,
@@ -373,6 +397,76 @@ class TestFilesystemClient(unittest.TestCase):
         with self.assertRaises(FilesystemError):
             fs.read_file("//")
 
+    def test_read_files_yields_in_order(self):
+        stub = _StubNative(
+            files={f"shard-{i}": f"data-{i}".encode() for i in range(50)}
+        )
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+        paths = [f"shard-{i}" for i in range(50)]
+
+        results = list(fs.read_files(paths, max_concurrency=4))
+
+        self.assertEqual(results, [(p, stub.files[p]) for p in paths])
+
+    def test_snapshot_reads_are_served_from_cache(self):
+        snapshot = "a" * 64
+        stub = _StubNative(files={"cfg/a.json": b"{}", "cfg/b.json": b"{}"})
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+
+        self.assertEqual(fs.read_file("cfg/a.json", snapshot), b"{}")
+        self.assertEqual(fs.read_file("/cfg/a.json", snapshot), b"{}")
+        self.assertEqual(fs.read_file_range("cfg/a.json", 1, 5, snapshot), b"}")
+        reads = [c for c in stub.calls if c[0].startswith("read_filesystem_file")]
+        self.assertEqual(len(reads), 1)
+
+        # Head reads always go to the network.
+        fs.read_file("cfg/a.json")
+        fs.read_file("cfg/a.json")
+        self.assertEqual([c[0] for c in stub.calls[-2:]], ["read_filesystem_file"] * 2)
+
+    def test_read_file_range_and_streaming_reader(self):
+        content = bytes(range(256)) * 4
+        stub = _StubNative(files={"model.bin": content})
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+
+        self.assertEqual(fs.read_file_range("model.bin", 100, 10), content[100:110])
+        self.assertEqual(fs.read_file_range("model.bin", 100, 0), b"")
+        with self.assertRaises(FilesystemError):
+            fs.read_file_range("model.bin", -1, 10)
+
+        with fs.open_read("model.bin", chunk_size=300) as reader:
+            self.assertEqual(reader.read(10), content[:10])
+            self.assertEqual(reader.size, len(content))
+            chunks = list(reader.iter_chunks())
+        self.assertEqual(content[:10] + b"".join(chunks), content)
+        ranges = [
+            c[1][4] for c in stub.calls if c[0] == "read_filesystem_file_with_metadata"
+        ]
+        self.assertIn((0, 300), ranges)
+        self.assertIn((900, 300), ranges)
+
+    def test_streaming_reader_raises_when_file_changes_between_ranges(self):
+        content = bytes(range(256)) * 4
+        stub = _StubNative(files={"model.bin": content})
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+
+        with fs.open_read("model.bin", chunk_size=300) as reader:
+            self.assertEqual(reader.read(300), content[:300])
+            # A write at head publishes new content for the file.
+            read_range = stub.read_filesystem_file_with_metadata
+
+            def read_changed_file(*args, **kwargs):
+                data, _, full_size = read_range(*args, **kwargs)
+                return data, "cid-rewritten", full_size
+
+            stub.read_filesystem_file_with_metadata = read_changed_file
+            with self.assertRaises(FilesystemError):
+                reader.read(300)
+
     def test_list_files_builds_paths(self):
         stub = _StubNative(
             entries=[
@@ -387,6 +481,59 @@ class TestFilesystemClient(unittest.TestCase):
         self.assertTrue(entries[0].is_dir)
         self.assertEqual(entries[1].size, 3)
 
+    def test_walk_lists_subtrees_and_caches_them_by_content_id(self):
+        stub = _StubNative(
+            trees={
+                "": [
+                    {"name": "docs", "oid": "tree-docs", "mode": 0o40000},
+                    {"name": "a.txt", "oid": "y", "mode": 0o100644},
+                ],
+                "docs": [
+                    {"name": "sub", "oid": "tree-sub", "mode": 0o40000},
+                    {"name": "b.txt", "oid": "z", "mode": 0o100644},
+                ],
+                "docs/sub": [{"name": "run.sh", "oid": "w", "mode": 0o100755}],
+            }
+        )
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+        snapshot = "a" * 64
+
+        # Head listings are never cached, a concurrent write can make a
+        # listing by path newer than the content id its parent reported.
+        for _ in range(2):
+            stub.calls.clear()
+            entries = fs.list_files(recursive=True)
+            self.assertEqual(
+                [e.path for e in entries],
+                ["docs", "a.txt", "docs/sub", "docs/b.txt", "docs/sub/run.sh"],
+            )
+            self.assertTrue(entries[-1].executable)
+            tree_calls = [c for c in stub.calls if c[0] == "list_filesystem_tree"]
+            self.assertEqual(
+                sorted(c[1][2] for c in tree_calls), ["", "docs", "docs/sub"]
+            )
+
+        # Unchanged subtrees of a snapshot are served from the content-id
+        # cache; only the start directory is listed again.
+        list(fs.walk(version=snapshot))
+        stub.calls.clear()
+        self.assertEqual(
+            [e.path for e in fs.walk(version=snapshot)], [e.path for e in entries]
+        )
+        self.assertEqual(
+            [c[1][2] for c in stub.calls if c[0] == "list_filesystem_tree"], [""]
+        )
+
+    def test_walk_of_missing_directory_raises_not_found(self):
+        stub = _StubNative(
+            errors={"list_filesystem_tree": ("remote_api", 404, "not found")}
+        )
+        client = _client_with_stub(stub)
+        fs = client.create("my-fs")
+        with self.assertRaises(FileNotFoundInFilesystemError):
+            list(fs.walk("missing"))
+
     def test_status_maps_version_and_generation(self):
         client = _client_with_stub(_StubNative())
         fs = client.create("my-fs")
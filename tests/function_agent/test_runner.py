@@ -6,6 +6,7 @@ import contextlib
 import hashlib
 import io
 import json
+import threading
 import unittest
 import zipfile
 from typing import Any, Coroutine
@@ -14,11 +15,25 @@ from tensorlake._cloud_sdk import FunctionAgentCore
 from tensorlake.applications.request_context.request_state import (
     REQUEST_STATE_USER_DATA_SERIALIZER,
 )
+from tensorlake.applications.runtime_hooks import (
+    clear_await_future_hook,
+    clear_coroutine_to_future_hook,
+    clear_register_coroutine_hook,
+    clear_run_future_hook,
+    clear_wait_futures_hook,
+)
 from tensorlake.applications.user_data_serializer import (
     APPLICATION_FUNCTION_CALL_SERIALIZER_NAME,
     serializer_by_name,
 )
-from tensorlake.function_agent.runner import ProtocolWriter, PythonFunctionRunner
+from tensorlake.function_agent.runner import (
+    ProtocolWriter,
+    PythonFunctionRunner,
+    _decode_binary_message,
+    _decode_json_message,
+    _encode_binary_message,
+    _encode_json_message,
+)
 
 
 class FakeNativeCore:
@@ -38,6 +53,29 @@ class FakeNativeCore:
         self.inputs.put_nowait(json.dumps(message))
 
 
+class FakeBinaryNativeCore:
+    """Native core that exchanges binary framed messages."""
+
+    def __init__(self) -> None:
+        self.inputs: asyncio.Queue[bytes] = asyncio.Queue()
+        self.outputs: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def next_input(self) -> str:
+        raise AssertionError("JSON input must not be used by binary protocol")
+
+    async def next_input_bytes(self) -> bytes:
+        return await self.inputs.get()
+
+    async def submit_output(self, output_json: str) -> None:
+        raise AssertionError("JSON output must not be used by binary protocol")
+
+    async def submit_output_bytes(self, output: bytes) -> None:
+        await self.outputs.put(_decode_binary_message(output))
+
+    def push(self, message: dict[str, Any]) -> None:
+        self.inputs.put_nowait(_encode_binary_message(message))
+
+
 class LoopBoundNativeCore:
     """Models PyO3 future creation, which requires the running loop thread."""
 
@@ -54,6 +92,10 @@ class LoopBoundNativeCore:
 
 
 class PythonFunctionRunnerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        # Each PythonFunctionRunner installs process wide runtime hooks.
+        self.addCleanup(self._clear_runtime_hooks)
+
     async def test_native_core_can_start_inside_the_python_event_loop(self) -> None:
         core = FunctionAgentCore(
             "http://127.0.0.1:9",
@@ -183,6 +225,164 @@ def {function_name}(value: dict) -> dict:
             expected,
         )
 
+    async def test_binary_protocol_sends_payloads_as_frames(self) -> None:
+        function_name = "embedded_agent_binary_test"
+        module_name = "embedded_agent_binary_test_module"
+        code = self._code_zip(
+            f"""\
+from tensorlake.applications import application, function
+
+@application()
+@function()
+def {function_name}(value: dict) -> dict:
+    return value
+""",
+            function_name,
+            module_name,
+        )
+        serializer = serializer_by_name(APPLICATION_FUNCTION_CALL_SERIALIZER_NAME)
+        expected = {"value": "x" * 1024 * 1024}
+        core = FakeBinaryNativeCore()
+        protocol = ProtocolWriter(core, asyncio.get_running_loop())  # type: ignore[arg-type]
+        runner = PythonFunctionRunner(protocol)
+        serve = asyncio.create_task(runner.serve(core))  # type: ignore[arg-type]
+        self.addAsyncCleanup(self._stop, serve)
+
+        core.push(
+            {
+                "type": "assignment",
+                "assignment": {
+                    "attempt_id": "attempt-binary",
+                    "fence_token": 7,
+                    "function_run_id": "run-binary",
+                    "request_id": "request-binary",
+                    "namespace": "default",
+                    "application": "binary-test",
+                    "application_version": "v1",
+                    "function": function_name,
+                    "timeout_ms": 5_000,
+                    "initialization_timeout_ms": 5_000,
+                    "inputs": [
+                        {
+                            "data": serializer.serialize(expected, dict),
+                            "metadata": b"",
+                            "content_type": serializer.content_type,
+                        }
+                    ],
+                    "request_headers": [],
+                    "call_metadata": b"",
+                    "application_code": code,
+                    "application_code_sha256": hashlib.sha256(code).hexdigest(),
+                },
+            }
+        )
+
+        self.assertEqual(await self._output(core), {"type": "initialized"})
+        result = await self._output(core)
+        self.assertEqual(result["type"], "success")
+        self.assertEqual(
+            serializer.deserialize(result["result"]["output"], dict), expected
+        )
+
+    async def test_messages_of_different_attempts_are_delivered_concurrently(
+        self,
+    ) -> None:
+        core = FakeNativeCore()
+        protocol = ProtocolWriter(core, asyncio.get_running_loop())  # type: ignore[arg-type]
+        runner = PythonFunctionRunner(protocol)
+        release_slow_attempt = threading.Event()
+        delivered: list[tuple[str, int]] = []
+
+        def handle_message(message: dict[str, Any]) -> None:
+            if message["attempt_id"] == "slow" and message["sequence"] == 0:
+                release_slow_attempt.wait(timeout=5)
+            delivered.append((message["attempt_id"], message["sequence"]))
+
+        runner._handle_message = handle_message  # type: ignore[method-assign]
+        serve = asyncio.create_task(runner.serve(core))  # type: ignore[arg-type]
+        self.addAsyncCleanup(self._stop, serve)
+
+        for attempt_id in ("slow", "fast"):
+            for sequence in range(2):
+                core.push(
+                    {"type": "cancel", "attempt_id": attempt_id, "sequence": sequence}
+                )
+
+        await self._wait_until(lambda: len(delivered) == 2)
+        self.assertEqual(delivered, [("fast", 0), ("fast", 1)])
+        metrics = runner.dispatch_metrics()
+        self.assertEqual(metrics.active_queues, 1)
+        self.assertEqual(metrics.queued_messages, 2)
+        self.assertEqual(metrics.max_queue_depth, 2)
+
+        release_slow_attempt.set()
+        await self._wait_until(lambda: len(delivered) == 4)
+        self.assertEqual(delivered[2:], [("slow", 0), ("slow", 1)])
+        self.assertEqual(runner.dispatch_metrics().queued_messages, 0)
+
+    async def test_growing_dispatch_queue_depth_is_logged(self) -> None:
+        core = FakeNativeCore()
+        protocol = ProtocolWriter(core, asyncio.get_running_loop())  # type: ignore[arg-type]
+        runner = PythonFunctionRunner(protocol)
+        release_attempt = threading.Event()
+        delivered: list[int] = []
+
+        def handle_message(message: dict[str, Any]) -> None:
+            release_attempt.wait(timeout=5)
+            delivered.append(message["sequence"])
+
+        runner._handle_message = handle_message  # type: ignore[method-assign]
+        serve = asyncio.create_task(runner.serve(core))  # type: ignore[arg-type]
+        self.addAsyncCleanup(self._stop, serve)
+
+        with self.assertLogs("tensorlake.function_agent.runner", "INFO") as logs:
+            for sequence in range(16):
+                core.push(
+                    {"type": "cancel", "attempt_id": "slow", "sequence": sequence}
+                )
+            await self._wait_until(
+                lambda: runner.dispatch_metrics().max_queue_depth_high_water_mark == 16
+            )
+        self.assertIn("max queue depth high water mark 16", logs.output[-1])
+
+        release_attempt.set()
+        await self._wait_until(lambda: len(delivered) == 16)
+
+    def test_protocol_messages_round_trip(self) -> None:
+        message = {
+            "type": "call_batch",
+            "calls": [
+                {
+                    "inputs": [{"data": b"\x00" * 10, "metadata": b""}],
+                    "call_metadata": b"metadata",
+                }
+            ],
+            "value": None,
+        }
+
+        encoded_json = _encode_json_message(message)
+        self.assertIn('"data_base64":"AAAAAAAAAAAAAA=="', encoded_json)
+        self.assertEqual(_decode_json_message(encoded_json), message)
+        self.assertEqual(
+            _decode_binary_message(_encode_binary_message(message)), message
+        )
+
+    @staticmethod
+    async def _wait_until(condition: Any) -> None:
+        async def wait() -> None:
+            while not condition():
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(wait(), timeout=2)
+
+    @staticmethod
+    def _clear_runtime_hooks() -> None:
+        clear_await_future_hook()
+        clear_coroutine_to_future_hook()
+        clear_register_coroutine_hook()
+        clear_run_future_hook()
+        clear_wait_futures_hook()
+
     @staticmethod
     async def _output(core: FakeNativeCore) -> dict[str, Any]:
         return await asyncio.wait_for(core.outputs.get(), timeout=2)
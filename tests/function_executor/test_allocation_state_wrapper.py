@@ -0,0 +1,59 @@
+import hashlib
+import unittest
+from unittest.mock import patch
+
+from tensorlake.function_executor.allocation_runner.allocation_state_wrapper import (
+    AllocationStateWrapper,
+)
+from tensorlake.function_executor.proto.function_executor_pb2 import (
+    AllocationState,
+)
+
+
+class AllocationStateWrapperTest(unittest.TestCase):
+    def test_burst_of_updates_is_hashed_once(self) -> None:
+        state = AllocationStateWrapper()
+        with patch(
+            "tensorlake.function_executor.allocation_runner.allocation_state_wrapper.hashlib.sha256",
+            wraps=hashlib.sha256,
+        ) as sha256:
+            for i in range(100):
+                state.update_progress(current=i, total=100)
+            self.assertEqual(sha256.call_count, 0)
+            self.assertEqual(state.version, 100)
+
+            allocation_state: AllocationState = state.wait_for_update(
+                last_seen_hash=None
+            )
+            self.assertEqual(sha256.call_count, 1)
+            self.assertEqual(allocation_state.progress.current, 99)
+
+    def test_state_with_same_content_is_not_returned_again(self) -> None:
+        state = AllocationStateWrapper()
+        initial_state: AllocationState = state.wait_for_update(last_seen_hash=None)
+
+        state.add_output_blob_request(id="blob", size=10)
+        state.remove_output_blob_request(id="blob")
+        state.set_finished()
+
+        self.assertIsNone(
+            state.wait_for_update(last_seen_hash=initial_state.sha256_hash)
+        )
+
+    def test_returned_state_has_hash_of_its_content(self) -> None:
+        state = AllocationStateWrapper()
+        state.add_output_blob_request(id="blob", size=10)
+
+        allocation_state: AllocationState = state.wait_for_update(last_seen_hash=None)
+        expected_hash: str = allocation_state.sha256_hash
+        allocation_state.ClearField("sha256_hash")
+        self.assertEqual(
+            expected_hash,
+            hashlib.sha256(
+                allocation_state.SerializeToString(deterministic=True)
+            ).hexdigest(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -102,6 +102,8 @@ class _EventLoopDriver:
         self.command_batches: list[OutputEventBatch] = []
         # Callback: (command) -> result. If None, auto-generate success results.
         self.result_callback = None
+        # Set to run the event loop as a special function call (i.e. map/reduce splitter).
+        self.special_settings: SpecialFunctionCallSettings | None = None
 
     def run(self, args: list, kwargs: dict) -> OutputEventFinishAllocation:
         """Run the event loop to completion, processing all commands."""
@@ -126,7 +128,7 @@ class _EventLoopDriver:
         clear_coroutine_to_future_hook()
 
     def _run_loop(self, args: list, kwargs: dict) -> OutputEventFinishAllocation:
-        self.loop.start(args, kwargs, special_settings=None)
+        self.loop.start(args, kwargs, special_settings=self.special_settings)
 
         while True:
             batch = self.loop.wait_for_output_event_batch()
@@ -719,6 +721,67 @@ class TestEventLoopMapOperation(unittest.TestCase):
         self.assertIsNotNone(splitter_durable_id)
         self.assertEqual(captured["result"], [100, 200, 300])
 
+    def test_batched_map_splitter_creates_map_batches(self):
+        """Batched map splitter creates a map batch call per batch and a flattening map concat tail call."""
+        child_func = _make_test_function("child_func", fn=lambda x: x)
+        register_function("child_func", child_func)
+        func = _make_test_function("my_func", fn=lambda *args: None)
+        register_function("my_func", func)
+
+        driver = _EventLoopDriver(_make_test_event_loop(func))
+        driver.special_settings = SpecialFunctionCallSettings(
+            is_map_splitter=True,
+            splitter_function_name="child_func",
+            map_batch_size=2,
+        )
+        output = driver.run([1, 2, 3, 4, 5], {})
+
+        self.assertIsNone(output.user_exception)
+        call_cmds = [
+            c
+            for c in driver.command_batches[0].events
+            if isinstance(c, OutputEventCreateFunctionCall)
+        ]
+        self.assertEqual(len(call_cmds), 4)
+        batch_cmds, concat_cmd = call_cmds[:3], call_cmds[3]
+        self.assertEqual([c.args for c in batch_cmds], [[[1, 2]], [[3, 4]], [[5]]])
+        for cmd in batch_cmds:
+            self.assertEqual(cmd.function_name, "child_func")
+            self.assertTrue(cmd.special_settings.is_map_batch)
+            self.assertFalse(cmd.is_tail_call)
+        self.assertTrue(concat_cmd.is_tail_call)
+        self.assertTrue(concat_cmd.special_settings.is_map_concat)
+        self.assertEqual(concat_cmd.special_settings.map_batch_size, 2)
+        self.assertEqual(
+            concat_cmd.args, [FunctionCallRef(c.durable_id) for c in batch_cmds]
+        )
+
+    def test_map_batch_calls_function_per_item(self):
+        """Map batch call returns a list with the function output for each of its items."""
+        func = _make_test_function("child_func", fn=lambda x: x * 10)
+        register_function("child_func", func)
+
+        driver = _EventLoopDriver(_make_test_event_loop(func))
+        driver.special_settings = SpecialFunctionCallSettings(is_map_batch=True)
+        output = driver.run([[1, 2, 3]], {})
+
+        self.assertIsNone(output.user_exception)
+        self.assertEqual(output.value, [10, 20, 30])
+
+    def test_batched_map_concat_flattens_batches(self):
+        """Map concat of a batched map flattens lists of map batch outputs."""
+        func = _make_test_function("my_func", fn=lambda *args: None)
+        register_function("my_func", func)
+
+        driver = _EventLoopDriver(_make_test_event_loop(func))
+        driver.special_settings = SpecialFunctionCallSettings(
+            is_map_concat=True, map_batch_size=2
+        )
+        output = driver.run([[10, 20], [30, 40], [50]], {})
+
+        self.assertIsNone(output.user_exception)
+        self.assertEqual(output.value, [10, 20, 30, 40, 50])
+
 
 class TestEventLoopResolveArg(unittest.TestCase):
     """Tests for _resolve_arg handling of MapFuture and ReduceOperationFuture args."""
@@ -1032,6 +1095,79 @@ class TestEventLoopReduceOperation(unittest.TestCase):
         self.assertIsNone(output.user_exception)
         self.assertEqual(captured["result"], 30)
 
+    def test_associative_reduce_splitter_settings(self):
+        """reduce(..., associative=True) marks the reduce splitter as associative."""
+        child_func = _make_test_function("child_func", fn=lambda x: x)
+        register_function("child_func", child_func)
+
+        def user_code():
+            child_func.future.reduce([10, 20, 30], associative=True).run()
+
+        func = _make_test_function("my_func", fn=user_code)
+
+        driver = _EventLoopDriver(_make_test_event_loop(func))
+        output = driver.run([], {})
+
+        self.assertIsNone(output.user_exception)
+        call_cmds = [
+            c
+            for c in driver.command_batches[0].events
+            if isinstance(c, OutputEventCreateFunctionCall)
+        ]
+        self.assertEqual(len(call_cmds), 1)
+        self.assertTrue(call_cmds[0].special_settings.is_reduce_splitter)
+        self.assertTrue(call_cmds[0].special_settings.is_associative_reduce)
+        self.assertEqual(call_cmds[0].args, [10, 20, 30])
+
+    def test_associative_reduce_changes_durable_id(self):
+        """Associative and sequential reduce splitters over the same items have different durable IDs."""
+        child_func = _make_test_function("child_func", fn=lambda x: x)
+        register_function("child_func", child_func)
+
+        def splitter_durable_id(associative: bool) -> str:
+            def user_code():
+                child_func.future.reduce([10, 20], associative=associative).run()
+
+            func = _make_test_function("my_func", fn=user_code)
+            driver = _EventLoopDriver(_make_test_event_loop(func))
+            driver.run([], {})
+            return driver.command_batches[0].events[0].durable_id
+
+        self.assertEqual(splitter_durable_id(False), splitter_durable_id(False))
+        self.assertNotEqual(splitter_durable_id(False), splitter_durable_id(True))
+
+    def test_associative_reduce_splitter_creates_balanced_tree(self):
+        """Associative reduce splitter reduces adjacent pairs level by level preserving item order."""
+        child_func = _make_test_function("child_func", fn=lambda x: x)
+        register_function("child_func", child_func)
+        func = _make_test_function("my_func", fn=lambda *args: None)
+
+        driver = _EventLoopDriver(_make_test_event_loop(func))
+        driver.special_settings = SpecialFunctionCallSettings(
+            is_reduce_splitter=True,
+            splitter_function_name="child_func",
+            is_associative_reduce=True,
+        )
+        output = driver.run([1, 2, 3, 4, 5], {})
+
+        self.assertIsNone(output.user_exception)
+        call_cmds = [
+            c
+            for c in driver.command_batches[0].events
+            if isinstance(c, OutputEventCreateFunctionCall)
+        ]
+        # ((1+2)+(3+4))+5: 4 reduce calls with depth 3 instead of sequential depth 4.
+        self.assertEqual(len(call_cmds), 4)
+        ids = [c.durable_id for c in call_cmds]
+        self.assertEqual(call_cmds[0].args, [1, 2])
+        self.assertEqual(call_cmds[1].args, [3, 4])
+        self.assertEqual(
+            call_cmds[2].args, [FunctionCallRef(ids[0]), FunctionCallRef(ids[1])]
+        )
+        self.assertEqual(call_cmds[3].args, [FunctionCallRef(ids[2]), 5])
+        self.assertTrue(call_cmds[3].is_tail_call)
+        self.assertEqual([c.is_tail_call for c in call_cmds[:3]], [False, False, False])
+
 
 class TestEventLoopTailCall(unittest.TestCase):
     def setUp(self):
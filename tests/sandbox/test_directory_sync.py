@@ -0,0 +1,248 @@
+import io
+import os
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from tensorlake._tracing import Traced
+from tensorlake.sandbox import (
+    CommandResult,
+    DirectoryEntry,
+    ListDirectoryResponse,
+    RemoteAPIError,
+    SandboxError,
+)
+from tensorlake.sandbox.directory_sync import (
+    _extract_archive,
+    download_directory,
+    upload_directory,
+)
+
+
+class _LocalSandbox:
+    """Sandbox stand-in whose file system is the local one.
+
+    Provides the ``Sandbox`` methods used by directory sync and records
+    the files transferred through them.
+    """
+
+    def __init__(self):
+        self.uploads = []
+        self.downloads = []
+        self.commands = []
+
+    def list_directory(self, path):
+        if not os.path.isdir(path):
+            raise RemoteAPIError(404, "directory not found")
+        entries = []
+        for entry in os.scandir(path):
+            stat = entry.stat()
+            entries.append(
+                DirectoryEntry(
+                    name=entry.name,
+                    is_dir=entry.is_dir(),
+                    size=None if entry.is_dir() else stat.st_size,
+                    modified_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc),
+                )
+            )
+        return Traced("t", ListDirectoryResponse(path=path, entries=entries))
+
+    def run(self, command, args=None):
+        self.commands.append([command, *args])
+        result = subprocess.run([command, *args], capture_output=True, text=True)
+        return Traced(
+            "t",
+            CommandResult(
+                exit_code=result.returncode, stdout=result.stdout, stderr=result.stderr
+            ),
+        )
+
+    def upload_file(self, local_path, path):
+        self.uploads.append(path)
+        shutil.copyfile(local_path, path)
+        return Traced("t", None)
+
+    def download_file(self, path, local_path):
+        self.downloads.append(path)
+        shutil.copyfile(path, local_path)
+        return Traced("t", None)
+
+    def write_file(self, path, content):
+        with open(path, "wb") as f:
+            f.write(content)
+        return Traced("t", None)
+
+    def delete_file(self, path):
+        os.remove(path)
+        return Traced("t", None)
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+
+
+def _read_tree(root):
+    tree = {}
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in file_names:
+            path = os.path.join(dir_path, file_name)
+            with open(path, "rb") as f:
+                tree[os.path.relpath(path, root)] = f.read()
+    return tree
+
+
+class TestDirectorySync(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.local_dir = os.path.join(tmp_dir.name, "local")
+        self.remote_dir = os.path.join(tmp_dir.name, "remote")
+        _write(os.path.join(self.local_dir, "a.txt"), b"a" * 100)
+        _write(os.path.join(self.local_dir, "src", "b.py"), b"print('b')\n")
+        _write(os.path.join(self.local_dir, "src", "pkg", "-c.bin"), bytes(5000))
+        self.sandbox = _LocalSandbox()
+
+    def test_upload_directory(self):
+        result = upload_directory(
+            self.sandbox, self.local_dir, self.remote_dir, parallelism=2
+        )
+
+        self.assertEqual(_read_tree(self.remote_dir), _read_tree(self.local_dir))
+        self.assertEqual(result.transferred_files, 3)
+        self.assertEqual(result.transferred_bytes, 100 + 11 + 5000)
+        self.assertEqual(result.skipped_files, 0)
+        # One archive per parallel batch, staging archives are removed.
+        self.assertEqual(len(self.sandbox.uploads), 2)
+        self.assertFalse(any(os.path.exists(path) for path in self.sandbox.uploads))
+
+    def test_upload_directory_skips_unchanged_files(self):
+        upload_directory(self.sandbox, self.local_dir, self.remote_dir)
+        _write(os.path.join(self.local_dir, "src", "b.py"), b"print('changed b')\n")
+        _write(os.path.join(self.local_dir, "d.txt"), b"new")
+        self.sandbox.uploads = []
+
+        result = upload_directory(self.sandbox, self.local_dir, self.remote_dir)
+
+        self.assertEqual(_read_tree(self.remote_dir), _read_tree(self.local_dir))
+        self.assertEqual(result.transferred_files, 2)
+        self.assertEqual(result.skipped_files, 2)
+
+    def test_upload_directory_of_unchanged_tree_transfers_nothing(self):
+        upload_directory(self.sandbox, self.local_dir, self.remote_dir)
+        self.sandbox.uploads = []
+        self.sandbox.commands = []
+
+        result = upload_directory(self.sandbox, self.local_dir, self.remote_dir)
+
+        self.assertEqual(result.transferred_files, 0)
+        self.assertEqual(result.skipped_files, 3)
+        self.assertEqual(self.sandbox.uploads, [])
+        self.assertEqual(self.sandbox.commands, [])
+
+    def test_upload_directory_with_gzip_compression(self):
+        upload_directory(
+            self.sandbox, self.local_dir, self.remote_dir, compression="gzip"
+        )
+
+        self.assertEqual(_read_tree(self.remote_dir), _read_tree(self.local_dir))
+        self.assertIn("-z", self.sandbox.commands[0])
+
+    def test_download_directory(self):
+        upload_directory(self.sandbox, self.local_dir, self.remote_dir)
+        download_dir = self.local_dir + "-copy"
+
+        result = download_directory(
+            self.sandbox, self.remote_dir, download_dir, compression="gzip"
+        )
+        self.assertEqual(_read_tree(download_dir), _read_tree(self.local_dir))
+        self.assertEqual(result.transferred_files, 3)
+
+        _write(os.path.join(self.remote_dir, "a.txt"), b"changed a")
+        result = download_directory(self.sandbox, self.remote_dir, download_dir)
+        self.assertEqual(_read_tree(download_dir), _read_tree(self.remote_dir))
+        self.assertEqual((result.transferred_files, result.skipped_files), (1, 2))
+        self.assertFalse(any(os.path.exists(path) for path in self.sandbox.downloads))
+
+    def test_failed_extraction_raises_sandbox_error(self):
+        # A file where the destination directory should be makes tar fail.
+        _write(self.remote_dir, b"not a directory")
+
+        with self.assertRaisesRegex(SandboxError, "failed with exit code"):
+            upload_directory(
+                self.sandbox, self.local_dir, self.remote_dir, skip_unchanged=False
+            )
+
+    def test_invalid_options_raise_sandbox_error(self):
+        with self.assertRaises(SandboxError):
+            upload_directory(
+                self.sandbox, self.local_dir, self.remote_dir, compression="lz4"
+            )
+        with self.assertRaises(SandboxError):
+            upload_directory(
+                self.sandbox, self.local_dir, self.remote_dir, parallelism=0
+            )
+
+
+def _tar_stream(*members):
+    """Returns a streaming tar archive reader with the given TarInfo members."""
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w") as archive:
+        for member in members:
+            archive.addfile(member, io.BytesIO(b"x") if member.isreg() else None)
+    data.seek(0)
+    return tarfile.open(fileobj=data, mode="r|")
+
+
+def _tar_member(name, type=tarfile.REGTYPE, linkname=""):
+    member = tarfile.TarInfo(name)
+    member.type = type
+    member.linkname = linkname
+    member.size = 1 if type == tarfile.REGTYPE else 0
+    return member
+
+
+class TestExtractArchiveWithoutDataFilter(unittest.TestCase):
+    """Python versions without tarfile extraction filters."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.local_dir = os.path.join(tmp_dir.name, "local")
+        os.makedirs(self.local_dir)
+        if hasattr(tarfile, "data_filter"):
+            data_filter = tarfile.data_filter
+            del tarfile.data_filter
+            self.addCleanup(setattr, tarfile, "data_filter", data_filter)
+
+    def test_extracts_files_inside_local_dir(self):
+        _extract_archive(
+            _tar_stream(
+                _tar_member("./src/b.py"),
+                _tar_member("./link", tarfile.SYMTYPE, "src/b.py"),
+            ),
+            self.local_dir,
+        )
+        self.assertEqual(_read_tree(self.local_dir), {"src/b.py": b"x", "link": b"x"})
+
+    def test_refuses_members_outside_local_dir(self):
+        for member in [
+            _tar_member("../evil.txt"),
+            _tar_member("/tmp/evil.txt"),
+            _tar_member("./link", tarfile.SYMTYPE, "../../etc"),
+            _tar_member("./link", tarfile.SYMTYPE, "/etc"),
+            _tar_member("./link", tarfile.LNKTYPE, "../evil.txt"),
+            _tar_member("./fifo", tarfile.FIFOTYPE),
+        ]:
+            with self.subTest(name=member.name, linkname=member.linkname):
+                with self.assertRaisesRegex(SandboxError, "refusing to extract"):
+                    _extract_archive(_tar_stream(member), self.local_dir)
+        self.assertEqual(os.listdir(self.local_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from tensorlake.sandbox import (
+    AsyncFileReadStream,
+    AsyncSandbox,
+    FileReadStream,
+    RemoteAPIError,
+    Sandbox,
+    SandboxError,
+)
+
+_CONTENT = bytes(range(256)) * 40  # 10240 bytes
+
+
+class _FakeProxyClient:
+    def __init__(self, base_url):
+        self._base_url = base_url
+
+    def base_url(self):
+        return self._base_url
+
+    def close(self):
+        return None
+
+
+class _FileServer:
+    """Sandbox daemon stand-in serving files with optional Range support."""
+
+    def __init__(self):
+        self.files = {"/data/model.bin": _CONTENT}
+        self.supports_ranges = True
+        self.ranges = []
+        # Requests of ranges starting at these offsets fail.
+        self.failing_offsets = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                content = server.files.get(parse_qs(url.query)["path"][0])
+                if url.path != "/api/v1/files" or content is None:
+                    self.send_error(404, "file not found")
+                    return
+
+                range_header = self.headers.get("Range")
+                server.ranges.append(range_header)
+                if range_header is None or not server.supports_ranges:
+                    self._send(200, content, {})
+                    return
+
+                start, end = re.match(r"bytes=(\d+)-(\d*)", range_header).groups()
+                start = int(start)
+                if start in server.failing_offsets:
+                    self.send_error(503, "unavailable")
+                    return
+                if start >= len(content):
+                    self._send(416, b"", {"Content-Range": f"bytes */{len(content)}"})
+                    return
+                end = min(int(end) if end else len(content) - 1, len(content) - 1)
+                self._send(
+                    206,
+                    content[start : end + 1],
+                    {"Content-Range": f"bytes {start}-{end}/{len(content)}"},
+                )
+
+            def _send(self, status, body, headers):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestFileTransfer(unittest.TestCase):
+    def setUp(self):
+        self.server = _FileServer()
+        self.addCleanup(self.server.stop)
+        self.sandbox = Sandbox(
+            sandbox_id="sbx-1",
+            proxy_url=self.server.base_url,
+            api_key="k",
+            _proxy_rust_client=_FakeProxyClient(self.server.base_url),
+        )
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.local_path = os.path.join(tmp_dir.name, "model.bin")
+
+    def _read_local_file(self):
+        with open(self.local_path, "rb") as f:
+            return f.read()
+
+    def test_read_file_range(self):
+        data = self.sandbox.read_file_range("/data/model.bin", 1000, 300).value
+
+        self.assertEqual(data, _CONTENT[1000:1300])
+        self.assertEqual(self.server.ranges, ["bytes=1000-1299"])
+
+    def test_read_file_range_without_server_range_support(self):
+        self.server.supports_ranges = False
+
+        data = self.sandbox.read_file_range("/data/model.bin", 1000, 300).value
+
+        self.assertEqual(data, _CONTENT[1000:1300])
+
+    def test_read_file_range_past_end_of_file(self):
+        sandbox = self.sandbox
+        self.assertEqual(
+            sandbox.read_file_range("/data/model.bin", 10000, 1000).value,
+            _CONTENT[10000:],
+        )
+        self.assertEqual(
+            sandbox.read_file_range("/data/model.bin", 20000, 10).value, b""
+        )
+        self.assertEqual(sandbox.read_file_range("/data/model.bin", 5, 0).value, b"")
+
+    def test_read_file_range_rejects_negative_offset(self):
+        with self.assertRaises(SandboxError):
+            self.sandbox.read_file_range("/data/model.bin", -1, 10)
+
+    def test_open_read_is_file_object(self):
+        with self.sandbox.open_read("/data/model.bin", chunk_size=1000) as stream:
+            self.assertIsInstance(stream, FileReadStream)
+            self.assertEqual(stream.size, len(_CONTENT))
+            self.assertEqual(stream.read(10), _CONTENT[:10])
+            with open(self.local_path, "wb") as f:
+                shutil.copyfileobj(stream, f)
+
+        self.assertEqual(self._read_local_file(), _CONTENT[10:])
+
+    def test_open_read_iterates_chunks(self):
+        with self.sandbox.open_read(
+            "/data/model.bin", offset=240, chunk_size=1000
+        ) as stream:
+            chunks = list(stream.iter_chunks())
+
+        self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), _CONTENT[240:])
+
+    def test_open_read_of_missing_file_raises_remote_api_error(self):
+        with self.assertRaises(RemoteAPIError) as cm:
+            self.sandbox.open_read("/data/missing.bin")
+        self.assertEqual(cm.exception.status_code, 404)
+
+    def test_download_file_in_parallel_parts(self):
+        self.sandbox.download_file(
+            "/data/model.bin", self.local_path, parallelism=3, part_size=1000
+        )
+
+        self.assertEqual(self._read_local_file(), _CONTENT)
+        # The first part's response tells the file size, the other 10 parts follow.
+        self.assertEqual(self.server.ranges[0], "bytes=0-999")
+        self.assertEqual(len(self.server.ranges), 11)
+        self.assertIn("bytes=10000-10239", self.server.ranges)
+
+    def test_download_file_without_server_range_support(self):
+        self.server.supports_ranges = False
+        with open(self.local_path, "wb") as f:
+            f.write(b"stale content longer than nothing")
+
+        self.sandbox.download_file("/data/model.bin", self.local_path, part_size=1000)
+
+        self.assertEqual(self._read_local_file(), _CONTENT)
+
+    def test_failed_parallel_download_keeps_prefix_and_resumes(self):
+        self.server.failing_offsets = {5000}
+
+        with self.assertRaises(RemoteAPIError):
+            self.sandbox.download_file(
+                "/data/model.bin", self.local_path, parallelism=2, part_size=1000
+            )
+        self.assertEqual(self._read_local_file(), _CONTENT[:5000])
+
+        self.server.failing_offsets = set()
+        self.server.ranges = []
+        self.sandbox.download_file(
+            "/data/model.bin", self.local_path, part_size=1000, resume=True
+        )
+
+        self.assertEqual(self._read_local_file(), _CONTENT)
+        self.assertEqual(self.server.ranges[0], "bytes=5000-5999")
+
+    def test_resume_of_complete_download(self):
+        with open(self.local_path, "wb") as f:
+            f.write(_CONTENT)
+
+        self.sandbox.download_file("/data/model.bin", self.local_path, resume=True)
+
+        self.assertEqual(self._read_local_file(), _CONTENT)
+        self.assertEqual(len(self.server.ranges), 1)
+        self.assertTrue(self.server.ranges[0].startswith(f"bytes={len(_CONTENT)}-"))
+
+    def test_resume_of_longer_local_file_downloads_again(self):
+        with open(self.local_path, "wb") as f:
+            f.write(_CONTENT + b"extra")
+
+        self.sandbox.download_file("/data/model.bin", self.local_path, resume=True)
+
+        self.assertEqual(self._read_local_file(), _CONTENT)
+
+
+class TestAsyncFileTransfer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = _FileServer()
+        self.addCleanup(self.server.stop)
+        self.sandbox = AsyncSandbox(
+            sandbox_id="sbx-1",
+            proxy_url=self.server.base_url,
+            api_key="k",
+            _proxy_rust_client=_FakeProxyClient(self.server.base_url),
+        )
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.local_path = os.path.join(tmp_dir.name, "model.bin")
+
+    async def test_read_file_range(self):
+        traced = await self.sandbox.read_file_range("/data/model.bin", 1000, 300)
+
+        self.assertEqual(traced.value, _CONTENT[1000:1300])
+
+    async def test_open_read(self):
+        async with await self.sandbox.open_read(
+            "/data/model.bin", chunk_size=1000
+        ) as stream:
+            self.assertIsInstance(stream, AsyncFileReadStream)
+            first = await stream.read(10)
+            rest = [chunk async for chunk in stream.iter_chunks()]
+
+        self.assertEqual(first + b"".join(rest), _CONTENT)
+
+    async def test_failed_parallel_download_keeps_prefix_and_resumes(self):
+        self.server.failing_offsets = {3000}
+
+        with self.assertRaises(RemoteAPIError):
+            await self.sandbox.download_file(
+                "/data/model.bin", self.local_path, parallelism=4, part_size=1000
+            )
+        with open(self.local_path, "rb") as f:
+            self.assertEqual(f.read(), _CONTENT[:3000])
+
+        self.server.failing_offsets = set()
+        await self.sandbox.download_file(
+            "/data/model.bin",
+            self.local_path,
+            parallelism=4,
+            part_size=1000,
+            resume=True,
+        )
+
+        with open(self.local_path, "rb") as f:
+            self.assertEqual(f.read(), _CONTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
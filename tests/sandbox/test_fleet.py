@@ -0,0 +1,233 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from tensorlake.sandbox import (
+    SandboxBatchError,
+    SandboxError,
+    SandboxFleet,
+    SandboxStatus,
+)
+
+
+class _FakeProxyClient:
+    def __init__(self, base_url):
+        self._base_url = base_url
+
+    def base_url(self):
+        return self._base_url
+
+    def close(self):
+        return None
+
+
+class _FakeFleetRustClient:
+    """API stand-in where pending sandboxes start running after a few lists."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self._lock = threading.Lock()
+        self.statuses: dict[str, str] = {}
+        self.names: dict[str, str] = {}
+        self.list_calls = 0
+        self.get_calls = 0
+        self.delete_calls: list[str] = []
+        self.suspend_calls: list[str] = []
+        self.connect_proxy_calls: list[str] = []
+        # Pending sandboxes become running when listed this many times.
+        self.lists_until_running = 2
+        self.failing_creates = 0
+        # Sandboxes created while this is positive are terminated right away.
+        self.terminated_creates = 0
+        self.failing_deletes: set[str] = set()
+        self._pending_lists: dict[str, int] = {}
+        type(self).instances.append(self)
+
+    def close(self):
+        return None
+
+    def create_sandbox(self, request_json):
+        with self._lock:
+            if self.failing_creates > 0:
+                self.failing_creates -= 1
+                raise SandboxError("no capacity")
+            sandbox_id = f"sbx-{len(self.statuses) + 1}"
+            if self.terminated_creates > 0:
+                self.terminated_creates -= 1
+                self.statuses[sandbox_id] = "terminated"
+            else:
+                self.statuses[sandbox_id] = "pending"
+                self._pending_lists[sandbox_id] = self.lists_until_running
+            status = self.statuses[sandbox_id]
+        return (
+            "trace-create",
+            json.dumps({"sandbox_id": sandbox_id, "status": status}),
+        )
+
+    def _info(self, sandbox_id):
+        return {
+            "id": sandbox_id,
+            "namespace": "default",
+            "status": self.statuses[sandbox_id],
+            "name": self.names.get(sandbox_id),
+            "resources": {"cpus": 1.0, "memory_mb": 512, "ephemeral_disk_mb": 1024},
+            "sandbox_url": f"https://{sandbox_id}.sandbox.tensorlake.ai",
+        }
+
+    def list_sandboxes_json(self):
+        with self._lock:
+            self.list_calls += 1
+            for sandbox_id, remaining in list(self._pending_lists.items()):
+                if remaining <= 1:
+                    self.statuses[sandbox_id] = "running"
+                    del self._pending_lists[sandbox_id]
+                else:
+                    self._pending_lists[sandbox_id] = remaining - 1
+            sandboxes = [self._info(sandbox_id) for sandbox_id in self.statuses]
+        return ("trace-list", json.dumps({"sandboxes": sandboxes}))
+
+    def get_sandbox_json(self, sandbox_id):
+        self.get_calls += 1
+        return ("trace-get", json.dumps(self._info(sandbox_id)))
+
+    def delete_sandbox(self, sandbox_id):
+        with self._lock:
+            if sandbox_id in self.failing_deletes:
+                raise SandboxError("delete failed")
+            self.delete_calls.append(sandbox_id)
+        return "trace-delete"
+
+    def suspend_sandbox(self, sandbox_id):
+        with self._lock:
+            self.suspend_calls.append(sandbox_id)
+            for known_id, name in self.names.items():
+                if sandbox_id in (known_id, name):
+                    self.statuses[known_id] = "suspended"
+        return "trace-suspend"
+
+    def select_sandbox_proxy_url(
+        self,
+        *,
+        sandbox_id,
+        sandbox_url=None,
+        ingress_endpoint=None,
+        explicit_proxy_url=None,
+    ):
+        return explicit_proxy_url or sandbox_url
+
+    def connect_proxy(
+        self, *, proxy_url, sandbox_id, routing_hint=None, request_timeout_sec=None
+    ):
+        with self._lock:
+            self.connect_proxy_calls.append(sandbox_id)
+        return _FakeProxyClient(proxy_url)
+
+
+class TestSandboxFleet(unittest.TestCase):
+    def setUp(self):
+        _FakeFleetRustClient.instances = []
+        for target, value in (
+            ("tensorlake.sandbox.client.RustCloudSandboxClient", _FakeFleetRustClient),
+            ("tensorlake.sandbox.client._RUST_SANDBOX_CLIENT_AVAILABLE", True),
+        ):
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.fleet = SandboxFleet(api_url="http://localhost:8900", api_key="k")
+        self.addCleanup(self.fleet.close)
+        self.api = _FakeFleetRustClient.instances[0]
+
+    def test_create_many_shares_one_client_and_waits_with_list_requests(self):
+        sandboxes = self.fleet.create_many(5, image="python:3.12", poll_interval=0.01)
+
+        self.assertEqual(
+            sorted(sandbox.sandbox_id for sandbox in sandboxes),
+            [f"sbx-{index}" for index in range(1, 6)],
+        )
+        # One API client for the whole fleet, sandbox proxies connect through it.
+        self.assertEqual(len(_FakeFleetRustClient.instances), 1)
+        self.assertEqual(len(self.api.connect_proxy_calls), 5)
+        # The whole fleet is waited for with list requests, not per-sandbox gets.
+        self.assertEqual(self.api.list_calls, 2)
+        self.assertEqual(self.api.get_calls, 0)
+        self.assertTrue(all(sandbox._owns_sandbox for sandbox in sandboxes))
+
+    def test_create_many_deletes_created_sandboxes_when_one_fails(self):
+        self.api.failing_creates = 1
+
+        with self.assertRaises(SandboxBatchError) as cm:
+            self.fleet.create_many(3, poll_interval=0.01)
+
+        self.assertEqual(len(cm.exception.errors), 1)
+        self.assertEqual(sorted(self.api.delete_calls), ["sbx-1", "sbx-2"])
+
+    def test_create_many_keys_startup_failures_by_sandbox_id(self):
+        self.api.terminated_creates = 1
+        self.api.lists_until_running = 1000
+
+        with self.assertRaises(SandboxBatchError) as cm:
+            self.fleet.create_many(2, startup_timeout=0.05, poll_interval=0.01)
+
+        # Terminated and timed out sandboxes are reported together.
+        self.assertEqual(sorted(cm.exception.errors), ["sbx-1", "sbx-2"])
+        self.assertEqual(sorted(self.api.delete_calls), ["sbx-1", "sbx-2"])
+
+    def test_create_many_rejects_create_arguments_with_pool_id(self):
+        with self.assertRaisesRegex(SandboxError, "image"):
+            self.fleet.create_many(2, pool_id="pool-1", image="python:3.12")
+
+        self.assertEqual(self.api.statuses, {})
+
+    def test_create_many_times_out(self):
+        self.api.lists_until_running = 1000
+
+        with self.assertRaisesRegex(SandboxBatchError, "did not reach running"):
+            self.fleet.create_many(2, startup_timeout=0.05, poll_interval=0.01)
+
+        self.assertEqual(sorted(self.api.delete_calls), ["sbx-1", "sbx-2"])
+
+    def test_delete_many_attempts_all_sandboxes(self):
+        self.api.failing_deletes = {"sbx-2"}
+
+        with self.assertRaises(SandboxBatchError) as cm:
+            self.fleet.delete_many(["sbx-1", "sbx-2", "sbx-3"])
+
+        self.assertEqual(list(cm.exception.errors), ["sbx-2"])
+        self.assertEqual(sorted(self.api.delete_calls), ["sbx-1", "sbx-3"])
+
+    def test_suspend_many_waits_for_suspended_status(self):
+        self.api.statuses = {"sbx-1": "running", "sbx-2": "running"}
+        self.api.names = {"sbx-1": "env-a", "sbx-2": "env-b"}
+
+        self.fleet.suspend_many(["env-a", "env-b"], poll_interval=0.01)
+
+        self.assertEqual(sorted(self.api.suspend_calls), ["env-a", "env-b"])
+        self.assertEqual(self.api.list_calls, 1)
+
+    def test_wait_for_status_reports_terminated_sandboxes(self):
+        self.api.statuses = {"sbx-1": "running", "sbx-2": "terminated"}
+
+        with self.assertRaises(SandboxBatchError) as cm:
+            self.fleet.wait_for_status(
+                ["sbx-1", "sbx-2"], SandboxStatus.RUNNING, poll_interval=0.01
+            )
+
+        self.assertEqual(list(cm.exception.errors), ["sbx-2"])
+
+    def test_connect_many_resolves_sandboxes_with_one_list_request(self):
+        self.api.statuses = {"sbx-1": "running", "sbx-2": "running"}
+        self.api.names = {"sbx-2": "env-b"}
+
+        sandboxes = self.fleet.connect_many(["sbx-1", "env-b"])
+
+        self.assertEqual(
+            [sandbox.sandbox_id for sandbox in sandboxes], ["sbx-1", "sbx-2"]
+        )
+        self.assertEqual((self.api.list_calls, self.api.get_calls), (1, 0))
+        self.assertFalse(any(sandbox._owns_sandbox for sandbox in sandboxes))
+
+
+if __name__ == "__main__":
+    unittest.main()
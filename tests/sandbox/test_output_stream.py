@@ -0,0 +1,242 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tensorlake.sandbox import (
+    AsyncOutputStream,
+    AsyncSandbox,
+    OutputStream,
+    RemoteAPIError,
+    Sandbox,
+    SandboxConnectionError,
+)
+
+_RUN_EVENTS = [
+    {"pid": 42, "started_at": 1_700_000_000},
+    {"line": "out1", "stream": "stdout", "timestamp": 1_700_000_001},
+    {"line": "err1", "stream": "stderr", "timestamp": 1_700_000_002},
+    {"line": "out2", "stream": "stdout", "timestamp": 1_700_000_003},
+    {"exit_code": 3},
+]
+
+
+class _FakeProxyClient:
+    def __init__(self, base_url):
+        self._base_url = base_url
+
+    def base_url(self):
+        return self._base_url
+
+    def close(self):
+        return None
+
+
+class _SSEServer:
+    """Sandbox daemon stand-in serving process output over SSE."""
+
+    def __init__(self):
+        self.requests = []
+        self.run_events = list(_RUN_EVENTS)
+        # Follow streams send their second event only once this is set.
+        self.send_second_event = threading.Event()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _start_event_stream(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+
+            def _send_event(self, event):
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+
+            def do_GET(self):
+                server.requests.append(("GET", self.path, dict(self.headers), None))
+                if not self.path.endswith("/follow"):
+                    self.send_error(404, "process not found")
+                    return
+                self._start_event_stream()
+                self.wfile.write(b": heartbeat\n\n")
+                self._send_event({"line": "first", "timestamp": 1_700_000_000})
+                server.send_second_event.wait(timeout=10)
+                self._send_event({"line": "second", "timestamp": 1_700_000_001})
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                server.requests.append(
+                    ("POST", self.path, dict(self.headers), json.loads(body))
+                )
+                self._start_event_stream()
+                for event in server.run_events:
+                    self._send_event(event)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.send_second_event.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestOutputStream(unittest.TestCase):
+    def setUp(self):
+        self.server = _SSEServer()
+        self.addCleanup(self.server.stop)
+        self.sandbox = Sandbox(
+            sandbox_id="sbx-1",
+            proxy_url=self.server.base_url,
+            api_key="k",
+            _proxy_rust_client=_FakeProxyClient(self.server.base_url),
+        )
+
+    def test_stream_output_yields_events_before_stream_ends(self):
+        with self.sandbox.stream_output(101) as stream:
+            self.assertIsInstance(stream, OutputStream)
+            self.assertEqual(next(stream).line, "first")
+            # The server only sends the second event after the first one was received.
+            self.server.send_second_event.set()
+            self.assertEqual([event.line for event in stream], ["second"])
+
+        method, path, headers, _ = self.server.requests[0]
+        self.assertEqual((method, path), ("GET", "/api/v1/processes/101/output/follow"))
+        self.assertEqual(headers["Authorization"], "Bearer k")
+        self.assertEqual(headers["Accept"], "text/event-stream")
+        self.assertEqual(stream.trace_id, headers["traceparent"].split("-")[1])
+
+    def test_stream_sends_routing_hint(self):
+        sandbox = Sandbox(
+            sandbox_id="sbx-1",
+            proxy_url=self.server.base_url,
+            api_key="k",
+            routing_hint="route-a",
+            _proxy_rust_client=_FakeProxyClient(self.server.base_url),
+        )
+        self.server.send_second_event.set()
+        with sandbox.stream_output(101) as stream:
+            list(stream)
+
+        self.assertEqual(
+            self.server.requests[0][2]["X-Tensorlake-Route-Hint"], "route-a"
+        )
+
+    def test_stream_stdout_encodes_process_name(self):
+        self.server.send_second_event.set()
+        with self.sandbox.stream_stdout("web app") as stream:
+            list(stream)
+
+        self.assertEqual(
+            self.server.requests[0][1], "/api/v1/processes/web%20app/stdout/follow"
+        )
+
+    def test_stream_can_be_closed_before_process_exits(self):
+        stream = self.sandbox.stream_stderr(101)
+        self.assertEqual(next(stream).line, "first")
+        stream.close()
+        self.assertEqual(
+            self.server.requests[0][1], "/api/v1/processes/101/stderr/follow"
+        )
+
+    def test_stream_of_unknown_path_raises_remote_api_error(self):
+        with self.assertRaises(RemoteAPIError) as cm:
+            self.sandbox._open_output_stream("/api/v1/unknown")
+        self.assertEqual(cm.exception.status_code, 404)
+
+    def test_stream_run_reports_pid_and_exit_code(self):
+        with self.sandbox.stream_run("make", args=["test"], user="root") as stream:
+            events = [(event.stream, event.line) for event in stream]
+
+        self.assertEqual(
+            events, [("stdout", "out1"), ("stderr", "err1"), ("stdout", "out2")]
+        )
+        self.assertEqual(stream.pid, 42)
+        self.assertEqual(stream.exit_code, 3)
+        method, path, _, payload = self.server.requests[0]
+        self.assertEqual((method, path), ("POST", "/api/v1/processes/run"))
+        self.assertEqual(payload["command"], "make")
+        self.assertEqual(payload["args"], ["test"])
+        self.assertEqual(payload["user"], "root")
+
+    def test_run_writes_output_to_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stdout_path = os.path.join(tmp_dir, "stdout.txt")
+            result = self.sandbox.run("make", stdout_path=stdout_path)
+
+            with open(stdout_path) as f:
+                self.assertEqual(f.read(), "out1\nout2\n")
+        self.assertEqual(result.exit_code, 3)
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(result.stderr, "err1")
+
+    def test_run_writes_both_streams_to_same_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "output.txt")
+            result = self.sandbox.run("make", stdout_path=path, stderr_path=path)
+
+            with open(path) as f:
+                self.assertEqual(f.read(), "out1\nerr1\nout2\n")
+        self.assertEqual((result.stdout, result.stderr), ("", ""))
+
+    def test_run_to_file_raises_when_stream_has_no_exit_event(self):
+        self.server.run_events = _RUN_EVENTS[:-1]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaisesRegex(
+                SandboxConnectionError, "stream ended without an exit event"
+            ):
+                self.sandbox.run(
+                    "make", stdout_path=os.path.join(tmp_dir, "stdout.txt")
+                )
+
+
+class TestAsyncOutputStream(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = _SSEServer()
+        self.addCleanup(self.server.stop)
+        self.sandbox = AsyncSandbox(
+            sandbox_id="sbx-1",
+            proxy_url=self.server.base_url,
+            api_key="k",
+            _proxy_rust_client=_FakeProxyClient(self.server.base_url),
+        )
+
+    async def test_stream_output_yields_events_before_stream_ends(self):
+        async with await self.sandbox.stream_output(101) as stream:
+            self.assertIsInstance(stream, AsyncOutputStream)
+            self.assertEqual((await stream.__anext__()).line, "first")
+            self.server.send_second_event.set()
+            self.assertEqual([event.line async for event in stream], ["second"])
+
+        self.assertEqual(
+            self.server.requests[0][1], "/api/v1/processes/101/output/follow"
+        )
+
+    async def test_stream_run_reports_exit_code(self):
+        async with await self.sandbox.stream_run("make") as stream:
+            lines = [event.line async for event in stream]
+
+        self.assertEqual(lines, ["out1", "err1", "out2"])
+        self.assertEqual(stream.pid, 42)
+        self.assertEqual(stream.exit_code, 3)
+
+    async def test_run_writes_output_to_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stderr_path = os.path.join(tmp_dir, "stderr.txt")
+            result = await self.sandbox.run("make", stderr_path=stderr_path)
+
+            with open(stderr_path) as f:
+                self.assertEqual(f.read(), "err1\n")
+        self.assertEqual(result.exit_code, 3)
+        self.assertEqual(result.stdout, "out1\nout2")
+        self.assertEqual(result.stderr, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
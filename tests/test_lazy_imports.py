@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import unittest
+
+
+def _imported_modules(statement: str, module_names: list[str]) -> list[str]:
+    """Returns the module names imported after running the statement in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\n"
+            "import sys\n"
+            f"print(','.join(name for name in {module_names!r} if name in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_tensorlake_does_not_import_subsystems(self):
+        self.assertEqual(
+            _imported_modules(
+                "import tensorlake",
+                ["tensorlake.image", "tensorlake.sandbox", "tensorlake.repositories"],
+            ),
+            [],
+        )
+
+    def test_application_definition_does_not_import_runners(self):
+        self.assertEqual(
+            _imported_modules(
+                "from tensorlake.applications import application, function, Image",
+                [
+                    "tensorlake.sandbox",
+                    "tensorlake.image.sandbox_builder",
+                    "tensorlake.applications.interface.run",
+                ],
+            ),
+            [],
+        )
+
+    def test_lazy_exports_are_loaded_on_access(self):
+        import tensorlake
+        import tensorlake.applications
+        from tensorlake.image.sandbox_builder import list_sandbox_images
+        from tensorlake.repositories import RepositoryClient
+
+        self.assertIs(tensorlake.RepositoryClient, RepositoryClient)
+        self.assertIs(tensorlake.list_sandbox_images, list_sandbox_images)
+        self.assertIn("FileSystem", dir(tensorlake))
+        self.assertTrue(callable(tensorlake.applications.run_local_application))
+        # Loading the lazy exports doesn't replace the function decorator with its subpackage.
+        self.assertTrue(callable(tensorlake.applications.function))
+        with self.assertRaises(AttributeError):
+            tensorlake.NotExported
+
+
+if __name__ == "__main__":
+    unittest.main()
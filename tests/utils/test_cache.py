@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from tensorlake.utils.cache import KVCache
+
+
+class TestKVCacheEvict(unittest.TestCase):
+    def setUp(self):
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.cache = KVCache("test", root_dir=Path(temporary_directory.name))
+
+    def _set_used_at(self, key: str, used_at: int) -> None:
+        path = self.cache._key_path(key, ".bin")
+        os.utime(path, (used_at, used_at))
+
+    def test_evicts_least_recently_used_values(self):
+        for used_at, key in enumerate(["a", "b", "c"]):
+            self.cache.set_bytes(key, b"x" * 100)
+            self._set_used_at(key, 1_000_000 + used_at)
+        # Reading a value makes it the most recently used one.
+        self.assertEqual(self.cache.get_bytes("a"), b"x" * 100)
+
+        self.cache.evict(max_bytes=200)
+
+        self.assertEqual(self.cache.get_bytes("a"), b"x" * 100)
+        self.assertIsNone(self.cache.get_bytes("b"))
+        self.assertEqual(self.cache.get_bytes("c"), b"x" * 100)
+
+    def test_keeps_values_within_limit(self):
+        self.cache.set_bytes("a", b"x" * 100)
+        self.cache.set("b", "y" * 100)
+
+        self.cache.evict(max_bytes=200)
+
+        self.assertEqual(self.cache.get_bytes("a"), b"x" * 100)
+        self.assertEqual(self.cache.get("b"), "y" * 100)
+
+    def test_evict_of_missing_namespace_does_nothing(self):
+        self.cache.evict(max_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()